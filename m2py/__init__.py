@@ -15,24 +15,59 @@ Matlab functions and functionality implemented in Python
 
 # from thermo import xsteam
 #from prefnum import prefnum
-from .misc import units
-from .misc import constants
-from .utils import is_num, is_list, is_dict, is_tuple
+import sys
+from importlib import import_module
 
-import numpy as np
-from numpy.core.umath import spacing, tan, arctan, arcsin, arccos, arctan2, floor, ceil
-from numpy.core.umath import sin, cos, log, log10, exp
-from numpy import linspace, logspace, arange
+from .utils import is_num, is_list, is_dict, is_tuple
 
 try:
     from linalg import inv, pinv, rank, eig
 except:
     pass
 
-unitfactor = units.factor
+# Subpackages, numpy and the unit modules are imported on the first access
+# of the attribute (PEP 562), importing m2py alone stays cheap.
+_lazy_modules = {
+    "units": ".misc.units",
+    "constants": ".misc.constants",
+    "np": "numpy",
+    "tabulate": "tabulate",
+}
+
+_lazy_subpackages = ("thermo", "finance", "numerical", "misc", "control", "electrical", "mechanical",
+                     "lsheet", "interval", "mohr", "prefnumpy")
+
+_lazy_numpy = ("spacing", "tan", "arctan", "arcsin", "arccos", "arctan2", "floor", "ceil",
+               "sin", "cos", "log", "log10", "exp", "linspace", "logspace", "arange")
+
+
+def __getattr__(name):
+    if name in _lazy_modules:
+        value = import_module(_lazy_modules[name], __name__)
+        if name == "tabulate":
+            value = value.tabulate
+    elif name in _lazy_subpackages:
+        value = import_module("." + name, __name__)
+    elif name in _lazy_numpy:
+        value = getattr(import_module("numpy"), name)
+    elif name in ("atan", "atan2"):
+        value = getattr(import_module("numpy"), "arc" + name[1:])
+    elif name == "unitfactor":
+        value = import_module(".misc.units", __name__).factor
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    globals()[name] = value
+    return value
 
-# eps constant
-EPS = spacing(1)
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_modules) | set(_lazy_subpackages) | set(_lazy_numpy) |
+                  {"unitfactor", "atan", "atan2"})
+
+
+# eps constant, spacing(1)
+EPS = sys.float_info.epsilon
 eps = EPS
 PI = 3.141592653589793
 E = 2.7182818284590451  # Euler's number exp(1)
@@ -58,10 +93,12 @@ def is_neg(x):
 
 
 def is_ndarray(lst):
-    return isinstance(numpy.ndarray, lst)
+    import numpy
+    return isinstance(lst, numpy.ndarray)
 
 
 def is_nan(var):
+    import numpy
     return numpy.isnan(var)
 
 
@@ -116,12 +153,6 @@ def mapl(function, array):
     return list(map(function, array))
 
 
-try:
-    from tabulate import tabulate
-except:
-    print("Couldn't import tabulate module")
-
-
 def disp(*params, **options):
     """
     Function To Display Numpy Matrix
@@ -539,29 +570,32 @@ def rad2deg(rad):
 
 
 def sind(x):
+    from numpy import sin
     return sin(deg2rad(x))
 
 
 def cosd(x):
+    from numpy import cos
     return cos(deg2rad(x))
 
 
 def tand(x):
+    from numpy import tan
     return tan(deg2rad(x))
 
 
-# Alias for arctan functions
-atan = arctan
-atan2 = arctan2
-
+# Alias for arctan functions, atan and atan2 are numpy arctan and arctan2
+# imported by __getattr__
 
 
 def atand(x):
-    return rad2deg(atan(x))
+    from numpy import arctan
+    return rad2deg(arctan(x))
 
 
 def atan2d(x, y):
-    return rad2deg(atan2(x, y))
+    from numpy import arctan2
+    return rad2deg(arctan2(x, y))
 
 
 def cummulated_function(function, array, init=0):
@@ -600,6 +634,8 @@ def __powerise10(x):
 
     """ Returns x as a * 10 ^ b with 0<= a <10
     """
+    from numpy import floor, log10
+
     if x == 0: return 0 , 0
     Neg = x <0
     if Neg : x = -x
@@ -634,4 +670,10 @@ def eng2(x):
         s= __factors__[factor]
         return "%s %s" % (base, s)
     except:
-        return e
\ No newline at end of file
+        return e
+
+# from m2py import * exports the numpy functions and the unit modules as
+# before the lazy imports, only the star import pays for numpy
+__all__ = sorted(name for name in list(globals())
+                 if not name.startswith("_") and name not in ("sys", "import_module", "utils")) + \
+    ["np", "units", "constants", "unitfactor", "atan", "atan2"] + list(_lazy_numpy)
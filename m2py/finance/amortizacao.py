@@ -13,8 +13,6 @@
 # http://www.gyplan.com/pt/amosink_pt.html
 #
 
-from tabulate import tabulate
-
 
 def __cacula_agio(table):
     """
@@ -37,6 +35,7 @@ def show_amort_table(table):
     :param table:
     :return:
     """
+    from tabulate import tabulate
     from m2py.misc.vectorize import column
 
     PV = table[0][-1]
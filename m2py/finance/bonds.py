@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from math import log
 
+import numpy
+
 from m2py.finance import finance
 
 
@@ -26,20 +29,27 @@ def make_expsum_function(coefficents, powers):
 
 
 
-def bond_cashflow(price, couponRate, maturity, freq=1, facevalue=1000.0):
-
+@lru_cache(maxsize=1024)
+def _flows(couponRate, maturity, freq, facevalue):
+    """ Cached read-only arrays of the times and cash flows after t = 0 """
     CF = couponRate*facevalue/freq
     N = maturity*freq
 
-    times = [1.0/freq*k for k in range(N+1)]
-
-    cashflow = [CF for k in range(N-1)]
-    cashflow.insert(0, -price)
-    cashflow.append( facevalue+CF)
+    times = numpy.arange(1, N + 1) / float(freq)
+    cashflow = numpy.full(N, CF)
+    cashflow[-1] += facevalue
 
+    times.flags.writeable = False
+    cashflow.flags.writeable = False
     return times, cashflow
 
 
+def bond_cashflow(price, couponRate, maturity, freq=1, facevalue=1000.0):
+
+    times, cashflow = _flows(couponRate, maturity, freq, facevalue)
+    return [0.0] + times.tolist(), [-price] + cashflow.tolist()
+
+
 
 def bond_yield(price, couponRate, maturity, freq=1, facevalue=1000.0):
     """
@@ -52,9 +62,9 @@ def bond_yield(price, couponRate, maturity, freq=1, facevalue=1000.0):
     """
     from m2py.numerical import roots
 
-    times, cashflow = bond_cashflow(price, couponRate, maturity, freq, facevalue)
+    times, cashflow = _flows(couponRate, maturity, freq, facevalue)
 
-    f = make_expsum_function(cashflow, times)
+    f = lambda x: numpy.dot(cashflow, x ** times) - price
 
     result = roots.regualfalsi(f,0, 1.1, 1e-6, 500)
     #print "result = ", result
@@ -74,15 +84,10 @@ def bond_price(ytm, couponRate, maturity, freq=1, facevalue=1000.0):
     :param facevalue:
     :return:
     """
-    times, cashflow = bond_cashflow(0, couponRate, maturity, freq, facevalue)
+    times, cashflow = _flows(couponRate, maturity, freq, facevalue)
 
     x = 1.0/(1+ytm)
-    pv = 0
-
-    for c, n in zip(cashflow, times):
-        pv += + c * x ** n
-
-    return pv
+    return float(numpy.dot(cashflow, x ** times))
 
 
 def bond_macaulay_duration(ytm, couponRate, maturity, freq=1, facevalue=1000.0):
@@ -94,19 +99,11 @@ def bond_macaulay_duration(ytm, couponRate, maturity, freq=1, facevalue=1000.0):
     :param facevalue:   Face value of the bond ( default 1000.0 )
     :return:
     """
-    times, cashflow = bond_cashflow(0, couponRate, maturity, freq, facevalue)
-    price = bond_price(ytm, couponRate, maturity, freq, facevalue)
+    times, cashflow = _flows(couponRate, maturity, freq, facevalue)
 
     x = 1.0/(1+ytm)
-    D = 0
-
-    for c, n in zip(cashflow, times):
-        pv = c * x ** n
-        D = D + pv*n
-
-    #print "D = ", D
-
-    D = D/price
+    pv = cashflow * x ** times
+    D = float(numpy.dot(pv, times) / pv.sum())
 
     return D
 
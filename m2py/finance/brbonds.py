@@ -4,7 +4,10 @@
 Brazilian Bonds Calculation and Validation
 
 """
+import numpy
+
 from m2py.finance import dtime as dt
+from m2py.finance import schedule
 
 
 def expsum(x, coefficient, powers):
@@ -34,25 +37,10 @@ def payment_dates(settle, maturity):
     :param maturity:
     :return:
 
-
-
+    The dates are a slice of the cached schedule of the maturity, see
+    m2py.finance.schedule.
     """
-    date_s = dt.date_dmy(settle)
-    date_m = dt.date_dmy(maturity)
-
-    ys, _, _ = dt.date2ymd(date_s)
-    ym, _, _ = dt.date2ymd(date_m)
-    dates = []
-
-    for year in range(ys, ym + 1):
-        # payment at 01/01/xx
-        dsemester1 = dt.ymd2date(year, 1, 1)
-        # payment at 01/07/xx
-        dsemester2 = dt.ymd2date(year, 7, 1)
-        dates.extend([dsemester1, dsemester2])
-
-    dates = [d for d in dates if date_s < d <= date_m]
-
+    dates = schedule.coupons(settle, maturity).astype("M8[us]").tolist()
     dates[0] = dt.daysadd(dates[0], -1)
 
     return dates
@@ -122,66 +110,160 @@ def bond_yield(price, couponRate, settle, maturity, facevalue=1000.0):
     :param maturity:     Maturity date
     :return:
     """
-    couponRate = (1 + couponRate) ** 0.5 - 1
+    return float(bond_yields(price, couponRate, settle, maturity, facevalue)[0])
 
-    from m2py.numerical import roots
 
-    date0 = dt.date_dmy(settle)
-    daten = dt.date_dmy(maturity)
+#------------------------------------------------------#
+#               Portfolios                             #
+#------------------------------------------------------#
 
-    if couponRate:
-        coupondates = payment_dates(settle, maturity)
-    else:
-        coupondates = []
+def _dates(dates):
+    """ datetime64 array of dates, strings in dd/mm/yyyy format """
+    dates = numpy.asarray(dates)
+    if dates.dtype.kind in "US":
+        return dt.parse_dates(dates.astype(str).ravel(), "%d/%m/%Y", asarray=True).reshape(dates.shape)
+    return dt.datetime64(dates)
 
-    expoents = []
-    coefficients = []
-    k = couponRate
 
-    for date in coupondates:
-        # Number of business days between settle and
-        # coupon payment
-        N = dt.daysbus(date0, date)
-        c = N / 252.0
-
-        #print dict(c=c, N=N)
-
-        expoents.append(c)
-        coefficients.append(k)
-
-    # Assemble Equation
-    # PV: Price, FV: Face Value
-    #
-    # f(x) = a1.X^c1 + a2.X^c2 + .... + an.X^cn + a0
-    #  f(x) = kX^c1 + kX^c2 + k.X^c3 + ... + (k+1).X^Cn - PV/FV
-    #
-    #  a1 = k, a2 = k, a3 = k, .... an= k+1,  a0 = -PV/FV
-    #  c0 = 0
-    #
-    #  x = 1/(1+YMT)
-    #
-    coefficients[-1] = coefficients[-1] + 1
-    coefficients.append(-price / facevalue)
-    expoents.append(0)
-
-    #from pprint import pprint
-    #pprint(zip(coefficients, expoents))
-
-    equation = make_expsum_function(coefficients, expoents)
-
-    #print "result = ", equation(1 / (0.1652 + 1))
-
-    #print stefessen(equation, 0.46, 1e-3, 200)
-
-    #result = roots.regualfalsi(equation, 0, 1, 1e-6, 400)
-    result = roots.steffenssen(equation, 1, 1e-6, 400)
-    print(result)
-    x = result[0]
-
-    #print "x = ", x
-    YTM = 1 / x - 1
-    return YTM
-    #print "YTM = ", YTM
+def _portfolio(settle, maturity, *values):
+    """ 1-d arrays of the same length of the dates and values of the bonds """
+    arrays = numpy.broadcast_arrays(_dates(settle), _dates(maturity),
+                                    *[numpy.asarray(v, dtype=float) for v in values])
+    return [numpy.ravel(a) for a in arrays]
+
+
+def bond_schedule(settle, maturity):
+    """
+    Business-day times of the coupons of many bonds, sliced from one
+    cached schedule, see m2py.finance.schedule
+
+    :param settle:   Settle date or array of dates (dd/mm/yyyy strings,
+                     datetime or datetime64)
+    :param maturity: Maturity date or array of dates
+    :return:         (t, tm) t matrix of the times in years of 252 business
+                     days of the coupons, a row for each bond and NaN after
+                     its last coupon, tm times of the maturities
+    """
+    settle, maturity = _portfolio(settle, maturity)
+    if numpy.any(maturity <= settle):
+        raise ValueError("The maturity must be after the settle date")
+
+    # The brazil schedules are the 01/01 and 01/07 grid up to the maturity,
+    # the cached schedule of the last maturity holds the coupons of every bond
+    grid = schedule.coupon_dates(maturity.max())
+    start = numpy.searchsorted(grid, settle, side="right")
+    count = numpy.searchsorted(grid, maturity, side="right") - start
+    k = numpy.arange(count.max())
+    index = numpy.minimum(start[:, None] + k, grid.size - 1)
+    paid = k < count[:, None]
+
+    dates = grid[index]
+    if k.size:
+        # The first coupon a day before, as payment_dates
+        dates[:, 0] -= numpy.timedelta64(1, "D")
+
+    N = dt.daysbus(settle[:, None], dates)
+    Nm = dt.daysbus(settle, maturity)
+    t = numpy.where(paid, N / 252.0, numpy.nan)
+    return t, Nm / 252.0
+
+
+def bond_prices(ytm, settle, maturity, couponRate=0.0, facevalue=1000.0):
+    """
+    Prices of many bonds at once, the rounding of bond_price
+
+    :param ytm:        Yield to maturity, number or array
+    :param settle:     Settle date or array of dates
+    :param maturity:   Maturity date or array of dates
+    :param couponRate: Coupon interest rate per year, number or array [default = 0.0]
+    :param facevalue:  Face Value [default: 1000.0 ]
+    :return:           Array of the prices
+
+    Example:
+        >>> bond_prices([0.1652, 0.15], "09/01/2004", "01/01/2008", 0.1)
+        array([828.5 , 865.25])
+    """
+    settle, maturity, y, k, F = _portfolio(settle, maturity, ytm, couponRate, facevalue)
+    t, tm = bond_schedule(settle, maturity)
+    k = (1 + k) ** 0.5 - 1
+
+    coupons = numpy.nansum(numpy.round((1 + y[:, None]) ** -t, 8), axis=1)
+    PV = F * (k * coupons + numpy.round((1 + y) ** -tm, 8))
+    return numpy.round(PV, 2)
+
+
+def bond_yields(price, couponRate, settle, maturity, facevalue=1000.0, guess=1.0):
+    """
+    Yields to maturity of many bonds at once
+
+    The equations of bond_yield of all the bonds are solved together, see
+    finance.expsum_roots.
+
+    :param price:      Spot price, number or array
+    :param couponRate: Coupon interest rate per year, number or array
+    :param settle:     Settle date or array of dates
+    :param maturity:   Maturity date or array of dates
+    :param facevalue:  Face Value [default: 1000.0 ]
+    :param guess:      Initial guess of x = 1/(1 + ytm), the yields of a
+                       previous day are a good guess
+    :return:           Array of the yields
+    """
+    from m2py.finance.finance import expsum_roots
+
+    settle, maturity, P, k, F = _portfolio(settle, maturity, price, couponRate, facevalue)
+    t, tm = bond_schedule(settle, maturity)
+    k = (1 + k) ** 0.5 - 1
+
+    # Columns of the equations, f(x) = -P/F + k.X^c1 + ... + k.X^cn + X^Cm
+    paid = ~numpy.isnan(t)
+    coefficients = numpy.vstack([-P / F, numpy.where(paid, k[:, None], 0.0).T, numpy.ones(tm.size)])
+    powers = numpy.vstack([numpy.zeros(tm.size), numpy.where(paid, t, 0.0).T, tm])
+
+    x = expsum_roots(coefficients, powers, guess)
+    return 1 / x - 1
+
+
+def bond_analytics(price, couponRate, settle, maturity, facevalue=1000.0, guess=1.0):
+    """
+    Yield, duration and DV01 of a portfolio of bonds
+
+    :param price:      Spot price, number or array
+    :param couponRate: Coupon interest rate per year, number or array
+    :param settle:     Settle date or array of dates
+    :param maturity:   Maturity date or array of dates
+    :param facevalue:  Face Value [default: 1000.0 ]
+    :param guess:      Initial guess of x = 1/(1 + ytm)
+    :return:           Dictionary of arrays:
+
+        ytm                 Yield to maturity
+        price               Price of the yield, rounded as bond_price
+        duration            Macaulay duration in years of 252 business days
+        modified_duration   duration / (1 + ytm)
+        dv01                Price change of one basis point of yield
+
+    Example:
+        >>> bond_analytics([828.5, 788.11], [0.10, 0.0], ["09/01/2004", "20/12/2006"], "01/01/2008")
+    """
+    settle, maturity, P, coupon, F = _portfolio(settle, maturity, price, couponRate, facevalue)
+    ytm = bond_yields(P, coupon, settle, maturity, F, guess)
+
+    t, tm = bond_schedule(settle, maturity)
+    k = (1 + coupon) ** 0.5 - 1
+
+    disc = numpy.nan_to_num((1 + ytm[:, None]) ** -t)
+    discm = (1 + ytm) ** -tm
+    t = numpy.nan_to_num(t)
+    PV = F * (k * disc.sum(axis=1) + discm)
+    duration = F * (k * (t * disc).sum(axis=1) + tm * discm) / PV
+    modified = duration / (1 + ytm)
+
+    return {
+        "ytm": ytm,
+        "price": bond_prices(ytm, settle, maturity, coupon, F),
+        "duration": duration,
+        "modified_duration": modified,
+        "dv01": modified * PV * 1e-4,
+    }
 
 
 def bond_quatinty(price, investment, minimum_fraction=0.1):
@@ -10,6 +10,9 @@ from datetime import datetime
 from m2py import utils
 import shelve
 import json
+from functools import lru_cache
+
+import numpy as np
 
 import re
 
@@ -466,6 +469,29 @@ __date_patterns2 = {
 }
 
 
+def _strptime(datestr, patterns):
+    """
+    Parse datestr with the first format of patterns that matches it,
+    None if no pattern matches. A format that matches only a prefix of
+    the string, like yyyy-mm-dd of yyyy-mm-dd HH:MM:SS, is skipped.
+    """
+    error = None
+    for fmt, pat in patterns.items():
+        if pat.match(datestr):
+            try:
+                return datetime.strptime(datestr, fmt)
+            except ValueError as err:
+                error = err
+    if error is not None:
+        raise error
+
+
+# Size of the memo caches of parse_date and parse_date2, date series repeat
+# the same strings many times
+DATE_CACHE_SIZE = 2 ** 16
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_date(datestr):
     """
     Parse date string
@@ -474,18 +500,14 @@ def parse_date(datestr):
     :return:
 
     Convention: Day before Month
-    """
-    for fmt, pat in __date_patterns.items():
-        if pat.match(datestr):
-            #print "-----------------"
-            #print "datestr = ", datestr, "fmt = ", fmt
-
-            return datetime.strptime(datestr, fmt)
-            #return datetime.strptime(datestr, fmt)
 
-            #print "-----------------"
+    The results are memoized, parse_date.cache_info() and
+    parse_date.cache_clear() inspect and clear the cache.
+    """
+    return _strptime(datestr, __date_patterns)
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_date2(datestr):
     """
     Parse Americam date string
@@ -495,12 +517,138 @@ def parse_date2(datestr):
 
     Convention: Month before day
     """
-    for fmt, pat in __date_patterns2.items():
+    return _strptime(datestr, __date_patterns2)
+
+
+def detect_format(datestr, american=False):
+    """
+    Format of a date string, the format of parse_date (parse_date2 if
+    american is True) that parses it, None if there is no one.
+
+        >>> detect_format("2014-12-08")
+        '%Y-%m-%d'
+        >>> detect_format("12/08/2014", american=True)
+        '%m/%d/%Y'
+    """
+    patterns = __date_patterns2 if american else __date_patterns
+    for fmt, pat in patterns.items():
         if pat.match(datestr):
-            #print "-----------------"
-            #print "datestr = ", datestr, "fmt = ", fmt
+            try:
+                datetime.strptime(datestr, fmt)
+                return fmt
+            except ValueError:
+                pass
+    return None
+
+
+# Fixed width formats parsed by slicing the digits, (width, year, month, day)
+__fixed_formats = {
+    '%Y-%m-%d': (10, (0, 4), (5, 7), (8, 10)),
+    '%Y/%m/%d': (10, (0, 4), (5, 7), (8, 10)),
+    '%Y%m%d': (8, (0, 4), (4, 6), (6, 8)),
+    '%d/%m/%Y': (10, (6, 10), (3, 5), (0, 2)),
+    '%d-%m-%Y': (10, (6, 10), (3, 5), (0, 2)),
+    '%m/%d/%Y': (10, (6, 10), (0, 2), (3, 5)),
+}
 
-            return datetime.strptime(datestr, fmt)
+
+def _parse_fixed(datestrs, fmt):
+    """
+    Parse a list of date strings of a fixed width format to a
+    datetime64[D] array, None if a string doesn't fit the format or
+    isn't a valid date
+    """
+    width, year, month, day = __fixed_formats[fmt]
+    chars = np.array(datestrs)
+    if chars.ndim != 1 or chars.dtype.kind != "U" or chars.dtype.itemsize != 4 * width \
+            or np.any(np.char.str_len(chars) != width):
+        return None
+    try:
+        chars = chars.astype("S%d" % width)
+    except UnicodeEncodeError:
+        return None
+
+    digits = chars.view(np.uint8).reshape(len(chars), width).astype(np.int64) - ord("0")
+
+    def number(span):
+        a, b = span
+        if np.any((digits[:, a:b] < 0) | (digits[:, a:b] > 9)):
+            raise ValueError
+        return digits[:, a:b].dot(10 ** np.arange(b - a - 1, -1, -1))
+
+    try:
+        Y, M, D = number(year), number(month), number(day)
+    except ValueError:
+        return None
+
+    # Separators
+    sample = fmt.replace("%Y", "YYYY").replace("%m", "mm").replace("%d", "dd")
+    for k, c in enumerate(sample):
+        if c not in "Ymd" and np.any(digits[:, k] != ord(c) - ord("0")):
+            return None
+
+    months = (Y - 1970) * 12 + (M - 1)
+    first = months.astype("M8[M]").astype("M8[D]")
+    dates = first + (D - 1)
+    if np.any((M < 1) | (M > 12) | (D < 1) | (dates.astype("M8[M]") != months.astype("M8[M]"))):
+        return None
+    return dates
+
+
+def parse_dates(datestrs, format=None, american=False, asarray=False):
+    """
+    Parse a column of date strings
+
+    The format is detected once, from the first string, unless it is
+    given. The fixed width formats (yyyy-mm-dd, dd/mm/yyyy, mm/dd/yyyy,
+    yyyy/mm/dd, yyyymmdd, dd-mm-yyyy) are parsed by array operations on
+    the digits of the whole column, the other formats by strptime with a
+    memo of the repeated strings.
+
+    :param datestrs: List or array of date strings, all in the same format
+    :param format:   strptime format, default detected as parse_date does
+    :param american: Detect the format with the month before the day (parse_date2)
+    :param asarray:  Return a numpy datetime64 array instead of a list
+    :return:         List of datetime.datetime objects, or datetime64 array,
+                     datetime64[D] for date formats and datetime64[s] otherwise
+
+    Example:
+        >>> parse_dates(["2014-12-08", "2014-12-09"])
+        [datetime.datetime(2014, 12, 8, 0, 0), datetime.datetime(2014, 12, 9, 0, 0)]
+        >>> parse_dates(["08/12/2014", "09/12/2014"], asarray=True)
+        array(['2014-12-08', '2014-12-09'], dtype='datetime64[D]')
+    """
+    datestrs = list(datestrs)
+    if not datestrs:
+        return np.array([], dtype="M8[D]") if asarray else []
+
+    if format is None:
+        format = detect_format(datestrs[0], american)
+        if format is None:
+            # Error of strptime if a pattern matches, but the date is invalid
+            _strptime(datestrs[0], __date_patterns2 if american else __date_patterns)
+            raise ValueError("Unknown date format: %r" % (datestrs[0],))
+
+    dates = None
+    if format in __fixed_formats:
+        dates = _parse_fixed(datestrs, format)
+
+    if dates is not None:
+        if asarray:
+            return dates
+        return dates.astype("M8[us]").tolist()
+
+    memo = {}
+    result = []
+    for datestr in datestrs:
+        date = memo.get(datestr)
+        if date is None:
+            date = memo[datestr] = datetime.strptime(datestr, format)
+        result.append(date)
+
+    if asarray:
+        return np.array(result, dtype="M8[s]")
+    return result
 
 
 def dtime(*param):
@@ -557,7 +705,8 @@ __brazil_holydays_database = utils.resource_path("data/brazil_holydays.csv")
 sh = utils.read_file(__brazil_holydays_database)
 brazil_holydays = json.loads(sh)
 brazil_holydays = brazil_holydays["brholydays"]
-brazil_holydays = map(lambda x: data_ymd(x, "-"), brazil_holydays)
+# yy-mm-dd, years 2001 to 2078
+brazil_holydays = [datetime(2000 + int(x[:2]), int(x[3:5]), int(x[6:8])) for x in brazil_holydays]
 
 #sh.close()
 
@@ -578,130 +727,412 @@ def eomday(year, month):
     """
     import calendar
 
-    return filter(lambda x: x != 0, calendar.monthcalendar(year, month)[-1])[-1]
+    return calendar.monthrange(year, month)[1]
 
 
-def days_actual(date1, date2):
-    return (date2 - date1).days
+#------------------------------------------------------#
+#               DATE ARRAYS                            #
+#------------------------------------------------------#
 
+# Ordinal of 1970-01-01, the origin of numpy.datetime64
+EPOCH_ORDINAL = 719163
 
-actual_actual = lambda date1, date2: (date2 - date1).days
 
+def _ordinal(date):
+    if hasattr(date, "toordinal"):
+        return date.toordinal()
+    if isinstance(date, str):
+        return dtime(date).toordinal()
+    return int(np.datetime64(date, "D").astype(int)) + EPOCH_ORDINAL
 
-def days360(date1, date2):
-    # date1 = Date(date1)
-    # date2 = Date(date2)
 
-    from calendar import isleap
+def datetime64(dates):
+    """
+    Convert dates to a numpy datetime64[D] array
 
-    Y1, M1, D1 = date2ymd(date1)
-    Y2, M2, D2 = date2ymd(date2)
+    :param dates: datetime.datetime, datetime.date, date string, numpy.datetime64
+                  or a list or array of them
+    :return:      numpy.ndarray of dtype datetime64[D], 0-d for a single date
 
-    if D1 == 31:
-        D1 = 30
+    Example:
+        >>> from m2py.finance import dtime as dt
+        >>> dt.datetime64([dt.date_dmy("01/12/2013"), "2014-01-02"])
+        array(['2013-12-01', '2014-01-02'], dtype='datetime64[D]')
+    """
+    if isinstance(dates, (np.ndarray, np.datetime64)) and np.asarray(dates).dtype.kind == "M":
+        return np.asanyarray(dates).astype("M8[D]", copy=False)
 
-    if D2 == 31 and D1 in [30, 31]:
-        D2 = 30
+    if isinstance(dates, np.ndarray) and dates.dtype.kind in "US" and dates.ndim > 0:
+        return parse_dates(dates.astype(str).ravel(), asarray=True).astype("M8[D]", copy=False).reshape(dates.shape)
 
-    if M1 == 2 and ((D1 == 28 and not isleap(Y1)) or D1 == 29):
-        D1 = 30
+    if np.ndim(dates) == 0 and not isinstance(dates, np.ndarray):
+        return np.array(_ordinal(dates) - EPOCH_ORDINAL).astype("M8[D]")
 
-    N = 360 * (Y2 - Y1) + 30 * (M2 - M1) + (D2 - D1)
-    return N
+    ordinals = np.array([_ordinal(d) for d in np.asarray(dates, dtype=object).ravel()], dtype=np.int64)
+    return (ordinals - EPOCH_ORDINAL).astype("M8[D]").reshape(np.shape(dates))
 
 
-def days360e(date1, date2):
-    # date1 = Date(date1)
-    # date2 = Date(date2)
+def _ymd(dates):
+    """ Year, month and day integer arrays of datetime64[D] array """
+    Y = dates.astype("M8[Y]")
+    M = dates.astype("M8[M]")
+    return (Y.astype(int) + 1970,
+            (M - Y).astype(int) + 1,
+            (dates - M).astype(int) + 1)
 
-    Y1, M1, D1 = date2ymd(date1)
-    Y2, M2, D2 = date2ymd(date2)
 
-    if D1 == 31:
-        D1 = 30
+def _isleap(Y):
+    return (Y % 4 == 0) & ((Y % 100 != 0) | (Y % 400 == 0))
 
-    if D2 == 31:
-        D2 = 30
 
-    N = 360 * (Y2 - Y1) + 30 * (M2 - M1) + (D2 - D1)
-    return N
+def _result(x, scalar):
+    """ Python number for scalar inputs, array otherwise """
+    return x.item() if scalar else x
 
 
-def days360isda(date1, date2):
-    # date1 = Date(date1)
-    # date2 = Date(date2)
+def _scalar(*dates):
+    return all(np.ndim(d) == 0 for d in dates)
+
+
+#------------------------------------------------------#
+#               DAY COUNT CONVENTIONS                  #
+#------------------------------------------------------#
+#
+#  The day count functions take two dates, or lists or arrays of dates
+#  (broadcast), see datetime64(), and return a number for single dates,
+#  an integer array otherwise.
+#
+
+def days_actual(date1, date2):
+    """ Actual number of days from date1 to date2 """
+    if hasattr(date1, "toordinal") and hasattr(date2, "toordinal"):
+        return (date2 - date1).days
 
-    Y1, M1, D1 = date2ymd(date1)
-    Y2, M2, D2 = date2ymd(date2)
+    N = (datetime64(date2) - datetime64(date1)).astype(int)
+    return _result(N, _scalar(date1, date2))
 
-    if D1 == 31:
-        D1 = 30
 
-        if D2 == 31:
-            D2 = 30
+actual_actual = days_actual
+
+
+def _days360(date1, date2, rule):
+    """ 30/360 day count, rule adjusts the days of the month (Y1, M1, D1, Y2, M2, D2) -> (D1, D2) """
+    if hasattr(date1, "year") and hasattr(date2, "year"):
+        Y1, M1, D1 = date2ymd(date1)
+        Y2, M2, D2 = date2ymd(date2)
+        D1, D2 = rule(Y1, M1, D1, Y2, M2, D2)
+        return int(360 * (Y2 - Y1) + 30 * (M2 - M1) + (D2 - D1))
+
+    Y1, M1, D1 = _ymd(datetime64(date1))
+    Y2, M2, D2 = _ymd(datetime64(date2))
+    D1, D2 = rule(Y1, M1, D1, Y2, M2, D2)
 
     N = 360 * (Y2 - Y1) + 30 * (M2 - M1) + (D2 - D1)
-    return N
+    return _result(N, _scalar(date1, date2))
+
+
+def _rule_sia(Y1, M1, D1, Y2, M2, D2):
+    D1 = np.where(D1 == 31, 30, D1)
+    D2 = np.where((D2 == 31) & (D1 >= 30), 30, D2)
+    D1 = np.where((M1 == 2) & (D1 == 28 + _isleap(Y1)), 30, D1)
+    return D1, D2
+
+
+def _rule_european(Y1, M1, D1, Y2, M2, D2):
+    return np.minimum(D1, 30), np.minimum(D2, 30)
+
+
+def _rule_isda(Y1, M1, D1, Y2, M2, D2):
+    D2 = np.where((D1 == 31) & (D2 == 31), 30, D2)
+    return np.minimum(D1, 30), D2
+
+
+def _rule_psa(Y1, M1, D1, Y2, M2, D2):
+    D1 = np.where((D1 == 31) | ((M1 == 2) & (D1 == 28 + _isleap(Y1))), 30, D1)
+    D2 = np.where((D2 == 31) & (D1 == 30), 30, D2)
+    return D1, D2
+
+
+def days360(date1, date2):
+    """ Days from date1 to date2 in the 30/360 (SIA) convention """
+    return _days360(date1, date2, _rule_sia)
+
+
+def days360e(date1, date2):
+    """ Days from date1 to date2 in the 30/360 European convention """
+    return _days360(date1, date2, _rule_european)
+
+
+def days360isda(date1, date2):
+    """ Days from date1 to date2 in the 30/360 (ISDA) convention """
+    return _days360(date1, date2, _rule_isda)
 
 
 def days360psa(date1, date2):
-    # date1 = Date(date1)
-    # date2 = Date(date2)
+    """ Days from date1 to date2 in the 30/360 (PSA) convention """
+    return _days360(date1, date2, _rule_psa)
 
-    Y1, M1, D1 = date2ymd(date1)
-    Y2, M2, D2 = date2ymd(date2)
 
-    if D1 == 31:
-        D1 = 30
+#------------------------------------------------------#
+#               BUSINESS DAYS CALENDAR                 #
+#------------------------------------------------------#
+
+class BusinessCalendar(object):
+    """
+    Business days calendar over a fixed range of dates
 
-    if M1 == 2 and D1 == eomday(Y1, 2):
-        D1 = 30
+    The business days of the range are precomputed once as a cumulative
+    count indexed by the date ordinal, so counting, testing and adding
+    business days are array lookups, independent of the distance between
+    the dates and of the number of holidays.
 
-    if D1 == 30:
-        D2 = 30
+    :param holidays: List of holidays, datetime.datetime or datetime.date
+    :param start:    First date of the calendar
+    :param end:      Last date of the calendar
+    :param weekends: Weekdays that are not business days, date.weekday() numbers
+    :param name:     Name of the calendar
 
-    N = 360 * (Y2 - Y1) + 30 * (M2 - M1) + (D2 - D1)
-    return N
+    Example:
+
+        >>> from m2py.finance import dtime as dt
+        >>> cal = dt.get_calendar("brazil")
+        >>> cal.daysbus(dt.date_dmy("01/12/2014"), dt.date_dmy("10/12/2014"))
+        8
+        >>> cal.daysaddbu(dt.date_dmy("24/12/2014"), 1)
+        datetime.datetime(2014, 12, 26, 0, 0)
+    """
+
+    def __init__(self, holidays=(), start=datetime(1900, 1, 1), end=datetime(2078, 12, 31),
+                 weekends=weekends, name=None):
+
+        self.name = name
+        self.start = start
+        self.end = end
+        self.weekends = tuple(weekends)
+        self.origin = start.toordinal()
+
+        ndays = end.toordinal() - self.origin + 1
+        if ndays <= 0:
+            raise ValueError("Empty calendar, end date before start date")
+
+        # date.weekday() == (ordinal + 6) % 7
+        weekday = (np.arange(self.origin, self.origin + ndays) + 6) % 7
+        busday = ~np.isin(weekday, self.weekends)
+
+        index = np.array([d.toordinal() for d in holidays], dtype=int) - self.origin
+        busday[index[(index >= 0) & (index < ndays)]] = False
+
+        #: True for the business days, indexed by ordinal - origin
+        self.busday = busday
+        #: count[i] is the number of business days before the day i
+        self.count = np.concatenate(([0], np.cumsum(busday)))
+        #: Indexes of the business days, days[k] is the k-th business day
+        self.days = np.flatnonzero(busday)
+
+    def __repr__(self):
+        return "BusinessCalendar(%r, %s)" % (self.name, self._range())
+
+    def _range(self):
+        return "%s to %s" % (self.start.strftime("%Y-%m-%d"), self.end.strftime("%Y-%m-%d"))
+
+    def _index(self, date):
+        """ Index of date into the calendar, integer array for lists and arrays of dates """
+        if hasattr(date, "toordinal"):
+            i = date.toordinal() - self.origin
+            inside = 0 <= i < self.busday.size
+        else:
+            i = datetime64(date).astype(np.int64) + (EPOCH_ORDINAL - self.origin)
+            inside = np.all((i >= 0) & (i < self.busday.size))
+        if not inside:
+            raise ValueError("Date %s out of the calendar range %s" % (date, self._range()))
+        return i
+
+    def _date(self, date, i, k):
+        """
+        Date of the k-th business day, date is the day i. The type and
+        the time of the day of a date object are kept, datetime64 otherwise.
+        """
+        if not np.all((k >= 0) & (k < self.days.size)):
+            raise ValueError("Business day out of the calendar range %s" % self._range())
+        if np.ndim(k) == 0 and hasattr(date, "toordinal"):
+            return date + timedelta(days=int(self.days[k]) - i)
+        return (self.days[k] + (self.origin - EPOCH_ORDINAL)).astype("M8[D]")[()]
+
+    def isbusday(self, date):
+        """ True if date is a business day, boolean array for arrays of dates """
+        busday = self.busday[self._index(date)]
+        return bool(busday) if np.ndim(busday) == 0 else busday
+
+    def daysbus(self, date1, date2):
+        """
+        Number of business days between date1 and date2, both included,
+        negative if date2 is before date1. The dates may be arrays (broadcast).
+        """
+        i1 = self._index(date1)
+        i2 = self._index(date2)
+        if np.ndim(i1) == 0 and np.ndim(i2) == 0:
+            if i1 <= i2:
+                return int(self.count[i2 + 1] - self.count[i1])
+            return -int(self.count[i1 + 1] - self.count[i2])
+        return np.where(i1 <= i2, self.count[i2 + 1] - self.count[i1], self.count[i2] - self.count[i1 + 1])
+
+    def daysaddbu(self, date, business_days):
+        """
+        Date business_days business days after date (before if negative),
+        date and business_days may be arrays (broadcast)
+        """
+        i = self._index(date)
+        if np.ndim(i) == 0 and np.ndim(business_days) == 0:
+            if business_days > 0:
+                return self._date(date, i, self.count[i + 1] + business_days - 1)
+            elif business_days < 0:
+                return self._date(date, i, self.count[i] + business_days)
+            return date if hasattr(date, "toordinal") else datetime64(date)[()]
+
+        i, n = np.broadcast_arrays(i, np.asarray(business_days, dtype=np.int64))
+        k = np.where(n > 0, self.count[i + 1] + n - 1, self.count[i] + n)
+        # Zero business days is the date itself, a business day or not
+        k = np.where(n == 0, 0, k)
+        dates = self._date(None, i, k)
+        return np.where(n == 0, datetime64(date), dates)
+
+    def nextbusday(self, date):
+        """ First business day on or after date """
+        i = self._index(date)
+        return self._date(date, i, self.count[i])
+
+    def prevbusday(self, date):
+        """ Last business day on or before date """
+        i = self._index(date)
+        return self._date(date, i, self.count[i + 1] - 1)
+
+
+# Calendars are built on the first use
+__calendar_holidays = {}
+calendars = {}
+
+
+def register_calendar(name, holidays=(), **options):
+    """
+    Register a named business days calendar
+
+    :param name:     Name of the calendar
+    :param holidays: List of holidays or a BusinessCalendar object
+    :param options:  start, end and weekends of BusinessCalendar
+    """
+    calendars.pop(name, None)
+    if isinstance(holidays, BusinessCalendar):
+        calendars[name] = holidays
+    else:
+        __calendar_holidays[name] = (list(holidays), options)
+
+
+def get_calendar(name="brazil"):
+    """
+    Get a business days calendar by name
+
+    :param name: Name of a registered calendar, "brazil" or "weekends" (no holidays)
+    :rtype:      BusinessCalendar
+    """
+    if name not in calendars:
+        if name not in __calendar_holidays:
+            raise ValueError("Unknown calendar %r, calendars: %s" % (name, ", ".join(sorted(calendar_names()))))
+        holidays, options = __calendar_holidays[name]
+        calendars[name] = BusinessCalendar(holidays, name=name, **options)
+    return calendars[name]
+
+
+def calendar_names():
+    """ Names of the registered calendars """
+    return sorted(set(calendars) | set(__calendar_holidays))
+
+
+register_calendar("brazil", brazil_holydays)
+register_calendar("weekends")
+
+
+def _calendar(holydays, *dates):
+    """
+    Calendar of the holydays argument, None for a plain list of holydays
+    and single dates
+    """
+    if holydays is brazil_holydays:
+        return get_calendar("brazil")
+    if isinstance(holydays, BusinessCalendar):
+        return holydays
+    if isinstance(holydays, str):
+        return get_calendar(holydays)
+    if not _scalar(*dates):
+        return BusinessCalendar(holydays)
+    return None
 
 
 def daysbus(date1, date2, holydays=brazil_holydays):
+    """
+    Number of business days between two dates, both included
+
+    :param date1:    Start date, or list or array of dates
+    :param date2:    End date, or list or array of dates
+    :param holydays: List of holydays, calendar name or BusinessCalendar,
+                     default Brazil bank holydays
+    :return:         Number of business days, integer array for arrays of dates
+    """
+    calendar = _calendar(holydays, date1, date2)
+    if calendar is not None:
+        return calendar.daysbus(date1, date2)
     return networkdays(date1, date2, holydays)
 
 
 def isbusday(date, holydays=brazil_holydays):
-    #print dict(date=date, week=date.isoweekday())
+    """
+    Test if a date is a business day
+
+    :param date:     datetime.datetime
+    :param holydays: List of holydays, calendar name or BusinessCalendar,
+                     default Brazil bank holydays
+    """
+    calendar = _calendar(holydays, date)
+    if calendar is not None:
+        return calendar.isbusday(date)
 
     if date.isoweekday() in [6, 7] or date in holydays:
         return False
     else:
         return True
 
-        #return date.weekday() not in [5, 6] and date not in holydays
-
 
-def nextbusday(date):
+def nextbusday(date, holydays=brazil_holydays):
     """
     Get the first business day after some date,
     if the date is as business day returns the date.
 
     :param date:
+    :param holydays: List of holydays, calendar name or BusinessCalendar
     :return:
     """
+    calendar = _calendar(holydays, date)
+    if calendar is not None:
+        return calendar.nextbusday(date)
+
     nextdate = date
 
     while True:
 
-        if isbusday(nextdate):
+        if isbusday(nextdate, holydays):
             return nextdate
-        nextdate = daysadd(nextdate, 1)
+        nextdate = nextdate + timedelta(days=1)
 
 
-def daysaddbu(date, business_days):
+def daysaddbu(date, business_days, holydays=brazil_holydays):
     """
     :param date:
     :param business_days:
+    :param holydays: List of holydays, calendar name or BusinessCalendar
     :return:
     """
+    calendar = _calendar(holydays, date, business_days)
+    if calendar is not None:
+        return calendar.daysaddbu(date, business_days)
 
     nextdate = date
     counter = 0
@@ -713,37 +1144,36 @@ def daysaddbu(date, business_days):
     else:
         return date
 
-    #print "sign = ", sign
-
     while True:
 
-        #print nextdate, counter, isbusday(nextdate)
-
         nextdate = nextdate + sign * timedelta(days=1)
-        if isbusday(nextdate):
+        if isbusday(nextdate, holydays):
             counter += sign
 
         if counter == business_days:
             return nextdate
 
-            #raw_input(">>")
-
 
-def prevbusday(date):
+def prevbusday(date, holydays=brazil_holydays):
     """
     Get the first business day before some date,
     if the date is as business day returns the date.
 
     :param date:
+    :param holydays: List of holydays, calendar name or BusinessCalendar
     :return:
     """
+    calendar = _calendar(holydays, date)
+    if calendar is not None:
+        return calendar.prevbusday(date)
+
     nextdate = date
 
     while True:
 
-        if isbusday(nextdate):
+        if isbusday(nextdate, holydays):
             return nextdate
-        nextdate = daysadd(nextdate, -1)
+        nextdate = nextdate - timedelta(days=1)
 
 
 def daysdif(StartDate, EndDate, Basis=0):
@@ -754,11 +1184,13 @@ def daysdif(StartDate, EndDate, Basis=0):
     :param Basis:
     :return:
 
-    StartDate	Enter as serial date numbers or date strings.
-    EndDate	Enter as serial date numbers or date strings.
+    StartDate	Enter as date objects, date strings, numpy.datetime64 or
+                lists or arrays of them
+    EndDate	Enter as date objects, date strings, numpy.datetime64 or
+                lists or arrays of them
 
 
-    Basis	"(Optional) Day-count basis of the instrument. A vector
+    Basis	"(Optional) Day-count basis of the instrument.
         0 = actual/actual (default)
         1 = 30/360 (SIA)                United States
         2 = actual/360
@@ -773,13 +1205,19 @@ def daysdif(StartDate, EndDate, Basis=0):
         11 = 30/360E (ISMA)
         12 = actual/365 (ISDA)
         13 = BUS/252                    Brazil Government Bonds
+
+    The number of days is an integer for single dates and an integer array
+    for lists and arrays of dates (broadcast):
+
+        >>> from m2py.finance import dtime as dt
+        >>> dt.daysdif("2014-01-31", ["2014-02-28", "2014-03-31"], 1)
+        array([28, 60])
     """
-    date1 = Date(StartDate)
-    date2 = Date(EndDate)
-    day_counting = daysdif.convention_list[str(Basis)]
+    if str(Basis) not in daysdif.convention_list:
+        raise ValueError("Invalid day count basis %r, valid: 0 to 13" % (Basis,))
 
-    ndays = day_counting(date1, date2)
-    return ndays
+    day_counting = daysdif.convention_list[str(Basis)]
+    return day_counting(StartDate, EndDate)
 
 
 daysdif.convention_list = {
@@ -802,7 +1240,30 @@ daysdif.convention_list = {
 }
 
 
-def yearfrac(StartDate, EndDate, Basis):
+def _yearfrac_actual(StartDate, EndDate):
+    """
+    Actual/actual year fraction, the days in every calendar year
+    are divided by the length of the year, 365 or 366.
+    """
+    d1 = datetime64(StartDate)
+    d2 = datetime64(EndDate)
+    sign = np.where(d2 < d1, -1.0, 1.0)
+    d1, d2 = np.minimum(d1, d2), np.maximum(d1, d2)
+
+    Y1 = d1.astype("M8[Y]")
+    Y2 = d2.astype("M8[Y]")
+    year1 = Y1.astype(int) + 1970
+    year2 = Y2.astype(int) + 1970
+
+    # Rest of the first year + whole years between + days of the last year
+    f = ((Y1 + 1).astype("M8[D]") - d1).astype(int) / (365.0 + _isleap(year1)) \
+        + (year2 - year1 - 1) \
+        + (d2 - Y2.astype("M8[D]")).astype(int) / (365.0 + _isleap(year2))
+
+    return _result(sign * f, _scalar(StartDate, EndDate))
+
+
+def yearfrac(StartDate, EndDate, Basis=0):
     """
 
     :param StartDate:
@@ -810,11 +1271,13 @@ def yearfrac(StartDate, EndDate, Basis):
     :param Basis:
     :return:
 
-    StartDate	Enter as serial date numbers or date strings.
-    EndDate	Enter as serial date numbers or date strings.
+    StartDate	Enter as date objects, date strings, numpy.datetime64 or
+                lists or arrays of them
+    EndDate	Enter as date objects, date strings, numpy.datetime64 or
+                lists or arrays of them
 
 
-    Basis	"(Optional) Day-count basis of the instrument. A vector
+    Basis	"(Optional) Day-count basis of the instrument.
         0 = actual/actual (default)
         1 = 30/360 (SIA)                United States
         2 = actual/360
@@ -830,13 +1293,28 @@ def yearfrac(StartDate, EndDate, Basis):
         12 = actual/365 (ISDA)
         13 = BUS/252                    Brazil Government Bonds
 
+    The year fractions of a whole schedule are computed in a single call:
+
+        >>> from m2py.finance import dtime as dt
+        >>> dt.yearfrac("2014-01-01", ["2014-07-01", "2015-01-01"], 2)
+        array([0.50277778, 1.01388889])
+
     Reference: http://www.mathworks.com/help/finance/yearfrac.html
     """
-    denom = yearfrac.denominators[str(Basis)]
+    if str(Basis) in yearfrac.actual_actual:
+        return _yearfrac_actual(StartDate, EndDate)
+
+    denom = yearfrac.denominators.get(str(Basis))
+    if denom is None:
+        raise ValueError("Invalid day count basis %r, valid: 0 to 13" % (Basis,))
+
     Ndays = daysdif(StartDate, EndDate, Basis)
     return Ndays / denom
 
 
+# Fraction of the calendar years
+yearfrac.actual_actual = ('0', '8')
+
 yearfrac.denominators = {
     # 360 days
     '1': 360.0,
@@ -868,8 +1346,7 @@ def daysadd(StartDate, NumDays, Basis=0):
 
     Reference: http://www.mathworks.com/help/finance/daysadd.html
     """
-    #print StartDate
-    return StartDate + datetime.timedelta(days=NumDays)
+    return StartDate + timedelta(days=NumDays)
 
 
 def date2offset_bu(datelst):
@@ -879,15 +1356,11 @@ def date2offset_bu(datelst):
     :param datelst: List of datetime.datetime objects [ d0, d1, d2, d3 .... , dn ]
     :return: List of date intervals [ 0, d1-d0, d2-d0, d3 - d0, ..., dn - d0]
     """
-    zerodate = datelst[0]
-    timevector = [daysbus(zerodate, d) for d in datelst]
-    return timevector
+    return daysbus(datelst[0], datelst).tolist()
 
 
 def date2ofsset(datelst):
-    zerodate = datelst[0]
-    timevector = [days_actual(zerodate, d) for d in datelst]
-    return timevector
+    return days_actual(datelst[0], datelst).tolist()
 
 
 def date_range(date1, date2):
@@ -17,7 +17,10 @@ http://www.quantcode.com/modules/mydownloads/viewcat.php?cid=9&min=120&orderby=d
 
 from math import exp
 import datetime
-from m2py.numerical.roots import nraphson
+
+import numpy
+
+from m2py.numerical.roots import nraphson, vbracket, vnraphson
 
 
 __all__ = ['effrr', 'pvfix', 'fvfix', 'pvvar', 'irr', 'fvvar', 'xirr']
@@ -337,34 +340,55 @@ def fvfix(Rate, NumPeriods, Payment, PresentVal=0, Due=0):
     return FV
 
 
-def __pvvar(CashFlow, Rate, CFDates=[], format=r"%m/%d/%Y", ndays=365):
-    """ Auxiliary pvvar function """
+def _cashflows(CashFlow, CFDates=None, format=r"%m/%d/%Y", ndays=365):
+    """
+    Cash flow matrix and the time of every cash flow in years
 
-    # print format
-    PV = 0
-    i = Rate
+    :return: (cf, t, vector) float arrays of rows periods and columns
+             streams, t from the first cash flow of each stream, vector is
+             True for a single stream
+    """
+    cf = numpy.asarray(CashFlow, dtype=float)
+    vector = cf.ndim == 1
+    if vector:
+        cf = cf[:, None]
+    if cf.ndim != 2 or not cf.shape[0]:
+        raise ValueError("CashFlow must be a vector or a matrix of cash flows")
 
-    dt = lambda s: datetime.datetime.strptime(s, format)
-    dates = list(map(dt, CFDates))
-    # dates = [datetime.datetime.strptime(s, format) for s in CFDates]
+    if CFDates is None or not len(CFDates):
+        t = numpy.arange(cf.shape[0], dtype=float)[:, None]
+        return cf, numpy.broadcast_to(t, cf.shape), vector
 
+    from m2py.finance import dtime
 
-    if not CFDates:
+    dates = numpy.asarray(CFDates)
+    if dates.dtype.kind in "US":
+        dates = dtime.parse_dates(dates.astype(str).ravel(), format, asarray=True).reshape(dates.shape)
+    dates = dtime.datetime64(dates)
+    if dates.ndim == 1:
+        dates = dates[:, None]
+    if dates.shape[0] != cf.shape[0] or dates.shape[1] not in (1, cf.shape[1]):
+        raise ValueError("CFDates must have the rows of CashFlow, shape %s, not %s" %
+                         (cf.shape, dates.shape))
 
-        for n, c in enumerate(CashFlow):
-            PV = PV + c / (1 + i) ** n
+    t = (dates - dates[0]).astype(float) / ndays
+    return cf, numpy.broadcast_to(t, cf.shape), vector
 
-    else:
-        d0 = dates[0]
 
-        for c, date in zip(CashFlow[1:], dates[1:]):
-            np = (date - d0).days / ndays
-            PV = PV + c * 1 / (1 + i) ** np
+def _rates(Rate, vector):
+    """ Rate array broadcasting against the streams, a list of rates of a single stream on the first axis """
+    rate = numpy.asarray(Rate, dtype=float)
+    if vector or not rate.ndim:
+        rate = rate[..., None]
+    return rate[..., None, :]
 
-        PV = PV + CashFlow[0]
 
-    # print "PV = ", PV
-    return PV
+def _value(cf, vector):
+    """ Python number or list of a single stream, array of streams """
+    if vector:
+        cf = cf[..., 0]
+        return cf.tolist() if cf.ndim else float(cf)
+    return cf
 
 
 def pvvar(CashFlow, Rate, CFDates=[], format=r"%m/%d/%Y", ndays=365):
@@ -386,6 +410,9 @@ def pvvar(CashFlow, Rate, CFDates=[], format=r"%m/%d/%Y", ndays=365):
     a scalar Rate is allowed when the same rate applies to all cash-flow streams i
     n CashFlow. When multiple cash-flow streams require different discount rates, 
     Rate must be a vector whose length equals the number of columns in CashFlow.
+    A matrix of rates, rows of rates and columns of streams, values all the
+    streams at many rates at once. A list of rates of a single cash flow vector
+    returns the list of present values.
      
     CFDates
     Optional) A vector of serial date numbers or date strings on which the cash flows occur. 
@@ -394,8 +421,12 @@ def pvvar(CashFlow, Rate, CFDates=[], format=r"%m/%d/%Y", ndays=365):
     cash-flow streams share the same dates, CFDates can be a vector whose length matches the 
     number of rows in CashFlow. When different cash-flow streams have different payment dates, 
     specify CFDates as a matrix the same size as CashFlow.
+    The dates are date strings in format, datetime objects or a numpy
+    datetime64 array, which is not parsed again.
         
-    
+    The present values are computed for all the rates and streams at once
+    with numpy broadcasting, the result is a number or a list for a single
+    stream and an array of the streams (rates by streams) for a matrix.
     
     This cash flow represents the yearly income from an initial investment of $10,000. The annual interest rate is 8%.
 
@@ -430,24 +461,28 @@ def pvvar(CashFlow, Rate, CFDates=[], format=r"%m/%d/%Y", ndays=365):
         >> CFDates = ['1/12/1987', '2/14/1988', '3/03/1988', '6/14/1988', '12/1/1988'] ;
         >> PresentVal = pvvar(CashFlow, [0.07, 0.09, 0.11], CFDates)
         PresentVal = [419.0136433133739, 142.16480472687726, -122.12751414382365]
+
+    Example3: Two streams, each one at its own rate
+
+        >> pvvar([[-10000, -5000], [2000, 3000], [1500, 3000]], [0.08, 0.10])
+        array([-6862.1399177 ,   206.61157025])
     
     Ref: http://www.mathworks.com/help/finance/pvvar.html
     """
-
-    if isinstance(Rate, list):
-        PV = lambda r: __pvvar(CashFlow, r, CFDates, format, ndays)
-        pv = list(map(PV, Rate))
-    else:
-        pv = __pvvar(CashFlow, Rate, CFDates, format, ndays)
-    return pv
+    cf, t, vector = _cashflows(CashFlow, CFDates, format, ndays)
+    rate = _rates(Rate, vector)
+    pv = numpy.sum(cf * (1 + rate) ** -t, axis=-2)
+    return _value(pv, vector)
 
 
 def irr(CashFlow, all=False):
     """
     irr - Internal Rate of Return
     
-    :param CashFlow: A list with the cash flow stream
-    :return: A list containing the internal rate of return 
+    :param CashFlow: A list with the cash flow stream, or a matrix with
+                     a stream in each column
+    :return: A list containing the internal rate of return, a list of
+             them for each column of a matrix
     
     Example:
     
@@ -459,12 +494,15 @@ def irr(CashFlow, all=False):
     from numpy.polynomial import Polynomial as P
     from numpy import isreal
 
+    if numpy.ndim(CashFlow) == 2:
+        return [irr(c, all) for c in numpy.asarray(CashFlow, dtype=float).T]
+
     roots = P(CashFlow).roots()
     # roots = [float(r) for r in roots if isreal(r)]
 
     if not all:
         roots = [r for r in roots if isreal(r) and r > 0]
-        roots = list(map(float, roots))
+        roots = [float(r.real) for r in roots]
 
     r2i = lambda r: 1 / r - 1
 
@@ -479,14 +517,18 @@ def fvvar(CashFlow, Rate, CFDates=[], format=r"%m/%d/%Y", ndays=365):
     
     CashFlow    "A vector of varying cash flows. Include the initial investment
                 as the initial cash flow value (a negative number)."
+                A matrix has a stream in each column.
     
     Rate        Periodic interest rate. Enter as a decimal fraction.
+                Rates of the streams and lists of rates as pvvar.
     
     CFDates     "(Optional) For irregular (nonperiodic) cash flows, a
                 vector of dates on which the cash flows occur. Enter dates as serial
                 date numbers or date strings. Default assumes CashFlow contains
                 regular (periodic) cash flows."
-    
+                A matrix of the dates of each stream as pvvar.
+
+    The cash flows are compounded to the date of the last one.
     
     Cash Flow   Dates
     ($10000)    January 12, 2000
@@ -495,47 +537,14 @@ def fvvar(CashFlow, Rate, CFDates=[], format=r"%m/%d/%Y", ndays=365):
     $3000       June 14, 2001
     $4000       December 1, 2001
 
+    >> fvvar([-10000, 2500, 2000, 3000, 4000], 0.09,
+             ['01/12/2000', '02/14/2001', '03/03/2001', '06/14/2001', '12/01/2001'])
+    166.6466796446116
     """
-    # print format
-    FV = 0
-    i = Rate
-    q = 1
-
-    dt = lambda s: datetime.datetime.strptime(s, format)
-    dates = list(map(dt, CFDates))
-    # dates = [datetime.datetime.strptime(s, format) for s in CFDates]
-
-    if not CFDates:
-
-        CashFlow.reverse()
-
-        for n, c in enumerate(CashFlow):
-            FV += c * q
-            q *= 1 + Rate
-
-    else:
-
-        dates.reverse()
-        CashFlow.reverse()
-
-        dend = dates[0]
-
-        print("dend = ", dend)
-
-        for c, date in zip(CashFlow, dates):
-            dt = dend - date
-            np = dt.days / ndays
-
-            FV = FV + c * (1 + i) ** np
-
-            print("c = ", c, " date = ", date, " dt = ", dt, "np = ", np, " FV = ", FV)
-
-            # FV = FV + CashFlow[0]
-            # np = (dates[0] - dates[-1]).days/ndays
-            # FV = FV + CashFlow[0]*(1+i)**np
-
-    # print "PV = ", PV
-    return FV
+    cf, t, vector = _cashflows(CashFlow, CFDates, format, ndays)
+    rate = _rates(Rate, vector)
+    fv = numpy.sum(cf * (1 + rate) ** (t[-1] - t), axis=-2)
+    return _value(fv, vector)
 
 
 # CashFlow = [-10000, 2500, 2000, 3000, 4000];
@@ -563,53 +572,68 @@ def expsum(x, coefficient, powers):
     return S
 
 
-def xirr(CashFlow, CFDates, ndays=365, format=r"%m/%d/%Y", guess=1.0):
+def expsum_roots(coefficients, powers, guess=1.0, tol=1e-12, maxit=200):
     """
+    Roots x of expsum of every column, many equations at once
 
-    :param CashFlow:        A list containing the cash flow
-    :param CashFlowDates:   A list containing the dates
-    :param ndays:           Number of days in a year
-    :param format:          Date format [default: "%m/%d/%Y"]
-    :param guess:           Initial guess to Newton Raphson method (default 2)
-    :return:                Internal rate of return for a schedule of nonperiodic cash flows.
+        sum(coefficients[:, j] * x ** powers[:, j]) = 0
 
-    Example:
-        >>> CashFlow = [-10000, 2500, 2000, 3000, 4000]
-        >>> CFDates = ['01/12/2007', '02/14/2008', '03/03/2008', '06/14/2008', '12/01/2008']
-        >>> Return = xirr(CashFlow, CFDates)
-        >>> print 100*Return
-        10.0643783426
+    The root is bracketed by an interval around the guess that grows until
+    the sign changes, roots.vbracket, and found by the bracketed Newton
+    iteration of roots.vnraphson. The roots of a previous solve of similar
+    equations are a warm start, the brackets are narrow and the iterations
+    few.
 
+    :param coefficients: Matrix of coefficients, a column for each equation
+    :param powers:       Matrix of expoents >= 0, same shape
+    :param guess:        Initial guess > 0, a number or one for each column
+    :param tol:          Relative tolerance of x
+    :param maxit:        Maximum number of iterations
+    :return:             Array of the roots, NaN for the columns without a
+                         sign change
     """
+    cf = numpy.asarray(coefficients, dtype=float)
+    t = numpy.asarray(powers, dtype=float)
+    f = lambda x: numpy.sum(cf * x ** t, axis=0)
 
-    dt = lambda s: datetime.datetime.strptime(s, format)
-    dates = list(map(dt, CFDates))
-    coefs = CashFlow
+    n = cf.shape[1]
+    lo, hi = vbracket(f, guess * numpy.ones(n), lower=0.0)
 
-    d0 = dates[0]
+    df = lambda x: numpy.sum(cf * t * x ** t, axis=0) / x
+    x, _, _ = vnraphson(f, df, guess * numpy.ones(n), tol, maxit, lo, hi)
+    return x
 
-    cashflow_exponents = []
 
-    for d, c in zip(dates, CashFlow):
-        dt = d - d0
-        np = dt.days / ndays
-        # print "d =", d, "c =", c, " dt = ", dt.days, "np = ", np
-        cashflow_exponents.append(np)
+def xirr(CashFlow, CFDates, ndays=365, format=r"%m/%d/%Y", guess=1.0):
+    """
 
-    d_cashflow_exponents = [np - 1 for np in cashflow_exponents[1:]]
-    d_coefs = [c * np for c, np in zip(coefs[1:], cashflow_exponents[1:])]
+    :param CashFlow:        A list containing the cash flow, or a matrix
+                            with a stream in each column
+    :param CashFlowDates:   A list containing the dates, or a matrix with
+                            the dates of each stream
+    :param ndays:           Number of days in a year
+    :param format:          Date format [default: "%m/%d/%Y"]
+    :param guess:           Initial guess of x = 1/(1 + rate) (default 1)
+    :return:                Internal rate of return for a schedule of nonperiodic cash flows,
+                            an array of the rates of the streams of a matrix,
+                            NaN for a stream without a sign change
 
-    # print "coefs ", coefs
-    # print "cashflow_exponents ", cashflow_exponents
-    # print "d_coefs", d_coefs
-    # print "d_cashflow_exponents", d_cashflow_exponents
+    All the streams are solved at once by Newton steps safeguarded by a
+    bracket of the root.
 
-    f = lambda x: expsum(x, coefs, cashflow_exponents)
-    df = lambda x: expsum(x, d_coefs, d_cashflow_exponents)
+    Example:
+        >>> CashFlow = [-10000, 2500, 2000, 3000, 4000]
+        >>> CFDates = ['01/12/2007', '02/14/2008', '03/03/2008', '06/14/2008', '12/01/2008']
+        >>> Return = xirr(CashFlow, CFDates)
+        >>> print(100*Return)
+        10.0643783426
 
-    x, _, _ = nraphson(f, df, guess)
-    i = 1 / x - 1
-    return i
+    """
+    cf, t, vector = _cashflows(CashFlow, CFDates, format, ndays)
+    x = expsum_roots(cf, t, guess)
+    with numpy.errstate(divide="ignore"):
+        i = 1 / x - 1
+    return _value(i, vector)
 
 
 def payper(Rate, NumPeriods, PresentValue, FutureValue, Due):
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Rolling window statistics of arrays in O(n)
+
+The windows of length w end at every element, the first w - 1 results
+are not a number:
+
+    rolling_sum([1, 2, 3, 4], 2)  ->  [nan, 3, 5, 7]
+
+The sums, products, minimums and maximums are computed by the van Herk /
+Gil-Werman algorithm: the array is split into blocks of w elements, the
+prefix and suffix accumulations of every block are computed once and a
+window, which spans at most two blocks, is the suffix of the first block
+combined with the prefix of the second one. It is O(n) for any window,
+vectorized, and the sums don't accumulate rounding errors over the whole
+array like a difference of cumulative sums.
+
+A window with a NaN is NaN.
+"""
+import numpy
+
+
+def _window(window):
+    if int(window) != window or window < 1:
+        raise ValueError("The window must be a positive integer, not %r" % (window,))
+    return int(window)
+
+
+def _reduce(x, window, ufunc):
+    """ ufunc reduction of every window of x, float array of len(x) """
+    x = numpy.asarray(x, dtype=float)
+    n = x.size
+    w = _window(window)
+    out = numpy.full(n, numpy.nan)
+    if w > n:
+        return out
+
+    # Blocks of w elements, the last one padded
+    blocks = numpy.zeros(-(-n // w) * w)
+    blocks[:n] = x
+    blocks = blocks.reshape(-1, w)
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    i = numpy.arange(n - w + 1)
+    j = i + w - 1
+    # A window starting at a block is the whole block
+    out[w - 1:] = numpy.where(i % w == 0, suffix[i], ufunc(suffix[i], prefix[j]))
+    return out
+
+
+def rolling_sum(x, window):
+    """ Sum of the last window elements """
+    return _reduce(x, window, numpy.add)
+
+
+def rolling_prod(x, window):
+    """ Product of the last window elements, compounded factors """
+    return _reduce(x, window, numpy.multiply)
+
+
+def rolling_min(x, window):
+    """ Minimum of the last window elements """
+    return _reduce(x, window, numpy.minimum)
+
+
+def rolling_max(x, window):
+    """ Maximum of the last window elements """
+    return _reduce(x, window, numpy.maximum)
+
+
+def rolling_mean(x, window):
+    """ Mean of the last window elements """
+    return rolling_sum(x, window) / _window(window)
+
+
+def rolling_std(x, window, ddof=1):
+    """
+    Standard deviation of the last window elements
+
+    :param ddof: Delta degrees of freedom, the divisor is window - ddof,
+                 1 the sample standard deviation (default)
+    """
+    x = numpy.asarray(x, dtype=float)
+    w = _window(window)
+    if w - ddof <= 0:
+        return numpy.full(x.size, numpy.nan)
+
+    # Centered values, the sums of squares don't cancel out
+    finite = numpy.isfinite(x)
+    d = x - (x[finite].mean() if finite.any() else 0.0)
+
+    s1 = rolling_sum(d, w)
+    s2 = rolling_sum(d * d, w)
+    var = (s2 - s1 * s1 / w) / (w - ddof)
+    return numpy.sqrt(numpy.maximum(var, 0.0))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Coupon schedules of bonds, generated once and cached
+
+A schedule is every coupon date of a bond up to its maturity, it depends
+only on the maturity, the frequency and the convention, not on the
+settle date. The schedules are cached (bounded by SCHEDULE_CACHE_SIZE)
+and the coupons after a settle date are a slice of the schedule found
+by bisection, pricing the same bond on many settle dates doesn't build
+the schedule again.
+
+Conventions:
+
+    brazil              The 01/01 and 01/07 grid of the Brazilian bonds, the
+                        first day of the months 1, 1 + 12/frequency ...
+    backward            Stepped back from the maturity by 12/frequency
+                        months, the day clipped to the end of the month
+    following           backward, on the next business day
+    modified_following  backward, on the next business day unless it is in
+                        the next month, then on the previous one
+    preceding           backward, on the previous business day
+
+Example:
+
+    >>> from m2py.finance import schedule
+    >>> schedule.coupons("09/01/2004", "01/01/2008")
+    array(['2004-07-01', '2005-01-01', '2005-07-01', '2006-01-01',
+           '2006-07-01', '2007-01-01', '2007-07-01', '2008-01-01'],
+          dtype='datetime64[D]')
+"""
+from functools import lru_cache
+
+import numpy
+
+from m2py.finance import dtime
+
+# Maximum number of cached schedules
+SCHEDULE_CACHE_SIZE = 4096
+
+# The schedules start after FIRST_DATE
+FIRST_DATE = numpy.datetime64("1900-01-01")
+
+conventions = ("brazil", "backward", "following", "modified_following", "preceding")
+
+
+def _date(date):
+    """ datetime64[D] of a date, strings in dd/mm/yyyy format """
+    if isinstance(date, str):
+        return dtime.parse_dates([date], "%d/%m/%Y", asarray=True)[0].astype("M8[D]")
+    return dtime.datetime64(date)
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _schedule(maturity, frequency, convention, calendar):
+    maturity = numpy.datetime64(maturity, "D")
+    months = 12 // frequency
+    month = maturity.astype("M8[M]")
+
+    if convention == "brazil":
+        # The grid months of the year, the last one not after the maturity
+        start = month.astype("M8[Y]").astype("M8[M]")
+        last = start + ((month - start).astype(int) // months) * months
+        if last.astype("M8[D]") > maturity:
+            last -= months
+        dates = (last - months * numpy.arange(0, _count(last, months))).astype("M8[D]")[::-1]
+        return _readonly(dates[dates > FIRST_DATE])
+
+    # Back from the maturity, the same day or the end of the month
+    day = (maturity - month.astype("M8[D]")).astype(int)
+    back = month - months * numpy.arange(_count(month, months))[::-1]
+    end = (back + 1).astype("M8[D]") - 1
+    dates = numpy.minimum(back.astype("M8[D]") + day, end)
+    dates = dates[dates > FIRST_DATE]
+
+    if convention == "backward":
+        return _readonly(dates)
+
+    cal = dtime.get_calendar(calendar)
+    if convention == "following":
+        dates = cal.nextbusday(dates)
+    elif convention == "preceding":
+        dates = cal.prevbusday(dates)
+    else:
+        following = cal.nextbusday(dates)
+        same = following.astype("M8[M]") == dates.astype("M8[M]")
+        dates = numpy.where(same, following, cal.prevbusday(dates))
+    return _readonly(dates)
+
+
+def _count(month, months):
+    """ Number of periods of months from FIRST_DATE to month """
+    return (month - FIRST_DATE.astype("M8[M]")).astype(int) // months + 1
+
+
+def _readonly(dates):
+    dates = numpy.ascontiguousarray(dates, dtype="M8[D]")
+    dates.flags.writeable = False
+    return dates
+
+
+def coupon_dates(maturity, frequency=2, convention="brazil", calendar="brazil"):
+    """
+    All the coupon dates of a bond up to its maturity, cached
+
+    :param maturity:   Maturity date, dd/mm/yyyy string, datetime or datetime64
+    :param frequency:  Coupons per year, a divisor of 12 [default: 2]
+    :param convention: Convention of the dates, see conventions [default: brazil]
+    :param calendar:   Calendar of the business day conventions, see dtime.get_calendar
+    :return:           Sorted read-only datetime64[D] array shared by the
+                       calls with the same arguments
+    """
+    if frequency not in (1, 2, 3, 4, 6, 12):
+        raise ValueError("The frequency must be a divisor of 12, not %r" % (frequency,))
+    if convention not in conventions:
+        raise ValueError("Unknown convention %r, conventions: %s" % (convention, ", ".join(conventions)))
+    return _schedule(str(_date(maturity)), frequency, convention, calendar)
+
+
+def coupons(settle, maturity, frequency=2, convention="brazil", calendar="brazil"):
+    """
+    Coupon dates after the settle date and up to the maturity, a view of
+    the cached schedule
+
+    :param settle:     Settle date
+    :param maturity:   Maturity date
+    :return:           Read-only datetime64[D] array
+    """
+    dates = coupon_dates(maturity, frequency, convention, calendar)
+    maturity = _date(maturity)
+    start = numpy.searchsorted(dates, _date(settle), side="right")
+    end = numpy.searchsorted(dates, maturity, side="right")
+    return dates[start:end]
+
+
+def cache_info():
+    """ Hits, misses and size of the cache of schedules, see functools.lru_cache """
+    return _schedule.cache_info()
+
+
+def cache_clear():
+    _schedule.cache_clear()
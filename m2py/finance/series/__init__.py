@@ -8,17 +8,30 @@ For while there is only Brazilian financial time series.
 """
 import m2py.utils as __utils__
 import os as __os__
-
-from m2py.finance.timeserie import plot_against
-
-from . import ipea
+from importlib import import_module as __import_module__
 
 __thisdir = __utils__.this_dir()
 datadir = datasets_dir = __utils__.resource_path("datasets")
-datafiles = __os__.listdir(datadir)
+datafiles = sorted(d for d in __os__.listdir(datadir) if d.endswith(".csv"))
 datasets = [d.split(".")[0] for d in datafiles]
 
 
+def __getattr__(name):
+    """
+    Submodules and timeserie.plot_against are imported on the first access,
+    timeserie pulls matplotlib.
+    """
+    if name == "ipea":
+        value = __import_module__(".ipea", __name__)
+    elif name == "plot_against":
+        from m2py.finance.timeserie import plot_against as value
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    globals()[name] = value
+    return value
+
+
 def __dataset_path(dataset):
     return __os__.path.join(__os__.path.join(__thisdir, "datasets", dataset))
 
@@ -41,7 +54,28 @@ def list_data():
     print()
 
 
-def update_dataset(dataset):
+def update_dataset(dataset, full=False):
+    """
+    Update a builtin dataset
+
+    The observations after the last one of the dataset are fetched and
+    appended, see m2py.finance.series.updater. The whole history is
+    downloaded again by the script update_scripts/update_<dataset>.py
+    if full is True or the dataset has no fetcher.
+
+    :param dataset: Dataset name
+    :param full:    Rebuild the whole dataset
+    :return:        Number of new observations, None for a full update
+    """
+    from m2py.finance.series import updater
+
+    if not full and dataset in updater.fetchers:
+        n = updater.update(dataset)
+        if dataset in Dataset.__dict__:
+            # Loaded again on the next access
+            setattr(Dataset, dataset, _LazyDataset(dataset))
+        return n
+
     import sys
     import subprocess as s
     script = __os__.path.join(__thisdir, "update_scripts", "update_" + dataset + ".py")
@@ -90,17 +124,57 @@ def data():
         print(tabulate(out, tablefmt="plain"))
 
 
-def load(dataset):
+def load(dataset, cache=True, directory=None):
     """
     Return a timeserie Object
 
+    The csv file of the dataset is parsed once and saved as a columnar
+    binary file, datasets/<dataset>.tsb, mapped to memory by the next
+    loads while the csv file is unchanged.
+
+    :param dataset:   Dataset name, see datasets
+    :param cache:     Use and update the binary file
+    :param directory: Directory of the dataset files, default datasets_dir
     :return:
     """
     from m2py.finance.timeserie import Tserie
-    return Tserie.from_csv(__dataset_path(dataset + ".csv"))
+    from m2py.finance import tsfile
+
+    directory = datasets_dir if directory is None else directory
+    csvfile = __os__.path.join(directory, dataset + ".csv")
+    binfile = __os__.path.join(directory, dataset + ".tsb")
+    if not cache:
+        return Tserie.from_csv(csvfile)
+
+    source = tsfile.source_key(csvfile)
+    if tsfile.is_tsfile(binfile) and tsfile.read_header(binfile).get("source") == source:
+        return Tserie.from_bin(binfile)
+
+    serie = Tserie.from_csv(csvfile)
+    try:
+        serie.to_bin(binfile, source=source)
+    except (IOError, OSError):
+        # Read only installation
+        pass
+    return serie
+
+
+class _LazyDataset(object):
+    """
+    Dataset loaded by load() on the first access of the class attribute,
+    the Tserie replaces the descriptor afterwards.
+    """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    def __get__(self, obj, cls):
+        serie = load(self.dataset)
+        setattr(cls, self.dataset, serie)
+        return serie
 
 
 class Dataset:
 
-    selic = load("selic")
-    usd2brl = load("usd2brl")
+    selic = _LazyDataset("selic")
+    usd2brl = _LazyDataset("usd2brl")
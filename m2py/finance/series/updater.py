@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Incremental update of the builtin datasets
+
+Every dataset is the csv file datasets/<dataset>.csv and its binary copy
+datasets/<dataset>.tsb (see m2py.finance.tsfile). An update fetches only
+the observations from the last date of the dataset, checks that the
+observation of the last date is the same that is stored, and appends the
+new rows to the end of both files, the cost is proportional to the new
+data, not to the whole history.
+
+The observations are fetched by a fetcher registered for the dataset, a
+callable
+
+    fetcher(start_date, end_date, last) -> (dates, columns)
+
+    start_date  First date, datetime.datetime, the last date of the dataset
+    end_date    Last date, datetime.datetime
+    last        Last row of the dataset (time, value1, value2 ...), the
+                derived columns continue from it
+    dates       List of datetime.datetime of the observations
+    columns     List of the columns of the dataset, lists of values
+
+Example:
+
+    >>> from m2py.finance.series import updater
+    >>> updater.update("selic")
+    3
+    >>> updater.register_fetcher("usd2brl", my_fetcher)
+"""
+import csv
+import os
+
+import numpy
+
+from m2py.finance import dtime
+from m2py.finance import tsfile
+
+fetchers = {}
+
+# Relative tolerance of the values of the overlapping observation
+OVERLAP_RTOL = 1e-8
+
+
+def register_fetcher(dataset, fetcher):
+    """
+    Register the fetcher of a dataset
+
+    :param dataset: Dataset name
+    :param fetcher: Callable fetcher(start_date, end_date, last) -> (dates, columns)
+    """
+    fetchers[dataset] = fetcher
+
+
+def _append_csv(filename, dates, columns):
+    """ Append rows to a csv file of Tserie.to_csv """
+    with open(filename, "rb") as fp:
+        fp.seek(0, os.SEEK_END)
+        newline = fp.tell() == 0
+        if not newline:
+            fp.seek(-1, os.SEEK_END)
+            newline = fp.read(1) not in b"\r\n"
+
+    with open(filename, "a", newline="") as fp:
+        if newline:
+            fp.write("\r\n")
+        writer = csv.writer(fp)
+        for row in zip(numpy.datetime_as_string(dates, unit="D"), *columns):
+            writer.writerow([row[0]] + [repr(float(x)) for x in row[1:]])
+
+
+def update(dataset, end_date=None, fetcher=None, directory=None):
+    """
+    Append the new observations of a dataset
+
+    :param dataset:   Dataset name
+    :param end_date:  Last date to fetch, default today
+    :param fetcher:   Fetcher, default the registered fetcher of the dataset
+    :param directory: Directory of the dataset files, default series.datasets_dir
+    :return:          Number of new observations
+    """
+    from m2py.finance import series
+
+    if fetcher is None:
+        if dataset not in fetchers:
+            raise ValueError("No fetcher for the dataset %r" % dataset)
+        fetcher = fetchers[dataset]
+
+    directory = series.datasets_dir if directory is None else directory
+    csvfile = os.path.join(directory, dataset + ".csv")
+    binfile = os.path.join(directory, dataset + ".tsb")
+
+    # Binary copy up to date with the csv file
+    serie = series.load(dataset, directory=directory)
+    if not tsfile.is_tsfile(binfile) or tsfile.read_header(binfile).get("source") != tsfile.source_key(csvfile):
+        raise IOError("Can't write the binary file of %s" % dataset)
+
+    last = serie.end()
+    end_date = dtime.dtime("today") if end_date is None else dtime.dtime(end_date)
+
+    dates, columns = fetcher(last[0], end_date, last)
+    dates = dtime.datetime64(dates)
+    columns = [numpy.asarray(c, dtype=float) for c in columns]
+    if len(columns) != len(last) - 1 or any(len(c) != len(dates) for c in columns):
+        raise ValueError("The fetcher of %s returned %d columns, the dataset has %d" %
+                         (dataset, len(columns), len(last) - 1))
+
+    # The observation of the last date must be the same
+    last_date = dtime.datetime64(last[0])
+    overlap = numpy.flatnonzero(dates == last_date)
+    if overlap.size:
+        fetched = [float(c[overlap[0]]) for c in columns]
+        stored = [float(x) for x in last[1:]]
+        if not numpy.allclose(fetched, stored, rtol=OVERLAP_RTOL, atol=0):
+            raise ValueError("The observation of %s of %s changed from %s to %s, the dataset must be rebuilt" %
+                             (last_date, dataset, stored, fetched))
+
+    new = dates > last_date
+    dates = dates[new]
+    columns = [c[new] for c in columns]
+    if not dates.size:
+        return 0
+    if numpy.any(dates[1:] <= dates[:-1]):
+        raise ValueError("The dates fetched for %s are not increasing" % dataset)
+
+    # The csv file first, it is the reference, a binary file that isn't
+    # updated is only stale
+    _append_csv(csvfile, dates, columns)
+    tsfile.append(binfile, dates, columns)
+    tsfile.update_header(binfile, source=tsfile.source_key(csvfile))
+    return int(dates.size)
+
+
+#------------------------------------------------------#
+#               SELIC                                  #
+#------------------------------------------------------#
+
+class SelicFetcher(object):
+    """
+    Daily SELIC rate from the Brazil Central Bank
+
+    The factor and the VNA of the new days continue from the last row of
+    the dataset:
+
+        factor = round((1 + rate/100) ** (1/252), 8)
+        VNA[k] = VNA[k - 1] * factor[k - 1]
+
+    :param url:     Url of the service, a local server for tests
+    :param timeout: Timeout of the request in seconds
+    """
+
+    url = "http://www3.bcb.gov.br/selic/consulta/taxaSelic.do"
+
+    user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_6_8) AppleWebKit/534.30 " \
+                 "(KHTML, like Gecko) Chrome/12.0.742.112 Safari/534.30"
+
+    def __init__(self, url=None, timeout=60):
+        if url is not None:
+            self.url = url
+        self.timeout = timeout
+
+    def download(self, start_date, end_date):
+        """ Raw text of the daily rates from start_date to end_date """
+        from urllib.parse import urlencode
+        from urllib.request import Request, urlopen
+
+        payload = urlencode({
+            "dataInicial": dtime.date2str_dmy(start_date),
+            "dataFinal": dtime.date2str_dmy(end_date),
+            "method": "listarTaxaDiaria",
+            "tipoApresentacao": "arquivo",
+            "Submit": "Consultar",
+        }).encode("ascii")
+
+        request = Request(self.url, data=payload, headers={"User-Agent": self.user_agent})
+        response = urlopen(request, timeout=self.timeout)
+        try:
+            return response.read().decode("latin-1").strip()
+        finally:
+            response.close()
+
+    @staticmethod
+    def parse(text):
+        """
+        Dates and rates of the text of the service, two lines of title
+        and the lines dd/mm/yyyy;rate;... with decimal comma
+        """
+        rows = [line.split(";") for line in text.splitlines()[2:] if line.strip()]
+        dates = dtime.parse_dates([r[0].strip() for r in rows], "%d/%m/%Y")
+        rates = [float(r[1].replace(",", ".")) for r in rows]
+        return dates, rates
+
+    def __call__(self, start_date, end_date, last):
+        dates, rates = self.parse(self.download(start_date, end_date))
+
+        factors = [round((1 + r / 100.0) ** (1 / 252.0), 8) for r in rates]
+        VNA = []
+        vna, factor = last[3], last[2]
+        for date, f in zip(dates, factors):
+            if date > last[0]:
+                vna = vna * factor
+                factor = f
+                VNA.append(vna)
+            else:
+                VNA.append(float("nan") if date < last[0] else last[3])
+
+        return dates, [rates, factors, VNA]
+
+
+register_fetcher("selic", SelicFetcher())
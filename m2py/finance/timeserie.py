@@ -2,13 +2,13 @@
 # -*- coding: utf-8 -*-
 
 
+import copy
 from functools import reduce
 
-from tabulate import tabulate
-from matplotlib import pyplot as plt
 import numpy
 
 from m2py.finance import dtime
+from m2py.finance import rolling
 
 
 def lst2array(obj):
@@ -25,12 +25,29 @@ def sprint(txt, *args):
 class Tserie:
     """
     Class To Manipulate Time Serie Object
+
+    The time is stored as a sorted numpy datetime64[D] array, or as the
+    numeric offsets of a range serie, and every column as a numpy array.
+    Dates are looked up by bisection (searchsorted) and the slices of the
+    serie, like date_range, are views of the columns, not copies.
     """
 
     def __init__(self, time, data, headers=[], name="", description="", dataprovider="", url=""):
 
-        self.time = lst2array(time)
-        self.data = list(map(lst2array, data))
+        time = lst2array(time)
+        data = list(map(lst2array, data))
+
+        if time.dtype.kind not in "iuf":
+            time = dtime.datetime64(time)
+
+        # Sorted index
+        if time.size > 1 and numpy.any(time[1:] < time[:-1]):
+            order = numpy.argsort(time, kind="stable")
+            time = time[order]
+            data = [c[order] for c in data]
+
+        self.time = time
+        self.data = data
         self.format = "%Y-%m-%d"
         self.headers = ['time']
         self.headers.extend(headers)
@@ -39,6 +56,8 @@ class Tserie:
         self.dataprovider = dataprovider
         self.url = url
         self.serie_type = 'tserie'  # type 1 - Time serie , type 2 date range serie
+        if time.dtype.kind in "iuf":
+            self.serie_type = 'rserie'
 
     def __getitem__(self, item):
 
@@ -67,15 +86,45 @@ class Tserie:
         t.headers.pop(0)
         return t
 
+    def _slice(self, start, stop):
+        """ Serie of the rows start:stop, the time and the columns are views of this serie """
+        new = copy.copy(self)
+        new.time = self.time[start:stop]
+        new.data = [c[start:stop] for c in self.data]
+        new.headers = list(self.headers)
+        return new
+
+    def times(self):
+        """ Time as a list of datetime.datetime objects, offsets of a range serie """
+        if self.time.dtype.kind == "M":
+            return self.time.astype("M8[us]").tolist()
+        return self.time.tolist()
+
+    def index(self, date, side="left"):
+        """
+        Position of date in the time index, the position where date would
+        be inserted keeping the order, see numpy.searchsorted
+
+        :param date: Date string, datetime.datetime or numpy.datetime64,
+                     offset of a range serie
+        :param side: "left", first position, or "right", last position
+        """
+        if self.time.dtype.kind == "M":
+            date = dtime.datetime64(date)
+        return int(numpy.searchsorted(self.time, date, side))
+
     def get_table(self):
-        table = [self.time]
+        table = [self.times()]
         list(map(table.append, self.data))
         table = list(zip(*table))
         return table
 
     def time_formated(self):
         if self.serie_type == "tserie":
-            times = [d.strftime(self.format) for d in self.time]
+            if self.format == "%Y-%m-%d":
+                times = numpy.datetime_as_string(self.time, unit="D").tolist()
+            else:
+                times = [d.strftime(self.format) for d in self.times()]
         else:
             times = self.time
 
@@ -90,6 +139,7 @@ class Tserie:
         return table
 
     def __str__(self):
+        from tabulate import tabulate
         return tabulate(self.get_table_formated())
 
 
@@ -113,6 +163,7 @@ class Tserie:
         #print len(table)
 
         table = list(zip(*table))[:n]
+        from tabulate import tabulate
         print(tabulate(table, headers=self.headers))
 
 
@@ -135,55 +186,53 @@ class Tserie:
 
         table = list(zip(*table))[-n:]
 
+        from tabulate import tabulate
         print("")
         print(tabulate(table, headers=self.headers))
         print("")
 
     def start(self):
-        table = [self.time]
-        list(map(table.append, self.data))
-        return zip(*table)[0]
+        """ First row (time, values ...) """
+        return self._slice(0, 1).get_table()[0]
 
     def end(self):
-        table = [self.time]
-        list(map(table.append, self.data))
-        return zip(*table)[-1]
+        """ Last row (time, values ...) """
+        return self._slice(-1, None).get_table()[0]
 
     def date_range(self, start_date, end_date):
+        """
+        Serie of the dates from start_date to end_date, both included,
+        the columns are views of the columns of this serie
+
+        :param start_date: Date string (dd/mm/yyyy, yyyy-mm-dd ...), datetime.datetime or numpy.datetime64
+        :param end_date:   Date string (dd/mm/yyyy, yyyy-mm-dd ...), datetime.datetime or numpy.datetime64
+        """
 
         if self.serie_type == "rserie":
             return None
 
-        start_date = dtime.date_dmy(start_date)
-        end_date = dtime.date_dmy(end_date)
-
-        table = [self.time]
-        list(map(table.append, self.data))
-        table = list(zip(*table))
-
-        table2 = [d for d in table if start_date <= d[0] <= end_date]
-
-        table2 = list(zip(*table2))
-
-        return Tserie(time=table2[0], data=table2[1:])
+        return self._slice(self.index(start_date, "left"), self.index(end_date, "right"))
 
     def get_time_range(self):
         return self.time[0], self.time[-1]
 
 
     def get_date(self, date, prevbusday=False):
+        """
+        Rows (time, values ...) of a date, empty list if the date is not
+        in the serie
+
+        :param date:       Date string, datetime.datetime or numpy.datetime64
+        :param prevbusday: Rows of the last business day on or before date
+        """
 
         if self.serie_type == "rserie":
             return None
 
-        date = dtime.dtime(date)
-        table = self.get_table()
-
         if prevbusday:
-            date = dtime.prevbusday(date)
+            date = dtime.prevbusday(dtime.datetime64(date)[()])
 
-        return [d for d in table if d[0].day == date.day and d[0].month == date.month
-                                and d[0].year == date.year]
+        return self._slice(self.index(date, "left"), self.index(date, "right")).get_table()
 
     def add_column(self, column, name=''):
         self.data.append(column)
@@ -192,7 +241,7 @@ class Tserie:
     def to_csv(self, filename):
         import csv
 
-        c = csv.writer(open(filename, "wb"))
+        c = csv.writer(open(filename, "w", newline=""))
         table = self.get_table_formated()
         c.writerow(["Name: {}".format(self.name)])
         c.writerow(["Data Provider: {}".format(self.dataprovider)])
@@ -220,9 +269,9 @@ class Tserie:
 
         data = [column(rows, i) for i in range(len(headers))]
         time = data.pop(0)
-        time = [dtime.date_ymd(d, '-') for d in time]
+        time = dtime.parse_dates(time, '%Y-%m-%d')
 
-        data = [list(map(float, c)) for c in data]
+        data = [numpy.array(c, dtype=float) for c in data]
 
         #headers.pop(0)
 
@@ -234,26 +283,45 @@ class Tserie:
 
 
 
-    def to_bin(self, filename):
+    def to_bin(self, filename, capacity=None, **meta):
         """
-        Save time serie as binary database
+        Save time serie as binary database, columnar file of
+        m2py.finance.tsfile, new rows can be appended with tsfile.append
+
+        :param filename: File name
+        :param capacity: Rows of the file without rewriting it, default with room to grow
+        :param meta:     Other keys of the file header
         """
-        import shelve
+        from m2py.finance import tsfile
 
-        s = shelve.open(filename)
-        s['name'] = self.name
-        s['dataprovider'] = self.dataprovider
-        s['url'] = self.url
-        s['description'] = self.description
-        s['headers'] = self.headers
-        s['time'] = self.time
-        s['data'] = self.data
-        s.close()
+        tsfile.write(filename, self.time, self.data, capacity,
+                     name=self.name, dataprovider=self.dataprovider, url=self.url,
+                     description=self.description, headers=self.headers[1:],
+                     serie_type=self.serie_type, format=self.format, **meta)
 
     @classmethod
-    def from_bin(cls, filename):
+    def from_bin(cls, filename, mmap=True):
         """
-        Load time Serie from binary database
+        Load time Serie from binary database, the columns are mapped to
+        memory (read-only) unless mmap is False. The old shelve databases
+        are still read.
+        """
+        from m2py.finance import tsfile
+
+        if not tsfile.is_tsfile(filename):
+            return cls._from_shelve(filename)
+
+        header, time, data = tsfile.read(filename, mmap)
+        new = Tserie(time, data, header["headers"], header["name"], header["description"],
+                     header["dataprovider"], header["url"])
+        new.format = header.get("format", new.format)
+        new.serie_type = header.get("serie_type", new.serie_type)
+        return new
+
+    @classmethod
+    def _from_shelve(cls, filename):
+        """
+        Load time Serie from a shelve database
         """
         import shelve
 
@@ -275,7 +343,7 @@ class Tserie:
 
     def timelenght(self):
         if self.serie_type == "tserie":
-            return (self.time[-1] - self.time[0]).days
+            return int((self.time[-1] - self.time[0]) // numpy.timedelta64(1, "D"))
 
         elif self.serie_type == "rserie":
             return self.time[-1]
@@ -295,6 +363,7 @@ class Tserie:
         return list(map(self.column, colist))
 
     def _plot(self, column_name):
+        from matplotlib import pyplot as plt
         column = self.column(column_name)
         plt.plot(self.time, column)
         plt.xlabel("Time")
@@ -302,6 +371,7 @@ class Tserie:
         # plt.ylabel(column_name)
 
     def plot(self, columns, xlabel="", ylable="", title=""):
+        from matplotlib import pyplot as plt
 
         if isinstance(columns, list):
             list(map(self._plot, columns))
@@ -334,8 +404,155 @@ class Tserie:
         serie.serie_type = "rserie"
         return serie
 
+    def _with(self, data, time=None):
+        """ Serie of the same metadata with new columns (and time) """
+        new = copy.copy(self)
+        new.time = self.time if time is None else time
+        new.data = list(data)
+        new.headers = list(self.headers)
+        return new
+
+    def join(self, other, how="inner"):
+        """
+        Columns of two series aligned on their times, see join()
+
+        :param other: Tserie
+        :param how:   "inner" times of both series [default], "outer" times
+                      of any of them, "left" times of this serie
+        """
+        return join([self, other], how)
+
+    def join_asof(self, other, prevbusday=False, tolerance=None):
+        """
+        Columns of this serie and the last observation of other on or
+        before each time of this serie, NaN if there isn't one
+
+        :param other:      Tserie
+        :param prevbusday: Observation of other on or before the previous
+                           business day of each date, see dtime.prevbusday
+        :param tolerance:  Maximum age of the observation of other, days
+                           (or offsets of a range serie), default no limit
+
+        Example: VNA of the SELIC bonds at the dates of the exchange rate
+
+            >>> usd2brl.join_asof(selic, prevbusday=True)["VNA"]
+        """
+        times = self.time
+        if prevbusday:
+            times = dtime.prevbusday(dtime.datetime64(times))
+
+        k = numpy.searchsorted(other.time, times, side="right") - 1
+        missing = k < 0
+        if tolerance is not None and other.time.size:
+            age = times - other.time[numpy.maximum(k, 0)]
+            if age.dtype.kind == "m":
+                age = age // numpy.timedelta64(1, "D")
+            missing |= age > tolerance
+
+        data = list(self.data) + [_take(c, k, missing) for c in other.data]
+        new = self._with(data)
+        new.headers = list(self.headers) + _suffixed(self.headers, other.headers[1:])
+        return new
+
+    def rolling(self, window):
+        """
+        Rolling window statistics of all the columns, O(n) for any window
+
+        :param window: Number of rows of the window
+        :return:       Rolling object, its methods sum, prod, mean, std, min
+                       and max return series of the same times, the first
+                       window - 1 values are NaN
+
+        Example: 252 days volatility of the daily returns
+
+            >>> vol = serie.pct_change().rolling(252).std()
+        """
+        return Rolling(self, window)
+
+    def pct_change(self, periods=1):
+        """
+        Relative change of the columns from periods rows before,
+        x[k] / x[k - periods] - 1, the first values are NaN
+
+        :param periods: Number of rows, at least 1
+        """
+        if int(periods) != periods or periods < 1:
+            raise ValueError("The periods must be an integer of at least 1, not %r" % (periods,))
+        periods = int(periods)
+
+        def change(c):
+            c = numpy.asarray(c, dtype=float)
+            out = numpy.full(c.size, numpy.nan)
+            if periods < c.size:
+                out[periods:] = c[periods:] / c[:-periods] - 1.0
+            return out
+
+        return self._with([change(c) for c in self.data])
+
+    def cumprod(self):
+        """ Cumulative product of the columns, accumulated factors """
+        return self._with([numpy.cumprod(numpy.asarray(c, dtype=float)) for c in self.data])
+
+    def resample(self, rule, how="last"):
+        """
+        Values of the columns by week, month, quarter or year
+
+        :param rule: "W" weeks from Monday, "M" months, "Q" quarters or "Y" years
+        :param how:  "last", "first", "mean", "sum", "prod", "min", "max",
+                     "count" or a function of an array to a number
+        :return:     Serie of one row per period with data, the time of a
+                     row is the last date of the period in this serie
+
+        Example: monthly accumulated factor of the daily SELIC factors
+
+            >>> selic.resample("M", how="prod")["factor"]
+        """
+        if self.time.dtype.kind != "M":
+            raise ValueError("Only time series can be resampled")
+
+        days = self.time.astype(numpy.int64)
+        if rule == "W":
+            # 1970-01-01 is a Thursday
+            period = (days + 3) // 7
+        elif rule == "M":
+            period = self.time.astype("M8[M]").astype(numpy.int64)
+        elif rule == "Q":
+            period = self.time.astype("M8[M]").astype(numpy.int64) // 3
+        elif rule == "Y":
+            period = self.time.astype("M8[Y]").astype(numpy.int64)
+        else:
+            raise ValueError("Unknown rule %r, rules: W, M, Q, Y" % (rule,))
+
+        if not days.size:
+            return self._with([numpy.asarray(c, dtype=float)[:0] for c in self.data], self.time[:0])
+
+        starts = numpy.concatenate(([0], numpy.flatnonzero(numpy.diff(period)) + 1))
+        ends = numpy.concatenate((starts[1:], [days.size])) - 1
+        counts = ends - starts + 1
+
+        reducers = {
+            "first": lambda c: c[starts],
+            "last": lambda c: c[ends],
+            "sum": lambda c: numpy.add.reduceat(c, starts),
+            "prod": lambda c: numpy.multiply.reduceat(c, starts),
+            "min": lambda c: numpy.minimum.reduceat(c, starts),
+            "max": lambda c: numpy.maximum.reduceat(c, starts),
+            "mean": lambda c: numpy.add.reduceat(c, starts) / counts,
+            "count": lambda c: counts.astype(float),
+        }
+        if callable(how):
+            reduce_ = lambda c: numpy.array([how(c[a:b + 1]) for a, b in zip(starts, ends)], dtype=float)
+        elif how in reducers:
+            reduce_ = reducers[how]
+        else:
+            raise ValueError("Unknown method %r, methods: %s" % (how, ", ".join(sorted(reducers))))
+
+        data = [reduce_(numpy.asarray(c, dtype=float)) for c in self.data]
+        return self._with(data, self.time[ends])
+
     @classmethod
     def show(cls):
+        from matplotlib import pyplot as plt
         plt.show()
 
     def info(self):
@@ -369,6 +586,119 @@ class Tserie:
         return text
 
 
+def _take(column, k, missing):
+    """ Values of column at the positions k, NaN where missing """
+    column = numpy.asarray(column, dtype=float)
+    if not column.size:
+        return numpy.full(len(k), numpy.nan)
+    out = column[numpy.clip(k, 0, column.size - 1)]
+    out[missing] = numpy.nan
+    return out
+
+
+def _positions(time, times):
+    """ Positions of times in the sorted time and mask of the times not found """
+    k = numpy.searchsorted(time, times)
+    found = k < time.size
+    found[found] = time[k[found]] == times[found]
+    return k, ~found
+
+
+def _suffixed(headers, new):
+    """ New headers, renamed name_2, name_3 ... if they are in headers """
+    names = list(headers)
+    out = []
+    for name in new:
+        renamed, n = name, 1
+        while renamed in names:
+            n += 1
+            renamed = "%s_%d" % (name, n)
+        names.append(renamed)
+        out.append(renamed)
+    return out
+
+
+def join(series, how="inner"):
+    """
+    Align the columns of several series on their times
+
+    The times are merged once, the sorted time indices of the series are
+    merged by a stable sort (runs already sorted) and every serie is
+    aligned by bisection of its index, there is no lookup per date.
+
+    :param series: List of Tserie
+    :param how:    "inner" times of all the series [default], "outer" times
+                   of any of them, "left" times of the first serie
+    :return:       Tserie of the columns of all series, NaN where a serie
+                   has no observation, the repeated headers are renamed
+                   name_2, name_3 ...
+
+    Example:
+        >>> from m2py.finance.series import Dataset
+        >>> table = join([Dataset.selic, Dataset.usd2brl])
+    """
+    series = list(series)
+    if not series:
+        raise ValueError("No series to join")
+
+    if how == "left":
+        times = series[0].time
+    elif how == "inner":
+        times = series[0].time
+        for serie in series[1:]:
+            _, missing = _positions(serie.time, times)
+            times = times[~missing]
+    elif how == "outer":
+        times = numpy.sort(numpy.concatenate([serie.time for serie in series]), kind="stable")
+        if times.size:
+            times = times[numpy.concatenate(([True], times[1:] != times[:-1]))]
+    else:
+        raise ValueError("Unknown join %r, joins: inner, outer, left" % (how,))
+
+    data = []
+    headers = ["time"]
+    for serie in series:
+        k, missing = _positions(serie.time, times)
+        data.extend(_take(c, k, missing) for c in serie.data)
+        headers.extend(_suffixed(headers, serie.headers[1:]))
+
+    new = series[0]._with(data, times)
+    new.headers = headers
+    return new
+
+
+class Rolling(object):
+    """
+    Rolling window statistics of the columns of a Tserie, see Tserie.rolling
+    and m2py.finance.rolling
+    """
+
+    def __init__(self, serie, window):
+        self.serie = serie
+        self.window = window
+
+    def _apply(self, function, **kwargs):
+        return self.serie._with([function(c, self.window, **kwargs) for c in self.serie.data])
+
+    def sum(self):
+        return self._apply(rolling.rolling_sum)
+
+    def prod(self):
+        return self._apply(rolling.rolling_prod)
+
+    def mean(self):
+        return self._apply(rolling.rolling_mean)
+
+    def std(self, ddof=1):
+        return self._apply(rolling.rolling_std, ddof=ddof)
+
+    def min(self):
+        return self._apply(rolling.rolling_min)
+
+    def max(self):
+        return self._apply(rolling.rolling_max)
+
+
 def product(factors):
     import operator
 
@@ -380,9 +710,8 @@ def cumproduct(vector):
     :param vector:
     :return:
     """
-    rng = range(1, len(vector) + 1)
     # return map(lambda i: round(product(vector[0:i]), 8), rng)
-    return [product(vector[0:i]) for i in rng]
+    return numpy.cumprod(numpy.asarray(vector, dtype=float)).tolist()
 
 
 def plot_against(serie1, serie2, columns, title="", xlabel="Date", labels =[] ):
@@ -396,6 +725,8 @@ def plot_against(serie1, serie2, columns, title="", xlabel="Date", labels =[] ):
     :return:
     """
 
+    from matplotlib import pyplot as plt
+
     c1, c2 = columns
 
     if not labels:
@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Columnar binary file of time series
+
+The file is a small JSON header followed by one raw little-endian block
+per column, the time first. The columns are read with numpy.memmap, no
+copy and no Python object per row, and new rows are written in place at
+the end of the blocks, every block has room for capacity rows.
+
+    offset 0        MAGIC, 8 bytes
+    offset 8        Length of the header in bytes, uint32 little-endian
+    offset 12       JSON header, padded with spaces
+    header["offset"]  Blocks of header["capacity"] values of each column,
+                    header["rows"] of them are valid
+
+Header:
+
+    {"name": "...", "dataprovider": "...", "url": "...", "description": "...",
+     "headers": ["rate", ...], "serie_type": "tserie", "format": "%Y-%m-%d",
+     "dtypes": ["<M8[D]", "<f8", ...], "rows": 3638, "capacity": 5457,
+     "offset": 1024}
+
+Example:
+
+    >>> from m2py.finance import tsfile
+    >>> tsfile.write("selic.tsb", time, [rate, factor], headers=["rate", "factor"])
+    >>> tsfile.append("selic.tsb", new_time, [new_rate, new_factor])
+    >>> header, time, columns = tsfile.read("selic.tsb")
+"""
+import json
+import os
+import struct
+
+import numpy
+
+MAGIC = b"M2PYTS\x01\x00"
+
+# The data starts at a multiple of ALIGN bytes, the header has at least
+# HEADER_RESERVE free bytes to be updated in place.
+ALIGN = 64
+HEADER_RESERVE = 256
+
+# Minimum number of free rows of a new file
+MIN_FREE_ROWS = 256
+
+
+def is_tsfile(filename):
+    """ True if filename is a columnar time serie file """
+    try:
+        with open(filename, "rb") as fp:
+            return fp.read(len(MAGIC)) == MAGIC
+    except (IOError, OSError):
+        return False
+
+
+def source_key(filename):
+    """
+    Key of a source file of a time serie file, [mtime_ns, size], a binary
+    copy of a text file is stale when the key of the text file changes
+    """
+    st = os.stat(filename)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _capacity(rows):
+    return rows + max(rows // 2, MIN_FREE_ROWS)
+
+
+def _column(array):
+    """ Column as a contiguous little-endian array """
+    array = numpy.asarray(array)
+    if array.dtype.kind not in "biufM":
+        raise ValueError("Columns must be numeric or datetime64, not %s" % array.dtype)
+    if array.dtype.kind == "M":
+        array = array.astype("M8[D]", copy=False)
+    return numpy.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+
+
+def _encode(header, size=None):
+    """ JSON header padded to size bytes, or to the data alignment with room for updates """
+    text = json.dumps(header, sort_keys=True).encode("utf-8")
+    if size is None:
+        size = len(text) + HEADER_RESERVE
+        size += -(len(MAGIC) + 4 + size) % ALIGN
+    if len(text) > size:
+        return None
+    return text + b" " * (size - len(text))
+
+
+def read_header(filename):
+    """ Header of the file, dictionary """
+    with open(filename, "rb") as fp:
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise ValueError("%s is not a time serie file" % filename)
+        size, = struct.unpack("<I", fp.read(4))
+        header = json.loads(fp.read(size).decode("utf-8"))
+    header["header_size"] = size
+    return header
+
+
+def _offsets(header):
+    """ Offset of the block of every column """
+    offsets = []
+    offset = header["offset"]
+    for dtype in header["dtypes"]:
+        offsets.append(offset)
+        offset += header["capacity"] * numpy.dtype(dtype).itemsize
+    return offsets
+
+
+def write(filename, time, data, capacity=None, **meta):
+    """
+    Write a time serie file, replacing an existing file atomically
+
+    :param filename: File name
+    :param time:     Time column, datetime64 array or numeric offsets
+    :param data:     List of columns of the same length of time
+    :param capacity: Rows of every block, default with room for appending
+    :param meta:     Other keys of the header, name, dataprovider, url,
+                     description, headers, serie_type, format ...
+    """
+    columns = [_column(time)] + [_column(c) for c in data]
+    rows = len(columns[0])
+    if any(len(c) != rows for c in columns):
+        raise ValueError("Columns of different lengths")
+
+    capacity = _capacity(rows) if capacity is None else max(capacity, rows)
+
+    header = dict(meta)
+    header.update(dtypes=[c.dtype.str for c in columns], rows=rows, capacity=capacity, offset=0)
+    size = len(_encode(header))
+    header["offset"] = len(MAGIC) + 4 + size
+    encoded = _encode(header, size)
+
+    tmp = filename + ".tmp"
+    with open(tmp, "wb") as fp:
+        fp.write(MAGIC)
+        fp.write(struct.pack("<I", size))
+        fp.write(encoded)
+        for c in columns:
+            fp.write(c.tobytes())
+            fp.write(b"\0" * ((capacity - rows) * c.dtype.itemsize))
+    os.replace(tmp, filename)
+
+
+def read(filename, mmap=True):
+    """
+    Read a time serie file
+
+    :param filename: File name
+    :param mmap:     Map the columns to memory (read-only, no copy), read
+                     them to arrays if False
+    :return:         (header, time, [columns ...])
+    """
+    header = read_header(filename)
+    rows = header["rows"]
+
+    columns = []
+    for dtype, offset in zip(header["dtypes"], _offsets(header)):
+        if rows == 0:
+            columns.append(numpy.empty(0, dtype=dtype))
+        elif mmap:
+            columns.append(numpy.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=(rows,)))
+        else:
+            columns.append(numpy.fromfile(filename, dtype=dtype, count=rows, offset=offset))
+
+    return header, columns[0], columns[1:]
+
+
+def append(filename, time, data):
+    """
+    Append rows to a time serie file, in place while the blocks have room,
+    the file is rewritten with a larger capacity otherwise. The header is
+    updated after the data, an interrupted append leaves the old rows.
+
+    :param filename: File name
+    :param time:     Times of the new rows, after the last time of the file, increasing
+    :param data:     List of the new values of every column
+    :return:         Number of rows of the file
+    """
+    header = read_header(filename)
+    dtypes = header["dtypes"]
+
+    columns = [_column(time)] + [_column(c) for c in data]
+    if len(columns) != len(dtypes):
+        raise ValueError("%d columns, the file has %d" % (len(columns) - 1, len(dtypes) - 1))
+    n = len(columns[0])
+    if any(len(c) != n for c in columns):
+        raise ValueError("Columns of different lengths")
+    columns = [c.astype(dtype, copy=False) for c, dtype in zip(columns, dtypes)]
+    if n == 0:
+        return header["rows"]
+
+    _, old_time, _ = read(filename)
+    new_time = columns[0]
+    if numpy.any(new_time[1:] <= new_time[:-1]) or (len(old_time) and new_time[0] <= old_time[-1]):
+        raise ValueError("The new times must be increasing and after the last time of the file")
+    del old_time
+
+    rows = header["rows"]
+    if rows + n > header["capacity"]:
+        header, time, data = read(filename, mmap=False)
+        columns = [numpy.concatenate((old, new)) for old, new in zip([time] + data, columns)]
+        meta = dict((k, v) for k, v in header.items()
+                    if k not in ("dtypes", "rows", "capacity", "offset", "header_size"))
+        write(filename, columns[0], columns[1:], **meta)
+        return rows + n
+
+    size = header.pop("header_size")
+    with open(filename, "r+b") as fp:
+        for c, offset in zip(columns, _offsets(header)):
+            fp.seek(offset + rows * c.dtype.itemsize)
+            fp.write(c.tobytes())
+        fp.flush()
+
+        header["rows"] = rows + n
+        _write_header(fp, filename, header, size)
+
+    return rows + n
+
+
+def _write_header(fp, filename, header, size):
+    encoded = _encode(header, size)
+    if encoded is None:
+        raise ValueError("No room to update the header of %s" % filename)
+    fp.seek(len(MAGIC) + 4)
+    fp.write(encoded)
+
+
+def update_header(filename, **keys):
+    """
+    Set keys of the header in place, like the metadata of the serie,
+    the layout keys (dtypes, rows, capacity, offset) can't be changed
+    """
+    layout = set(keys) & set(("dtypes", "rows", "capacity", "offset", "header_size"))
+    if layout:
+        raise ValueError("Layout keys can't be changed: %s" % ", ".join(sorted(layout)))
+
+    header = read_header(filename)
+    size = header.pop("header_size")
+    header.update(keys)
+    with open(filename, "r+b") as fp:
+        _write_header(fp, filename, header, size)
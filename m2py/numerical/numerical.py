@@ -4,21 +4,257 @@ numerical.py
     Numerical Methods Library
 
         * Newton Raphson
-        * Table read, csv files
-        * Table Interpolation
+        * Table read, csv files, load_table with a binary cache
+        * Table Interpolation, Interpolator class
 
 """
+import os
+from bisect import bisect_right
+from math import exp
+
+import numpy as np
 
 from m2py.utils import Container
 
 
-def interpol(x, X, Y):
+# ************************************************************************************************
+# Table interpolation
+# ************************************************************************************************
+
+# Interpolation modes
+#
+#   linear      y linear between the nodes
+#   cubic       Monotone piecewise cubic (Fritsch-Carlson), no overshoot
+#               between the nodes
+#   loglinear   log(y) linear between the nodes, y > 0, exponential
+#               quantities like the saturation pressure
+#
+KINDS = ("linear", "cubic", "loglinear")
+
+# Extrapolation policies, x outside of [X[0], X[-1]]
+#
+#   linear      Extend the first or last interval, the cubic mode uses the
+#               slope at the end node
+#   clip        Value at the end node
+#   nan         Not a number
+#   raise       ValueError
+#
+EXTRAPOLATION = ("linear", "clip", "nan", "raise")
+
+
+class Interpolator(object):
+    """
+    Interpolation of several columns YY over the sorted column X. The
+    intervals are found by bisection, O(log n) per point, and all the
+    columns are interpolated from the same search.
+
+    :param X:           Input column, strictly increasing or decreasing
+    :param YY:          Output columns (list of columns or 2-D array, one row per column)
+    :param kind:        Interpolation mode, see KINDS
+    :param extrapolate: Extrapolation policy, see EXTRAPOLATION
+
+    Example:
+
+    >>> table = Interpolator(T, [P, vf, vg])
+    >>> table(100.233)
+    [102.20870000000001, 0.0010441398, 1.6610850359999998]
+    >>> table([100.233, 150.0], columns=[0])      # Arrays of x, only P
+    [array([ 102.2087,  475.9   ])]
+    """
+
+    def __init__(self, X, YY, kind="linear", extrapolate="linear"):
+        if kind not in KINDS:
+            raise ValueError("kind must be one of %s" % (KINDS,))
+        if extrapolate not in EXTRAPOLATION:
+            raise ValueError("extrapolate must be one of %s" % (EXTRAPOLATION,))
+
+        X = np.asarray(X, dtype=float)
+        Y = np.array(YY, dtype=float, ndmin=2)
+        if X.ndim != 1 or X.size < 2 or Y.shape[1] != X.size:
+            raise ValueError("X must have at least two values and the length of the columns of YY")
+
+        if X[0] > X[-1]:
+            X, Y = X[::-1], Y[:, ::-1]
+        if np.any(np.diff(X) <= 0):
+            raise ValueError("X must be strictly increasing or decreasing")
+
+        if kind == "loglinear":
+            if np.any(Y <= 0):
+                raise ValueError("Log-linear interpolation needs positive values")
+            Y = np.log(Y)
+
+        self.kind = kind
+        self.extrapolate = extrapolate
+        self.X = X
+        self.Y = Y
+        self.D = _monotone_slopes(X, Y) if kind == "cubic" else None
+
+        # Python lists of the scalar path, bisect on lists is faster than NumPy for one point
+        self._X = X.tolist()
+        self._Y = Y.tolist()
+        self._D = None if self.D is None else self.D.tolist()
+
+    def __len__(self):
+        return len(self._Y)
+
+    def __call__(self, x, columns=None):
+        """
+        Interpolated columns at x
+
+        :param x:       Input value or array of values
+        :param columns: Indexes of the columns, all by default
+        :return:        List of the values of the columns, floats for a
+                        scalar x, arrays of the shape of x otherwise
+        """
+        if columns is None:
+            columns = range(len(self._Y))
+        if np.ndim(x) == 0:
+            return self._scalar(float(x), columns)
+        return list(self._vector(np.asarray(x, dtype=float), list(columns)))
+
+    def _scalar(self, x, columns):
+        X = self._X
+        n = len(X)
+        if x != x:
+            return [float("nan") for _ in columns]
+
+        k = bisect_right(X, x) - 1
+        if x < X[0] or x > X[-1]:
+            if self.extrapolate == "raise":
+                raise ValueError("x = %g outside of the table [%g, %g]" % (x, X[0], X[-1]))
+            if self.extrapolate == "nan":
+                return [float("nan") for _ in columns]
+            if self.extrapolate == "clip":
+                x = X[0] if x < X[0] else X[-1]
+
+        k = min(max(k, 0), n - 2)
+        x1, x2 = X[k], X[k + 1]
+        h = x2 - x1
+        t = (x - x1) / h
+
+        result = []
+        for c in columns:
+            Y = self._Y[c]
+            y1, y2 = Y[k], Y[k + 1]
+            if self.kind == "cubic":
+                D = self._D[c]
+                if t < 0:
+                    y = y1 + D[k] * (x - x1)
+                elif t > 1:
+                    y = y2 + D[k + 1] * (x - x2)
+                else:
+                    y = (y1 * (1 + 2 * t) * (1 - t) ** 2 + D[k] * h * t * (1 - t) ** 2 +
+                         y2 * t * t * (3 - 2 * t) + D[k + 1] * h * t * t * (t - 1))
+            else:
+                y = y1 + (y2 - y1) * t
+            result.append(exp(y) if self.kind == "loglinear" else y)
+        return result
+
+    def _vector(self, x, columns):
+        X = self.X
+        shape = x.shape
+        x = x.ravel()
+        outside = (x < X[0]) | (x > X[-1])
+
+        if self.extrapolate == "raise" and outside.any():
+            raise ValueError("%d values of x outside of the table [%g, %g]" % (outside.sum(), X[0], X[-1]))
+        if self.extrapolate == "clip":
+            x = np.clip(x, X[0], X[-1])
+
+        k = np.clip(np.searchsorted(X, x, side="right") - 1, 0, X.size - 2)
+        x1 = X[k]
+        h = X[k + 1] - x1
+        t = (x - x1) / h
+
+        Y = self.Y[columns]
+        y1, y2 = Y[:, k], Y[:, k + 1]
+        if self.kind == "cubic":
+            D = self.D[columns]
+            d1, d2 = D[:, k], D[:, k + 1]
+            tc = np.clip(t, 0, 1)
+            y = (y1 * (1 + 2 * tc) * (1 - tc) ** 2 + d1 * h * tc * (1 - tc) ** 2 +
+                 y2 * tc * tc * (3 - 2 * tc) + d2 * h * tc * tc * (tc - 1))
+            # Linear extension with the slope of the end node
+            y = np.where(t < 0, y1 + d1 * (x - x1), np.where(t > 1, y2 + d2 * (x - X[k + 1]), y))
+        else:
+            y = y1 + (y2 - y1) * t
+        if self.kind == "loglinear":
+            y = np.exp(y)
+
+        if self.extrapolate == "nan":
+            y[:, outside] = np.nan
+        return y.reshape((len(columns),) + shape)
+
+
+def _monotone_slopes(X, Y):
+    """
+    Node derivatives of the monotone cubic interpolation (Fritsch-Carlson),
+    weighted harmonic mean of the slopes of the neighbour intervals, zero at
+    local extrema. Y has one row per column.
+    """
+    h = np.diff(X)
+    delta = np.diff(Y, axis=1) / h
+    D = np.zeros_like(Y)
+
+    if X.size == 2:
+        D[:] = delta
+        return D
+
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    d0, d1 = delta[:, :-1], delta[:, 1:]
+    same = d0 * d1 > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        D[:, 1:-1] = np.where(same, (w1 + w2) / (w1 / np.where(same, d0, 1) + w2 / np.where(same, d1, 1)), 0.0)
+
+    # End nodes, three point formula limited to keep the monotony
+    for end, hh, dd in [(0, (h[0], h[1]), (delta[:, 0], delta[:, 1])),
+                        (-1, (h[-1], h[-2]), (delta[:, -1], delta[:, -2]))]:
+        d = ((2 * hh[0] + hh[1]) * dd[0] - hh[0] * dd[1]) / (hh[0] + hh[1])
+        d = np.where(np.sign(d) != np.sign(dd[0]), 0.0, d)
+        d = np.where((np.sign(dd[0]) != np.sign(dd[1])) & (np.abs(d) > np.abs(3 * dd[0])), 3 * dd[0], d)
+        D[:, end] = d
+    return D
+
+
+def _linear(x, X, YY, extrapolate):
+    """
+    Linear interpolation of the columns YY at the scalar x, X increasing,
+    bisection on the table as given, without building an Interpolator
+    """
+    n = len(X)
+    if x != x:
+        return [float("nan") for _ in YY]
+
+    if x < X[0] or x > X[n - 1]:
+        if extrapolate == "raise":
+            raise ValueError("x = %g outside of the table [%g, %g]" % (x, X[0], X[n - 1]))
+        if extrapolate == "nan":
+            return [float("nan") for _ in YY]
+        if extrapolate == "clip":
+            x = X[0] if x < X[0] else X[n - 1]
+
+    k = min(max(bisect_right(X, x) - 1, 0), n - 2)
+    x1 = X[k]
+    t = (x - x1) / (X[k + 1] - x1)
+    return [float(Y[k] + (Y[k + 1] - Y[k]) * t) for Y in YY]
+
+
+def _is_scalar_linear(x, X, kind, extrapolate):
+    """ True if interpol can take the bisection path of _linear """
+    return (kind == "linear" and extrapolate in EXTRAPOLATION and
+            (isinstance(x, (int, float)) or np.ndim(x) == 0) and len(X) >= 2 and X[0] < X[-1])
+
+
+def interpol(x, X, Y, kind="linear", extrapolate="linear"):
     """
     Interpolate over x in X, Y table.
     
-    :param x: Input value 
-    :param X: input column  ( List of float)
+    :param x: Input value or array of values
+    :param X: input column  ( List of float), sorted
     :param Y: output column
+    :param kind:        Interpolation mode "linear", "cubic" or "loglinear"
+    :param extrapolate: Policy outside of X "linear", "clip", "nan" or "raise"
     :return: y = (y2-y1)/(x2-x1)*(x-x1) + y1
     
     In [10]: T[:4], P[:4]
@@ -26,25 +262,21 @@ def interpol(x, X, Y):
     
     In [11]: interp(6.45, T, P)
     Out[11]: 0.975195
+
+    A scalar x in the linear mode is found by bisection on X as given,
+    O(log n) without copying the table. Repeated lookups of arrays or of
+    the other modes should build an Interpolator once instead.
     """
-    
-    for idx, xx in enumerate(X):
-        if x <= xx:
-            break
-    
-    x2 = xx         
-    y2 = Y[idx]
-    x1 = X[idx-1] 
-    y1 = Y[idx-1]    
-    y = (y2-y1)/(x2-x1)*(x-x1) + y1
-    
-    return y
- 
-def interpol2(x, X, YY):
+    if _is_scalar_linear(x, X, kind, extrapolate):
+        return _linear(float(x), X, [Y], extrapolate)[0]
+    return Interpolator(X, [Y], kind, extrapolate)(x)[0]
+
+
+def interpol2(x, X, YY, kind="linear", extrapolate="linear"):
     """
     Interpolate x in X, YY tables:
      
-    :param x: Input value to be interpolated
+    :param x: Input value to be interpolated, or array of values
     :param X: input column  ( List of float)
     :param YY: output columns vector ( List of List of float)
     :return: y = (y2-y1)/(x2-x1)*(x-x1) + y1 
@@ -54,8 +286,10 @@ def interpol2(x, X, YY):
     Out[6]: [102.20870000000001, 0.0010441398, 1.6610850359999998]
         
     """
-    m =  lambda Y: interpol(x, X, Y)
-    return list(map(m, YY))
+    if _is_scalar_linear(x, X, kind, extrapolate):
+        return _linear(float(x), X, YY, extrapolate)
+    return Interpolator(X, YY, kind, extrapolate)(x)
+
 
 def read_table(filename, separator=',', dtype='float'):
     """
@@ -106,6 +340,75 @@ def read_table(filename, separator=',', dtype='float'):
     return table
 
 
+# Smallest file cached by load_table, NumPy parses smaller files faster than it
+# reads the .npz file. The steam tables of m2py.thermo (under 11 kB) are not
+# cached: load_table parses one in ~0.1 ms, np.load of its .npz takes ~0.25 ms.
+CACHE_MIN_SIZE = 32768
+
+
+def load_table(filename, separator=',', cache=None):
+    """
+    Read table columns from csv formated file into float64 NumPy columns,
+    same access by column name than read_table:
+
+        >>> s = load_table(resource_path("saturated_steam.txt"))
+        >>> s.headers[:3]
+        ['T', 'P', 'vf']
+        >>> s["P"][:3]
+        array([ 0.6113,  0.8721,  1.2276])
+
+    The file is parsed in one bulk read and the parsed table is cached in
+    the sidecar file filename + ".npz", used while the modification time
+    and the size of the source file are unchanged. The cache is skipped
+    when it can't be written (read only install).
+
+    :param filename:  csv file, the first line are the headers
+    :param separator: Column separator
+    :param cache:     Use and write the .npz sidecar file, by default only
+                      for files of at least CACHE_MIN_SIZE bytes
+    :return:          Container of columns, attribute headers in the order of the file
+    """
+    stat = os.stat(filename)
+    source = np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+    sidecar = filename + ".npz"
+    if cache is None:
+        cache = stat.st_size >= CACHE_MIN_SIZE
+
+    if cache and os.path.exists(sidecar):
+        try:
+            with np.load(sidecar) as npz:
+                if np.array_equal(npz["source"], source):
+                    return _columns(npz["headers"].tolist(), npz["data"])
+        except Exception:
+            # Damaged cache file, parsed again
+            pass
+
+    with open(filename, 'r') as fp:
+        headers = [h.strip() for h in fp.readline().split(separator)]
+        headers = [h for h in headers if h]
+        # The lines may end with the separator, the empty last column is dropped
+        data = np.loadtxt(fp, delimiter=separator, usecols=range(len(headers)), dtype=float, ndmin=2)
+
+    # One contiguous row per column
+    data = np.ascontiguousarray(data.T)
+
+    if cache:
+        try:
+            with open(sidecar + ".tmp", "wb") as fp:
+                np.savez(fp, source=source, headers=np.array(headers), data=data)
+            os.replace(sidecar + ".tmp", sidecar)
+        except OSError:
+            pass
+
+    return _columns(headers, data)
+
+
+def _columns(headers, data):
+    table = Container(**dict(zip(headers, data)))
+    table.headers = headers
+    return table
+
+
 def read_csv_table(filename, dtype="float"):
     import csv
     fp = open(filename, "rb")
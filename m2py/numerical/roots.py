@@ -3,8 +3,12 @@
 """
 Root finding Methods for solving nonlinear equations.
 
-
+The functions vnraphson, villinois and vbrent solve many independent
+equations at once with numpy arrays, vbracket finds their brackets.
 """
+import numpy as np
+
+from m2py.numerical import solverstats
 
 
 class RootFindErrror(Exception):
@@ -33,6 +37,10 @@ def bissection(f, a, b, tol=1e-3, maxit=2000, debug=False):
 
     Reference: http://mat.iitm.ac.in/home/sryedida/public_html/caimna/transcendental/bracketing%20methods/bisection/bisection.html
     """
+    p = solverstats.probe("bissection")
+    if p is not None:
+        f = p.wrap(f)
+
     it = 0
 
     while it < maxit:
@@ -57,6 +65,9 @@ def bissection(f, a, b, tol=1e-3, maxit=2000, debug=False):
         print("it =", it)
         print("fc ", fc)
 
+    if p is not None:
+        p.done(it, fc, abs(fc) <= tol)
+
     if fc > tol:
         raise RootFindErrror("Root not found ", x=c, it=it, fc=fc)
 
@@ -78,6 +89,10 @@ def nraphson(f, df, x0, tol=1e-3, maxit=20000):
     :param tol:     Tolerance
     :return:        [ x, it, error ]
     """
+    p = solverstats.probe("nraphson")
+    if p is not None:
+        f, df = p.wrap(f), p.wrap(df)
+
     x = 0
     x_ = x0
     it = 0
@@ -95,6 +110,9 @@ def nraphson(f, df, x0, tol=1e-3, maxit=20000):
     # print "it =", it
     # print "error = ", error
 
+    if p is not None:
+        p.done(it, error, error < tol)
+
     return x, it, error
 
 
@@ -131,6 +149,9 @@ def steffenssen(f, x0, tol=1e-3, maxit=20000):
 
     [2] http://www.cs.technion.ac.il/~asidi/Sidi_Journal_Papers/P091_JOMA2006.Vol6.pdf
     """
+    p = solverstats.probe("steffenssen")
+    if p is not None:
+        f = p.wrap(f)
 
     x = x0
     it = 0
@@ -146,6 +167,9 @@ def steffenssen(f, x0, tol=1e-3, maxit=20000):
         if error < tol:
             break
 
+    if p is not None:
+        p.done(it, error, error < tol)
+
     if error > tol:
         raise RootFindErrror("Root not found ", x=x, it=it)
 
@@ -164,6 +188,9 @@ def stefessen2(f, x0, tol=1e-3, maxit=20000):
 
     Reference: http://www.os-cfd.ru/UserFiles/File/e-library/FSI/016_lec08-2x3.pdf
     """
+    p = solverstats.probe("stefessen2")
+    if p is not None:
+        f = p.wrap(f)
 
     x = x0
     it = 0
@@ -186,6 +213,8 @@ def stefessen2(f, x0, tol=1e-3, maxit=20000):
             break
         x0 = x
 
+    if p is not None:
+        p.done(it, error, error < tol)
 
     return x, it, error
 
@@ -204,6 +233,9 @@ def regualfalsi(f, x0, x1, tol=1e-3, maxit=200, debug=False):
 
     Reference: http://www.physics.arizona.edu/~restrepo/475A/Notes/sourcea-/node17.html
     """
+    p = solverstats.probe("regualfalsi")
+    if p is not None:
+        f = p.wrap(f)
 
     x = x0
     it = 0
@@ -228,6 +260,8 @@ def regualfalsi(f, x0, x1, tol=1e-3, maxit=200, debug=False):
             break
 
         if abs(y1-y0)< 1e-6:
+            if p is not None:
+                p.done(it, error, False)
             raise  RootFindErrror("Regula falsi can't compute root y1=y0, denominator zero ", it=str(it), error=str(error), x=str(x))
 
         x = x0 - y0 * (x1 - x0) / (y1 - y0)
@@ -242,8 +276,291 @@ def regualfalsi(f, x0, x1, tol=1e-3, maxit=200, debug=False):
 
 
 
+    if p is not None:
+        p.done(it, error, error < tol)
+
     if error > tol:
         raise RootFindErrror("Root not found ", x=x, it=it, error=error)
 
     return x, it, error
 
+
+
+#------------------------------------------------------#
+#     Vectorized solvers, N equations at once          #
+#------------------------------------------------------#
+#
+# The residual f(x) takes an array x and returns the array of the residuals
+# of the N independent equations, f(x)[k] depends only on x[k]. Every
+# iteration calls f once for all the equations, the equations that
+# converged keep their root and iteration count, the others go on.
+#
+# The bracketed solvers return NaN for the equations where f(a) and f(b)
+# have the same sign.
+
+
+def _bracket(f, a, b):
+    """ Arrays of the bracket a, b, f(a), f(b) and the mask of the valid brackets """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    # Scalar ends of the intervals of all the equations
+    a, b, fa, fb = [np.array(v, dtype=float) for v in np.broadcast_arrays(a, b, f(a), f(b))]
+    return a, b, fa, fb, (np.sign(fa) != np.sign(fb)) & ~np.isnan(fa) & ~np.isnan(fb)
+
+
+def vbracket(f, guess, step=None, lower=None, upper=None, factor=2.0, maxit=60):
+    """
+    Vectorized bracketing, intervals around the guesses where f changes sign
+
+    The interval guess - step, guess + step of every equation grows by
+    factor on the side with the smaller |f| until the sign changes, never
+    beyond the bounds lower and upper. A guess close to the root, the root
+    of a previous solve, gives a narrow bracket in a few evaluations.
+
+    :param f:      Residuals f(x) of an array x
+    :param guess:  Guesses, array
+    :param step:   Half width of the first intervals, default 1% of |guess|
+    :param lower:  (Optional) Lower bound of the domain of f
+    :param upper:  (Optional) Upper bound of the domain of f
+    :return:       [ a, b ] arrays of the intervals, NaN where f doesn't
+                   change sign
+    """
+    guess = np.array(guess, dtype=float)
+    if step is None:
+        step = 1e-2 * np.maximum(np.abs(guess), 1e-2)
+    lower = -np.inf if lower is None else lower
+    upper = np.inf if upper is None else upper
+
+    a = np.maximum(guess - step, lower)
+    b = np.minimum(guess + step, upper)
+    fa = np.asarray(f(a), dtype=float)
+    fb = np.asarray(f(b), dtype=float)
+
+    with np.errstate(invalid="ignore"):
+        for _ in range(maxit):
+            grow = np.sign(fa) == np.sign(fb)
+            if not grow.any():
+                break
+            width = factor * (b - a)
+            left = grow & ((np.abs(fa) < np.abs(fb)) | (b >= upper)) & (a > lower)
+            right = grow & ~left & (b < upper)
+            if not (left | right).any():
+                break
+            if left.any():
+                a = np.where(left, np.maximum(a - width, lower), a)
+                fa = np.where(left, f(a), fa)
+            if right.any():
+                b = np.where(right, np.minimum(b + width, upper), b)
+                fb = np.where(right, f(b), fb)
+
+    found = np.sign(fa) != np.sign(fb)
+    return np.where(found, a, np.nan), np.where(found, b, np.nan)
+
+
+def vnraphson(f, df, x0, tol=1e-10, maxit=100, a=None, b=None):
+    """
+    Vectorized Newton Raphson, N equations at once
+
+    :param f:     Residuals f(x) of an array x
+    :param df:    Derivates f'(x) of an array x
+    :param x0:    Inital guesses, array
+    :param tol:   Relative tolerance of x
+    :param maxit: Max number of iterations
+    :param a:     (Optional) Brackets [a, b] of the roots, the steps that
+    :param b:     leave the bracket are replaced by bisections
+    :return:      [ x, it, error ] arrays of the roots, iterations and
+                  relative errors, NaN where the iteration diverged
+
+    Example:
+
+        >>> import numpy as np
+        >>> c = np.array([2.0, 3.0, 5.0])
+        >>> x, it, error = vnraphson(lambda x: x**2 - c, lambda x: 2*x, np.ones(3))
+        >>> x
+        array([1.41421356, 1.73205081, 2.23606798])
+    """
+    p = solverstats.probe("vnraphson")
+    if p is not None:
+        f, df = p.wrap(f), p.wrap(df)
+
+    x = np.array(x0, dtype=float)
+    bracketed = a is not None and b is not None
+    if bracketed:
+        a, b, fa, fb, valid = _bracket(f, a, b)
+        x = np.where(valid, np.clip(x, np.minimum(a, b), np.maximum(a, b)), np.nan)
+
+    it = np.zeros(x.shape, dtype=int)
+    error = np.full(x.shape, np.inf)
+    active = np.isfinite(x)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(maxit):
+            if not active.any():
+                break
+            fx = f(x)
+            new = x - fx / df(x)
+
+            if bracketed:
+                left = np.sign(fx) == np.sign(fa)
+                a = np.where(active & left, x, a)
+                fa = np.where(active & left, fx, fa)
+                b = np.where(active & ~left, x, b)
+                outside = (new < np.minimum(a, b)) | (new > np.maximum(a, b))
+                # A converged step just out of the bracket by rounding is kept
+                outside &= np.abs(new - x) > tol * np.maximum(np.abs(x), tol)
+                new = np.where(outside | ~np.isfinite(new), (a + b) / 2, new)
+
+            new = np.where(fx == 0, x, new)
+            err = np.abs(new - x) / np.maximum(np.abs(x), tol)
+            x = np.where(active, new, x)
+            error = np.where(active, err, error)
+            it += active
+            active &= (err > tol) & np.isfinite(x)
+
+    if p is not None:
+        p.done(it, error, error <= tol)
+
+    return x, it, error
+
+
+def villinois(f, a, b, tol=1e-10, maxit=200):
+    """
+    Vectorized Illinois method, regula falsi that halves the residual of
+    the end of the bracket that is kept twice in a row
+
+    :param f:     Residuals f(x) of an array x
+    :param a:     First values of the intervals where the roots lie
+    :param b:     Second values of the intervals where the roots lie
+    :param tol:   Tolerance of the width of the bracket, relative to x
+    :param maxit: Max number of iterations
+    :return:      [ x, it, error ] arrays of the roots, iterations and
+                  residuals |f(x)|
+
+    Reference: M. Dowell and P. Jarratt, A modified regula falsi method
+    for computing the root of an equation, BIT 11 (1971)
+    """
+    p = solverstats.probe("villinois")
+    if p is not None:
+        f = p.wrap(f)
+    a, b, fa, fb, active = _bracket(f, a, b)
+    x = np.where(active, np.where(np.abs(fa) < np.abs(fb), a, b), np.nan)
+    fx = np.where(active, np.minimum(np.abs(fa), np.abs(fb)), np.nan)
+    it = np.zeros(x.shape, dtype=int)
+    side = np.zeros(x.shape, dtype=int)
+    active &= (fa != 0) & (fb != 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(maxit):
+            if not active.any():
+                break
+            c = np.where(active, (a * fb - b * fa) / (fb - fa), x)
+            fc = f(c)
+
+            # c replaces the end with the same sign
+            keep_a = active & (np.sign(fc) == np.sign(fb))
+            keep_b = active & ~keep_a
+            fa = np.where(keep_a & (side == -1), fa / 2, fa)
+            fb = np.where(keep_b & (side == +1), fb / 2, fb)
+            b, fb = np.where(keep_a, c, b), np.where(keep_a, fc, fb)
+            a, fa = np.where(keep_b, c, a), np.where(keep_b, fc, fa)
+            side = np.where(keep_a, -1, np.where(keep_b, +1, side))
+
+            x = np.where(active, c, x)
+            fx = np.where(active, np.abs(fc), fx)
+            it += active
+            active &= (fc != 0) & (np.abs(b - a) > tol * np.maximum(np.abs(c), 1.0))
+
+    if p is not None:
+        p.done(it, fx, ~np.isnan(x) & (it < maxit))
+
+    return x, it, fx
+
+
+def vbrent(f, a, b, tol=1e-12, maxit=100):
+    """
+    Vectorized Brent method, inverse quadratic interpolation and secant
+    steps safeguarded by bisection, the root stays bracketed
+
+    :param f:     Residuals f(x) of an array x
+    :param a:     First values of the intervals where the roots lie
+    :param b:     Second values of the intervals where the roots lie
+    :param tol:   Tolerance of x, relative to x
+    :param maxit: Max number of iterations
+    :return:      [ x, it, error ] arrays of the roots, iterations and
+                  residuals |f(x)|
+
+    Example: 100000 equations x**3 = c
+
+        >>> import numpy as np
+        >>> c = np.linspace(1, 1000, 100000)
+        >>> x, it, error = vbrent(lambda x: x**3 - c, 0, 11)
+        >>> abs(x**3 - c).max() < 1e-9, it.max()
+        (True, 9)
+
+    Reference: R. P. Brent, Algorithms for Minimization without Derivatives,
+    chapter 4, the step selection of scipy.optimize.brentq
+    """
+    p = solverstats.probe("vbrent")
+    if p is not None:
+        f = p.wrap(f)
+    xpre, xcur, fpre, fcur, active = _bracket(f, a, b)
+    n = xcur.shape
+    xblk = np.zeros(n)
+    fblk = np.zeros(n)
+    spre = np.zeros(n)
+    scur = np.zeros(n)
+    it = np.zeros(n, dtype=int)
+
+    # Roots at the ends of the intervals
+    xcur = np.where(fpre == 0, xpre, xcur)
+    fcur = np.where(fpre == 0, 0.0, fcur)
+    xcur = np.where(active, xcur, np.nan)
+    active &= fcur != 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(maxit + 1):
+            # The other end of the bracket, blk, has the opposite sign
+            new = active & (fpre != 0) & (np.sign(fpre) != np.sign(fcur))
+            xblk = np.where(new, xpre, xblk)
+            fblk = np.where(new, fpre, fblk)
+            spre = np.where(new, xcur - xpre, spre)
+            scur = np.where(new, xcur - xpre, scur)
+
+            # cur is the best approximation
+            swap = active & (np.abs(fblk) < np.abs(fcur))
+            xpre = np.where(swap, xcur, xpre)
+            fpre = np.where(swap, fcur, fpre)
+            xcur, xblk = np.where(swap, xblk, xcur), np.where(swap, xcur, xblk)
+            fcur, fblk = np.where(swap, fblk, fcur), np.where(swap, fcur, fblk)
+
+            delta = tol * np.maximum(np.abs(xcur), 1e-3) / 2
+            sbis = (xblk - xcur) / 2
+            active &= (fcur != 0) & (np.abs(sbis) >= delta)
+            if not active.any() or it.max() >= maxit:
+                break
+
+            # Secant step between two points, inverse quadratic with three
+            secant = -fcur * (xcur - xpre) / (fcur - fpre)
+            dpre = (fpre - fcur) / (xpre - xcur)
+            dblk = (fblk - fcur) / (xblk - xcur)
+            quadratic = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            stry = np.where(xpre == xblk, secant, quadratic)
+
+            interpolate = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+            good = interpolate & np.isfinite(stry) & \
+                (2 * np.abs(stry) < np.minimum(np.abs(spre), 3 * np.abs(sbis) - delta))
+            spre = np.where(active, np.where(good, scur, sbis), spre)
+            scur = np.where(active, np.where(good, stry, sbis), scur)
+
+            step = np.where(np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta))
+            xpre = np.where(active, xcur, xpre)
+            fpre = np.where(active, fcur, fpre)
+            xcur = np.where(active, xcur + step, xcur)
+            fcur = np.where(active, f(xcur), fcur)
+            it += active
+
+    error = np.where(np.isnan(xcur), np.nan, np.abs(fcur))
+    if p is not None:
+        p.done(it, error, ~np.isnan(xcur) & (it < maxit))
+
+    return xcur, it, error
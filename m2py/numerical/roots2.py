@@ -3,13 +3,19 @@
 """
 Iplementation using functional programming principles
 
+The solves are recorded in the active m2py.numerical.solverstats.SolverStats,
+the evaluations are the iterations times the function evaluations of
+each iteration of the solver.
 """
+from m2py.numerical import solverstats
 
 
-def iterate_root(function):
+def iterate_root(function, name="iterate_root", evaluations=1):
 
     def solver(guess, itmax=100, tol=1e-3, debug=False):
+        p = solverstats.probe(name)
         x = guess
+        error = float("nan")
         for i in range(itmax):
 
             x_ = x
@@ -25,17 +31,25 @@ def iterate_root(function):
                 if debug:
                     print("guess = ", guess, "x = ", x, " error = ", error, "iteratiosn = ", i)
 
+                if p is not None:
+                    p.done(i + 1, error, True, (i + 1) * evaluations)
+
                 return x
 
+        if p is not None:
+            p.done(itmax, error, False, itmax * evaluations)
+
         raise Exception("Root not found")
 
     return solver
 
-def iterate_root2(function):
+def iterate_root2(function, name="iterate_root2", evaluations=1):
 
     def solver2(guess0, guess1, itmax=100, tol=1e-3, debug=False):
+        p = solverstats.probe(name)
         x_ = guess0
         x = guess1
+        error = float("nan")
 
         for i in range(itmax):
 
@@ -49,8 +63,14 @@ def iterate_root2(function):
                 if debug:
                     print("guess = ", (guess0, guess1), "x = ", x, " error = ", error, "iteratiosn = ", i)
 
+                if p is not None:
+                    p.done(i + 1, error, True, (i + 1) * evaluations)
+
                 return x
 
+        if p is not None:
+            p.done(itmax, error, False, itmax * evaluations)
+
         raise Exception("Root not found")
 
     return solver2
@@ -59,7 +79,7 @@ def iterate_root2(function):
 
 def newton_solver(func, derv):
     newton_iterator = lambda x: x - func(x) / derv(x)
-    solver = iterate_root(newton_iterator)
+    solver = iterate_root(newton_iterator, "newton_solver", 2)
     return solver
 
 
@@ -69,7 +89,7 @@ def steff_solver(func):
         y = func(x)
         return x - y ** 2 / (func(x + y) - y)
 
-    solver = iterate_root(iterator)
+    solver = iterate_root(iterator, "steff_solver", 2)
     return solver
 
 
@@ -91,7 +111,7 @@ def regulafalsi_solver(func):
 
         return x0, x1
 
-    solver = iterate_root2(iterator)
+    solver = iterate_root2(iterator, "regulafalsi_solver", 3)
 
     return solver
 
@@ -111,40 +131,144 @@ def bissection_solver(func):
 
         return x0, x1
 
-    solver = iterate_root2(iterator)
+    solver = iterate_root2(iterator, "bissection_solver", 2)
 
     return solver
 
 
-def super_solver(func):
+def find_bracket(func, guess, step=None, lower=None, upper=None, factor=2.0, itmax=60):
     """
-    :param func:
-    :return:
+    Interval around guess where func changes sign
+
+    The interval guess - step, guess + step grows by factor on the side
+    with the smaller |func| until the sign changes, never beyond the
+    bounds lower and upper of the domain of func.
+
+    :return: (a, b, fa, fb)
     """
+    if step is None:
+        step = 1e-2 * max(abs(guess), 1e-2)
+
+    a, b = guess - step, guess + step
+    if lower is not None:
+        a = max(a, lower)
+    if upper is not None:
+        b = min(b, upper)
+    fa, fb = func(a), func(b)
+
+    for i in range(itmax):
+        if fa * fb <= 0:
+            return a, b, fa, fb
+
+        width = factor * (b - a)
+        if (abs(fa) < abs(fb) or b == upper) and a != lower:
+            a = a - width if lower is None else max(a - width, lower)
+            fa = func(a)
+        elif b != upper:
+            b = b + width if upper is None else min(b + width, upper)
+            fb = func(b)
+        else:
+            break
 
-    def steff_iterator(x):
-        y = func(x)
-        return x - y ** 2 / (func(x + y) - y)
+    raise Exception("Root not bracketed")
 
-    def iterator(x0, x1):
 
-        x = (x0 + x1) / 2
+def super_solver(func, lower=None, upper=None):
+    """
+    Derivative free solver with automatic bracketing and warm start
+
+    The root is bracketed from the guesses, see find_bracket, and the
+    bracket is shrunk by Chandrupatla's method: inverse quadratic
+    interpolation when the three last points are close to a quadratic,
+    bisection otherwise. The root stays bracketed, there are no
+    derivatives and the convergence is superlinear.
+
+    :param func:  Function f(x)
+    :param lower: (Optional) Lower bound of the domain of func
+    :param upper: (Optional) Upper bound of the domain of func
+    :return:      solver(guess0=None, guess1=None, itmax=100, tol=1e-3, step=None, debug=False)
+
+        guess0, guess1  Interval of the root, it is expanded if func doesn't change
+                        sign. Without guess1 the interval is around guess0, without
+                        guess0 around the last root found, solver.root, a warm
+                        start that re-solves a slightly changed equation in a
+                        few iterations
+        tol             Tolerance of x, relative to |x| for |x| > 1
+        step            Half width of the interval around guess0
+
+    Example:
+        >>> from math import exp
+        >>> solver = super_solver(lambda x: x ** 2 - exp(x))
+        >>> solver(-20, 13, tol=1e-10)
+        -0.7034674224983917
+
+    Reference: T. R. Chandrupatla, A new hybrid quadratic/bisection algorithm
+    for finding the zero of a nonlinear function without using derivatives,
+    Advances in Engineering Software 28 (1997)
+    """
 
-        fx = func(x)
+    def solver(guess0=None, guess1=None, itmax=100, tol=1e-3, step=None, debug=False):
+        p = solverstats.probe("super_solver")
+        f = func if p is None else p.wrap(func)
 
-        if func(x0) * fx < 0:
-            x1 = x
+        if guess0 is None:
+            if solver.root is None:
+                raise ValueError("A guess is needed for the first solve")
+            guess0 = solver.root
+
+        if guess1 is None:
+            a, b, fa, fb = find_bracket(f, guess0, step, lower, upper)
         else:
-            x0 = x
+            a, b = guess0, guess1
+            fa, fb = f(a), f(b)
+            if fa * fb > 0:
+                a, b, fa, fb = find_bracket(f, (a + b) / 2.0, abs(b - a) / 2.0, lower, upper)
+
+        # a is the last point, b and c the previous ones, the root is between a and b
+        x, fx = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+        t = 0.5
+        i = 0
+
+        while fx != 0:
+            if i == itmax:
+                if p is not None:
+                    p.done(i, abs(fx), False)
+                raise Exception("Root not found")
+            i += 1
+
+            xt = a + t * (b - a)
+            ft = f(xt)
+            if (ft > 0) == (fa > 0):
+                c, fc = a, fa
+            else:
+                c, fc, b, fb = b, fb, a, fa
+            a, fa = xt, ft
+
+            x, fx = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+            tl = tol * max(abs(x), 1.0) / abs(b - c)
+            if tl > 0.5:
+                break
+
+            # Inverse quadratic interpolation if the points are close to a quadratic
+            xi = (a - b) / (c - b)
+            phi = (fa - fb) / (fc - fb)
+            if phi ** 2 < xi and (1 - phi) ** 2 < 1 - xi:
+                t = fa / (fb - fa) * fc / (fb - fc) + (c - a) / (b - a) * fa / (fc - fa) * fb / (fc - fb)
+            else:
+                t = 0.5
+            t = min(1 - tl, max(tl, t))
 
-        x1 = steff_iterator(x1)
-        x0 = steff_iterator(x0)
+        if debug:
+            print("guess = ", (guess0, guess1), "x = ", x, " f(x) = ", fx, "iteratiosn = ", i)
 
-        return x0, x1
+        if p is not None:
+            p.done(i, abs(fx), True)
 
-    solver = iterate_root2(iterator)
-    return solver
+        solver.root = x
+        return x
 
+    solver.root = None
+    return solver
 
 
 def test_solvers():
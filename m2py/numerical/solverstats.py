@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Convergence statistics of the root finding solvers
+
+The solvers of m2py.numerical.roots and m2py.numerical.roots2 record
+every solve in the active SolverStats, the iterations, the function
+evaluations, the wall time, the final residual and if it converged. No
+SolverStats is active by default, then a solver only checks a global
+variable and its functions are not wrapped.
+
+Example:
+
+    >>> from m2py.numerical import roots, solverstats
+    >>> with solverstats.record() as stats:
+    ...     yields = brbonds.bond_yields(prices, coupons, settles, maturities)
+    >>> stats.summary()
+    {'vnraphson': {'solves': 1, 'equations': 20000, 'iterations': {'mean': 4.2, 'p50': 4.0, ...
+    >>> stats.slowest(5)            # The equations with more iterations
+
+The vectorized solvers record a solve of many equations, the iterations
+and residuals of every equation and the evaluations and time of the
+whole solve.
+"""
+import time
+from contextlib import contextmanager
+
+import numpy
+
+# Active SolverStats, None when the solvers aren't instrumented
+_active = None
+
+PERCENTILES = (50, 90, 99)
+
+
+class SolverStats(object):
+    """
+    Records of the solves, aggregated by solver
+
+    Every record is a dictionary:
+
+        solver       Name of the solver function
+        tag          Tag of the SolverStats when the solve ran
+        iterations   Iterations, array of the equations of a vectorized solver
+        evaluations  Function evaluations (calls of the vectorized function),
+                     an estimate for the roots2 fixed point solvers, the
+                     iterations times the evaluations per iteration
+        time         Wall time in seconds
+        residual     Final residual or error, array of the equations
+        converged    True if converged, array of the equations
+
+    :param tag: Tag of the next records, the tag attribute can be changed
+                between solves, e.g. the name of the bond being solved
+    """
+
+    def __init__(self, tag=None):
+        self.tag = tag
+        self.records = []
+
+    def add(self, solver, iterations, evaluations, seconds, residual, converged):
+        self.records.append({
+            "solver": solver,
+            "tag": self.tag,
+            "iterations": iterations,
+            "evaluations": evaluations,
+            "time": seconds,
+            "residual": residual,
+            "converged": converged,
+        })
+
+    def merge(self, other):
+        """ Add the records of other SolverStats """
+        self.records.extend(other.records)
+        return self
+
+    def clear(self):
+        del self.records[:]
+
+    def __len__(self):
+        return len(self.records)
+
+    def _select(self, solver=None, tag=None):
+        return [r for r in self.records
+                if (solver is None or r["solver"] == solver) and (tag is None or r["tag"] == tag)]
+
+    def values(self, field, solver=None, tag=None):
+        """
+        Float array of a field of the records, the values of every
+        equation of the vectorized solves
+
+        :param field:  iterations, evaluations, time, residual or converged
+        :param solver: Only the records of this solver
+        :param tag:    Only the records of this tag
+        """
+        records = self._select(solver, tag)
+        if not records:
+            return numpy.array([], dtype=float)
+        return numpy.concatenate([numpy.ravel(numpy.asarray(r[field], dtype=float)) for r in records])
+
+    def percentiles(self, field, q=PERCENTILES, solver=None, tag=None):
+        """ Dictionary {q: percentile} of a field, NaN without records """
+        return _percentiles(self.values(field, solver, tag), q)
+
+    def histogram(self, field="iterations", bins=10, solver=None, tag=None):
+        """ (counts, edges) of a field, see numpy.histogram """
+        x = self.values(field, solver, tag)
+        return numpy.histogram(x[~numpy.isnan(x)], bins)
+
+    def summary(self, solver=None, tag=None):
+        """
+        Statistics of each solver: number of solves and equations, not
+        converged equations, total evaluations and time, mean and
+        percentiles of the iterations and time per solve, max residual
+        """
+        solvers = sorted(set(r["solver"] for r in self._select(solver, tag)))
+        result = {}
+
+        for name in solvers:
+            records = self._select(name, tag)
+            iterations = self.values("iterations", name, tag)
+            times = self.values("time", name, tag)
+            residual = numpy.abs(self.values("residual", name, tag))
+            converged = self.values("converged", name, tag)
+
+            stats = {
+                "solves": len(records),
+                "equations": iterations.size,
+                "failed": int(numpy.sum(converged == 0)),
+                "evaluations": int(numpy.nansum(self.values("evaluations", name, tag))),
+                "time": float(times.sum()),
+                "residual": float(numpy.nanmax(residual)) if numpy.isfinite(residual).any() else numpy.nan,
+            }
+            stats["iterations"] = _describe(iterations)
+            stats["time_per_solve"] = _describe(times)
+            result[name] = stats
+
+        return result
+
+    def slowest(self, n=10, field="iterations", solver=None, tag=None):
+        """
+        The n equations with the largest field
+
+        :return: List of (value, record number, equation number, tag),
+                 the equation number is the position in the arrays of a
+                 vectorized solve, 0 for the scalar solves
+        """
+        items = []
+        for k, r in enumerate(self.records):
+            if (solver is not None and r["solver"] != solver) or (tag is not None and r["tag"] != tag):
+                continue
+            x = numpy.ravel(numpy.asarray(r[field], dtype=float))
+            for i in numpy.argsort(-x, kind="stable")[:n]:
+                items.append((float(x[i]), k, int(i), r["tag"]))
+        items.sort(key=lambda item: -item[0])
+        return items[:n]
+
+
+def _percentiles(x, q=PERCENTILES):
+    x = x[~numpy.isnan(x)]
+    if not x.size:
+        return dict((p, numpy.nan) for p in q)
+    return dict(zip(q, numpy.percentile(x, q).tolist()))
+
+
+def _describe(x):
+    """ Mean, max and percentiles p50, p90 ... of an array """
+    item = {"mean": float(numpy.nanmean(x)) if x.size else numpy.nan,
+            "max": float(numpy.nanmax(x)) if x.size else numpy.nan}
+    for p, v in _percentiles(x).items():
+        item["p%d" % p] = v
+    return item
+
+
+class _Probe(object):
+    """ Counter of the evaluations and clock of one solve """
+
+    def __init__(self, stats, solver):
+        self.stats = stats
+        self.solver = solver
+        self.evaluations = 0
+        self.start = time.perf_counter()
+
+    def wrap(self, f):
+        """ f counting its calls in the evaluations """
+        def counted(*args):
+            self.evaluations += 1
+            return f(*args)
+        return counted
+
+    def done(self, iterations, residual, converged=True, evaluations=None):
+        self.stats.add(self.solver, iterations, self.evaluations if evaluations is None else evaluations,
+                       time.perf_counter() - self.start, residual, converged)
+
+
+def probe(solver):
+    """
+    Probe of a solve, None when no SolverStats is active
+
+    The solvers call it once per solve:
+
+        p = solverstats.probe("bissection")
+        if p is not None:
+            f = p.wrap(f)                     # Counts the evaluations
+        ...
+        if p is not None:
+            p.done(it, error, converged)
+    """
+    if _active is None:
+        return None
+    return _Probe(_active, solver)
+
+
+def enable(stats=None):
+    """ Record the solves in stats, a new SolverStats by default, and return it """
+    global _active
+    _active = SolverStats() if stats is None else stats
+    return _active
+
+
+def disable():
+    """ Stop recording the solves, return the SolverStats that was active """
+    global _active
+    stats, _active = _active, None
+    return stats
+
+
+@contextmanager
+def record(stats=None, tag=None):
+    """
+    Record the solves inside a with block
+
+    :param stats: SolverStats, default a new one
+    :param tag:   Tag of the records
+    """
+    global _active
+    previous = _active
+    stats = SolverStats(tag) if stats is None else stats
+    if tag is not None:
+        stats.tag = tag
+    _active = stats
+    try:
+        yield stats
+    finally:
+        _active = previous
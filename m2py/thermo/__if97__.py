@@ -0,0 +1,511 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+IAPWS IF-97 coefficient tables
+
+Coefficients of the basic and backward equations used by the steam
+table functions, stored once at module level as tuples so they are not
+rebuilt on every call.
+
+Each equation is stored as three tuples of the same length
+
+    <equation>_I    Exponents of the first reduced variable
+    <equation>_J    Exponents of the second reduced variable
+    <equation>_n    Coefficients
+
+The second part of the module compiles the tables into Series objects.
+A series is evaluated with the Horner scheme by a small python function
+generated on its first call; the powers of the reduced variables are
+computed once per call and shared between the terms, and the Evaluator
+objects share them between several derivatives of the same equation.
+Generated functions only use arithmetic operators so they accept floats
+and numpy arrays alike.
+
+Release on the IAPWS Industrial formulation 1997 for the Thermodynamic
+Properties of Water and Steam, September 1997
+"""
+
+R = 0.461526  # kJ/(kg K)
+
+# Region 1 - Basic equation, Table 2, Page 7
+gamma1_I = (0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31,
+            32)
+gamma1_J = (-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29,
+            -31, -38, -39, -40, -41)
+gamma1_n = (0.14632971213167, -0.84548187169114, -3.756360367204, 3.3855169168385, -0.95791963387872,
+            0.15772038513228, -0.016616417199501, 0.00081214629983568, 0.00028319080123804, -0.00060706301565874,
+            -0.018990068218419, -0.032529748770505, -0.021841717175414, -5.283835796993e-05, -0.00047184321073267,
+            -0.00030001780793026, 4.7661393906987e-05, -4.4141845330846e-06, -7.2694996297594e-16,
+            -3.1679644845054e-05, -2.8270797985312e-06, -8.5205128120103e-10, -2.2425281908e-06,
+            -6.5171222895601e-07, -1.4341729937924e-13, -4.0516996860117e-07, -1.2734301741641e-09,
+            -1.7424871230634e-10, -6.8762131295531e-19, 1.4478307828521e-20, 2.6335781662795e-23,
+            -1.1947622640071e-23, 1.8228094581404e-24, -9.3537087292458e-26)
+
+# Region 2 - Ideal-gas part, Table 10, Page 13
+gamma2o_J = (0, 1, -5, -4, -3, -2, -1, 2, 3)
+gamma2o_n = (-9.6927686500217, 10.086655968018, -0.005608791128302, 0.071452738081455, -0.40710498223928,
+             1.4240819171444, -4.383951131945, -0.28408632460772, 0.021268463753307)
+
+# Region 2 - Residual part, Table 11, Page 14
+gamma2r_I = (1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 6, 6, 6, 7, 7, 7, 8, 8, 9, 10, 10, 10, 16, 16,
+             18, 20, 20, 20, 21, 22, 23, 24, 24, 24)
+gamma2r_J = (0, 1, 2, 3, 6, 1, 2, 4, 7, 36, 0, 1, 3, 6, 35, 1, 2, 3, 7, 3, 16, 35, 0, 11, 25, 8, 36, 13, 4, 10, 14,
+             29, 50, 57, 20, 35, 48, 21, 53, 39, 26, 40, 58)
+gamma2r_n = (-0.0017731742473213, -0.017834862292358, -0.045996013696365, -0.057581259083432, -0.05032527872793,
+             -3.3032641670203e-05, -0.00018948987516315, -0.0039392777243355, -0.043797295650573,
+             -2.6674547914087e-05, 2.0481737692309e-08, 4.3870667284435e-07, -3.227767723857e-05,
+             -0.0015033924542148, -0.040668253562649, -7.8847309559367e-10, 1.2790717852285e-08,
+             4.8225372718507e-07, 2.2922076337661e-06, -1.6714766451061e-11, -0.0021171472321355, -23.895741934104,
+             -5.905956432427e-18, -1.2621808899101e-06, -0.038946842435739, 1.1256211360459e-11, -8.2311340897998,
+             1.9809712802088e-08, 1.0406965210174e-19, -1.0234747095929e-13, -1.0018179379511e-09,
+             -8.0882908646985e-11, 0.10693031879409, -0.33662250574171, 8.9185845355421e-25, 3.0629316876232e-13,
+             -4.2002467698208e-06, -5.9056029685639e-26, 3.7826947613457e-06, -1.2768608934681e-15,
+             7.3087610595061e-29, 5.5414715350778e-17, -9.436970724121e-07)
+
+# Region 3 - Basic equation, Table 30, Page 30
+phi3_I = (0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 6, 6, 6, 7, 8,
+          9, 9, 10, 10, 11)
+phi3_J = (0, 0, 1, 2, 7, 10, 12, 23, 2, 6, 15, 17, 0, 2, 6, 7, 22, 26, 0, 2, 4, 16, 26, 0, 2, 4, 26, 1, 3, 26, 0, 2,
+          26, 2, 26, 2, 26, 0, 1, 26)
+phi3_n = (1.0658070028513, -15.732845290239, 20.944396974307, -7.6867707878716, 2.6185947787954, -2.808078114862,
+          1.2053369696517, -0.0084566812812502, -1.2654315477714, -1.1524407806681, 0.88521043984318,
+          -0.64207765181607, 0.38493460186671, -0.85214708824206, 4.8972281541877, -3.0502617256965,
+          0.039420536879154, 0.12558408424308, -0.2799932969871, 1.389979956946, -2.018991502357,
+          -0.0082147637173963, -0.47596035734923, 0.0439840744735, -0.44476435428739, 0.90572070719733,
+          0.70522450087967, 0.10770512626332, -0.32913623258954, -0.50871062041158, -0.022175400873096,
+          0.094260751665092, 0.16436278447961, -0.013503372241348, -0.014834345352472, 0.00057922953628084,
+          0.0032308904703711, 8.0964802996215e-05, -0.00016557679795037, -4.4923899061815e-05)
+
+# Region 5 - Ideal-gas part, Table 37, Page 37
+gamma5o_J = (0, 1, -3, -2, -1, 2)
+gamma5o_n = (-13.179983674201, 6.8540841634434, -0.024805148933466, 0.36901534980333, -3.1161318213925,
+             -0.32961626538917)
+
+# Region 5 - Residual part, Table 38, Page 37
+gamma5r_I = (1, 1, 1, 2, 3)
+gamma5r_J = (0, 1, 3, 9, 3)
+gamma5r_n = (-0.00012563183589592, 0.0021774678714571, -0.004594282089991, -3.9724828359569e-06,
+             1.2919228289784e-07)
+
+# Backward equation T(p, h) for region 1, Table 6, Page 10
+T1ph_I = (0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 2, 2, 3, 3, 4, 5, 6)
+T1ph_J = (0, 1, 2, 6, 22, 32, 0, 1, 2, 3, 4, 10, 32, 10, 32, 10, 32, 32, 32, 32)
+T1ph_n = (-238.72489924521, 404.21188637945, 113.49746881718, -5.8457616048039, -0.0001528548241314,
+          -1.0866707695377e-06, -13.391744872602, 43.211039183559, -54.010067170506, 30.535892203916,
+          -6.5964749423638, 0.0093965400878363, 1.157364750534e-07, -2.5858641282073e-05, -4.0644363084799e-09,
+          6.6456186191635e-08, 8.0670734103027e-11, -9.3477771213947e-13, 5.8265442020601e-15, -1.5020185953503e-17)
+
+# Backward equation T(p, s) for region 1, Table 8, Page 11
+T1ps_I = (0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 4)
+T1ps_J = (0, 1, 2, 3, 11, 31, 0, 1, 2, 3, 12, 31, 0, 1, 2, 9, 31, 10, 32, 32)
+T1ps_n = (174.78268058307, 34.806930892873, 6.5292584978455, 0.33039981775489, -1.9281382923196e-07,
+          -2.4909197244573e-23, -0.26107636489332, 0.22592965981586, -0.064256463395226, 0.0078876289270526,
+          3.5672110607366e-10, 1.7332496994895e-24, 0.00056608900654837, -0.00032635483139717, 4.4778286690632e-05,
+          -5.1322156908507e-10, -4.2522657042207e-26, 2.6400441360689e-13, 7.8124600459723e-29,
+          -3.0732199903668e-31)
+
+# Backward equation T(p, h) for subregion 2a, Table 20, Page 22
+T2ph_a_I = (0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 4, 4, 4, 5, 5, 5, 6, 6, 7)
+T2ph_a_J = (0, 1, 2, 3, 7, 20, 0, 1, 2, 3, 7, 9, 11, 18, 44, 0, 2, 7, 36, 38, 40, 42, 44, 24, 44, 12, 32, 44, 32,
+            36, 42, 34, 44, 28)
+T2ph_a_n = (1089.8952318288, 849.51654495535, -107.81748091826, 33.153654801263, -7.4232016790248, 11.765048724356,
+            1.844574935579, -4.1792700549624, 6.2478196935812, -17.344563108114, -200.58176862096, 271.96065473796,
+            -455.11318285818, 3091.9688604755, 252266.40357872, -0.0061707422868339, -0.31078046629583,
+            11.670873077107, 128127984.04046, -985549096.23276, 2822454697.3002, -3594897141.0703, 1722734991.3197,
+            -13551.334240775, 12848734.66465, 1.3865724283226, 235988.32556514, -13105236.545054, 7399.9835474766,
+            -551966.9703006, 3715408.5996233, 19127.72923966, -415351.64835634, -62.459855192507)
+
+# Backward equation T(p, h) for subregion 2b, Table 21, Page 23
+T2ph_b_I = (0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 5, 5, 5, 6, 7,
+            7, 9, 9)
+T2ph_b_J = (0, 1, 2, 12, 18, 24, 28, 40, 0, 2, 6, 12, 18, 24, 28, 40, 2, 8, 18, 40, 1, 2, 12, 24, 2, 12, 18, 24, 28,
+            40, 18, 24, 40, 28, 2, 28, 1, 40)
+T2ph_b_n = (1489.5041079516, 743.07798314034, -97.708318797837, 2.4742464705674, -0.63281320016026, 1.1385952129658,
+            -0.47811863648625, 0.0085208123431544, 0.93747147377932, 3.3593118604916, 3.3809355601454,
+            0.16844539671904, 0.73875745236695, -0.47128737436186, 0.15020273139707, -0.002176411421975,
+            -0.021810755324761, -0.10829784403677, -0.046333324635812, 7.1280351959551e-05, 0.00011032831789999,
+            0.00018955248387902, 0.0030891541160537, 0.0013555504554949, 2.8640237477456e-07, -1.0779857357512e-05,
+            -7.6462712454814e-05, 1.4052392818316e-05, -3.1083814331434e-05, -1.0302738212103e-06,
+            2.821728163504e-07, 1.2704902271945e-06, 7.3803353468292e-08, -1.1030139238909e-08,
+            -8.1456365207833e-14, -2.5180545682962e-11, -1.7565233969407e-18, 8.6934156344163e-15)
+
+# Backward equation T(p, h) for subregion 2c, Table 22, Page 24
+T2ph_c_I = (-7, -7, -6, -6, -5, -5, -2, -2, -1, -1, 0, 0, 1, 1, 2, 6, 6, 6, 6, 6, 6, 6, 6)
+T2ph_c_J = (0, 4, 0, 2, 0, 2, 0, 1, 0, 2, 0, 1, 4, 8, 4, 0, 1, 4, 10, 12, 16, 20, 22)
+T2ph_c_n = (-3236839855524.2, 7326335090218.1, 358250899454.47, -583401318515.9, -10783068217.47, 20825544563.171,
+            610747.83564516, 859777.2253558, -25745.72360417, 31081.088422714, 1208.2315865936, 482.19755109255,
+            3.7966001272486, -10.842984880077, -0.04536417267666, 1.4559115658698e-13, 1.126159740723e-12,
+            -1.7804982240686e-11, 1.2324579690832e-07, -1.1606921130984e-06, 2.7846367088554e-05,
+            -0.00059270038474176, 0.0012918582991878)
+
+# Backward equation T(p, s) for subregion 2a, Table 25, Page 26
+T2ps_a_I = (-1.5, -1.5, -1.5, -1.5, -1.5, -1.5, -1.25, -1.25, -1.25, -1, -1, -1, -1, -1, -1, -0.75, -0.75, -0.5,
+            -0.5, -0.5, -0.5, -0.25, -0.25, -0.25, -0.25, 0.25, 0.25, 0.25, 0.25, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5,
+            0.75, 0.75, 0.75, 0.75, 1, 1, 1.25, 1.25, 1.5, 1.5)
+T2ps_a_J = (-24, -23, -19, -13, -11, -10, -19, -15, -6, -26, -21, -17, -16, -9, -8, -15, -14, -26, -13, -9, -7, -27,
+            -25, -11, -6, 1, 4, 8, 11, 0, 1, 5, 6, 10, 14, 16, 0, 4, 9, 17, 7, 18, 3, 15, 5, 18)
+T2ps_a_n = (-392359.83861984, 515265.7382727, 40482.443161048, -321.93790923902, 96.961424218694, -22.867846371773,
+            -449429.14124357, -5011.8336020166, 0.35684463560015, 44235.33584819, -13673.388811708, 421632.60207864,
+            22516.925837475, 474.42144865646, -149.31130797647, -197811.26320452, -23554.39947076, -19070.616302076,
+            55375.669883164, 3829.3691437363, -603.91860580567, 1936.3102620331, 4266.064369861, -5978.0638872718,
+            -704.01463926862, 338.36784107553, 20.862786635187, 0.033834172656196, -4.3124428414893e-05,
+            166.53791356412, -139.86292055898, -0.78849547999872, 0.072132411753872, -0.0059754839398283,
+            -1.2141358953904e-05, 2.3227096733871e-07, -10.538463566194, 2.0718925496502, -0.072193155260427,
+            2.074988708112e-07, -0.018340657911379, 2.9036272348696e-07, 0.21037527893619, 0.00025681239729999,
+            -0.012799002933781, -8.2198102652018e-06)
+
+# Backward equation T(p, s) for subregion 2b, Table 26, Page 27
+T2ps_b_I = (-6, -6, -5, -5, -4, -4, -4, -3, -3, -3, -3, -2, -2, -2, -2, -1, -1, -1, -1, -1, 0, 0, 0, 0, 0, 0, 0, 1,
+            1, 1, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 5, 5, 5)
+T2ps_b_J = (0, 11, 0, 11, 0, 1, 11, 0, 1, 11, 12, 0, 1, 6, 10, 0, 1, 5, 8, 9, 0, 1, 2, 4, 5, 6, 9, 0, 1, 2, 3, 7, 8,
+            0, 1, 5, 0, 1, 3, 0, 1, 0, 1, 2)
+T2ps_b_n = (316876.65083497, 20.864175881858, -398593.99803599, -21.816058518877, 223697.85194242, -2784.1703445817,
+            9.920743607148, -75197.512299157, 2970.8605951158, -3.4406878548526, 0.38815564249115, 17511.29508575,
+            -1423.7112854449, 1.0943803364167, 0.89971619308495, -3375.9740098958, 471.62885818355,
+            -1.9188241993679, 0.41078580492196, -0.33465378172097, 1387.0034777505, -406.63326195838,
+            41.72734715961, 2.1932549434532, -1.0320050009077, 0.35882943516703, 0.0052511453726066,
+            12.838916450705, -2.8642437219381, 0.56912683664855, -0.099962954584931, -0.0032632037778459,
+            0.00023320922576723, -0.1533480985745, 0.029072288239902, 0.00037534702741167, 0.0017296691702411,
+            -0.00038556050844504, -3.5017712292608e-05, -1.4566393631492e-05, 5.6420857267269e-06,
+            4.1286150074605e-08, -2.0684671118824e-08, 1.6409393674725e-09)
+
+# Backward equation T(p, s) for subregion 2c, Table 27, Page 28
+T2ps_c_I = (-2, -2, -1, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 5, 5, 6, 6, 7, 7, 7, 7, 7)
+T2ps_c_J = (0, 1, 0, 0, 1, 2, 3, 0, 1, 3, 4, 0, 1, 2, 0, 1, 5, 0, 1, 4, 0, 1, 2, 0, 1, 0, 1, 3, 4, 5)
+T2ps_c_n = (909.68501005365, 2404.566708842, -591.6232638713, 541.45404128074, -270.98308411192, 979.76525097926,
+            -469.66772959435, 14.399274604723, -19.104204230429, 5.3299167111971, -21.252975375934,
+            -0.3114733441376, 0.60334840894623, -0.042764839702509, 0.0058185597255259, -0.014597008284753,
+            0.0056631175631027, -7.6155864584577e-05, 0.00022440342919332, -1.2561095013413e-05,
+            6.3323132660934e-07, -2.0541989675375e-06, 3.6405370390082e-08, -2.9759897789215e-09,
+            1.0136618529763e-08, 5.9925719692351e-12, -2.0677870105164e-11, -2.0874278181886e-11,
+            1.0162166825089e-10, -1.6429828281347e-10)
+
+# Backward equation T(p, h) for subregion 3a, Table 3, Page 7 (Revised Supplementary Release 2004)
+T3ph_a_I = (-12, -12, -12, -12, -12, -12, -12, -12, -10, -10, -10, -8, -8, -8, -8, -5, -3, -2, -2, -2, -1, -1, 0, 0,
+            1, 3, 3, 4, 4, 10, 12)
+T3ph_a_J = (0, 1, 2, 6, 14, 16, 20, 22, 1, 5, 12, 0, 2, 4, 10, 2, 0, 1, 3, 4, 0, 2, 0, 1, 1, 0, 1, 0, 3, 4, 5)
+T3ph_a_n = (-1.33645667811215e-07, 4.55912656802978e-06, -1.46294640700979e-05, 0.0063934131297008,
+            372.783927268847, -7186.54377460447, 573494.7521034, -2675693.29111439, -3.34066283302614e-05,
+            -0.0245479214069597, 47.8087847764996, 7.64664131818904e-06, 0.00128350627676972, 0.0171219081377331,
+            -8.51007304583213, -0.0136513461629781, -3.84460997596657e-06, 0.00337423807911655, -0.551624873066791,
+            0.72920227710747, -0.00992522757376041, -0.119308831407288, 0.793929190615421, 0.454270731799386,
+            0.20999859125991, -0.00642109823904738, -0.023515586860454, 0.00252233108341612, -0.00764885133368119,
+            0.0136176427574291, -0.0133027883575669)
+
+# Backward equation T(p, h) for subregion 3b, Table 4, Page 8 (Revised Supplementary Release 2004)
+T3ph_b_I = (-12, -12, -10, -10, -10, -10, -10, -8, -8, -8, -8, -8, -6, -6, -6, -4, -4, -3, -2, -2, -1, -1, -1, -1,
+            -1, -1, 0, 0, 1, 3, 5, 6, 8)
+T3ph_b_J = (0, 1, 0, 1, 5, 10, 12, 0, 1, 2, 4, 10, 0, 1, 2, 0, 1, 5, 0, 4, 2, 4, 6, 10, 14, 16, 0, 2, 1, 1, 1, 1, 1)
+T3ph_b_n = (3.2325457364492e-05, -0.000127575556587181, -0.000475851877356068, 0.00156183014181602,
+            0.105724860113781, -85.8514221132534, 724.140095480911, 0.00296475810273257, -0.00592721983365988,
+            -0.0126305422818666, -0.115716196364853, 84.9000969739595, -0.0108602260086615, 0.0154304475328851,
+            0.0750455441524466, 0.0252520973612982, -0.0602507901232996, -3.07622221350501, -0.0574011959864879,
+            5.03471360939849, -0.925081888584834, 3.91733882917546, -77.314600713019, 9493.08762098587,
+            -1410437.19679409, 8491662.30819026, 0.861095729446704, 0.32334644281172, 0.873281936020439,
+            -0.436653048526683, 0.286596714529479, -0.131778331276228, 0.00676682064330275)
+
+# Backward equation v(p, h) for subregion 3a, Table 6, Page 9 (Revised Supplementary Release 2004)
+v3ph_a_I = (-12, -12, -12, -12, -10, -10, -10, -8, -8, -6, -6, -6, -4, -4, -3, -2, -2, -1, -1, -1, -1, 0, 0, 1, 1,
+            1, 2, 2, 3, 4, 5, 8)
+v3ph_a_J = (6, 8, 12, 18, 4, 7, 10, 5, 12, 3, 4, 22, 2, 3, 7, 3, 16, 0, 1, 2, 3, 0, 1, 0, 1, 2, 0, 2, 0, 2, 2, 2)
+v3ph_a_n = (0.00529944062966028, -0.170099690234461, 11.1323814312927, -2178.98123145125, -0.000506061827980875,
+            0.556495239685324, -9.43672726094016, -0.297856807561527, 93.9353943717186, 0.0192944939465981,
+            0.421740664704763, -3689141.2628233, -0.00737566847600639, -0.354753242424366, -1.99768169338727,
+            1.15456297059049, 5683.6687581596, 0.00808169540124668, 0.172416341519307, 1.04270175292927,
+            -0.297691372792847, 0.560394465163593, 0.275234661176914, -0.148347894866012, -0.0651142513478515,
+            -2.92468715386302, 0.0664876096952665, 3.52335014263844, -0.0146340792313332, -2.24503486668184,
+            1.10533464706142, -0.0408757344495612)
+
+# Backward equation v(p, h) for subregion 3b, Table 7, Page 9 (Revised Supplementary Release 2004)
+v3ph_b_I = (-12, -12, -8, -8, -8, -8, -8, -8, -6, -6, -6, -6, -6, -6, -4, -4, -4, -3, -3, -2, -2, -1, -1, -1, -1, 0,
+            1, 1, 2, 2)
+v3ph_b_J = (0, 1, 0, 1, 3, 6, 7, 8, 0, 1, 2, 5, 6, 10, 3, 6, 10, 0, 2, 1, 2, 0, 1, 4, 5, 0, 0, 1, 2, 6)
+v3ph_b_n = (-2.25196934336318e-09, 1.40674363313486e-08, 2.3378408528056e-06, -3.31833715229001e-05,
+            0.00107956778514318, -0.271382067378863, 1.07202262490333, -0.853821329075382, -2.15214194340526e-05,
+            0.00076965608822273, -0.00431136580433864, 0.453342167309331, -0.507749535873652, -100.475154528389,
+            -0.219201924648793, -3.21087965668917, 607.567815637771, 0.000557686450685932, 0.18749904002955,
+            0.00905368030448107, 0.285417173048685, 0.0329924030996098, 0.239897419685483, 4.82754995951394,
+            -11.8035753702231, 0.169490044091791, -0.0179967222507787, 0.0371810116332674, -0.0536288335065096,
+            1.6069710109252)
+
+# Backward equation T(p, s) for subregion 3a, Table 10, Page 11 (Revised Supplementary Release 2004)
+T3ps_a_I = (-12, -12, -10, -10, -10, -10, -8, -8, -8, -8, -6, -6, -6, -5, -5, -5, -4, -4, -4, -2, -2, -1, -1, 0, 0,
+            0, 1, 2, 2, 3, 8, 8, 10)
+T3ps_a_J = (28, 32, 4, 10, 12, 14, 5, 7, 8, 28, 2, 6, 32, 0, 14, 32, 6, 10, 36, 1, 4, 1, 6, 0, 1, 4, 0, 0, 3, 2, 0,
+            1, 2)
+T3ps_a_n = (1500420082.63875, -159397258480.424, 0.000502181140217975, -67.2057767855466, 1450.58545404456,
+            -8238.8953488889, -0.154852214233853, 11.2305046746695, -29.7000213482822, 43856513263.5495,
+            0.00137837838635464, -2.97478527157462, 9717779473494.13, -5.71527767052398e-05, 28830.794977842,
+            -74442828926270.3, 12.8017324848921, -368.275545889071, 6647689047791770.0, 0.044935925195888,
+            -4.22897836099655, -0.240614376434179, -4.74341365254924, 0.72409399912611, 0.923874349695897,
+            3.99043655281015, 0.0384066651868009, -0.00359344365571848, -0.735196448821653, 0.188367048396131,
+            0.000141064266818704, -0.00257418501496337, 0.00123220024851555)
+
+# Backward equation T(p, s) for subregion 3b, Table 11, Page 11 (Revised Supplementary Release 2004)
+T3ps_b_I = (-12, -12, -12, -12, -8, -8, -8, -6, -6, -6, -5, -5, -5, -5, -5, -4, -3, -3, -2, 0, 2, 3, 4, 5, 6, 8, 12,
+            14)
+T3ps_b_J = (1, 3, 4, 7, 0, 1, 3, 0, 2, 4, 0, 1, 2, 4, 6, 12, 1, 6, 2, 0, 1, 1, 0, 24, 0, 3, 1, 2)
+T3ps_b_n = (0.52711170160166, -40.1317830052742, 153.020073134484, -2247.99398218827, -0.193993484669048,
+            -1.40467557893768, 42.6799878114024, 0.752810643416743, 22.6657238616417, -622.873556909932,
+            -0.660823667935396, 0.841267087271658, -25.3717501764397, 485.708963532948, 880.531517490555,
+            2650155.92794626, -0.359287150025783, -656.991567673753, 2.41768149185367, 0.856873461222588,
+            0.655143675313458, -0.213535213206406, 0.00562974957606348, -316955725450471, -0.000699997000152457,
+            0.0119845803210767, 1.93848122022095e-05, -2.15095749182309e-05)
+
+# Backward equation v(p, s) for subregion 3a, Table 13, Page 14 (Revised Supplementary Release 2004)
+v3ps_a_I = (-12, -12, -12, -10, -10, -10, -10, -8, -8, -8, -8, -6, -5, -4, -3, -3, -2, -2, -1, -1, 0, 0, 0, 1, 2, 4,
+            5, 6)
+v3ps_a_J = (10, 12, 14, 4, 8, 10, 20, 5, 6, 14, 16, 28, 1, 5, 2, 4, 3, 8, 1, 2, 0, 1, 3, 0, 0, 2, 2, 0)
+v3ps_a_n = (79.5544074093975, -2382.6124298459, 17681.3100617787, -0.00110524727080379, -15.3213833655326,
+            297.544599376982, -35031520.6871242, 0.277513761062119, -0.523964271036888, -148011.182995403,
+            1600148.99374266, 1708023226634.27, 0.000246866996006494, 1.6532608479798, -0.118008384666987,
+            2.537986423559, 0.965127704669424, -28.2172420532826, 0.203224612353823, 1.10648186063513,
+            0.52612794845128, 0.277000018736321, 1.08153340501132, -0.0744127885357893, 0.0164094443541384,
+            -0.0680468275301065, 0.025798857610164, -0.000145749861944416)
+
+# Backward equation v(p, s) for subregion 3b, Table 14, Page 14 (Revised Supplementary Release 2004)
+v3ps_b_I = (-12, -12, -12, -12, -12, -12, -10, -10, -10, -10, -8, -5, -5, -5, -4, -4, -4, -4, -3, -2, -2, -2, -2,
+            -2, -2, 0, 0, 0, 1, 1, 2)
+v3ps_b_J = (0, 1, 2, 3, 5, 6, 0, 1, 2, 4, 0, 1, 2, 3, 0, 1, 2, 3, 1, 0, 1, 2, 3, 4, 12, 0, 1, 2, 0, 2, 2)
+v3ps_b_n = (5.91599780322238e-05, -0.00185465997137856, 0.0104190510480013, 0.0059864730203859, -0.771391189901699,
+            1.72549765557036, -0.000467076079846526, 0.0134533823384439, -0.0808094336805495, 0.508139374365767,
+            0.00128584643361683, -1.63899353915435, 5.86938199318063, -2.92466667918613, -0.00614076301499537,
+            5.76199014049172, -12.1613320606788, 1.67637540957944, -7.44135838773463, 0.0378168091437659,
+            4.01432203027688, 16.0279837479185, 3.17848779347728, -3.58362310304853, -1159952.60446827,
+            0.199256573577909, -0.122270624794624, -19.1449143716586, -0.0150448002905284, 14.6407900162154,
+            -3.2747778718823)
+
+# Saturation boundary psat(h) for region 3, Table 17, Page 18 (Revised Supplementary Release 2004)
+p3sath_I = (0, 1, 1, 1, 1, 5, 7, 8, 14, 20, 22, 24, 28, 36)
+p3sath_J = (0, 1, 3, 4, 36, 3, 0, 24, 16, 16, 3, 18, 8, 24)
+p3sath_n = (0.600073641753024, -9.36203654849857, 24.6590798594147, -107.014222858224, -91582131580576.8,
+            -8623.32011700662, -23.5837344740032, 2.52304969384128e+17, -3.89718771997719e+18,
+            -3.33775713645296e+22, 35649946963.6328, -1.48547544720641e+26, 3.30611514838798e+18,
+            8.13641294467829e+37)
+
+# Saturation boundary psat(s) for region 3, Table 19, Page 19 (Revised Supplementary Release 2004)
+p3sats_I = (0, 1, 1, 4, 12, 12, 16, 24, 28, 32)
+p3sats_J = (0, 1, 32, 7, 4, 14, 36, 10, 0, 18)
+p3sats_n = (0.639767553612785, -12.9727445396014, -2245951258484030.0, 1774667.41801846, 7170793495.71538,
+            -3.78829107169011e+17, -9.55586736431328e+34, 1.87269814676188e+23, 119254746466.473,
+            1.10649277244882e+36)
+
+
+
+# ************************************************************************************************
+# Compiled equations
+# ************************************************************************************************
+
+class _Powers(object):
+    """
+    Powers of one variable needed by a set of series. Integer powers are
+    built from previously computed ones with one multiplication each.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.lines = []
+        self.names = {1: base}
+
+    def __call__(self, e):
+        if e in self.names:
+            return self.names[e]
+
+        if float(e).is_integer():
+            e = int(e)
+            k = abs(e)
+            name = "%s_%s%d" % (self.base, "m" if e < 0 else "", k)
+            if e == -1:
+                self.lines.append("%s = 1.0 / %s" % (name, self.base))
+            else:
+                sign = -1 if e < 0 else 1
+                half = k // 2
+                self.lines.append("%s = %s * %s" % (name, self(sign * half), self(sign * (k - half))))
+        else:
+            name = "%s_f%d" % (self.base, len(self.names))
+            self.lines.append("%s = %s ** %r" % (name, self.base, e))
+
+        self.names[e] = name
+        return name
+
+
+def _horner(out, n, I, J, xpow, ypow):
+    """
+    Source lines evaluating  sum(n * x**I * y**J)  into the variable out.
+
+    The terms are grouped by I and the sum is evaluated with the Horner
+    scheme, first in y inside every group and then in x across the groups.
+    """
+    groups = {}
+    for c, i, j in zip(n, I, J):
+        groups.setdefault(i, []).append((j, c))
+
+    lines = []
+    prev = None
+    for i in sorted(groups, reverse=True):
+        terms = sorted(groups[i], reverse=True)
+        lines.append("h = %r" % terms[0][1])
+        for (j0, _), (j, c) in zip(terms, terms[1:]):
+            lines.append("h = h * %s + %r" % (ypow(j0 - j), c))
+        if terms[-1][0] != 0:
+            lines.append("h = h * %s" % ypow(terms[-1][0]))
+
+        if prev is None:
+            lines.append("%s = h" % out)
+        else:
+            lines.append("%s = %s * %s + h" % (out, out, xpow(prev - i)))
+        prev = i
+
+    if prev is None:
+        lines.append("%s = 0.0" % out)
+    elif prev != 0:
+        lines.append("%s = %s * %s" % (out, out, xpow(prev)))
+    return lines
+
+
+def compile_series(*series):
+    """
+    Compile one or more series of the same variables into a single python
+    function f(x, y). The powers of x and y are computed once and shared by
+    all the series, the function returns one value per series (a tuple when
+    more than one series is given).
+
+    The compiled function only uses arithmetic operators, so x and y can
+    be floats or numpy arrays.
+    """
+    xpow = _Powers("x")
+    ypow = _Powers("y")
+
+    body = []
+    for k, s in enumerate(series):
+        body += _horner("s%d" % k, s.n, s.I, s.J, xpow, ypow)
+
+    names = ", ".join("s%d" % k for k in range(len(series)))
+    lines = ["def evaluate(x, y):"]
+    lines += ["    " + line for line in xpow.lines + ypow.lines + body]
+    lines.append("    return " + names)
+
+    namespace = {}
+    exec(compile("\n".join(lines), "<IF97 series>", "exec"), namespace)
+    return namespace["evaluate"]
+
+
+class Series(object):
+    """
+    Sum of the terms  n[i] * x**I[i] * y**J[i]  of an IF-97 equation.
+
+    The series is compiled to a Horner scheme evaluator on the first call,
+    see compile_series(). x and y can be floats or numpy arrays.
+    """
+
+    def __init__(self, n, I, J):
+        self.n = tuple(n)
+        self.I = tuple(I)
+        self.J = tuple(J)
+        self._function = None
+
+    def diff(self, dx=0, dy=0):
+        """ Partial derivative of order dx in x and dy in y """
+        terms = []
+        for c, i, j in zip(self.n, self.I, self.J):
+            for k in range(dx):
+                c *= i - k
+            for k in range(dy):
+                c *= j - k
+            if c != 0:
+                terms.append((c, i - dx, j - dy))
+
+        return Series(*zip(*terms)) if terms else Series((), (), ())
+
+    def __call__(self, x, y):
+        if self._function is None:
+            self._function = compile_series(self)
+        return self._function(x, y)
+
+
+class Evaluator(object):
+    """
+    Several series of the same variables evaluated together, the powers
+    of x and y are computed only once.
+
+        >>> gamma, gamma_tau = Evaluator(gamma1, gamma1_y)(x, y)
+
+    Compiled on the first call.
+    """
+
+    def __init__(self, *series):
+        self.series = series
+        self._function = None
+
+    def __call__(self, x, y):
+        if self._function is None:
+            self._function = compile_series(*self.series)
+        return self._function(x, y)
+
+
+def _family(n, I, J):
+    """ Series with its first and second partial derivatives (g, g_x, g_y, g_xx, g_xy, g_yy) """
+    g = Series(n, I, J)
+    return g, g.diff(1, 0), g.diff(0, 1), g.diff(2, 0), g.diff(1, 1), g.diff(0, 2)
+
+
+# Region 1 - x = 7.1 - Pi, y = tau - 1.222
+gamma1, gamma1_x, gamma1_y, gamma1_xx, gamma1_xy, gamma1_yy = _family(gamma1_n, gamma1_I, gamma1_J)
+
+# Region 2 - The ideal-gas part only depends on tau and is evaluated with x = 1, y = tau.
+#            The residual part with x = Pi, y = tau - 0.5
+gamma2o, _, gamma2o_y, _, _, gamma2o_yy = _family(gamma2o_n, (0,) * len(gamma2o_J), gamma2o_J)
+gamma2r, gamma2r_x, gamma2r_y, gamma2r_xx, gamma2r_xy, gamma2r_yy = _family(gamma2r_n, gamma2r_I, gamma2r_J)
+
+# Region 3 - x = delta, y = tau. The first term  n1 * log(delta)  is not part of the series.
+phi3, phi3_x, phi3_y, phi3_xx, phi3_xy, phi3_yy = _family(phi3_n[1:], phi3_I[1:], phi3_J[1:])
+
+# Region 5 - Ideal-gas part with x = 1, y = tau. Residual part with x = Pi, y = tau
+gamma5o, _, gamma5o_y, _, _, gamma5o_yy = _family(gamma5o_n, (0,) * len(gamma5o_J), gamma5o_J)
+gamma5r, gamma5r_x, gamma5r_y, gamma5r_xx, gamma5r_xy, gamma5r_yy = _family(gamma5r_n, gamma5r_I, gamma5r_J)
+
+# Derivatives evaluated together share the powers of the reduced variables
+gamma1_u = Evaluator(gamma1_x, gamma1_y)
+gamma1_s = Evaluator(gamma1, gamma1_y)
+gamma1_cv = Evaluator(gamma1_x, gamma1_xx, gamma1_xy, gamma1_yy)
+gamma2o_s = Evaluator(gamma2o, gamma2o_y)
+gamma2r_u = Evaluator(gamma2r_x, gamma2r_y)
+gamma2r_s = Evaluator(gamma2r, gamma2r_y)
+gamma2r_cv = Evaluator(gamma2r_x, gamma2r_xy, gamma2r_xx, gamma2r_yy)
+phi3_h = Evaluator(phi3_x, phi3_y)
+phi3_s = Evaluator(phi3, phi3_y)
+gamma5o_s = Evaluator(gamma5o, gamma5o_y)
+gamma5r_u = Evaluator(gamma5r_x, gamma5r_y)
+gamma5r_s = Evaluator(gamma5r, gamma5r_y)
+
+# All the derivatives needed by the state functions, up to first (d1) or second order (d2)
+gamma1_d1 = Evaluator(gamma1, gamma1_x, gamma1_y)
+gamma1_d2 = Evaluator(gamma1, gamma1_x, gamma1_y, gamma1_xx, gamma1_xy, gamma1_yy)
+gamma2o_d2 = Evaluator(gamma2o, gamma2o_y, gamma2o_yy)
+gamma2r_d1 = Evaluator(gamma2r, gamma2r_x, gamma2r_y)
+gamma2r_d2 = Evaluator(gamma2r, gamma2r_x, gamma2r_y, gamma2r_xx, gamma2r_xy, gamma2r_yy)
+phi3_d1 = Evaluator(phi3, phi3_x, phi3_y)
+phi3_d2 = Evaluator(phi3, phi3_x, phi3_y, phi3_xx, phi3_xy, phi3_yy)
+gamma5o_d2 = Evaluator(gamma5o, gamma5o_y, gamma5o_yy)
+gamma5r_d1 = Evaluator(gamma5r, gamma5r_x, gamma5r_y)
+gamma5r_d2 = Evaluator(gamma5r, gamma5r_x, gamma5r_y, gamma5r_xx, gamma5r_xy, gamma5r_yy)
+
+# Backward equations
+T1ph = Series(T1ph_n, T1ph_I, T1ph_J)
+T1ps = Series(T1ps_n, T1ps_I, T1ps_J)
+T2ph_a = Series(T2ph_a_n, T2ph_a_I, T2ph_a_J)
+T2ph_b = Series(T2ph_b_n, T2ph_b_I, T2ph_b_J)
+T2ph_c = Series(T2ph_c_n, T2ph_c_I, T2ph_c_J)
+T2ps_a = Series(T2ps_a_n, T2ps_a_I, T2ps_a_J)
+T2ps_b = Series(T2ps_b_n, T2ps_b_I, T2ps_b_J)
+T2ps_c = Series(T2ps_c_n, T2ps_c_I, T2ps_c_J)
+T3ph_a = Series(T3ph_a_n, T3ph_a_I, T3ph_a_J)
+T3ph_b = Series(T3ph_b_n, T3ph_b_I, T3ph_b_J)
+v3ph_a = Series(v3ph_a_n, v3ph_a_I, v3ph_a_J)
+v3ph_b = Series(v3ph_b_n, v3ph_b_I, v3ph_b_J)
+T3ps_a = Series(T3ps_a_n, T3ps_a_I, T3ps_a_J)
+T3ps_b = Series(T3ps_b_n, T3ps_b_I, T3ps_b_J)
+v3ps_a = Series(v3ps_a_n, v3ps_a_I, v3ps_a_J)
+v3ps_b = Series(v3ps_b_n, v3ps_b_I, v3ps_b_J)
+p3sath = Series(p3sath_n, p3sath_I, p3sath_J)
+p3sats = Series(p3sats_n, p3sats_I, p3sats_J)
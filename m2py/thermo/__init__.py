@@ -2,6 +2,7 @@
 Thermodynamic function collection
 
     * Steam tables - module steam
+    * Vectorized steam tables - module vxsteam
 
 """
 import os
@@ -12,4 +13,5 @@ path_dir = os.path.join(this, "..")
 sys.path.append(path_dir)
 
 from . import xsteam
+from . import vxsteam
 from . import gas
\ No newline at end of file
@@ -162,6 +162,10 @@ import numpy as np
 from numpy import ndarray, arange
 from math import log, log10, exp
 
+from . import __if97__ as if97
+
+R = if97.R  # kJ/(kg K)
+
 toSIunit_T = lambda ins: ins + 273.15
 fromSIunit_T = lambda ins: ins - 273.15
 
@@ -215,20 +219,13 @@ def p1_hs(h, s):
           450.620017338667, 854.68067822417, 6075.23214001162, 32.6487682621856, -26.9408844582931, -319.9478483343,
           -928.35430704332, 30.3634537455249, -65.0540422444146, -4309.9131651613, -747.512324096068, 730.000345529245,
           1142.84032569021, -436.407041874559]
-    # I1 = ndarray(I1)
-    # J1 = ndarray(J1)
-    # n1 = ndarray(n1)
-
-    I1 = lambda i: I1(i - 1)
-    J1 = lambda i: J1(i - 1)
-    n1 = lambda i: n1(i - 1)
 
     eta = h / 3400
     Sigma = s / 7.6
 
     p = 0
-    for i in range(1, 19):
-        p = p + n1(i) * (eta + 0.05) ** I1(i) * (Sigma + 0.05) ** J1(i)
+    for i in range(19):
+        p = p + n1[i] * (eta + 0.05) ** I1[i] * (Sigma + 0.05) ** J1[i]
 
     return p * 100
 
@@ -237,20 +234,10 @@ def T1_ph(p, h):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 5 Equations for Region 1, Section. 5.1 Basic Equation, 5.2.1 The Backward Equation T ( p,h )
     # Eqution 11, Table 6, Page 10
-    I1 = [0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 2, 2, 3, 3, 4, 5, 6]
-    J1 = [0, 1, 2, 6, 22, 32, 0, 1, 2, 3, 4, 10, 32, 10, 32, 10, 32, 32, 32, 32]
-    n1 = [-238.72489924521, 404.21188637945, 113.49746881718, -5.8457616048039, -1.528548241314E-04,
-          -1.0866707695377E-06, -13.391744872602, 43.211039183559, -54.010067170506, 30.535892203916, -6.5964749423638,
-          9.3965400878363E-03, 1.157364750534E-07, -2.5858641282073E-05, -4.0644363084799E-09, 6.6456186191635E-08,
-          8.0670734103027E-11, -9.3477771213947E-13, 5.8265442020601E-15, -1.5020185953503E-17]
     Pi = p / 1
     eta = h / 2500
-    T = 0
-    # for i = 1 : 20
-    for i in range(20):
-        T += n1[i] * Pi ** I1[i] * (eta + 1) ** J1[i]
 
-    _T1_ph = T
+    _T1_ph = if97.T1ph(Pi, eta + 1)
     return _T1_ph
 
 
@@ -258,47 +245,23 @@ def T1_ps(p, s):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 5 Equations for Region 1, Section. 5.1 Basic Equation, 5.2.2 The Backward Equation T ( p, s )
     # Eqution 13, Table 8, Page 11
-    I1 = [0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 4]
-    J1 = [0, 1, 2, 3, 11, 31, 0, 1, 2, 3, 12, 31, 0, 1, 2, 9, 31, 10, 32, 32]
-    n1 = [174.78268058307, 34.806930892873, 6.5292584978455, 0.33039981775489, -1.9281382923196E-07,
-          -2.4909197244573E-23, -0.26107636489332, 0.22592965981586, -0.064256463395226, 7.8876289270526E-03,
-          3.5672110607366E-10, 1.7332496994895E-24, 5.6608900654837E-04, -3.2635483139717E-04, 4.4778286690632E-05,
-          -5.1322156908507E-10, -4.2522657042207E-26, 2.6400441360689E-13, 7.8124600459723E-29, -3.0732199903668E-31]
     Pi = p / 1
     Sigma = s / 1
-    T = 0
-    # for i = 1 : 20
-    for i in range(20):
-        T = T + n1[i] * Pi ** I1[i] * (Sigma + 2) ** J1[i]
 
-    return T
+    _T1_ps = if97.T1ps(Pi, Sigma + 2)
+    return _T1_ps
 
 
 def h1_pT(p, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 5 Equations for Region 1, Section. 5.1 Basic Equation
     # Eqution 7, Table 3, Page 6
-
-    I1 = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32]
-    J1 = [-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31,
-          -38, -39, -40, -41]
-    n1 = [0.14632971213167, -0.84548187169114, -3.756360367204, 3.3855169168385, -0.95791963387872, 0.15772038513228,
-          -0.016616417199501, 8.1214629983568E-04, 2.8319080123804E-04, -6.0706301565874E-04, -0.018990068218419,
-          -0.032529748770505, -0.021841717175414, -5.283835796993E-05, -4.7184321073267E-04, -3.0001780793026E-04,
-          4.7661393906987E-05, -4.4141845330846E-06, -7.2694996297594E-16, -3.1679644845054E-05, -2.8270797985312E-06,
-          -8.5205128120103E-10, -2.2425281908E-06, -6.5171222895601E-07, -1.4341729937924E-13, -4.0516996860117E-07,
-          -1.2734301741641E-09, -1.7424871230634E-10, -6.8762131295531E-19, 1.4478307828521E-20, 2.6335781662795E-23,
-          -1.1947622640071E-23, 1.8228094581404E-24, -9.3537087292458E-26]
-    R = 0.461526  # kJ/(kg K)
     Pi = p / 16.53
     tau = 1386 / T
-    gamma_der_tau = 0
+    gamma_der_tau = if97.gamma1_y(7.1 - Pi, tau - 1.222)
 
-    # for i = 1 : 34
-    for i in range(34):
-        gamma_der_tau += n1[i] * (7.1 - Pi) ** I1[i] * J1[i] * (tau - 1.222) ** (J1[i] - 1)
-
-    return R * T * tau * gamma_der_tau
+    _h1_pT = R * T * tau * gamma_der_tau
+    return _h1_pT
 
 
 def v1_pT(p, T):
@@ -310,24 +273,9 @@ def v1_pT(p, T):
         5 Equations for Region 1, Section. 5.1 Basic Equation
         Eqution 7, Table 3, Page 6
     """
-
-    I1 = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32]
-    J1 = [-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31,
-          -38, -39, -40, -41]
-    n1 = [0.14632971213167, -0.84548187169114, -3.756360367204, 3.3855169168385, -0.95791963387872, 0.15772038513228,
-          -0.016616417199501, 8.1214629983568E-04, 2.8319080123804E-04, -6.0706301565874E-04, -0.018990068218419,
-          -0.032529748770505, -0.021841717175414, -5.283835796993E-05, -4.7184321073267E-04, -3.0001780793026E-04,
-          4.7661393906987E-05, -4.4141845330846E-06, -7.2694996297594E-16, -3.1679644845054E-05, -2.8270797985312E-06,
-          -8.5205128120103E-10, -2.2425281908E-06, -6.5171222895601E-07, -1.4341729937924E-13, -4.0516996860117E-07,
-          -1.2734301741641E-09, -1.7424871230634E-10, -6.8762131295531E-19, 1.4478307828521E-20, 2.6335781662795E-23,
-          -1.1947622640071E-23, 1.8228094581404E-24, -9.3537087292458E-26]
-    R = 0.461526  # kJ/(kg K)
     Pi = p / 16.53
     tau = 1386 / T
-    gamma_der_pi = 0
-    # for i = 1 : 34
-    for i in range(34):
-        gamma_der_pi -= n1[i] * I1[i] * (7.1 - Pi) ** (I1[i] - 1) * (tau - 1.222) ** J1[i]
+    gamma_der_pi = -if97.gamma1_x(7.1 - Pi, tau - 1.222)
 
     _v1_pT = R * T / p * Pi * gamma_der_pi / 1000
     return _v1_pT
@@ -339,23 +287,9 @@ def Cp1_pT(p, T):
     5 Equations for Region 1, Section. 5.1 Basic Equation
     Eqution 7, Table 3, Page 6
     """
-    I1 = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32]
-    J1 = [-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31,
-          -38, -39, -40, -41]
-    n1 = [0.14632971213167, -0.84548187169114, -3.756360367204, 3.3855169168385, -0.95791963387872, 0.15772038513228,
-          -0.016616417199501, 8.1214629983568E-04, 2.8319080123804E-04, -6.0706301565874E-04, -0.018990068218419,
-          -0.032529748770505, -0.021841717175414, -5.283835796993E-05, -4.7184321073267E-04, -3.0001780793026E-04,
-          4.7661393906987E-05, -4.4141845330846E-06, -7.2694996297594E-16, -3.1679644845054E-05, -2.8270797985312E-06,
-          -8.5205128120103E-10, -2.2425281908E-06, -6.5171222895601E-07, -1.4341729937924E-13, -4.0516996860117E-07,
-          -1.2734301741641E-09, -1.7424871230634E-10, -6.8762131295531E-19, 1.4478307828521E-20, 2.6335781662795E-23,
-          -1.1947622640071E-23, 1.8228094581404E-24, -9.3537087292458E-26]
-    R = 0.461526  # kJ/(kg K)
     Pi = p / 16.53
     tau = 1386 / T
-    gamma_der_tautau = 0
-    # for i = 1 :34
-    for i in range(34):
-        gamma_der_tautau += n1[i] * (7.1 - Pi) ** n1[i] * J1[i] * (J1[i] - 1) * (tau - 1.222) ** (J1[i] - 2)
+    gamma_der_tautau = if97.gamma1_yy(7.1 - Pi, tau - 1.222)
 
     _Cp1_pT = -R * tau ** 2 * gamma_der_tautau
     return _Cp1_pT
@@ -365,30 +299,11 @@ def Cv1_pT(p, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 5 Equations for Region 1, Section. 5.1 Basic Equation
     # Eqution 7, Table 3, Page 6
-
-    I1 = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32]
-    J1 = [-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31,
-          -38, -39, -40, -41]
-    n1 = [0.14632971213167, -0.84548187169114, -3.756360367204, 3.3855169168385, -0.95791963387872, 0.15772038513228,
-          -0.016616417199501, 8.1214629983568E-04, 2.8319080123804E-04, -6.0706301565874E-04, -0.018990068218419,
-          -0.032529748770505, -0.021841717175414, -5.283835796993E-05, -4.7184321073267E-04, -3.0001780793026E-04,
-          4.7661393906987E-05, -4.4141845330846E-06, -7.2694996297594E-16, -3.1679644845054E-05, -2.8270797985312E-06,
-          -8.5205128120103E-10, -2.2425281908E-06, -6.5171222895601E-07, -1.4341729937924E-13, -4.0516996860117E-07,
-          -1.2734301741641E-09, -1.7424871230634E-10, -6.8762131295531E-19, 1.4478307828521E-20, 2.6335781662795E-23,
-          -1.1947622640071E-23, 1.8228094581404E-24, -9.3537087292458E-26]
-    R = 0.461526  # kJ/(kg K)
     Pi = p / 16.53
     tau = 1386 / T
-    gamma_der_pi = 0
-    gamma_der_pipi = 0
-    gamma_der_pitau = 0
-    gamma_der_tautau = 0
-
-    for i in range(34):
-        gamma_der_pi -= n1[i] * I1[i] * (7.1 - Pi) ** (I1[i] - 1) * (tau - 1.222) ** J1[i]
-        gamma_der_pipi += n1[i] * I1[i] * (I1[i] - 1) * (7.1 - Pi) ** (I1[i] - 2) * (tau - 1.222) ** J1[i]
-        gamma_der_pitau -= n1[i] * I1[i] * (7.1 - Pi) ** (I1[i] - 1) * J1[i] * (tau - 1.222) ** (J1[i] - 1)
-        gamma_der_tautau += n1[i] * (7.1 - Pi) ** I1[i] * J1[i] * (J1[i] - 1) * (tau - 1.222) ** (J1[i] - 2)
+    gamma_der_x, gamma_der_pipi, gamma_der_xy, gamma_der_tautau = if97.gamma1_cv(7.1 - Pi, tau - 1.222)
+    gamma_der_pi = -gamma_der_x
+    gamma_der_pitau = -gamma_der_xy
 
     _Cv1_pT = R * (-tau ** 2 * gamma_der_tautau + (gamma_der_pi - tau * gamma_der_pitau) ** 2 / gamma_der_pipi)
     return _Cv1_pT
@@ -398,31 +313,11 @@ def w1_pT(p, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 5 Equations for Region 1, Section. 5.1 Basic Equation
     # Eqution 7, Table 3, Page 6
-
-    I1 = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32]
-    J1 = [-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31,
-          -38, -39, -40, -41]
-    n1 = [0.14632971213167, -0.84548187169114, -3.756360367204, 3.3855169168385, -0.95791963387872, 0.15772038513228,
-          -0.016616417199501, 8.1214629983568E-04, 2.8319080123804E-04, -6.0706301565874E-04, -0.018990068218419,
-          -0.032529748770505, -0.021841717175414, -5.283835796993E-05, -4.7184321073267E-04, -3.0001780793026E-04,
-          4.7661393906987E-05, -4.4141845330846E-06, -7.2694996297594E-16, -3.1679644845054E-05, -2.8270797985312E-06,
-          -8.5205128120103E-10, -2.2425281908E-06, -6.5171222895601E-07, -1.4341729937924E-13, -4.0516996860117E-07,
-          -1.2734301741641E-09, -1.7424871230634E-10, -6.8762131295531E-19, 1.4478307828521E-20, 2.6335781662795E-23,
-          -1.1947622640071E-23, 1.8228094581404E-24, -9.3537087292458E-26]
-
-    R = 0.461526  # kJ/(kg K)
     Pi = p / 16.53
     tau = 1386 / T
-    gamma_der_pi = 0
-    gamma_der_pipi = 0
-    gamma_der_pitau = 0
-    gamma_der_tautau = 0
-
-    for i in range(34):
-        gamma_der_pi -= n1[i] * I1[i] * (7.1 - Pi) ** (I1[i] - 1) * (tau - 1.222) ** J1[i]
-        gamma_der_pipi += n1[i] * I1[i] * (I1[i] - 1) * (7.1 - Pi) ** (I1[i] - 2) * (tau - 1.222) ** J1[i]
-        gamma_der_pitau -= n1[i] * I1[i] * (7.1 - Pi) ** (I1[i] - 1) * J1[i] * (tau - 1.222) ** (J1[i] - 1)
-        gamma_der_tautau += n1[i] * (7.1 - Pi) ** I1[i] * J1[i] * (J1[i] - 1) * (tau - 1.222) ** (J1[i] - 2)
+    gamma_der_x, gamma_der_pipi, gamma_der_xy, gamma_der_tautau = if97.gamma1_cv(7.1 - Pi, tau - 1.222)
+    gamma_der_pi = -gamma_der_x
+    gamma_der_pitau = -gamma_der_xy
 
     _w1_pT = (1000 * R * T * gamma_der_pi ** 2 / (
         (gamma_der_pi - tau * gamma_der_pitau) ** 2 / (tau ** 2 * gamma_der_tautau) - gamma_der_pipi)) ** 0.5
@@ -435,39 +330,10 @@ def v2_pT(p, T):
     # 6 Equations for Region 2, Section. 6.1 Basic Equation
 
     # Table 11 and 12, Page 14 and 15
-
-    J0 = [0, 1, -5, -4, -3, -2, -1, 2, 3]
-    n0 = [-9.6927686500217, 10.086655968018, -0.005608791128302, 0.071452738081455, -0.40710498223928, 1.4240819171444,
-          -4.383951131945, -0.28408632460772, 0.021268463753307]
-    Ir = [1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 6, 6, 6, 7, 7, 7, 8, 8, 9, 10, 10, 10, 16, 16, 18,
-          20, 20, 20, 21, 22, 23, 24, 24, 24]
-
-    Jr = [0, 1, 2, 3, 6, 1, 2, 4, 7, 36, 0, 1, 3, 6, 35, 1, 2, 3, 7, 3, 16, 35, 0, 11, 25, 8, 36, 13, 4, 10, 14, 29, 50,
-          57, 20, 35, 48, 21, 53, 39, 26, 40, 58]
-
-    nr = [-1.7731742473213E-03, -0.017834862292358, -0.045996013696365, -0.057581259083432, -0.05032527872793,
-          -3.3032641670203E-05, -1.8948987516315E-04, -3.9392777243355E-03, -0.043797295650573, -2.6674547914087E-05,
-          2.0481737692309E-08, 4.3870667284435E-07, -3.227767723857E-05, -1.5033924542148E-03, -0.040668253562649,
-          -7.8847309559367E-10, 1.2790717852285E-08, 4.8225372718507E-07, 2.2922076337661E-06, -1.6714766451061E-11,
-          -2.1171472321355E-03, -23.895741934104, -5.905956432427E-18, -1.2621808899101E-06, -0.038946842435739,
-          1.1256211360459E-11, -8.2311340897998, 1.9809712802088E-08, 1.0406965210174E-19, -1.0234747095929E-13,
-          -1.0018179379511E-09, -8.0882908646985E-11, 0.10693031879409, -0.33662250574171, 8.9185845355421E-25,
-          3.0629316876232E-13, -4.2002467698208E-06, -5.9056029685639E-26, 3.7826947613457E-06, -1.2768608934681E-15,
-          7.3087610595061E-29, 5.5414715350778E-17, -9.436970724121E-07]
-
-    R = 0.461526  # kJ/(kg K)
-
     Pi = p
-
     tau = 540 / T
-
     g0_pi = 1 / Pi
-
-    gr_pi = 0
-
-    for i in range(43):
-        # gr_pi = gr_pi + nr(i) * Ir(i) * Pi ** (Ir(i) - 1) * (tau - 0.5) ** Jr(i);
-        gr_pi += nr[i] * Ir[i] * Pi ** (Ir[i] - 1) * (tau - 0.5) ** Jr[i]
+    gr_pi = if97.gamma2r_x(Pi, tau - 0.5)
 
     _v2_pT = R * T / p * Pi * (g0_pi + gr_pi) / 1000
     return _v2_pT
@@ -482,56 +348,19 @@ def v3_ph(p, h):
     # Section 3.3 Backward Equations T(p,h) and v(p,h) for Subregions 3a and 3b
 
     # Boundary equation, Eq 1 Page 5
-
     h3ab = 2014.64004206875 + 3.74696550136983 * p - 2.19921901054187E-02 * p ** 2 + 8.7513168600995E-05 * p ** 3
+    ps = p / 100
 
     if h < h3ab:
-
         # Subregion 3a
-
         # Eq 4, Table 6, Page 9
-
-        Ii = [-12, -12, -12, -12, -10, -10, -10, -8, -8, -6, -6, -6, -4, -4, -3, -2, -2, -1, -1, -1, -1, 0, 0, 1, 1, 1,
-              2, 2, 3, 4, 5, 8]
-        Ji = [6, 8, 12, 18, 4, 7, 10, 5, 12, 3, 4, 22, 2, 3, 7, 3, 16, 0, 1, 2, 3, 0, 1, 0, 1, 2, 0, 2, 0, 2, 2, 2]
-        ni = [5.29944062966028E-03, -0.170099690234461, 11.1323814312927, -2178.98123145125, -5.06061827980875E-04,
-              0.556495239685324, -9.43672726094016, -0.297856807561527, 93.9353943717186, 1.92944939465981E-02,
-              0.421740664704763, -3689141.2628233, -7.37566847600639E-03, -0.354753242424366, -1.99768169338727,
-              1.15456297059049, 5683.6687581596, 8.08169540124668E-03, 0.172416341519307, 1.04270175292927,
-              -0.297691372792847, 0.560394465163593, 0.275234661176914, -0.148347894866012, -6.51142513478515E-02,
-              -2.92468715386302, 6.64876096952665E-02, 3.52335014263844, -1.46340792313332E-02, -2.24503486668184,
-              1.10533464706142, -4.08757344495612E-02]
-        ps = p / 100
         hs = h / 2100
-        vs = 0
-
-        for i in range(32):
-            vs += ni[i] * (ps + 0.128) ** Ii[i] * (hs - 0.727) ** Ji[i]
-
-        _v3_ph = vs * 0.0028
-
+        _v3_ph = if97.v3ph_a(ps + 0.128, hs - 0.727) * 0.0028
     else:
-
         # Subregion 3b
         # Eq 5, Table 7, Page 9
-        Ii = [-12, -12, -8, -8, -8, -8, -8, -8, -6, -6, -6, -6, -6, -6, -4, -4, -4, -3, -3, -2, -2, -1, -1, -1, -1, 0,
-              1, 1, 2, 2]
-        Ji = [0, 1, 0, 1, 3, 6, 7, 8, 0, 1, 2, 5, 6, 10, 3, 6, 10, 0, 2, 1, 2, 0, 1, 4, 5, 0, 0, 1, 2, 6]
-        ni = [-2.25196934336318E-09, 1.40674363313486E-08, 2.3378408528056E-06, -3.31833715229001E-05,
-              1.07956778514318E-03, -0.271382067378863, 1.07202262490333, -0.853821329075382, -2.15214194340526E-05,
-              7.6965608822273E-04, -4.31136580433864E-03, 0.453342167309331, -0.507749535873652, -100.475154528389,
-              -0.219201924648793, -3.21087965668917, 607.567815637771, 5.57686450685932E-04, 0.18749904002955,
-              9.05368030448107E-03, 0.285417173048685, 3.29924030996098E-02, 0.239897419685483, 4.82754995951394,
-              -11.8035753702231, 0.169490044091791, -1.79967222507787E-02, 3.71810116332674E-02, -5.36288335065096E-02,
-              1.6069710109252]
-
-        ps = p / 100
         hs = h / 2800
-        vs = 0
-
-        for i in range(30):
-            vs += ni[i] * (ps + 0.0661) ** Ii[i] * (hs - 0.72) ** Ji[i]
-        _v3_ph = vs * 0.0088
+        _v3_ph = if97.v3ph_b(ps + 0.0661, hs - 0.72) * 0.0088
 
     return _v3_ph
 
@@ -544,34 +373,11 @@ def h2_pT(p, T):
         6 Equations for Region 2, Section. 6.1 Basic Equation
         Table 11 and 12, Page 14 and 15
     """
-    J0 = [0, 1, -5, -4, -3, -2, -1, 2, 3]
-    n0 = [-9.6927686500217, 10.086655968018, -0.005608791128302, 0.071452738081455, -0.40710498223928, 1.4240819171444,
-          -4.383951131945, -0.28408632460772, 0.021268463753307]
-    Ir = [1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 6, 6, 6, 7, 7, 7, 8, 8, 9, 10, 10, 10, 16, 16, 18,
-          20, 20, 20, 21, 22, 23, 24, 24, 24]
-    Jr = [0, 1, 2, 3, 6, 1, 2, 4, 7, 36, 0, 1, 3, 6, 35, 1, 2, 3, 7, 3, 16, 35, 0, 11, 25, 8, 36, 13, 4, 10, 14, 29, 50,
-          57, 20, 35, 48, 21, 53, 39, 26, 40, 58]
-    nr = [-1.7731742473213E-03, -0.017834862292358, -0.045996013696365, -0.057581259083432, -0.05032527872793,
-          -3.3032641670203E-05, -1.8948987516315E-04, -3.9392777243355E-03, -0.043797295650573, -2.6674547914087E-05,
-          2.0481737692309E-08, 4.3870667284435E-07, -3.227767723857E-05, -1.5033924542148E-03, -0.040668253562649,
-          -7.8847309559367E-10, 1.2790717852285E-08, 4.8225372718507E-07, 2.2922076337661E-06, -1.6714766451061E-11,
-          -2.1171472321355E-03, -23.895741934104, -5.905956432427E-18, -1.2621808899101E-06, -0.038946842435739,
-          1.1256211360459E-11, -8.2311340897998, 1.9809712802088E-08, 1.0406965210174E-19, -1.0234747095929E-13,
-          -1.0018179379511E-09, -8.0882908646985E-11, 0.10693031879409, -0.33662250574171, 8.9185845355421E-25,
-          3.0629316876232E-13, -4.2002467698208E-06, -5.9056029685639E-26, 3.7826947613457E-06, -1.2768608934681E-15,
-          7.3087610595061E-29, 5.5414715350778E-17, -9.436970724121E-07]
-    R = 0.461526  # kJ/(kg K)
     Pi = p
     tau = 540 / T
-    g0_tau = 0
-
-    for i in range(0, 9):
-        g0_tau += n0[i] * J0[i] * tau ** (J0[i] - 1)
-    #
-    gr_tau = 0
-    for i in range(0, 43):
-        gr_tau += nr[i] * Pi ** Ir[i] * Jr[i] * (tau - 0.5) ** (Jr[i] - 1)
-    #
+    g0_tau = if97.gamma2o_y(1.0, tau)
+    gr_tau = if97.gamma2r_y(Pi, tau - 0.5)
+
     _h2_pT = R * T * tau * (g0_tau + gr_tau)
     return _h2_pT
 
@@ -583,35 +389,11 @@ def u2_pT(p, T):
     6 Equations for Region 2, Section. 6.1 Basic Equation
     Table 11 and 12, Page 14 and 15
     """
-    J0 = [0, 1, -5, -4, -3, -2, -1, 2, 3]
-    n0 = [-9.6927686500217, 10.086655968018, -0.005608791128302, 0.071452738081455, -0.40710498223928, 1.4240819171444,
-          -4.383951131945, -0.28408632460772, 0.021268463753307]
-    Ir = [1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 6, 6, 6, 7, 7, 7, 8, 8, 9, 10, 10, 10, 16, 16, 18,
-          20, 20, 20, 21, 22, 23, 24, 24, 24]
-    Jr = [0, 1, 2, 3, 6, 1, 2, 4, 7, 36, 0, 1, 3, 6, 35, 1, 2, 3, 7, 3, 16, 35, 0, 11, 25, 8, 36, 13, 4, 10, 14, 29, 50,
-          57, 20, 35, 48, 21, 53, 39, 26, 40, 58]
-    nr = [-1.7731742473213E-03, -0.017834862292358, -0.045996013696365, -0.057581259083432, -0.05032527872793,
-          -3.3032641670203E-05, -1.8948987516315E-04, -3.9392777243355E-03, -0.043797295650573, -2.6674547914087E-05,
-          2.0481737692309E-08, 4.3870667284435E-07, -3.227767723857E-05, -1.5033924542148E-03, -0.040668253562649,
-          -7.8847309559367E-10, 1.2790717852285E-08, 4.8225372718507E-07, 2.2922076337661E-06, -1.6714766451061E-11,
-          -2.1171472321355E-03, -23.895741934104, -5.905956432427E-18, -1.2621808899101E-06, -0.038946842435739,
-          1.1256211360459E-11, -8.2311340897998, 1.9809712802088E-08, 1.0406965210174E-19, -1.0234747095929E-13,
-          -1.0018179379511E-09, -8.0882908646985E-11, 0.10693031879409, -0.33662250574171, 8.9185845355421E-25,
-          3.0629316876232E-13, -4.2002467698208E-06, -5.9056029685639E-26, 3.7826947613457E-06, -1.2768608934681E-15,
-          7.3087610595061E-29, 5.5414715350778E-17, -9.436970724121E-07]
-    R = 0.461526  # kJ/(kg K)
     Pi = p
     tau = 540 / T
     g0_pi = 1 / Pi
-    g0_tau = 0
-    for i in range(0, 9):
-        g0_tau += n0[i] * J0[i] * tau ** (J0[i] - 1)
-
-    gr_pi = 0
-    gr_tau = 0
-    for i in range(0, 43):
-        gr_pi += nr[i] * Ir[i] * Pi ** (Ir[i] - 1) * (tau - 0.5) ** Jr[i]
-        gr_tau += nr[i] * Pi ** Ir[i] * Jr[i] * (tau - 0.5) ** (Jr[i] - 1)
+    g0_tau = if97.gamma2o_y(1.0, tau)
+    gr_pi, gr_tau = if97.gamma2r_u(Pi, tau - 0.5)
 
     _u2_pT = R * T * (tau * (g0_tau + gr_tau) - Pi * (g0_pi + gr_pi))
     return _u2_pT
@@ -625,36 +407,11 @@ def s2_pT(p, T):
     6 Equations for Region 2, Section. 6.1 Basic Equation
     Table 11 and 12, Page 14 and 15
     """
-    J0 = [0, 1, -5, -4, -3, -2, -1, 2, 3]
-    n0 = [-9.6927686500217, 10.086655968018, -0.005608791128302, 0.071452738081455, -0.40710498223928, 1.4240819171444,
-          -4.383951131945, -0.28408632460772, 0.021268463753307]
-    Ir = [1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 6, 6, 6, 7, 7, 7, 8, 8, 9, 10, 10, 10, 16, 16, 18,
-          20, 20, 20, 21, 22, 23, 24, 24, 24]
-    Jr = [0, 1, 2, 3, 6, 1, 2, 4, 7, 36, 0, 1, 3, 6, 35, 1, 2, 3, 7, 3, 16, 35, 0, 11, 25, 8, 36, 13, 4, 10, 14, 29, 50,
-          57, 20, 35, 48, 21, 53, 39, 26, 40, 58]
-    nr = [-1.7731742473213E-03, -0.017834862292358, -0.045996013696365, -0.057581259083432, -0.05032527872793,
-          -3.3032641670203E-05, -1.8948987516315E-04, -3.9392777243355E-03, -0.043797295650573, -2.6674547914087E-05,
-          2.0481737692309E-08, 4.3870667284435E-07, -3.227767723857E-05, -1.5033924542148E-03, -0.040668253562649,
-          -7.8847309559367E-10, 1.2790717852285E-08, 4.8225372718507E-07, 2.2922076337661E-06, -1.6714766451061E-11,
-          -2.1171472321355E-03, -23.895741934104, -5.905956432427E-18, -1.2621808899101E-06, -0.038946842435739,
-          1.1256211360459E-11, -8.2311340897998, 1.9809712802088E-08, 1.0406965210174E-19, -1.0234747095929E-13,
-          -1.0018179379511E-09, -8.0882908646985E-11, 0.10693031879409, -0.33662250574171, 8.9185845355421E-25,
-          3.0629316876232E-13, -4.2002467698208E-06, -5.9056029685639E-26, 3.7826947613457E-06, -1.2768608934681E-15,
-          7.3087610595061E-29, 5.5414715350778E-17, -9.436970724121E-07]
-    R = 0.461526  # kJ/(kg K)
     Pi = p
     tau = 540 / T
-    g0 = log(Pi)
-    g0_tau = 0
-    for i in range(0, 9):
-        g0 += n0[i] * tau ** J0[i]
-        g0_tau += n0[i] * J0[i] * tau ** (J0[i] - 1)
-
-    gr = 0
-    gr_tau = 0
-    for i in range(0, 43):
-        gr += nr[i] * Pi ** Ir[i] * (tau - 0.5) ** Jr[i]
-        gr_tau += nr[i] * Pi ** Ir[i] * Jr[i] * (tau - 0.5) ** (Jr[i] - 1)
+    g0, g0_tau = if97.gamma2o_s(1.0, tau)
+    g0 += log(Pi)
+    gr, gr_tau = if97.gamma2r_s(Pi, tau - 0.5)
 
     _s2_pT = R * (tau * (g0_tau + gr_tau) - (g0 + gr))
     return _s2_pT
@@ -669,34 +426,10 @@ def Cp2_pT(p, T):
         6 Equations for Region 2, Section. 6.1 Basic Equation
         Table 11 and 12, Page 14 and 15
     """
-    J0 = [0, 1, -5, -4, -3, -2, -1, 2, 3]
-    n0 = [-9.6927686500217, 10.086655968018, -0.005608791128302, 0.071452738081455, -0.40710498223928, 1.4240819171444,
-          -4.383951131945, -0.28408632460772, 0.021268463753307]
-    Ir = [1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 6, 6, 6, 7, 7, 7, 8, 8, 9, 10, 10, 10, 16, 16, 18,
-          20, 20, 20, 21, 22, 23, 24, 24, 24]
-    Jr = [0, 1, 2, 3, 6, 1, 2, 4, 7, 36, 0, 1, 3, 6, 35, 1, 2, 3, 7, 3, 16, 35, 0, 11, 25, 8, 36, 13, 4, 10, 14, 29, 50,
-          57, 20, 35, 48, 21, 53, 39, 26, 40, 58]
-    nr = [-1.7731742473213E-03, -0.017834862292358, -0.045996013696365, -0.057581259083432, -0.05032527872793,
-          -3.3032641670203E-05, -1.8948987516315E-04, -3.9392777243355E-03, -0.043797295650573, -2.6674547914087E-05,
-          2.0481737692309E-08, 4.3870667284435E-07, -3.227767723857E-05, -1.5033924542148E-03, -0.040668253562649,
-          -7.8847309559367E-10, 1.2790717852285E-08, 4.8225372718507E-07, 2.2922076337661E-06, -1.6714766451061E-11,
-          -2.1171472321355E-03, -23.895741934104, -5.905956432427E-18, -1.2621808899101E-06, -0.038946842435739,
-          1.1256211360459E-11, -8.2311340897998, 1.9809712802088E-08, 1.0406965210174E-19, -1.0234747095929E-13,
-          -1.0018179379511E-09, -8.0882908646985E-11, 0.10693031879409, -0.33662250574171, 8.9185845355421E-25,
-          3.0629316876232E-13, -4.2002467698208E-06, -5.9056029685639E-26, 3.7826947613457E-06, -1.2768608934681E-15,
-          7.3087610595061E-29, 5.5414715350778E-17, -9.436970724121E-07]
-    R = 0.461526  # kJ/(kg K)
     Pi = p
     tau = 540 / T
-    g0_tautau = 0
-
-    for i in range(0, 9):
-        g0_tautau += n0[i] * J0[i] * (J0[i] - 1) * tau ** (J0[i] - 2)
-
-    gr_tautau = 0
-
-    for i in range(0, 43):
-        gr_tautau += nr[i] * Pi ** Ir[i] * Jr[i] * (Jr[i] - 1) * (tau - 0.5) ** (Jr[i] - 2)
+    g0_tautau = if97.gamma2o_yy(1.0, tau)
+    gr_tautau = if97.gamma2r_yy(Pi, tau - 0.5)
 
     _Cp2_pT = -R * tau ** 2 * (g0_tautau + gr_tautau)
 
@@ -709,49 +442,10 @@ def Cv2_pT(p, T):
     # 6 Equations for Region 2, Section. 6.1 Basic Equation
 
     # Table 11 and 12, Page 14 and 15
-
-    J0 = [0, 1, -5, -4, -3, -2, -1, 2, 3]
-
-    n0 = [-9.6927686500217, 10.086655968018, -0.005608791128302, 0.071452738081455, -0.40710498223928, 1.4240819171444,
-          -4.383951131945, -0.28408632460772, 0.021268463753307]
-
-    Ir = [1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 6, 6, 6, 7, 7, 7, 8, 8, 9, 10, 10, 10, 16, 16, 18,
-          20, 20, 20, 21, 22, 23, 24, 24, 24]
-
-    Jr = [0, 1, 2, 3, 6, 1, 2, 4, 7, 36, 0, 1, 3, 6, 35, 1, 2, 3, 7, 3, 16, 35, 0, 11, 25, 8, 36, 13, 4, 10, 14, 29, 50,
-          57, 20, 35, 48, 21, 53, 39, 26, 40, 58]
-
-    nr = [-1.7731742473213E-03, -0.017834862292358, -0.045996013696365, -0.057581259083432, -0.05032527872793,
-          -3.3032641670203E-05, -1.8948987516315E-04, -3.9392777243355E-03, -0.043797295650573, -2.6674547914087E-05,
-          2.0481737692309E-08, 4.3870667284435E-07, -3.227767723857E-05, -1.5033924542148E-03, -0.040668253562649,
-          -7.8847309559367E-10, 1.2790717852285E-08, 4.8225372718507E-07, 2.2922076337661E-06, -1.6714766451061E-11,
-          -2.1171472321355E-03, -23.895741934104, -5.905956432427E-18, -1.2621808899101E-06, -0.038946842435739,
-          1.1256211360459E-11, -8.2311340897998, 1.9809712802088E-08, 1.0406965210174E-19, -1.0234747095929E-13,
-          -1.0018179379511E-09, -8.0882908646985E-11, 0.10693031879409, -0.33662250574171, 8.9185845355421E-25,
-          3.0629316876232E-13, -4.2002467698208E-06, -5.9056029685639E-26, 3.7826947613457E-06, -1.2768608934681E-15,
-          7.3087610595061E-29, 5.5414715350778E-17, -9.436970724121E-07]
-
-    R = 0.461526  # kJ/(kg K)
-
     Pi = p
-
     tau = 540 / T
-
-    g0_tautau = 0
-
-    for i in range(9):
-        g0_tautau += n0[i] * J0[i] * (J0[i] - 1) * tau ** (J0[i] - 2)
-
-    gr_pi = 0
-    gr_pitau = 0
-    gr_pipi = 0
-    gr_tautau = 0
-
-    for i in range(43):
-        gr_pi += nr[i] * Ir[i] * Pi ** (Ir[i] - 1) * (tau - 0.5) ** Jr[i]
-        gr_pipi += nr[i] * Ir[i] * (Ir[i] - 1) * Pi ** (Ir[i] - 2) * (tau - 0.5) ** Jr[i]
-        gr_pitau += nr[i] * Ir[i] * Pi ** (Ir[i] - 1) * Jr[i] * (tau - 0.5) ** (Jr[i] - 1)
-        gr_tautau += nr[i] * Pi ** Ir[i] * Jr[i] * (Jr[i] - 1) * (tau - 0.5) ** (Jr[i] - 2)
+    g0_tautau = if97.gamma2o_yy(1.0, tau)
+    gr_pi, gr_pitau, gr_pipi, gr_tautau = if97.gamma2r_cv(Pi, tau - 0.5)
 
     _Cv2_pT = R * (
         -tau ** 2 * (g0_tautau + gr_tautau) - (1 + Pi * gr_pi - tau * Pi * gr_pitau) ** 2 / (1 - Pi ** 2 * gr_pipi))
@@ -762,76 +456,21 @@ def Cv2_pT(p, T):
 def T2_ph(p, h):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 6 Equations for Region 2,6.3.1 The Backward Equations T( p, h ) for Subregions 2a, 2b, and 2c
-
-    sub_reg = 0
-
     if p < 4:
-        sub_reg = 1
-    else:
-        if p < (905.84278514723 - 0.67955786399241 * h + 1.2809002730136E-04 * h ** 2):
-            sub_reg = 2
-        else:
-            sub_reg = 3
-
-    # sub_reg
-    if sub_reg == 1:
         # Subregion A
         # Table 20, Eq 22, page 22
-        Ji = [0, 1, 2, 3, 7, 20, 0, 1, 2, 3, 7, 9, 11, 18, 44, 0, 2, 7, 36, 38, 40, 42, 44, 24, 44, 12, 32, 44, 32, 36,
-              42, 34, 44, 28]
-        Ii = [0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 4, 4, 4, 5, 5, 5, 6, 6, 7]
-        ni = [1089.8952318288, 849.51654495535, -107.81748091826, 33.153654801263, -7.4232016790248, 11.765048724356,
-              1.844574935579, -4.1792700549624, 6.2478196935812, -17.344563108114, -200.58176862096, 271.96065473796,
-              -455.11318285818, 3091.9688604755, 252266.40357872, -6.1707422868339E-03, -0.31078046629583,
-              11.670873077107, 128127984.04046, -985549096.23276, 2822454697.3002, -3594897141.0703, 1722734991.3197,
-              -13551.334240775, 12848734.66465, 1.3865724283226, 235988.32556514, -13105236.545054, 7399.9835474766,
-              -551966.9703006, 3715408.5996233, 19127.72923966, -415351.64835634, -62.459855192507]
-        Ts = 0
         hs = h / 2000
-
-        # for i = 1 : 34
-        for i in range(0, 34):
-            Ts += ni[i] * p ** (Ii[i]) * (hs - 2.1) ** Ji[i]
-
-        _T2_ph = Ts
-
-    elif sub_reg == 2:
+        _T2_ph = if97.T2ph_a(p, hs - 2.1)
+    elif p < (905.84278514723 - 0.67955786399241 * h + 1.2809002730136E-04 * h ** 2):
         # Subregion B
         # Table 21, Eq 23, page 23
-        Ji = [0, 1, 2, 12, 18, 24, 28, 40, 0, 2, 6, 12, 18, 24, 28, 40, 2, 8, 18, 40, 1, 2, 12, 24, 2, 12, 18, 24, 28,
-              40, 18, 24, 40, 28, 2, 28, 1, 40]
-        Ii = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 5, 5, 5, 6, 7,
-              7, 9, 9]
-        ni = [1489.5041079516, 743.07798314034, -97.708318797837, 2.4742464705674, -0.63281320016026, 1.1385952129658,
-              -0.47811863648625, 8.5208123431544E-03, 0.93747147377932, 3.3593118604916, 3.3809355601454,
-              0.16844539671904, 0.73875745236695, -0.47128737436186, 0.15020273139707, -0.002176411421975,
-              -0.021810755324761, -0.10829784403677, -0.046333324635812, 7.1280351959551E-05, 1.1032831789999E-04,
-              1.8955248387902E-04, 3.0891541160537E-03, 1.3555504554949E-03, 2.8640237477456E-07, -1.0779857357512E-05,
-              -7.6462712454814E-05, 1.4052392818316E-05, -3.1083814331434E-05, -1.0302738212103E-06, 2.821728163504E-07,
-              1.2704902271945E-06, 7.3803353468292E-08, -1.1030139238909E-08, -8.1456365207833E-14,
-              -2.5180545682962E-11, -1.7565233969407E-18, 8.6934156344163E-15]
-        Ts = 0
         hs = h / 2000
-        for i in range(0, 38):
-            Ts += ni[i] * (p - 2) ** (Ii[i]) * (hs - 2.6) ** Ji[i]
-
-        _T2_ph = Ts
+        _T2_ph = if97.T2ph_b(p - 2, hs - 2.6)
     else:
         # Subregion C
         # Table 22, Eq 24, page 24
-        Ji = [0, 4, 0, 2, 0, 2, 0, 1, 0, 2, 0, 1, 4, 8, 4, 0, 1, 4, 10, 12, 16, 20, 22]
-        Ii = [-7, -7, -6, -6, -5, -5, -2, -2, -1, -1, 0, 0, 1, 1, 2, 6, 6, 6, 6, 6, 6, 6, 6]
-        ni = [-3236839855524.2, 7326335090218.1, 358250899454.47, -583401318515.9, -10783068217.47, 20825544563.171,
-              610747.83564516, 859777.2253558, -25745.72360417, 31081.088422714, 1208.2315865936, 482.19755109255,
-              3.7966001272486, -10.842984880077, -0.04536417267666, 1.4559115658698E-13, 1.126159740723E-12,
-              -1.7804982240686E-11, 1.2324579690832E-07, -1.1606921130984E-06, 2.7846367088554E-05,
-              -5.9270038474176E-04, 1.2918582991878E-03]
-        Ts = 0
         hs = h / 2000
-        for i in range(0, 23):
-            Ts += ni[i] * (p + 25) ** (Ii[i]) * (hs - 1.8) ** Ji[i]
-
-        _T2_ph = Ts
+        _T2_ph = if97.T2ph_c(p + 25, hs - 1.8)
 
     return _T2_ph
 
@@ -844,85 +483,22 @@ def T2_ps(p, s):
         6 Equations for Region 2,6.3.2 The Backward Equations T( p, s )
         for Subregions 2a, 2b, and 2c Page 26
     """
-
+    Pi = p
     if p < 4:
-        sub_reg = 1
-    else:
-        if s < 5.85:
-            sub_reg = 3
-        else:
-            sub_reg = 2
-
-
-    # switch sub_reg
-
-    if sub_reg == 1:
         # Subregion A
         # Table 25, Eq 25, page 26
-        Ii = [-1.5, -1.5, -1.5, -1.5, -1.5, -1.5, -1.25, -1.25, -1.25, -1, -1, -1, -1, -1, -1, -0.75, -0.75, -0.5, -0.5,
-              -0.5, -0.5, -0.25, -0.25, -0.25, -0.25, 0.25, 0.25, 0.25, 0.25, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.75,
-              0.75, 0.75, 0.75, 1, 1, 1.25, 1.25, 1.5, 1.5]
-        Ji = [-24, -23, -19, -13, -11, -10, -19, -15, -6, -26, -21, -17, -16, -9, -8, -15, -14, -26, -13, -9, -7, -27,
-              -25, -11, -6, 1, 4, 8, 11, 0, 1, 5, 6, 10, 14, 16, 0, 4, 9, 17, 7, 18, 3, 15, 5, 18]
-        ni = [-392359.83861984, 515265.7382727, 40482.443161048, -321.93790923902, 96.961424218694, -22.867846371773,
-              -449429.14124357, -5011.8336020166, 0.35684463560015, 44235.33584819, -13673.388811708, 421632.60207864,
-              22516.925837475, 474.42144865646, -149.31130797647, -197811.26320452, -23554.39947076, -19070.616302076,
-              55375.669883164, 3829.3691437363, -603.91860580567, 1936.3102620331, 4266.064369861, -5978.0638872718,
-              -704.01463926862, 338.36784107553, 20.862786635187, 0.033834172656196, -4.3124428414893E-05,
-              166.53791356412, -139.86292055898, -0.78849547999872, 0.072132411753872, -5.9754839398283E-03,
-              -1.2141358953904E-05, 2.3227096733871E-07, -10.538463566194, 2.0718925496502, -0.072193155260427,
-              2.074988708112E-07, -0.018340657911379, 2.9036272348696E-07, 0.21037527893619, 2.5681239729999E-04,
-              -0.012799002933781, -8.2198102652018E-06]
-        Pi = p
         Sigma = s / 2
-        teta = 0
-        for i in range(0, 46):
-            teta += ni[i] * Pi ** Ii[i] * (Sigma - 2) ** Ji[i]
-
-        _T2_ps = teta
-
-    elif sub_reg == 2:
-        # Subregion B
-        # Table 26, Eq 26, page 27
-        Ii = [-6, -6, -5, -5, -4, -4, -4, -3, -3, -3, -3, -2, -2, -2, -2, -1, -1, -1, -1, -1, 0, 0, 0, 0, 0, 0, 0, 1, 1,
-              1, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 5, 5, 5]
-        Ji = [0, 11, 0, 11, 0, 1, 11, 0, 1, 11, 12, 0, 1, 6, 10, 0, 1, 5, 8, 9, 0, 1, 2, 4, 5, 6, 9, 0, 1, 2, 3, 7, 8,
-              0, 1, 5, 0, 1, 3, 0, 1, 0, 1, 2]
-        ni = [316876.65083497, 20.864175881858, -398593.99803599, -21.816058518877, 223697.85194242, -2784.1703445817,
-              9.920743607148, -75197.512299157, 2970.8605951158, -3.4406878548526, 0.38815564249115, 17511.29508575,
-              -1423.7112854449, 1.0943803364167, 0.89971619308495, -3375.9740098958, 471.62885818355, -1.9188241993679,
-              0.41078580492196, -0.33465378172097, 1387.0034777505, -406.63326195838, 41.72734715961, 2.1932549434532,
-              -1.0320050009077, 0.35882943516703, 5.2511453726066E-03, 12.838916450705, -2.8642437219381,
-              0.56912683664855, -0.099962954584931, -3.2632037778459E-03, 2.3320922576723E-04, -0.1533480985745,
-              0.029072288239902, 3.7534702741167E-04, 1.7296691702411E-03, -3.8556050844504E-04, -3.5017712292608E-05,
-              -1.4566393631492E-05, 5.6420857267269E-06, 4.1286150074605E-08, -2.0684671118824E-08, 1.6409393674725E-09]
-        Pi = p
-        Sigma = s / 0.7853
-        teta = 0
-        # for i = 1 : 44
-        for i in range(0, 44):
-            teta += ni[i] * Pi ** Ii[i] * (10 - Sigma) ** Ji[i]
-
-        _T2_ps = teta
-    else:
+        _T2_ps = if97.T2ps_a(Pi, Sigma - 2)
+    elif s < 5.85:
         # Subregion C
         # Table 27, Eq 27, page 28
-        Ii = [-2, -2, -1, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 5, 5, 6, 6, 7, 7, 7, 7, 7]
-        Ji = [0, 1, 0, 0, 1, 2, 3, 0, 1, 3, 4, 0, 1, 2, 0, 1, 5, 0, 1, 4, 0, 1, 2, 0, 1, 0, 1, 3, 4, 5]
-        ni = [909.68501005365, 2404.566708842, -591.6232638713, 541.45404128074, -270.98308411192, 979.76525097926,
-              -469.66772959435, 14.399274604723, -19.104204230429, 5.3299167111971, -21.252975375934, -0.3114733441376,
-              0.60334840894623, -0.042764839702509, 5.8185597255259E-03, -0.014597008284753, 5.6631175631027E-03,
-              -7.6155864584577E-05, 2.2440342919332E-04, -1.2561095013413E-05, 6.3323132660934E-07,
-              -2.0541989675375E-06, 3.6405370390082E-08, -2.9759897789215E-09, 1.0136618529763E-08, 5.9925719692351E-12,
-              -2.0677870105164E-11, -2.0874278181886E-11, 1.0162166825089E-10, -1.6429828281347E-10]
-        Pi = p
         Sigma = s / 2.9251
-        teta = 0
-        # for i = 1 : 30
-        for i in range(0, 30):
-            teta += ni[i] * Pi ** Ii[i] * (2 - Sigma) ** Ji[i]
-
-        _T2_ps = teta
+        _T2_ps = if97.T2ps_c(Pi, 2 - Sigma)
+    else:
+        # Subregion B
+        # Table 26, Eq 26, page 27
+        Sigma = s / 0.7853
+        _T2_ps = if97.T2ps_b(Pi, 10 - Sigma)
 
     return _T2_ps
 
@@ -964,7 +540,7 @@ def p2_hs(h, s):
 
         Pi = 0
 
-        for i in range(1, 29):
+        for i in range(29):
             Pi += ni[i] * (eta - 0.5) ** Ii[i] * (Sigma - 1.2) ** Ji[i]
 
         _p2_hs = Pi ** 4 * 4
@@ -994,7 +570,7 @@ def p2_hs(h, s):
 
         Pi = 0
 
-        for i in range(1, 33):
+        for i in range(33):
             Pi += ni[i] * (eta - 0.6) ** Ii[i] * (Sigma - 1.01) ** Ji[i]
 
         _p2_hs = Pi ** 4 * 100
@@ -1089,32 +665,16 @@ def p3sat_h(h):
     Section 4 Boundary Equations psat(h)  & psat(s) for the Saturation Lines of Region 3
     Se pictures Page 17, Eq 10, Table 17, Page 18
     """
-    Ii = [0, 1, 1, 1, 1, 5, 7, 8, 14, 20, 22, 24, 28, 36]
-    Ji = [0, 1, 3, 4, 36, 3, 0, 24, 16, 16, 3, 18, 8, 24]
-    ni = [0.600073641753024, -9.36203654849857, 24.6590798594147, -107.014222858224, -91582131580576.8,
-          -8623.32011700662, -23.5837344740032, 2.52304969384128E+17, -3.89718771997719E+18, -3.33775713645296E+22,
-          35649946963.6328, -1.48547544720641E+26, 3.30611514838798E+18, 8.13641294467829E+37]
     hs = h / 2600
-    ps = 0
-
-    # for i = 1:14
-    for i in range(0, 14):
-        ps += ni[i] * (hs - 1.02) ** Ii[i] * (hs - 0.608) ** Ji[i]
+    ps = if97.p3sath(hs - 1.02, hs - 0.608)
 
     _p3sat_h = ps * 22
     return _p3sat_h
 
 
 def p3sat_s(s):
-    Ii = [0, 1, 1, 4, 12, 12, 16, 24, 28, 32]
-    Ji = [0, 1, 32, 7, 4, 14, 36, 10, 0, 18]
-    ni = [0.639767553612785, -12.9727445396014, -2.24595125848403E+15, 1774667.41801846, 7170793495.71538,
-          -3.78829107169011E+17, -9.55586736431328E+34, 1.87269814676188E+23, 119254746466.473, 1.10649277244882E+36]
     Sigma = s / 5.2
-    Pi = 0
-    # for i = 1:10
-    for i in range(0, 10):
-        Pi += ni[i] * (Sigma - 1.03) ** Ii[i] * (Sigma - 0.699) ** Ji[i]
+    Pi = if97.p3sats(Sigma - 1.03, Sigma - 0.699)
 
     _p3sat_s = Pi * 22
     return _p3sat_s
@@ -1126,33 +686,13 @@ def p3_rhoT(rho, T):
         7 Basic Equation for Region 3, Section. 6.1 Basic Equation
         Table 30 and 31, Page 30 and 31
     """
-    Ii = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 6, 6, 6, 7, 8, 9, 9,
-          10, 10, 11]
-    Ji = [0, 0, 1, 2, 7, 10, 12, 23, 2, 6, 15, 17, 0, 2, 6, 7, 22, 26, 0, 2, 4, 16, 26, 0, 2, 4, 26, 1, 3, 26, 0, 2, 26,
-          2, 26, 2, 26, 0, 1, 26]
-    ni = [1.0658070028513, -15.732845290239, 20.944396974307, -7.6867707878716, 2.6185947787954, -2.808078114862,
-          1.2053369696517, -8.4566812812502E-03, -1.2654315477714, -1.1524407806681, 0.88521043984318,
-          -0.64207765181607, 0.38493460186671, -0.85214708824206, 4.8972281541877, -3.0502617256965, 0.039420536879154,
-          0.12558408424308, -0.2799932969871, 1.389979956946, -2.018991502357, -8.2147637173963E-03, -0.47596035734923,
-          0.0439840744735, -0.44476435428739, 0.90572070719733, 0.70522450087967, 0.10770512626332, -0.32913623258954,
-          -0.50871062041158, -0.022175400873096, 0.094260751665092, 0.16436278447961, -0.013503372241348,
-          -0.014834345352472, 5.7922953628084E-04, 3.2308904703711E-03, 8.0964802996215E-05, -1.6557679795037E-04,
-          -4.4923899061815E-05]
-    R = 0.461526  # kJ/(KgK)
     tc = 647.096  # K
-    pc = 22.064  # MPa
     rhoc = 322  # kg/m3
     delta = rho / rhoc
     tau = tc / T
-    fidelta = 0
-
-    # for i = 2 : 40
-    for i in range(2, 40):
-        fidelta += ni[i] * Ii[i] * delta ** (Ii[i] - 1) * tau ** Ji[i]
+    fidelta = if97.phi3_x(delta, tau) + if97.phi3_n[0] / delta
 
-    fidelta += ni[1] / delta
     _p3_rhoT = rho * R * T * delta * fidelta / 1000
-
     return _p3_rhoT
 
 
@@ -1389,26 +929,10 @@ def u1_pT(p, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 5 Equations for Region 1, Section. 5.1 Basic Equation
     # Eqution 7, Table 3, Page 6
-
-    I1 = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32]
-    J1 = [-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31,
-          -38, -39, -40, -41]
-    n1 = [0.14632971213167, -0.84548187169114, -3.756360367204, 3.3855169168385, -0.95791963387872, 0.15772038513228,
-          -0.016616417199501, 8.1214629983568E-04, 2.8319080123804E-04, -6.0706301565874E-04, -0.018990068218419,
-          -0.032529748770505, -0.021841717175414, -5.283835796993E-05, -4.7184321073267E-04, -3.0001780793026E-04,
-          4.7661393906987E-05, -4.4141845330846E-06, -7.2694996297594E-16, -3.1679644845054E-05, -2.8270797985312E-06,
-          -8.5205128120103E-10, -2.2425281908E-06, -6.5171222895601E-07, -1.4341729937924E-13, -4.0516996860117E-07,
-          -1.2734301741641E-09, -1.7424871230634E-10, -6.8762131295531E-19, 1.4478307828521E-20, 2.6335781662795E-23,
-          -1.1947622640071E-23, 1.8228094581404E-24, -9.3537087292458E-26]
-    R = 0.461526  # kJ/(kg K)
     Pi = p / 16.53
     tau = 1386 / T
-    gamma_der_tau = 0
-    gamma_der_pi = 0
-
-    for i in range(134):
-        gamma_der_pi -= n1[i] * I1[i] * (7.1 - Pi) ** (I1[i] - 1) * (tau - 1.222) ** J1[i]
-        gamma_der_tau += n1[i] * (7.1 - Pi) ** I1[i] * J1[i] * (tau - 1.222) ** (J1[i] - 1)
+    gamma_der_x, gamma_der_tau = if97.gamma1_u(7.1 - Pi, tau - 1.222)
+    gamma_der_pi = -gamma_der_x
 
     _u1_pT = R * T * (tau * gamma_der_tau - Pi * gamma_der_pi)
     return _u1_pT
@@ -1418,26 +942,9 @@ def s1_pT(p, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 5 Equations for Region 1, Section. 5.1 Basic Equation
     # Eqution 7, Table 3, Page 6
-
-    I1 = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32]
-    J1 = [-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31,
-          -38, -39, -40, -41]
-    n1 = [0.14632971213167, -0.84548187169114, -3.756360367204, 3.3855169168385, -0.95791963387872, 0.15772038513228,
-          -0.016616417199501, 8.1214629983568E-04, 2.8319080123804E-04, -6.0706301565874E-04, -0.018990068218419,
-          -0.032529748770505, -0.021841717175414, -5.283835796993E-05, -4.7184321073267E-04, -3.0001780793026E-04,
-          4.7661393906987E-05, -4.4141845330846E-06, -7.2694996297594E-16, -3.1679644845054E-05, -2.8270797985312E-06,
-          -8.5205128120103E-10, -2.2425281908E-06, -6.5171222895601E-07, -1.4341729937924E-13, -4.0516996860117E-07,
-          -1.2734301741641E-09, -1.7424871230634E-10, -6.8762131295531E-19, 1.4478307828521E-20, 2.6335781662795E-23,
-          -1.1947622640071E-23, 1.8228094581404E-24, -9.3537087292458E-26]
-    R = 0.461526  # kJ/(kg K)
     Pi = p / 16.53
     tau = 1386 / T
-    gamma = 0
-    gamma_der_tau = 0
-
-    for i in range(34):
-        gamma_der_tau += n1[i] * (7.1 - Pi) ** I1[i] * J1[i] * (tau - 1.222) ** (J1[i] - 1)
-        gamma += n1[i] * (7.1 - Pi) ** I1[i] * (tau - 1.222) ** J1[i]
+    gamma, gamma_der_tau = if97.gamma1_s(7.1 - Pi, tau - 1.222)
 
     _s1_pT = R * tau * gamma_der_tau - R * gamma
     return _s1_pT
@@ -1450,53 +957,19 @@ def T3_ph(p, h):
     # 2004
     # Section 3.3 Backward Equations T(p,h) and v(p,h) for Subregions 3a and 3b
     # Boundary equation, Eq 1 Page 5
-
     h3ab = 2014.64004206875 + 3.74696550136983 * p - 2.19921901054187E-02 * p ** 2 + 8.7513168600995E-05 * p ** 3
+    ps = p / 100
 
     if h < h3ab:
         # Subregion 3a
         # Eq 2, Table 3, Page 7
-
-        Ii = [-12, -12, -12, -12, -12, -12, -12, -12, -10, -10, -10, -8, -8, -8, -8, -5, -3, -2, -2, -2, -1, -1, 0, 0,
-              1, 3, 3, 4, 4, 10, 12]
-        Ji = [0, 1, 2, 6, 14, 16, 20, 22, 1, 5, 12, 0, 2, 4, 10, 2, 0, 1, 3, 4, 0, 2, 0, 1, 1, 0, 1, 0, 3, 4, 5]
-        ni = [-1.33645667811215E-07, 4.55912656802978E-06, -1.46294640700979E-05, 6.3934131297008E-03, 372.783927268847,
-              -7186.54377460447, 573494.7521034, -2675693.29111439, -3.34066283302614E-05, -2.45479214069597E-02,
-              47.8087847764996, 7.64664131818904E-06, 1.28350627676972E-03, 1.71219081377331E-02, -8.51007304583213,
-              -1.36513461629781E-02, -3.84460997596657E-06, 3.37423807911655E-03, -0.551624873066791, 0.72920227710747,
-              -9.92522757376041E-03, -0.119308831407288, 0.793929190615421, 0.454270731799386, 0.20999859125991,
-              -6.42109823904738E-03, -0.023515586860454, 2.52233108341612E-03, -7.64885133368119E-03,
-              1.36176427574291E-02, -1.33027883575669E-02]
-        ps = p / 100
         hs = h / 2300
-        Ts = 0
-
-        for i in range(31):
-            Ts += ni[i] * (ps + 0.24) ** Ii[i] * (hs - 0.615) ** Ji[i]
-
-        _T3_ph = Ts * 760
+        _T3_ph = if97.T3ph_a(ps + 0.24, hs - 0.615) * 760
     else:
         # Subregion 3b
         # Eq 3, Table 4, Page 7,8
-
-        Ii = [-12, -12, -10, -10, -10, -10, -10, -8, -8, -8, -8, -8, -6, -6, -6, -4, -4, -3, -2, -2, -1, -1, -1, -1, -1,
-              -1, 0, 0, 1, 3, 5, 6, 8]
-        Ji = [0, 1, 0, 1, 5, 10, 12, 0, 1, 2, 4, 10, 0, 1, 2, 0, 1, 5, 0, 4, 2, 4, 6, 10, 14, 16, 0, 2, 1, 1, 1, 1, 1]
-        ni = [3.2325457364492E-05, -1.27575556587181E-04, -4.75851877356068E-04, 1.56183014181602E-03,
-              0.105724860113781, -85.8514221132534, 724.140095480911, 2.96475810273257E-03, -5.92721983365988E-03,
-              -1.26305422818666E-02, -0.115716196364853, 84.9000969739595, -1.08602260086615E-02, 1.54304475328851E-02,
-              7.50455441524466E-02, 2.52520973612982E-02, -6.02507901232996E-02, -3.07622221350501,
-              -5.74011959864879E-02, 5.03471360939849, -0.925081888584834, 3.91733882917546, -77.314600713019,
-              9493.08762098587, -1410437.19679409, 8491662.30819026, 0.861095729446704, 0.32334644281172,
-              0.873281936020439, -0.436653048526683, 0.286596714529479, -0.131778331276228, 6.76682064330275E-03]
         hs = h / 2800
-        ps = p / 100
-        Ts = 0
-
-        for i in range(33):
-            Ts += ni[i] * (ps + 0.298) ** Ii[i] * (hs - 0.72) ** Ji[i]
-
-        _T3_ph = Ts * 860
+        _T3_ph = if97.T3ph_b(ps + 0.298, hs - 0.72) * 860
 
     return _T3_ph
 
@@ -1507,23 +980,10 @@ def h5_pT(p, T):
     # Basic Equation for Region 5
 
     # Eq 32,33, Page 36, Tables 37-41
-    Ji0 = [0, 1, -3, -2, -1, 2]
-    ni0 = [-13.179983674201, 6.8540841634434, -0.024805148933466, 0.36901534980333, -3.1161318213925, -0.32961626538917]
-    Iir = [1, 1, 1, 2, 3]
-    Jir = [0, 1, 3, 9, 3]
-    nir = [-1.2563183589592E-04, 2.1774678714571E-03, -0.004594282089991, -3.9724828359569E-06, 1.2919228289784E-07]
-    R = 0.461526  # kJ/(kg K)
     tau = 1000 / T
     Pi = p
-    gamma0_tau = 0
-    for i in range(1, 6):
-        gamma0_tau += ni0[i] * Ji0[i] * tau ** (Ji0[i] - 1)
-
-    gammar_tau = 0
-
-    for i in range(5):
-        # gammar_tau = gammar_tau + nir(i) * Pi ** Iir(i) * Jir(i) * tau ** (Jir(i) - 1);
-        gammar_tau += nir[i] * Pi ** Iir[i] * Jir[i] * tau ** (Jir[i] - 1)
+    gamma0_tau = if97.gamma5o_y(1.0, tau)
+    gammar_tau = if97.gamma5r_y(Pi, tau)
 
     _h5_pT = R * T * tau * (gamma0_tau + gammar_tau)
     return _h5_pT
@@ -1533,29 +993,11 @@ def u5_pT(p, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # Basic Equation for Region 5
     # Eq 32,33, Page 36, Tables 37-41
-    Ji0 = [0, 1, -3, -2, -1, 2]
-    ni0 = [-13.179983674201, 6.8540841634434, -0.024805148933466, 0.36901534980333, -3.1161318213925, -0.32961626538917]
-    Iir = [1, 1, 1, 2, 3]
-    Jir = [0, 1, 3, 9, 3]
-    nir = [-1.2563183589592E-04, 2.1774678714571E-03, -0.004594282089991, -3.9724828359569E-06, 1.2919228289784E-07]
-    R = 0.461526  # kJ/(kg K)
     tau = 1000 / T
     Pi = p
     gamma0_pi = 1 / Pi
-    gamma0_tau = 0
-
-    for i in range(1, 6):
-        gamma0_tau = gamma0_tau + ni0[i] * Ji0[i] * tau ** (Ji0[i] - 1)
-
-    gammar_pi = 0
-    gammar_tau = 0
-
-    for i in range(1, 5):
-        # gammar_pi = gammar_pi + nir(i) * Iir(i) * Pi ** (Iir(i) - 1) * tau ** Jir(i);
-        # gammar_tau = gammar_tau + nir(i) * Pi ** Iir(i) * Jir(i) * tau ** (Jir(i) - 1);
-
-        gammar_pi += nir[i] * Iir[i] * Pi ** (Iir[i] - 1) * tau ** Jir[i]
-        gammar_tau += nir[i] * Pi ** Iir[i] * Jir[i] * tau ** (Jir[i] - 1)
+    gamma0_tau = if97.gamma5o_y(1.0, tau)
+    gammar_pi, gammar_tau = if97.gamma5r_u(Pi, tau)
 
     _u5_pT = R * T * (tau * (gamma0_tau + gammar_tau) - Pi * (gamma0_pi + gammar_pi))
     return _u5_pT
@@ -1569,52 +1011,19 @@ def v3_ps(p, s):
     # 3.4 Backward Equations T(p,s) and v(p,s) for Subregions 3a and 3b
 
     # Boundary equation, Eq 6 Page 11
-    if s <= 4.41202148223476:
+    # Boundary equation, Eq 1 Page 5
+    Pi = p / 100
 
+    if s <= 4.41202148223476:
         # Subregion 3a
         # Eq 8, Table 13, Page 14
-        Ii = [-12, -12, -12, -10, -10, -10, -10, -8, -8, -8, -8, -6, -5, -4, -3, -3, -2, -2, -1, -1, 0, 0, 0, 1, 2, 4,
-              5, 6]
-        Ji = [10, 12, 14, 4, 8, 10, 20, 5, 6, 14, 16, 28, 1, 5, 2, 4, 3, 8, 1, 2, 0, 1, 3, 0, 0, 2, 2, 0]
-        ni = [79.5544074093975, -2382.6124298459, 17681.3100617787, -1.10524727080379E-03, -15.3213833655326,
-              297.544599376982, -35031520.6871242, 0.277513761062119, -0.523964271036888, -148011.182995403,
-              1600148.99374266, 1708023226634.27, 2.46866996006494E-04, 1.6532608479798, -0.118008384666987,
-              2.537986423559,
-              0.965127704669424, -28.2172420532826, 0.203224612353823, 1.10648186063513, 0.52612794845128,
-              0.277000018736321, 1.08153340501132, -7.44127885357893E-02, 1.64094443541384E-02, -6.80468275301065E-02,
-              0.025798857610164, -1.45749861944416E-04]
-        Pi = p / 100
         Sigma = s / 4.4
-        omega = 0
-
-        for i in range(28):
-            omega += ni[i] * (Pi + 0.187) ** Ii[i] * (Sigma - 0.755) ** Ji[i]
-
-        _v3_ps = omega * 0.0028
+        _v3_ps = if97.v3ps_a(Pi + 0.187, Sigma - 0.755) * 0.0028
     else:
-
         # Subregion 3b
         # Eq 9, Table 14, Page 14
-        Ii = [-12, -12, -12, -12, -12, -12, -10, -10, -10, -10, -8, -5, -5, -5, -4, -4, -4, -4, -3, -2, -2, -2, -2, -2,
-              -2,
-              0, 0, 0, 1, 1, 2]
-        Ji = [0, 1, 2, 3, 5, 6, 0, 1, 2, 4, 0, 1, 2, 3, 0, 1, 2, 3, 1, 0, 1, 2, 3, 4, 12, 0, 1, 2, 0, 2, 2]
-        ni = [5.91599780322238E-05, -1.85465997137856E-03, 1.04190510480013E-02, 5.9864730203859E-03,
-              -0.771391189901699,
-              1.72549765557036, -4.67076079846526E-04, 1.34533823384439E-02, -8.08094336805495E-02, 0.508139374365767,
-              1.28584643361683E-03, -1.63899353915435, 5.86938199318063, -2.92466667918613, -6.14076301499537E-03,
-              5.76199014049172, -12.1613320606788, 1.67637540957944, -7.44135838773463, 3.78168091437659E-02,
-              4.01432203027688, 16.0279837479185, 3.17848779347728, -3.58362310304853, -1159952.60446827,
-              0.199256573577909,
-              -0.122270624794624, -19.1449143716586, -1.50448002905284E-02, 14.6407900162154, -3.2747778718823]
-        Pi = p / 100
         Sigma = s / 5.3
-        omega = 0
-
-        for i in range(31):
-            omega += ni[i] * (Pi + 0.298) ** Ii[i] * (Sigma - 0.816) ** Ji[i]
-
-        _v3_ps = omega * 0.0088
+        _v3_ps = if97.v3ps_b(Pi + 0.298, Sigma - 0.816) * 0.0088
 
     return _v3_ps
 
@@ -1647,7 +1056,7 @@ def p3_hs(h, s):
         eta = h / 2300
         Pi = 0
 
-        for i in range(1, 33):
+        for i in range(33):
             Pi += ni[i] * (eta - 1.01) ** Ii[i] * (Sigma - 0.75) ** Ji[i]
 
         _p3_hs = Pi * 99
@@ -1671,7 +1080,7 @@ def p3_hs(h, s):
         eta = h / 2800
         Pi = 0
 
-        for i in range(1, 35):
+        for i in range(35):
             Pi += ni[i] * (eta - 0.681) ** Ii[i] * (Sigma - 0.792) ** Ji[i]
         _p3_hs = 16.6 / Pi
 
@@ -1701,36 +1110,14 @@ def s3_rhoT(rho, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 7 Basic Equation for Region 3, Section. 6.1 Basic Equation
     # Table 30 and 31, Page 30 and 31
-
-    Ii = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 6, 6, 6, 7, 8, 9, 9,
-          10, 10, 11]
-    Ji = [0, 0, 1, 2, 7, 10, 12, 23, 2, 6, 15, 17, 0, 2, 6, 7, 22, 26, 0, 2, 4, 16, 26, 0, 2, 4, 26, 1, 3, 26, 0, 2, 26,
-          2, 26, 2, 26, 0, 1, 26]
-    ni = [1.0658070028513, -15.732845290239, 20.944396974307, -7.6867707878716, 2.6185947787954, -2.808078114862,
-          1.2053369696517, -8.4566812812502E-03, -1.2654315477714, -1.1524407806681, 0.88521043984318,
-          -0.64207765181607, 0.38493460186671, -0.85214708824206, 4.8972281541877, -3.0502617256965, 0.039420536879154,
-          0.12558408424308, -0.2799932969871, 1.389979956946, -2.018991502357, -8.2147637173963E-03, -0.47596035734923,
-          0.0439840744735, -0.44476435428739, 0.90572070719733, 0.70522450087967, 0.10770512626332, -0.32913623258954,
-          -0.50871062041158, -0.022175400873096, 0.094260751665092, 0.16436278447961, -0.013503372241348,
-          -0.014834345352472, 5.7922953628084E-04, 3.2308904703711E-03, 8.0964802996215E-05, -1.6557679795037E-04,
-          -4.4923899061815E-05]
-
-    R = 0.461526  # kJ/(KgK)
     tc = 647.096  # K
-    pc = 22.064  # MPa
     rhoc = 322  # kg/m3
     delta = rho / rhoc
     tau = tc / T
-    fi = 0
-    fitau = 0
+    fi, fitau = if97.phi3_s(delta, tau)
+    fi += if97.phi3_n[0] * log(delta)
 
-    for i in range(1, 40):
-        fi += ni[i] * delta ** Ii[i] * tau ** Ji[i]
-        fitau += ni[i] * delta ** Ii[i] * Ji[i] * tau ** (Ji[i] - 1)
-
-    fi += ni[1] * log(delta)
     _s3_rhoT = R * (tau * fitau - fi)
-
     return _s3_rhoT
 
 
@@ -1738,36 +1125,14 @@ def h3_rhoT(rho, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # 7 Basic Equation for Region 3, Section. 6.1 Basic Equation
     # Table 30 and 31, Page 30 and 31
-
-    Ii = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 6, 6, 6, 7, 8, 9, 9,
-          10, 10, 11]
-    Ji = [0, 0, 1, 2, 7, 10, 12, 23, 2, 6, 15, 17, 0, 2, 6, 7, 22, 26, 0, 2, 4, 16, 26, 0, 2, 4, 26, 1, 3, 26, 0, 2, 26,
-          2, 26, 2, 26, 0, 1, 26]
-    ni = [1.0658070028513, -15.732845290239, 20.944396974307, -7.6867707878716, 2.6185947787954, -2.808078114862,
-          1.2053369696517, -8.4566812812502E-03, -1.2654315477714, -1.1524407806681, 0.88521043984318,
-          -0.64207765181607, 0.38493460186671, -0.85214708824206, 4.8972281541877, -3.0502617256965, 0.039420536879154,
-          0.12558408424308, -0.2799932969871, 1.389979956946, -2.018991502357, -8.2147637173963E-03, -0.47596035734923,
-          0.0439840744735, -0.44476435428739, 0.90572070719733, 0.70522450087967, 0.10770512626332, -0.32913623258954,
-          -0.50871062041158, -0.022175400873096, 0.094260751665092, 0.16436278447961, -0.013503372241348,
-          -0.014834345352472, 5.7922953628084E-04, 3.2308904703711E-03, 8.0964802996215E-05, -1.6557679795037E-04,
-          -4.4923899061815E-05]
-    R = 0.461526  # kJ/(KgK)
     tc = 647.096  # K
-    pc = 22.064  # MPa
     rhoc = 322  # kg/m3
-
     delta = rho / rhoc
     tau = tc / T
-    fidelta = 0
-    fitau = 0
-
-    for i in range(1, 40):
-        fidelta = fidelta + ni[i] * Ii[i] * delta ** (Ii[i] - 1) * tau ** Ji[i]
-        fitau = fitau + ni[i] * delta ** Ii[i] * Ji[i] * tau ** (Ji[i] - 1)
+    fidelta, fitau = if97.phi3_h(delta, tau)
+    fidelta += if97.phi3_n[0] / delta
 
-    fidelta = fidelta + ni[0] / delta
     _h3_rhoT = R * T * (tau * fitau + delta * fidelta)
-
     return _h3_rhoT
 
 
@@ -1867,29 +1232,11 @@ def s5_pT(p, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # Basic Equation for Region 5
     # Eq 32,33, Page 36, Tables 37-41
-    Ji0 = [0, 1, -3, -2, -1, 2]
-    ni0 = [-13.179983674201, 6.8540841634434, -0.024805148933466, 0.36901534980333, -3.1161318213925, -0.32961626538917]
-    Iir = [1, 1, 1, 2, 3]
-    Jir = [0, 1, 3, 9, 3]
-
-    nir = [-1.2563183589592E-04, 2.1774678714571E-03, -0.004594282089991, -3.9724828359569E-06, 1.2919228289784E-07]
-
-    R = 0.461526  # kJ/(kg K)
     tau = 1000 / T
     Pi = p
-    gamma0 = log(Pi)
-    gamma0_tau = 0
-
-    for i in range(5):
-        gamma0_tau += ni0[i] * Ji0[i] * tau ** (Ji0[i] - 1)
-        gamma0 += ni0[i] * tau ** Ji0[i]
-
-    gammar = 0
-    gammar_tau = 0
-
-    for i in range(5):
-        gammar += nir[i] * Pi ** Iir[i] * tau ** Jir[i]
-        gammar_tau += Iir[i] * Pi ** Iir[i] * Jir[i] * tau ** (Jir[i] - 1)
+    gamma0, gamma0_tau = if97.gamma5o_s(1.0, tau)
+    gamma0 += log(Pi)
+    gammar, gammar_tau = if97.gamma5r_s(Pi, tau)
 
     _s5_pT = R * (tau * (gamma0_tau + gammar_tau) - (gamma0 + gammar))
 
@@ -1900,19 +1247,10 @@ def v5_pT(p, T):
     # Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     # Basic Equation for Region 5
     # Eq 32,33, Page 36, Tables 37-41
-    Ji0 = [0, 1, -3, -2, -1, 2]
-    ni0 = [-13.179983674201, 6.8540841634434, -0.024805148933466, 0.36901534980333, -3.1161318213925, -0.32961626538917]
-    Iir = [1, 1, 1, 2, 3]
-    Jir = [0, 1, 3, 9, 3]
-    nir = [-1.2563183589592E-04, 2.1774678714571E-03, -0.004594282089991, -3.9724828359569E-06, 1.2919228289784E-07]
-    R = 0.461526  # kJ/(kg K)
     tau = 1000 / T
     Pi = p
     gamma0_pi = 1 / Pi
-    gammar_pi = 0
-
-    for i in range(5):
-        gammar_pi = gammar_pi + nir[i] * Iir[i] * Pi ** (Iir[i] - 1) * tau ** Jir[i]
+    gammar_pi = if97.gamma5r_x(Pi, tau)
 
     _v5_pT = R * T / p * Pi * (gamma0_pi + gammar_pi) / 1000
 
@@ -1926,46 +1264,19 @@ def T3_ps(p, s):
     # 2004
     # 3.4 Backward Equations T(p,s) and v(p,s) for Subregions 3a and 3b
     # Boundary equation, Eq 6 Page 11
+    # Boundary equation, Eq 1 Page 5
+    Pi = p / 100
 
     if s <= 4.41202148223476:
         # Subregion 3a
         # Eq 6, Table 10, Page 11
-        Ii = [-12, -12, -10, -10, -10, -10, -8, -8, -8, -8, -6, -6, -6, -5, -5, -5, -4, -4, -4, -2, -2, -1, -1, 0, 0, 0,
-              1, 2, 2, 3, 8, 8, 10]
-        Ji = [28, 32, 4, 10, 12, 14, 5, 7, 8, 28, 2, 6, 32, 0, 14, 32, 6, 10, 36, 1, 4, 1, 6, 0, 1, 4, 0, 0, 3, 2, 0, 1,
-              2]
-        ni = [1500420082.63875, -159397258480.424, 5.02181140217975E-04, -67.2057767855466, 1450.58545404456,
-              -8238.8953488889, -0.154852214233853, 11.2305046746695, -29.7000213482822, 43856513263.5495,
-              1.37837838635464E-03, -2.97478527157462, 9717779473494.13, -5.71527767052398E-05, 28830.794977842,
-              -74442828926270.3, 12.8017324848921, -368.275545889071, 6.64768904779177E+15, 0.044935925195888,
-              -4.22897836099655, -0.240614376434179, -4.74341365254924, 0.72409399912611, 0.923874349695897,
-              3.99043655281015, 3.84066651868009E-02, -3.59344365571848E-03, -0.735196448821653, 0.188367048396131,
-              1.41064266818704E-04, -2.57418501496337E-03, 1.23220024851555E-03]
         Sigma = s / 4.4
-        Pi = p / 100
-        teta = 0
-        for i in range(33):
-            teta += ni[i] * (Pi + 0.24) ** Ii[i] * (Sigma - 0.703) ** Ji[i]
-
-        _T3_ps = teta * 760
+        _T3_ps = if97.T3ps_a(Pi + 0.24, Sigma - 0.703) * 760
     else:
         # Subregion 3b
         # Eq 7, Table 11, Page 11
-        Ii = [-12, -12, -12, -12, -8, -8, -8, -6, -6, -6, -5, -5, -5, -5, -5, -4, -3, -3, -2, 0, 2, 3, 4, 5, 6, 8, 12,
-              14]
-        Ji = [1, 3, 4, 7, 0, 1, 3, 0, 2, 4, 0, 1, 2, 4, 6, 12, 1, 6, 2, 0, 1, 1, 0, 24, 0, 3, 1, 2]
-        ni = [0.52711170160166, -40.1317830052742, 153.020073134484, -2247.99398218827, -0.193993484669048,
-              -1.40467557893768, 42.6799878114024, 0.752810643416743, 22.6657238616417, -622.873556909932,
-              -0.660823667935396, 0.841267087271658, -25.3717501764397, 485.708963532948, 880.531517490555,
-              2650155.92794626, -0.359287150025783, -656.991567673753, 2.41768149185367, 0.856873461222588,
-              0.655143675313458, -0.213535213206406, 5.62974957606348E-03, -316955725450471, -6.99997000152457E-04,
-              1.19845803210767E-02, 1.93848122022095E-05, -2.15095749182309E-05]
         Sigma = s / 5.3
-        Pi = p / 100
-        teta = 0
-        for i in range(28):
-            teta += ni[i] * (Pi + 0.76) ** Ii[i] * (Sigma - 0.818) ** Ji[i]
-        _T3_ps = teta * 860
+        _T3_ps = if97.T3ps_b(Pi + 0.76, Sigma - 0.818) * 860
 
     return _T3_ps
 
@@ -2300,7 +1611,7 @@ def region_ps(p, s):
     if s > s2_pT(p, 1073.15):
         if p <= 10:
             _region_ps = 5
-            return
+            return _region_ps
         else:
             _region_ps = 0
 
@@ -2348,7 +1659,7 @@ def region_pT(p, T):
                 _region_pT = 3
                 if T < 647.096:
                     ps = p4_T(T)
-                    if abs(p - ps) < 0.0000:
+                    if abs(p - ps) < 0.00001:
                         _region_pT = 4
             else:
                 _region_pT = 2
@@ -2356,7 +1667,7 @@ def region_pT(p, T):
             ps = p4_T(T)
             if abs(p - ps) < 0.00001:
                 _region_pT = 4
-            elif p > p:
+            elif p > ps:
                 _region_pT = 1
             else:
                 _region_pT = 2
@@ -2482,32 +1793,157 @@ def T4_hs(h, s):
                 Low_Bound = p
 
         _T4_hs = T4_p(p)
-        return _T4_hs
+
+    return _T4_hs
 
 
 def u3_rhoT(rho, T):
     #Release on the IAPWS Industrial formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     #7 Basic Equation for Region 3, Section. 6.1 Basic Equation
     #Table 30 and 31, Page 30 and 31
-    Ii = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 6, 6, 6, 7, 8, 9, 9, 10, 10, 11]
-    Ji = [0, 0, 1, 2, 7, 10, 12, 23, 2, 6, 15, 17, 0, 2, 6, 7, 22, 26, 0, 2, 4, 16, 26, 0, 2, 4, 26, 1, 3, 26, 0, 2, 26, 2, 26, 2, 26, 0, 1, 26]
-    ni = [1.0658070028513, -15.732845290239, 20.944396974307, -7.6867707878716, 2.6185947787954, -2.808078114862, 1.2053369696517, -8.4566812812502E-03, -1.2654315477714, -1.1524407806681, 0.88521043984318, -0.64207765181607, 0.38493460186671, -0.85214708824206, 4.8972281541877, -3.0502617256965, 0.039420536879154, 0.12558408424308, -0.2799932969871, 1.389979956946, -2.018991502357, -8.2147637173963E-03, -0.47596035734923, 0.0439840744735, -0.44476435428739, 0.90572070719733, 0.70522450087967, 0.10770512626332, -0.32913623258954, -0.50871062041158, -0.022175400873096, 0.094260751665092, 0.16436278447961, -0.013503372241348, -0.014834345352472, 5.7922953628084E-04, 3.2308904703711E-03, 8.0964802996215E-05, -1.6557679795037E-04, -4.4923899061815E-05]
-    R = 0.461526 #kJ/(KgK)
-    tc = 647.096 #K
-    pc = 22.064 #MPa
-    rhoc = 322 #kg/m3
+    tc = 647.096  # K
+    rhoc = 322  # kg/m3
     delta = rho / rhoc
     tau = tc / T
-    fitau = 0
-
-    for i in range(1, 40):
-        # fitau = fitau + ni(i) * delta ^ Ii(i) * Ji(i) * tau ^ (Ji(i) - 1);
-        fitau = fitau + ni[i] * delta ** Ii[i] * Ji[i] * tau ** (Ji[i] - 1)
+    fitau = if97.phi3_y(delta, tau)
 
     _u3_rhoT = R * T * (tau * fitau)
     return _u3_rhoT
 
 
+# ***********************************************************************************************************
+# *2.6 State functions - several properties from a single evaluation of the basic equations
+# ***********************************************************************************************************
+
+def props_gibbs(p, T, Pi, tau, g, g_pi, g_tau, g_pipi=None, g_pitau=None, g_tautau=None):
+    """
+    Properties from the dimensionless Gibbs free energy g(Pi, tau) and its
+    derivatives, Table 3 (region 1), Table 12 (region 2) and Table 39 (region 5)
+    of the IF-97 release. Cp, Cv and w are None when the second derivatives
+    are not given.
+
+    :return: v, h, u, s, Cp, Cv, w
+    """
+    v = R * T / p * Pi * g_pi / 1000
+    h = R * T * tau * g_tau
+    u = R * T * (tau * g_tau - Pi * g_pi)
+    s = R * (tau * g_tau - g)
+
+    if g_tautau is None:
+        return v, h, u, s, None, None, None
+
+    a = g_pi - tau * g_pitau
+    Cp = -R * tau ** 2 * g_tautau
+    Cv = R * (-tau ** 2 * g_tautau + a ** 2 / g_pipi)
+    w = (1000 * R * T * g_pi ** 2 / (a ** 2 / (tau ** 2 * g_tautau) - g_pipi)) ** 0.5
+    return v, h, u, s, Cp, Cv, w
+
+
+def props_helmholtz(rho, T, delta, tau, f, f_delta, f_tau, f_deltadelta=None, f_deltatau=None, f_tautau=None):
+    """
+    Properties from the dimensionless Helmholtz free energy f(delta, tau) and
+    its derivatives, Table 31 of the IF-97 release (region 3). Cp, Cv and w
+    are None when the second derivatives are not given.
+
+    :return: v, h, u, s, Cp, Cv, w
+    """
+    h = R * T * (tau * f_tau + delta * f_delta)
+    u = R * T * tau * f_tau
+    s = R * (tau * f_tau - f)
+
+    if f_tautau is None:
+        return 1 / rho, h, u, s, None, None, None
+
+    a = delta * f_delta - delta * tau * f_deltatau
+    b = 2 * delta * f_delta + delta ** 2 * f_deltadelta
+    Cv = -R * tau ** 2 * f_tautau
+    Cp = Cv + R * a ** 2 / b
+    w = (1000 * R * T * (b - a ** 2 / (tau ** 2 * f_tautau))) ** 0.5
+    return 1 / rho, h, u, s, Cp, Cv, w
+
+
+def state1_pT(p, T, second=True):
+    """
+    Region 1 state (v, h, u, s, Cp, Cv, w) evaluating the basic equation
+    once. Without second derivatives Cp, Cv and w are None.
+    """
+    Pi = p / 16.53
+    tau = 1386 / T
+    if second:
+        g, g_x, g_tau, g_xx, g_xy, g_tautau = if97.gamma1_d2(7.1 - Pi, tau - 1.222)
+        return props_gibbs(p, T, Pi, tau, g, -g_x, g_tau, g_xx, -g_xy, g_tautau)
+
+    g, g_x, g_tau = if97.gamma1_d1(7.1 - Pi, tau - 1.222)
+    return props_gibbs(p, T, Pi, tau, g, -g_x, g_tau)
+
+
+def state2_pT(p, T, second=True):
+    """
+    Region 2 state (v, h, u, s, Cp, Cv, w) evaluating the basic equation
+    once. Without second derivatives Cp, Cv and w are None.
+    """
+    Pi = p
+    tau = 540 / T
+    if second:
+        g0, g0_tau, g0_tautau = if97.gamma2o_d2(1.0, tau)
+        gr, gr_pi, gr_tau, gr_pipi, gr_pitau, gr_tautau = if97.gamma2r_d2(Pi, tau - 0.5)
+        return props_gibbs(p, T, Pi, tau, g0 + log(Pi) + gr, 1 / Pi + gr_pi, g0_tau + gr_tau,
+                           -1 / Pi ** 2 + gr_pipi, gr_pitau, g0_tautau + gr_tautau)
+
+    g0, g0_tau = if97.gamma2o_s(1.0, tau)
+    gr, gr_pi, gr_tau = if97.gamma2r_d1(Pi, tau - 0.5)
+    return props_gibbs(p, T, Pi, tau, g0 + log(Pi) + gr, 1 / Pi + gr_pi, g0_tau + gr_tau)
+
+
+def state3_rhoT(rho, T, second=True):
+    """
+    Region 3 state (v, h, u, s, Cp, Cv, w) evaluating the basic equation
+    once. Without second derivatives Cp, Cv and w are None.
+    """
+    delta = rho / 322
+    tau = 647.096 / T
+    n1 = if97.phi3_n[0]
+    if second:
+        f, f_delta, f_tau, f_deltadelta, f_deltatau, f_tautau = if97.phi3_d2(delta, tau)
+        return props_helmholtz(rho, T, delta, tau, f + n1 * log(delta), f_delta + n1 / delta, f_tau,
+                               f_deltadelta - n1 / delta ** 2, f_deltatau, f_tautau)
+
+    f, f_delta, f_tau = if97.phi3_d1(delta, tau)
+    return props_helmholtz(rho, T, delta, tau, f + n1 * log(delta), f_delta + n1 / delta, f_tau)
+
+
+def state4_p(p, second=False):
+    """
+    Saturation state at pressure p
+
+    :return: Saturation temperature, state of the saturated liquid and state of the saturated vapour
+    """
+    Ts = T4_p(p)
+    if p < 16.529:
+        return Ts, state1_pT(p, Ts, second), state2_pT(p, Ts, second)
+
+    return (Ts, state3_rhoT(1 / v3_ph(p, h4L_p(p)), Ts, second),
+            state3_rhoT(1 / v3_ph(p, h4V_p(p)), Ts, second))
+
+
+def state5_pT(p, T, second=True):
+    """
+    Region 5 state (v, h, u, s, Cp, Cv, w) evaluating the basic equation
+    once. Without second derivatives Cp, Cv and w are None.
+    """
+    Pi = p
+    tau = 1000 / T
+    if second:
+        g0, g0_tau, g0_tautau = if97.gamma5o_d2(1.0, tau)
+        gr, gr_pi, gr_tau, gr_pipi, gr_pitau, gr_tautau = if97.gamma5r_d2(Pi, tau)
+        return props_gibbs(p, T, Pi, tau, g0 + log(Pi) + gr, 1 / Pi + gr_pi, g0_tau + gr_tau,
+                           -1 / Pi ** 2 + gr_pipi, gr_pitau, g0_tautau + gr_tautau)
+
+    g0, g0_tau = if97.gamma5o_s(1.0, tau)
+    gr, gr_pi, gr_tau = if97.gamma5r_d1(Pi, tau)
+    return props_gibbs(p, T, Pi, tau, g0 + log(Pi) + gr, 1 / Pi + gr_pi, g0_tau + gr_tau)
+
+
 def test_eq(function, args, expected_result, tol=1e-3):
     for arg, e in zip(list(zip(*args)), expected_result):
         test_eq_(function, arg, e, tol=1e-3)
@@ -12,6 +12,9 @@ http://www.myengineeringworld.net/2013/10/Excel-thermochemical-NASA-polynomials-
 #sys.path.append("/home/tux/PycharmProjects/m2py")
 
 from math import (log, exp)
+
+import numpy
+
 from m2py import units
 from m2py.utils import resource_path
 from m2py import utils
@@ -89,7 +92,22 @@ def get_molarmass(substance):
     """Return molar mass in kg/mol"""
     return molarmass[substance]
 
-def __cp_nasap_p7__(T, substance):
+
+# The coefficients of every substance are two sets of 7, the first one for
+# T >= Tmid, the second one for T < Tmid. Tmid is 1000 K except for these
+# substances (nasa_poly7gas.txt, not stored in gas_nasa_poly7.json).
+tmid = {"HCNO": 1382.0, "HOCN": 1368.0, "HNCO": 1478.0}
+
+
+def __coefficients__(T, substance):
+    """ The 7 coefficients of substance for the range of the temperature T in K """
+    a = nasapoly7coefs[substance]
+    if T >= tmid.get(substance, Tr):
+        return a[:7]
+    return a[7:]
+
+
+def __cp_nasap_p7__(T, substance, rounded=True):
     """
     Calculates Heat Capacity cp - [cal/(mol.K)] 
     from Nasa 7-coefficient Polynomials. 
@@ -97,17 +115,18 @@ def __cp_nasap_p7__(T, substance):
     Cp/R = a1 + a2 T + a3 T^2 + a4 T^3 + a5 T^4
     
     :param T: Temperature in K
+    :param rounded: Round the result to 2 decimal places
     :return: cp Heat Capacity/ Cp heat in [cal/(mol.K)]
     """
-    a = nasapoly7coefs[substance]
+    a = __coefficients__(T, substance)
     
     C = 0
     for i in range(5):
         C = C + a[i]*T**i
     
-    return round(C*R_, 2)
+    return round(C*R_, 2) if rounded else C*R_
 
-def cp_nasa_p7_mol(T, substance):
+def cp_nasa_p7_mol(T, substance, rounded=True):
     """
     Calculates Heat Capacity cp - [J/(mol.K)] 
     from Nasa 7-coefficient Polynomials. 
@@ -115,14 +134,15 @@ def cp_nasa_p7_mol(T, substance):
     Cp/R = a1 + a2 T + a3 T^2 + a4 T^3 + a5 T^4
     
     :param T: Temperature in C
+    :param rounded: Round cp in cal/(mol.K) to 2 decimal places
     :return: cp Heat Capacity/ Cp heat in [ J/(mol.K)]
     """  
     T = units.c2k(T)
-    cp = __cp_nasap_p7__(T, substance)
+    cp = __cp_nasap_p7__(T, substance, rounded)
     cp = cal2J*cp
     return cp
 
-def cp_nasa_p7(T, substance):
+def cp_nasa_p7(T, substance, rounded=True):
     """
     Calculates Heat Capacity cp - [J/(kg.K)] 
     from Nasa 7-coefficient Polynomials. 
@@ -130,37 +150,185 @@ def cp_nasa_p7(T, substance):
     Cp/R = a1 + a2 T + a3 T^2 + a4 T^3 + a5 T^4
     
     :param T: Temperature in C
+    :param rounded: Round cp in cal/(mol.K) to 2 decimal places
     :return: cp Heat Capacity/ Cp heat in [ J/(kg.K)]
     """  
     m = molarmass[substance]
     T = units.c2k(T)
-    cp = __cp_nasap_p7__(T, substance)
+    cp = __cp_nasap_p7__(T, substance, rounded)
     cp = cal2J*cp/m
     return cp
 
-def s_nasa_p7(T, substance):
+def s_nasa_p7(T, substance, rounded=True):
     """
     S/R  = a1 lnT + a2 T + a3 T^2 /2 + a4 T^3 /3 + a5 T^4 /4 + a7
+
+    :param T: Temperature in K
+    :param rounded: Round the result to 2 decimal places
+    :return: s Entropy in [cal/(mol.K)]
     """
-    a = nasapoly7coefs[substance]
+    a = __coefficients__(T, substance)
     C = a[0]*log(T) + a[1]*T + a[2]*T**2 /2 + a[3]*T**3 /3 + a[4]*T**4 /4 + a[6]
     C = C*R_
-    return round(C, 2)
+    return round(C, 2) if rounded else C
 
 def h_nasa_p7(T, substance ):
     """
     :param T: Temperature in K
     :param substance: Substance Name
+    :return: H Enthalpy in [cal/mol]
     """
-    a = nasapoly7coefs[substance]
+    a = __coefficients__(T, substance)
     
     C =  a[0] + a[1]*T/2 + a[2]*T**2 /3 + a[3]*T**3 /4 + a[4]*T**4 /5 + a[5]/T
     H = R_*T*C
     return H
-    
- 
 
 
+# ************************************************************************************************
+# Batch evaluation, species x temperatures
+# ************************************************************************************************
+
+# Universal gas constant J/(mol.K), R_ in SI units
+RJ = R * 1e3
+
+
+class NASA7(object):
+    """
+    NASA 7-coefficient polynomials of several species as coefficient
+    matrices, evaluated over a grid of species x temperatures in one call
+    with full precision. SI units: T in K, cp and s in J/(mol.K), h in
+    J/mol (per kg with the mass=True argument).
+
+    :param species: Names of the species, all the substances by default
+
+    Example:
+
+    >>> gases = NASA7(["O2", "N2", "CO2", "H2O"])
+    >>> T = numpy.linspace(300, 2000, 5)
+    >>> gases.cp(T).shape                    # (species, temperatures)
+    (4, 5)
+    >>> gases.cp(T, species=["N2"])          # Only some species
+    >>> x = [0.21, 0.79, 0, 0]               # Mole fractions of air
+    >>> gases.cp_mix(x, T)                   # J/(mol.K)
+    >>> gases.cp_mix(x, T, mass=True)        # J/(kg.K)
+    """
+
+    def __init__(self, species=None):
+        self.species = list(species if species is not None else substances)
+        self.index = dict((name, k) for k, name in enumerate(self.species))
+        coefficients = numpy.array([nasapoly7coefs[name] for name in self.species], dtype=float)
+        self.high = coefficients[:, :7]
+        self.low = coefficients[:, 7:]
+        self.tmid = numpy.array([tmid.get(name, Tr) for name in self.species], dtype=float)
+        self.molarmass = numpy.array([molarmass[name] for name in self.species], dtype=float)
+
+    def _rows(self, species):
+        if species is None:
+            return slice(None)
+        return [self.index[name] for name in species]
+
+    def _coefficients(self, T, species):
+        """ Coefficients of the grid species x T, shape (7, species, temperatures) """
+        rows = self._rows(species)
+        T = numpy.asarray(T, dtype=float)
+        high = (T.ravel()[None, :] >= self.tmid[rows][:, None])[None, :, :]
+        a = numpy.where(high, self.high[rows].T[:, :, None], self.low[rows].T[:, :, None])
+        return a, T
+
+    def _grid(self, values, T, species, mass):
+        """ Reshape to (species,) + shape of T, per kg when mass is True """
+        if mass:
+            values = values / self.molarmass[self._rows(species)][:, None]
+        return values.reshape(values.shape[:1] + T.shape)
+
+    def cp(self, T, species=None, mass=False):
+        """
+        Heat capacity, Cp/R = a1 + a2 T + a3 T^2 + a4 T^3 + a5 T^4
+
+        :param T:       Temperatures in K, scalar or array
+        :param species: Names of the species, all by default
+        :param mass:    J/(kg.K) instead of J/(mol.K)
+        :return:        Array (species,) + shape of T
+        """
+        a, T = self._coefficients(T, species)
+        t = T.ravel()
+        cp = a[0] + t * (a[1] + t * (a[2] + t * (a[3] + t * a[4])))
+        return self._grid(RJ * cp, T, species, mass)
+
+    def h(self, T, species=None, mass=False):
+        """
+        Enthalpy, H/RT = a1 + a2 T /2 + a3 T^2 /3 + a4 T^3 /4 + a5 T^4 /5 + a6/T
+
+        :return: Array (species,) + shape of T in J/mol (J/kg)
+        """
+        a, T = self._coefficients(T, species)
+        t = T.ravel()
+        h = t * (a[0] + t * (a[1] / 2 + t * (a[2] / 3 + t * (a[3] / 4 + t * a[4] / 5)))) + a[5]
+        return self._grid(RJ * h, T, species, mass)
+
+    def s(self, T, species=None, mass=False):
+        """
+        Entropy at p0, S/R  = a1 lnT + a2 T + a3 T^2 /2 + a4 T^3 /3 + a5 T^4 /4 + a7
+
+        :return: Array (species,) + shape of T in J/(mol.K) (J/(kg.K))
+        """
+        a, T = self._coefficients(T, species)
+        t = T.ravel()
+        s = a[0] * numpy.log(t) + t * (a[1] + t * (a[2] / 2 + t * (a[3] / 3 + t * a[4] / 4))) + a[6]
+        return self._grid(RJ * s, T, species, mass)
+
+    # Mixtures of all the species of the object
+
+    def _fractions(self, x):
+        x = numpy.asarray(x, dtype=float)
+        if x.shape[0] != len(self.species):
+            raise ValueError("Expected %d mole fractions, one per species" % len(self.species))
+        return x
+
+    def molarmass_mix(self, x):
+        """ Molar mass of the mixture in kg/mol, x mole fractions (species,) or (species, points) """
+        return numpy.tensordot(self.molarmass, self._fractions(x), axes=1)
+
+    def _mix(self, values, x, mass):
+        x = self._fractions(x)
+        if x.ndim == 1:
+            mix = numpy.tensordot(x, values, axes=1)
+        else:
+            # One composition per temperature
+            mix = numpy.sum(x * values, axis=0)
+        if mass:
+            mix = mix / self.molarmass_mix(x)
+        return mix
+
+    def cp_mix(self, x, T, mass=False):
+        """
+        Heat capacity of the ideal gas mixture, sum(x_i cp_i)
+
+        :param x:    Mole fractions (species,), or (species,) + shape of T
+                     for a composition per temperature
+        :param T:    Temperatures in K
+        :param mass: J/(kg.K) instead of J/(mol.K)
+        """
+        return self._mix(self.cp(T), x, mass)
+
+    def h_mix(self, x, T, mass=False):
+        """ Enthalpy of the ideal gas mixture, sum(x_i h_i) in J/mol (J/kg) """
+        return self._mix(self.h(T), x, mass)
+
+    def s_mix(self, x, T, mass=False):
+        """
+        Entropy of the ideal gas mixture at p0, sum(x_i (s_i - R ln x_i))
+        in J/(mol.K) (J/(kg.K)), the species with x_i = 0 don't contribute
+        """
+        x = self._fractions(x)
+        s = self.s(T)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            mixing = numpy.where(x > 0, -RJ * numpy.log(numpy.where(x > 0, x, 1.0)), 0.0)
+        if x.ndim == 1:
+            mixing = mixing.reshape((-1,) + (1,) * (s.ndim - 1))
+        return self._mix(s + mixing, x, mass)
+
 """
 3.03399249E+00 2.17691804E-03-1.64072518E-07-9.70419870E-11 1.68200992E-14    2
 -3.00042971E+04 4.96677010E+00 4.19864056E+00-2.03643410E-03 6.52040211E-06    3
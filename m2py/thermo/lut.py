@@ -0,0 +1,733 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Bicubic lookup tables for the steam tables
+
+Fast approximation of the xsteam functions for real time simulation. The
+tables are built once from the exact IF-97 functions of vxsteam, saved to
+a .npy file (with a .json file describing its layout and the error report)
+and memory mapped when they are loaded again.
+
+Every plane of input variables is split in patches that follow the region
+boundaries and the saturation line. The second variable of a patch is
+scaled between its lower and upper boundary at each pressure, so the cells
+of a table never cross the saturation line:
+
+    p, T    liquid, vapour, supercritical and region 5 patches
+    p, h    the same patches bounded by h(p, T), the saturated
+    p, s    liquid and vapour h and s are 1-D tables of p
+
+Close to the critical point the properties change quickly, the patches
+are also split in pressure (SPLITS) so a fine table there stays small.
+
+Inside the saturation dome t_ph, t_ps, h_ps and u_ps are computed
+explicitly from the saturated liquid and vapour tables and the vapour
+fraction. Pressures use a logarithmic axis.
+
+The number of nodes of every table is doubled along the axis with the
+largest error until the error is below the tolerance or the maximum number
+of nodes is reached. The error is sampled at the midpoints of the edges
+and at the centres of all the cells, where the error of the cubic Hermite
+interpolation peaks, and it is pointwise relative: |f_table - f| divided
+by max(|f|, FLOOR * max|f| of the table).
+
+The cells still above the tolerance after max_nodes (the steep properties
+next to the critical point, the saturation line close to PC) are marked
+and computed by the exact functions. The relative error at every sampled
+point is therefore bounded by tol. Between the samples it is measured, not
+bounded: LUT.error_report() gives the error against the exact functions
+over random points (below 3 tol for tol = 1e-4 and the default 1e-5)
+and the largest fraction of the cells of a table computed exactly.
+
+Tabulated functions, units of xsteam (p in kPa, T in °C):
+
+    h_pt, v_pt, s_pt, u_pt, t_ph, t_ps, h_ps, u_ps
+
+Example:
+
+    >>> from m2py.thermo import xsteam
+    >>> tables = xsteam.use_lut()    # Load the tables or build them on the first use
+    >>> xsteam.h_pt(100.0, 300.0)    # From the tables
+    >>> print(tables.error_report())
+    >>> xsteam.use_exact()           # Back to the IF-97 equations
+
+"""
+import json
+import os
+from math import log, exp
+
+import numpy as np
+
+from . import __xsteam__ as xst
+from . import vxsteam as vxs
+
+VERSION = 2
+
+PMIN = 0.000611657  # MPa, triple point
+PC = 22.06395       # MPa, upper pressure of the saturation line
+P5 = 10.0           # MPa, upper pressure of region 5
+P3 = 16.529         # MPa, saturation pressure at 623.15 K, start of region 3
+PMAX = 100.0        # MPa
+TMIN = 273.15       # K
+T25 = 1073.15       # K, boundary between regions 2 and 5
+TMAX = 2273.15      # K
+
+# Default location of the tables
+TABLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "xsteam_lut.npy")
+
+# Inputs of the exact functions are moved inside the patch by this fraction
+# of its size, the boundaries of the regions are strict inequalities.
+_NUDGE = 1e-12
+
+# The relative errors are |f_table - f| / max(|f|, FLOOR * max|f| of the table),
+# the floor keeps the error finite where f crosses zero (entropy near 0 °C)
+FLOOR = 1e-3
+
+
+def _relative(approx, exact, scale):
+    """ Pointwise relative errors, scale is the largest |f| of the table """
+    return np.abs(approx - exact) / np.maximum(np.abs(exact), FLOOR * scale)
+
+
+# ************************************************************************************************
+# Cubic Hermite tables
+# ************************************************************************************************
+
+def hermite1(F):
+    """ Node data [f, f_x] of a 1-D cubic Hermite table, derivatives per cell """
+    return np.stack([F, np.gradient(F, edge_order=2)], axis=-1)
+
+
+def hermite2(F):
+    """ Node data [f, f_x, f_u, f_xu] of a bicubic Hermite table, derivatives per cell """
+    Fx = np.gradient(F, axis=0, edge_order=2)
+    Fu = np.gradient(F, axis=1, edge_order=2)
+    Fxu = np.gradient(Fx, axis=1, edge_order=2)
+    return np.stack([F, Fx, Fu, Fxu], axis=-1)
+
+
+def _basis(a):
+    """ Cubic Hermite basis functions h00, h10, h01, h11 """
+    a2 = a * a
+    b = 1 - a
+    return (1 + 2 * a) * b * b, a * b * b, a2 * (3 - 2 * a), a2 * (a - 1)
+
+
+class Table1(object):
+    """
+    Cubic Hermite interpolation of the node data [f, f_x] (shape (n, 2)) of
+    a uniform grid over 0 <= X <= 1.
+
+    exact marks the cells (shape (n - 1,)) where the table isn't accurate
+    enough, they return None (scalar) or nan (arrays) for the exact function.
+    """
+
+    def __init__(self, data, exact=None):
+        self.data = data
+        self.nx = data.shape[0] - 1
+        self._list = data.tolist()
+        self.exact = None if exact is None else np.asarray(exact) != 0
+        self._exact = None if exact is None else self.exact.tolist()
+
+    def __call__(self, X):
+        x = np.asarray(X, dtype=float) * self.nx
+        i = np.clip(np.floor(x), 0, self.nx - 1).astype(int)
+        h00, h10, h01, h11 = _basis(x - i)
+        c0 = self.data[i]
+        c1 = self.data[i + 1]
+        out = c0[..., 0] * h00 + c0[..., 1] * h10 + c1[..., 0] * h01 + c1[..., 1] * h11
+        if self.exact is not None:
+            out = np.where(self.exact[i], np.nan, out)
+        return out
+
+    def scalar(self, X):
+        x = X * self.nx
+        i = min(max(int(x), 0), self.nx - 1)
+        if self._exact is not None and self._exact[i]:
+            return None
+        a = x - i
+        a2 = a * a
+        b = 1 - a
+        f0, d0 = self._list[i]
+        f1, d1 = self._list[i + 1]
+        return f0 * (1 + 2 * a) * b * b + d0 * a * b * b + f1 * a2 * (3 - 2 * a) + d1 * a2 * (a - 1)
+
+
+class Table(object):
+    """
+    Bicubic Hermite interpolation of the node data [f, f_x, f_u, f_xu]
+    (shape (nx, ny, 4)) of a uniform grid over the unit square. The data
+    can be a memory mapped array, scalar calls only read the four nodes of
+    the cell.
+
+    exact marks the cells (shape (nx - 1, ny - 1)) where the table isn't
+    accurate enough, they return None (scalar) or nan (arrays) for the
+    exact function.
+    """
+
+    def __init__(self, data, exact=None):
+        self.data = data
+        self.nx = data.shape[0] - 1
+        self.ny = data.shape[1] - 1
+        self.exact = None if exact is None else np.asarray(exact) != 0
+        self._exact = None if exact is None else self.exact.tolist()
+
+    def __call__(self, X, U):
+        x = np.asarray(X, dtype=float) * self.nx
+        u = np.asarray(U, dtype=float) * self.ny
+        i = np.clip(np.floor(x), 0, self.nx - 1).astype(int)
+        j = np.clip(np.floor(u), 0, self.ny - 1).astype(int)
+        ha = _basis(x - i)
+        hb = _basis(u - j)
+
+        out = 0.0
+        for di, (pa, da) in enumerate([ha[0:2], ha[2:4]]):
+            for dj, (pb, db) in enumerate([hb[0:2], hb[2:4]]):
+                c = self.data[i + di, j + dj]
+                out = out + c[..., 0] * pa * pb + c[..., 1] * da * pb + c[..., 2] * pa * db + c[..., 3] * da * db
+        if self.exact is not None:
+            out = np.where(self.exact[i, j], np.nan, out)
+        return out
+
+    def scalar(self, X, U):
+        x = X * self.nx
+        u = U * self.ny
+        i = min(max(int(x), 0), self.nx - 1)
+        j = min(max(int(u), 0), self.ny - 1)
+        if self._exact is not None and self._exact[i][j]:
+            return None
+        a = x - i
+        b = u - j
+        (c00, c01), (c10, c11) = self.data[i:i + 2, j:j + 2].tolist()
+
+        a2 = a * a
+        a1 = 1 - a
+        pa0, da0, pa1, da1 = (1 + 2 * a) * a1 * a1, a * a1 * a1, a2 * (3 - 2 * a), a2 * (a - 1)
+        b2 = b * b
+        b1 = 1 - b
+        pb0, db0, pb1, db1 = (1 + 2 * b) * b1 * b1, b * b1 * b1, b2 * (3 - 2 * b), b2 * (b - 1)
+
+        return (pb0 * (c00[0] * pa0 + c00[1] * da0 + c10[0] * pa1 + c10[1] * da1) +
+                db0 * (c00[2] * pa0 + c00[3] * da0 + c10[2] * pa1 + c10[3] * da1) +
+                pb1 * (c01[0] * pa0 + c01[1] * da0 + c11[0] * pa1 + c11[1] * da1) +
+                db1 * (c01[2] * pa0 + c01[3] * da0 + c11[2] * pa1 + c11[3] * da1))
+
+
+# ************************************************************************************************
+# Patches
+# ************************************************************************************************
+
+class Patch(object):
+    """
+    Part of a plane between two pressures, the second variable y goes from
+    lower(p) to upper(p). The boundaries are pairs of functions
+    (scalar function, vectorized function) of the pressure in MPa.
+
+    The tables are functions of X = (log(p) - log(pmin)) / (log(pmax) - log(pmin))
+    and U = (y - lower(p)) / (upper(p) - lower(p)).
+    """
+
+    def __init__(self, name, pmin, pmax, lower, upper, outputs, side=None):
+        self.name = name
+        self.side = side or name
+        self.pmin = pmin
+        self.pmax = pmax
+        self.lower = lower
+        self.upper = upper
+        self.outputs = outputs
+        self.la = log(pmin)
+        self.dl = log(pmax) - log(pmin)
+        self.tables = {}
+
+    def nodes(self, X, U, nudge=0.0):
+        """ Pressures and values of y of the grid X x U, moved inside by the fraction nudge """
+        X, U = np.meshgrid(np.clip(X, nudge, 1 - nudge), np.clip(U, nudge, 1 - nudge), indexing="ij")
+        p = np.exp(self.la + X * self.dl)
+        lo = self.lower[1](p)
+        return p, lo + U * (self.upper[1](p) - lo)
+
+
+def _const(value):
+    return (lambda p: value), (lambda p: np.full(np.shape(p), value))
+
+
+def _at(func, vfunc, T):
+    """ Boundary func(p, T) at constant temperature """
+    return (lambda p: func(p, T)), (lambda p: vfunc(p, T))
+
+
+def _exact_pT(patch, p, T):
+    """ h, v, s and u of the pT patches, the region is chosen by the side of the saturation line """
+    if patch.side == "liquid":
+        region = np.where(T <= 623.15, 1, 3)
+    elif patch.side == "vapour":
+        region = np.where((T > 623.15) & (p > vxs.B23p_T(T)), 3, 2)
+    elif patch.side == "supercritical":
+        region = np.where(T <= 623.15, 1, np.where(p > vxs.B23p_T(T), 3, 2))
+    else:
+        region = np.full(p.shape, 5)
+
+    out = dict((k, np.empty(p.shape)) for k in ("h", "v", "s", "u"))
+    for r, funcs in [(1, (vxs.h1_pT, vxs.v1_pT, vxs.s1_pT, vxs.u1_pT)),
+                     (2, (vxs.h2_pT, vxs.v2_pT, vxs.s2_pT, vxs.u2_pT)),
+                     (5, (vxs.h5_pT, vxs.v5_pT, vxs.s5_pT, vxs.u5_pT))]:
+        sel = region == r
+        for k, func in zip(("h", "v", "s", "u"), funcs):
+            out[k][sel] = func(p[sel], T[sel])
+
+    sel = region == 3
+    ps, Ts = p[sel], T[sel]
+    hs = vxs.h3_pT(ps, Ts)
+    rhos = 1 / vxs.v3_ph(ps, hs)
+    out["h"][sel] = hs
+    out["v"][sel] = 1 / rhos
+    out["s"][sel] = vxs.s3_rhoT(rhos, Ts)
+    out["u"][sel] = vxs.u3_rhoT(rhos, Ts)
+    return out
+
+
+def _exact_ph(patch, p, h):
+    return {"T": vxs.t_ph(p * 1000.0, h) + 273.15}
+
+
+def _exact_ps(patch, p, s):
+    # At the triple point the saturated liquid entropy is -1e-8, region_ps starts at s = 0
+    st = vxs.state_ps(p * 1000.0, np.maximum(s, 0.0), ("T", "h", "u"))
+    return {"T": st["T"] + 273.15, "h": st["h"], "u": st["u"]}
+
+
+def _exact_sat(p):
+    Ts, liquid, vapour = vxs.state4_p(p)
+    return {"hL": liquid[1], "hV": vapour[1], "sL": liquid[3], "sV": vapour[3], "uL": liquid[2], "uV": vapour[2]}
+
+
+SATURATION = ("hL", "hV", "sL", "sV", "uL", "uV")
+
+# Exact functions of the planes, (patch, p [MPa], y) -> {output: array}
+EXACT = {"pT": _exact_pT, "ph": _exact_ph, "ps": _exact_ps}
+
+
+# ************************************************************************************************
+# Lookup tables
+# ************************************************************************************************
+
+class LUT(object):
+    """
+    Lookup tables of the steam tables functions, see the module documentation.
+
+    Build new tables with LUT.build(), load saved ones with LUT.load(). The
+    functions accept scalars (returning None outside the tables like
+    xsteam) or arrays (returning nan outside the tables).
+
+    Attributes:
+
+        report  Error against the exact functions, dictionary
+                function -> {"max_abs", "max_rel", "p", "y", "points", "mismatch"}
+        info    Tolerance, bound, number of nodes, sampled error and fraction
+                of the cells computed by the exact functions of every table
+    """
+
+    def __init__(self, arrays, info):
+        self.info = info
+        self.report = info.get("report", {})
+        self.sat = dict((k, Table1(arrays["sat/" + k], arrays.get("sat/%s/exact" % k))) for k in SATURATION)
+        self._lsat = log(PMIN)
+        self._dsat = log(PC) - log(PMIN)
+        self.satf = dict((k, self._sat(k)) for k in SATURATION)
+
+        self.planes = self._patches()
+        for plane, patches in self.planes.items():
+            for patch in patches:
+                for k in patch.outputs:
+                    key = "%s/%s/%s" % (plane, patch.name, k)
+                    if key in arrays:
+                        patch.tables[k] = Table(arrays[key], arrays.get(key + "/exact"))
+
+    # Saturated liquid and vapour properties as function of the pressure
+
+    def _sat(self, name):
+        table = self.sat[name]
+
+        def scalar(p):
+            y = table.scalar((log(p) - self._lsat) / self._dsat)
+            return _exact_sat(np.array([p]))[name][0] if y is None else y
+
+        def vector(p):
+            y = table((np.log(p) - self._lsat) / self._dsat)
+            bad = np.isnan(y) & ~np.isnan(p)
+            if bad.any():
+                y[bad] = _exact_sat(p[bad])[name]
+            return y
+
+        return scalar, vector
+
+    def _patches(self):
+        """ Patches of the planes pT, ph and ps """
+        return _definitions(lambda name: self.satf[name])
+
+    # ----------------------------------------------------------------------------------------------
+    # Building and persistence
+    # ----------------------------------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, tol=1e-5, max_nodes=2 ** 14, points=20000):
+        """
+        Build the tables from the exact functions
+
+        :param tol:       Bound of the pointwise relative error at the midpoints of the
+                          edges and the centres of the cells, the cells above it after
+                          max_nodes use the exact functions
+        :param max_nodes: Maximum number of nodes of a table
+        :param points:    Number of random points of the error report of every function
+        :return:          LUT object
+        """
+        arrays = {}
+        info = {"version": VERSION, "tol": tol, "max_nodes": max_nodes, "nodes": {}}
+
+        # Saturation tables
+        n = 129
+        while True:
+            X = np.linspace(0, 1, n)
+            exact = _exact_sat(np.exp(log(PMIN) + np.clip(X, _NUDGE, 1 - _NUDGE) * (log(PC) - log(PMIN))))
+            Xm = (np.arange(n - 1) + 0.5) / (n - 1)
+            middle = _exact_sat(np.exp(log(PMIN) + Xm * (log(PC) - log(PMIN))))
+            errors = {}
+            for k in SATURATION:
+                arrays["sat/" + k] = hermite1(exact[k])
+                errors[k] = _relative(Table1(arrays["sat/" + k])(Xm), middle[k], np.max(np.abs(exact[k])))
+            error = max(np.nanmax(e) for e in errors.values())
+            if error <= tol or 2 * n - 1 > max_nodes:
+                break
+            n = 2 * n - 1
+
+        cells = 0
+        for k, e in errors.items():
+            arrays["sat/%s/exact" % k] = (e > tol).astype(float)
+            cells += np.sum(e > tol)
+        info["nodes"]["sat"] = [n, float(error), float(cells) / (len(SATURATION) * (n - 1))]
+
+        # Patches, the boundaries of the ph and ps patches need the saturation tables
+        lut = cls(arrays, info)
+        for plane, patches in lut.planes.items():
+            for patch in patches:
+                tables, nx, ny, error = _build_patch(patch, EXACT[plane], tol, max_nodes)
+                cells = 0
+                for k, (data, exact) in tables.items():
+                    key = "%s/%s/%s" % (plane, patch.name, k)
+                    arrays[key] = data
+                    arrays[key + "/exact"] = exact.astype(float)
+                    cells += np.sum(exact)
+                info["nodes"]["%s/%s" % (plane, patch.name)] = [nx, ny, float(error),
+                                                                float(cells) / (len(tables) * (nx - 1) * (ny - 1))]
+
+        lut = cls(arrays, info)
+        lut.report = info["report"] = lut.measure(points)
+        return lut
+
+    def save(self, path=TABLES):
+        """
+        Save the tables to the .npy file path, all the tables are stored in
+        one array and their layout in the .json file of the same name.
+        """
+        layout = {}
+        chunks = []
+        offset = 0
+        for key, data in self._arrays():
+            layout[key] = [offset, list(data.shape)]
+            chunks.append(np.asarray(data, dtype=float).ravel())
+            offset += data.size
+
+        np.save(path, np.concatenate(chunks))
+        with open(os.path.splitext(path)[0] + ".json", "w") as fp:
+            json.dump(dict(self.info, layout=layout, report=self.report), fp, indent=1)
+
+    @classmethod
+    def load(cls, path=TABLES):
+        """ Load the tables saved by save(), the data is memory mapped """
+        with open(os.path.splitext(path)[0] + ".json") as fp:
+            info = json.load(fp)
+        if info.get("version") != VERSION:
+            raise ValueError("Lookup tables %s were built by another version, build them again" % path)
+
+        data = np.load(path, mmap_mode="r").view(np.ndarray)
+        arrays = {}
+        for key, (offset, shape) in info.pop("layout").items():
+            arrays[key] = data[offset:offset + int(np.prod(shape))].reshape(shape)
+        return cls(arrays, info)
+
+    def _arrays(self):
+        for k in SATURATION:
+            yield "sat/" + k, self.sat[k].data
+            if self.sat[k].exact is not None:
+                yield "sat/%s/exact" % k, self.sat[k].exact
+        for plane, patches in self.planes.items():
+            for patch in patches:
+                for k in patch.outputs:
+                    key = "%s/%s/%s" % (plane, patch.name, k)
+                    yield key, patch.tables[k].data
+                    if patch.tables[k].exact is not None:
+                        yield key + "/exact", patch.tables[k].exact
+
+    # ----------------------------------------------------------------------------------------------
+    # Evaluation
+    # ----------------------------------------------------------------------------------------------
+
+    def _scalar(self, plane, name, p, y):
+        if not PMIN <= p <= PMAX:
+            return None
+
+        for patch in self.planes[plane]:
+            if patch.pmin <= p <= patch.pmax:
+                lo = patch.lower[0](p)
+                hi = patch.upper[0](p)
+                if lo <= y <= hi:
+                    value = patch.tables[name].scalar((log(p) - patch.la) / patch.dl, (y - lo) / (hi - lo))
+                    if value is None:
+                        value = float(EXACT[plane](patch, np.array([p]), np.array([y]))[name][0])
+                    return value
+
+        if plane == "pT" or p >= PC:
+            return None
+
+        # Saturation dome
+        key = "h" if plane == "ph" else "s"
+        yL = self.satf[key + "L"][0](p)
+        yV = self.satf[key + "V"][0](p)
+        if not yL <= y <= yV:
+            return None
+        if name == "T":
+            return xst.T4_p(p)
+        x = (y - yL) / (yV - yL)
+        return x * self.satf[name + "V"][0](p) + (1 - x) * self.satf[name + "L"][0](p)
+
+    def _vector(self, plane, name, p, y):
+        p, y = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(y, dtype=float))
+        shape = p.shape
+        p, y = p.ravel(), y.ravel()
+        out = np.full(p.shape, np.nan)
+        todo = (PMIN <= p) & (p <= PMAX)
+
+        for patch in self.planes[plane]:
+            idx = np.flatnonzero(todo & (patch.pmin <= p) & (p <= patch.pmax))
+            ps, ys = p[idx], y[idx]
+            lo = patch.lower[1](ps)
+            hi = patch.upper[1](ps)
+            inside = (lo <= ys) & (ys <= hi)
+            idx, ps, ys, lo, hi = idx[inside], ps[inside], ys[inside], lo[inside], hi[inside]
+            values = patch.tables[name]((np.log(ps) - patch.la) / patch.dl, (ys - lo) / (hi - lo))
+            exact = np.isnan(values)
+            if exact.any():
+                values[exact] = EXACT[plane](patch, ps[exact], ys[exact])[name]
+            out[idx] = values
+            todo[idx] = False
+
+        if plane != "pT":
+            idx = np.flatnonzero(todo & (p < PC))
+            ps, ys = p[idx], y[idx]
+            key = "h" if plane == "ph" else "s"
+            yL = self.satf[key + "L"][1](ps)
+            yV = self.satf[key + "V"][1](ps)
+            inside = (yL <= ys) & (ys <= yV)
+            idx, ps = idx[inside], ps[inside]
+            if name == "T":
+                out[idx] = vxs.T4_p(ps)
+            else:
+                x = (ys[inside] - yL[inside]) / (yV[inside] - yL[inside])
+                out[idx] = x * self.satf[name + "V"][1](ps) + (1 - x) * self.satf[name + "L"][1](ps)
+
+        return out.reshape(shape)
+
+    def evaluate(self, plane, name, p, y):
+        """
+        Tabulated property name of the plane ("pT", "ph" or "ps"), p in MPa,
+        y in K, kJ/kg or kJ/(kg K). Temperatures are returned in K.
+        """
+        if isinstance(p, (int, float)) and isinstance(y, (int, float)):
+            return self._scalar(plane, name, p, y)
+        return self._vector(plane, name, p, y)
+
+    # ----------------------------------------------------------------------------------------------
+    # Steam tables functions - units of xsteam
+    # ----------------------------------------------------------------------------------------------
+
+    def h_pt(self, p, T):
+        """ Enthalpy [kJ/kg] as function of pressure [kPa] and temperature [°C] """
+        return self.evaluate("pT", "h", p / 1000.0, T + 273.15)
+
+    def v_pt(self, p, T):
+        """ Specific volume [m3/kg] as function of pressure [kPa] and temperature [°C] """
+        return self.evaluate("pT", "v", p / 1000.0, T + 273.15)
+
+    def s_pt(self, p, T):
+        """ Entropy [kJ/(kg K)] as function of pressure [kPa] and temperature [°C] """
+        return self.evaluate("pT", "s", p / 1000.0, T + 273.15)
+
+    def u_pt(self, p, T):
+        """ Internal energy [kJ/kg] as function of pressure [kPa] and temperature [°C] """
+        return self.evaluate("pT", "u", p / 1000.0, T + 273.15)
+
+    def t_ph(self, p, h):
+        """ Temperature [°C] as function of pressure [kPa] and enthalpy [kJ/kg] """
+        T = self.evaluate("ph", "T", p / 1000.0, h)
+        return None if T is None else T - 273.15
+
+    def t_ps(self, p, s):
+        """ Temperature [°C] as function of pressure [kPa] and entropy [kJ/(kg K)] """
+        T = self.evaluate("ps", "T", p / 1000.0, s)
+        return None if T is None else T - 273.15
+
+    def h_ps(self, p, s):
+        """ Enthalpy [kJ/kg] as function of pressure [kPa] and entropy [kJ/(kg K)] """
+        return self.evaluate("ps", "h", p / 1000.0, s)
+
+    def u_ps(self, p, s):
+        """ Internal energy [kJ/kg] as function of pressure [kPa] and entropy [kJ/(kg K)] """
+        return self.evaluate("ps", "u", p / 1000.0, s)
+
+    # ----------------------------------------------------------------------------------------------
+    # Error report
+    # ----------------------------------------------------------------------------------------------
+
+    def measure(self, points=20000, seed=1997):
+        """
+        Error of every function against the exact vxsteam functions over
+        random points, pressures are log-uniform between the triple point
+        and 100 MPa.
+
+        :return: dictionary function -> {"max_abs", "max_rel", "p", "y", "points", "mismatch"}
+                 p and y are the inputs of the largest relative error,
+                 mismatch counts the points valid only in one of the paths.
+                 The relative errors are those of the build, the errors of
+                 the temperatures are relative to T in K.
+        """
+        rng = np.random.RandomState(seed)
+        p = np.exp(rng.uniform(log(PMIN), log(PMAX), points)) * 1000.0
+        T = rng.uniform(TMIN - 273.15, TMAX - 273.15, points)
+        h = rng.uniform(0, 7500, points)
+        s = rng.uniform(0, 12, points)
+
+        st = vxs.state_ps(p, s, ("u",))
+        cases = [("h_pt", T, vxs.h_pt), ("v_pt", T, vxs.v_pt), ("s_pt", T, vxs.s_pt), ("u_pt", T, vxs.u_pt),
+                 ("t_ph", h, vxs.t_ph), ("t_ps", s, vxs.t_ps), ("h_ps", s, vxs.h_ps),
+                 ("u_ps", s, lambda p, s: st["u"])]
+
+        report = {}
+        for name, y, exact in cases:
+            expected = np.asarray(exact(p, y))
+            result = np.asarray(getattr(self, name)(p, y))
+            if name.startswith("t_"):
+                # Relative errors of the tabulated temperatures in K
+                expected, result = expected + 273.15, result + 273.15
+            valid = ~np.isnan(expected) & ~np.isnan(result)
+            error = np.abs(result[valid] - expected[valid])
+            scale = np.maximum(np.abs(expected[valid]), FLOOR * np.max(np.abs(expected[valid])))
+            k = np.argmax(error / scale)
+            report[name] = {"max_abs": float(np.max(error)), "max_rel": float((error / scale)[k]),
+                            "p": float(p[valid][k]), "y": float(y[valid][k]), "points": int(np.sum(valid)),
+                            "mismatch": int(np.sum(np.isnan(expected) != np.isnan(result)))}
+        return report
+
+    def error_report(self):
+        """ Error report as a text table """
+        nodes = self.info.get("nodes", {})
+        exact = max([v[-1] for v in nodes.values()] or [0.0])
+        lines = ["Tolerance %g, at most %.1f%% of the cells of a table use the exact functions" % (
+            self.info.get("tol", float("nan")), 100 * exact)]
+        lines += ["%-6s %12s %12s %12s %12s %8s %8s" % ("func", "max abs", "max rel", "at p [kPa]", "at y",
+                                                      "points", "mismatch")]
+        for name in sorted(self.report):
+            r = self.report[name]
+            lines.append("%-6s %12.3e %12.3e %12.6g %12.6g %8d %8d" % (
+                name, r["max_abs"], r["max_rel"], r["p"], r["y"], r["points"], r["mismatch"]))
+        return "\n".join(lines)
+
+
+def _definitions(sat):
+    """
+    Patches of every plane, sat(name) returns the boundary of the saturated
+    property name ("hL", "hV", "sL", "sV"). Entropies start at 0 like in
+    region_ps, s1_pT(p, 273.15) is slightly negative.
+    """
+    tsat = (xst.T4_p, vxs.T4_p)
+    pT = ("h", "v", "s", "u")
+    ph = ("T",)
+    ps = ("T", "h", "u")
+    return {
+        "pT": (_split("liquid", _const(TMIN), tsat, pT) +
+               _split("vapour", tsat, _const(T25), pT) +
+               _split("supercritical", _const(TMIN), _const(T25), pT) +
+               [Patch("region5", PMIN, P5, _const(T25), _const(TMAX), pT)]),
+
+        "ph": (_split("liquid", _at(xst.h1_pT, vxs.h1_pT, TMIN), sat("hL"), ph) +
+               _split("vapour", sat("hV"), _at(xst.h2_pT, vxs.h2_pT, T25), ph) +
+               _split("supercritical", _at(xst.h1_pT, vxs.h1_pT, TMIN), _at(xst.h2_pT, vxs.h2_pT, T25), ph) +
+               [Patch("region5", PMIN, P5, _at(xst.h2_pT, vxs.h2_pT, T25), _at(xst.h5_pT, vxs.h5_pT, TMAX), ph)]),
+
+        "ps": (_split("liquid", _const(0.0), sat("sL"), ps) +
+               _split("vapour", sat("sV"), _at(xst.s2_pT, vxs.s2_pT, T25), ps) +
+               _split("supercritical", _const(0.0), _at(xst.s2_pT, vxs.s2_pT, T25), ps) +
+               [Patch("region5", PMIN, P5, _at(xst.s2_pT, vxs.s2_pT, T25), _at(xst.s5_pT, vxs.s5_pT, TMAX), ps)]),
+    }
+
+
+# Pressures splitting the patches, the properties change quickly close to
+# the critical point and a table of its own keeps the error local.
+SPLITS = {
+    "liquid": (PMIN, 1.0, P3, 21.0, PC),
+    "vapour": (PMIN, 1.0, P3, 21.0, PC),
+    "supercritical": (PC, 25.0, 35.0, PMAX),
+}
+
+
+def _split(side, lower, upper, outputs):
+    """ Patches of one side of the saturation line between the pressures of SPLITS """
+    pressures = SPLITS[side]
+    return [Patch("%s%d" % (side, k), pressures[k], pressures[k + 1], lower, upper, outputs, side)
+            for k in range(len(pressures) - 1)]
+
+
+def _build_patch(patch, exact, tol, max_nodes):
+    """
+    Tables of a patch refined until the pointwise relative error at the
+    midpoints of the edges and at the centres of the cells is below tol or
+    the maximum number of nodes is reached.
+
+    :return: {output: (node data, cells above tol)}, nx, ny, largest error
+    """
+    nx = ny = 17
+    while True:
+        X = np.linspace(0, 1, nx)
+        U = np.linspace(0, 1, ny)
+        F = exact(patch, *patch.nodes(X, U, _NUDGE))
+        for k in patch.outputs:
+            if np.isnan(F[k]).any():
+                raise ValueError("Exact function %s is not defined over the patch %s" % (k, patch.name))
+
+        data = dict((k, hermite2(F[k])) for k in patch.outputs)
+        tables = dict((k, Table(v)) for k, v in data.items())
+        scale = dict((k, np.max(np.abs(F[k]))) for k in patch.outputs)
+
+        # Midpoints of the edges along X, along U and centres of the cells
+        Xm = (np.arange(nx - 1) + 0.5) / (nx - 1)
+        Um = (np.arange(ny - 1) + 0.5) / (ny - 1)
+        samples = []
+        for XS, US in [(Xm, U), (X, Um), (Xm, Um)]:
+            middle = exact(patch, *patch.nodes(XS, US, _NUDGE))
+            XX, UU = np.meshgrid(XS, US, indexing="ij")
+            samples.append(dict((k, _relative(tables[k](XX, UU), middle[k], scale[k])) for k in patch.outputs))
+
+        errors = [max(np.nanmax(e[k]) for k in patch.outputs) for e in samples]
+        error = max(errors)
+        if error <= tol or (2 * nx - 1) * ny > max_nodes and nx * (2 * ny - 1) > max_nodes:
+            # Largest error of every cell, its four edges and its centre
+            result = {}
+            for k in patch.outputs:
+                ex, eu, ec = samples[0][k], samples[1][k], samples[2][k]
+                cell = np.fmax.reduce([ex[:, :-1], ex[:, 1:], eu[:-1], eu[1:], ec])
+                result[k] = (data[k], cell > tol)
+            return result, nx, ny, error
+
+        if errors[0] >= errors[1] and (2 * nx - 1) * ny <= max_nodes or nx * (2 * ny - 1) > max_nodes:
+            nx = 2 * nx - 1
+        else:
+            ny = 2 * ny - 1
@@ -11,12 +11,14 @@ this = os.path.dirname(os.path.abspath(__file__))
 path_dir = os.path.join(this, "../..")
 sys.path.append(path_dir)
 
-from m2py.numerical.numerical import interpol, read_table
-from m2py.utils import resource_path
+from m2py.numerical.numerical import Interpolator, load_table
 
 
-__saturation_table__ = resource_path("saturated_steam.txt")
-__saturation__ = read_table(__saturation_table__)
+__saturation_table__ = os.path.join(this, "data", "saturated_steam.txt")
+__saturation__ = load_table(__saturation_table__)
+
+# Interpolators of all the columns over the input columns 'T' and 'P', built on the first use
+__interpolators__ = {}
 
 tol = 1e-1
 
@@ -32,10 +34,11 @@ def __stable__(value, _input, params):
         SI Units Thermodynamic Tables. 8th edition
         BORGNAKKE and SONNTAG
 
-    :param T:       Temperature at ºC
+    :param T:       Temperature at ºC, or array of temperatures
     :param params:  List of properties to be calculated
     :param _input:   Type of input parameter. Possible values
-    :return:        List of calculated properties
+    :return:        List of calculated properties, arrays of the shape
+                    of value for an array input
     
     Possible Values of input: ['T', 'P']
     
@@ -71,15 +74,11 @@ def __stable__(value, _input, params):
          639.3956696428571]  
     """
     s = __saturation__
-    result = []
-
-    input_column = s[_input]
 
-    for p in params:
-        y = interpol(value, input_column, s[p])
-        result.append(y)
+    if _input not in __interpolators__:
+        __interpolators__[_input] = Interpolator(s[_input], [s[h] for h in s.headers])
 
-    return result
+    return __interpolators__[_input](value, [s.headers.index(p) for p in params])
 
 
 def psat_t(T):
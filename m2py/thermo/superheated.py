@@ -1,73 +1,151 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+"""
+Superheated steam table
+
+    Table B.1.3, Fundamentals of Thermodynamics, BORGNAKKE and SONNTAG
+
+The table is stored on its grid: the sorted pressures and, for every
+pressure, the sorted temperatures and the properties v, u, h and s as NumPy
+arrays. The properties are interpolated linearly in T along the two
+pressures around p, then linearly in log(p) (bilinear interpolation over
+the cells of the table). The specific volume is interpolated as p v,
+nearly constant in the superheated region, like s is nearly linear in
+log(p). The intervals are found by bisection and the
+functions accept arrays of points, so the table is a cheap cross check of
+the IF-97 functions over large batches:
+
+    >>> from m2py.thermo import superheated, vxsteam
+    >>> superheated.h_pt(300.0, 275.0)
+    3018.75
+    >>> p, T = numpy.meshgrid([150.0, 700.0], [250.0, 650.0])
+    >>> superheated.h_pt(p, T) - vxsteam.h_pt(p, T)
+
+Units: p in kPa, T in °C, v in m3/kg, u and h in kJ/kg, s in kJ/(kg K).
+Points outside of the table, or below the lowest temperature of one of the
+two pressures around p, are not a number.
+"""
+import os
 
-from m2py.numerical.numerical import read_table
+import numpy as np
 
-s = read_table("superheated_steam.txt")
+from m2py.numerical.numerical import load_table
 
-_pressure_tables = {}
+s = load_table(os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "superheated_steam.txt"))
 
-for line in zip(*list(map(s.get, s.headers))):
-    #print line
+PROPERTIES = ("v", "u", "h", "s")
 
-    p = line[1]
-    data = (line[0],) + line[2:]
-    #print data
 
-    p_ = str(int(p))
+class SuperheatedTable(object):
+    """
+    Gridded table of properties as function of (p, T)
 
-    if p_ not in list(_pressure_tables.keys()):
-        _pressure_tables[p_] = []
-    else:
-        _pressure_tables[p_].append(data)
+    :param table:      Columns "P", "T" and the properties, rows in any order
+    :param properties: Names of the property columns
 
+    Attributes:
 
-_pressures = list(_pressure_tables.keys())
+        pressures       Sorted pressures, array
+        temperatures    Sorted temperatures of every pressure, list of arrays
+        data            Property -> list of arrays, values at temperatures[k]
+    """
 
-pressures = sorted(map(float, _pressures))
-_pressures = [str(int(x)) for x in pressures]
+    def __init__(self, table, properties=PROPERTIES):
+        P = np.asarray(table["P"], dtype=float)
+        T = np.asarray(table["T"], dtype=float)
 
+        self.properties = tuple(properties)
+        self.pressures = np.unique(P)
+        self.temperatures = []
+        self.data = dict((name, []) for name in self.properties)
 
-def find_temperature_data(T, data):
+        for p in self.pressures:
+            rows = np.flatnonzero(P == p)
+            rows = rows[np.argsort(T[rows], kind="stable")]
+            self.temperatures.append(T[rows])
+            for name in self.properties:
+                self.data[name].append(np.asarray(table[name], dtype=float)[rows])
 
-    for idx, d in enumerate(data):
-        t = d[0]
-        if t >= T:
-            break
+    def _along_T(self, name, k, T):
+        """ Property name at the pressure k interpolated at the temperatures T, nan outside """
+        Tk = self.temperatures[k]
+        Yk = self.data[name][k]
+        j = np.clip(np.searchsorted(Tk, T, side="right") - 1, 0, Tk.size - 2)
+        y = Yk[j] + (T - Tk[j]) / (Tk[j + 1] - Tk[j]) * (Yk[j + 1] - Yk[j])
+        y[(T < Tk[0]) | (T > Tk[-1])] = np.nan
+        return y
 
-    _data = data[idx]
+    def __call__(self, name, p, T):
+        """
+        Property name at the points (p, T), arrays of any shape (broadcast)
+        or scalars
 
-    return (idx, _data)
+        :return: float for scalar inputs, array otherwise
+        """
+        if name not in self.data:
+            raise ValueError("Unknown property %r, properties: %s" % (name, ", ".join(self.properties)))
 
+        scalar = np.ndim(p) == 0 and np.ndim(T) == 0
+        p, T = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(T, dtype=float))
+        shape = p.shape
+        p, T = p.ravel(), T.ravel()
 
-def find_pt(P, T):
+        P = self.pressures
+        out = np.full(p.shape, np.nan)
+        k = np.clip(np.searchsorted(P, p, side="right") - 1, 0, P.size - 2)
+        inside = (P[0] <= p) & (p <= P[-1])
+
+        # One pass per cell of the pressure axis
+        for kk in np.unique(k[inside]):
+            sel = np.flatnonzero(inside & (k == kk))
+            y1 = self._along_T(name, kk, T[sel])
+            y2 = self._along_T(name, kk + 1, T[sel])
+            if name == "v":
+                y1, y2 = P[kk] * y1, P[kk + 1] * y2
+            w = np.log(p[sel] / P[kk]) / np.log(P[kk + 1] / P[kk])
+            # Exactly on a pressure of the table the other one isn't needed
+            out[sel] = np.where(w == 0, y1, np.where(w == 1, y2, y1 + w * (y2 - y1)))
+
+        if name == "v":
+            out /= p
+
+        if scalar:
+            return float(out[0])
+        return out.reshape(shape)
 
-    for idx, (p, psrt) in enumerate(zip(pressures, _pressures)):
-        if p > P:
-            break
+    def state(self, p, T):
+        """ Tuple of all the properties at (p, T) """
+        return tuple(self(name, p, T) for name in self.properties)
 
-    _p = pressures[idx-1]
-    _pstr = _pressures[idx-1]
-    print(dict(idx=idx, p=p, pstr=psrt, _p=_p))
 
-    data1 = _pressure_tables[psrt]
-    idx1, x11 = find_temperature_data(T, data1)
-    x12 = data1[idx1-1]
+table = SuperheatedTable(s)
 
+pressures = table.pressures.tolist()
 
 
-    data2 = _pressure_tables[_pstr]
-    idx2, x21 = find_temperature_data(T, data2)
+def v_pt(p, T):
+    """ Specific volume [m3/kg] as function of pressure [kPa] and temperature [°C] """
+    return table("v", p, T)
 
-    print("idx2 = ", idx2)
 
-    x22 = data2[idx2-1]
+def u_pt(p, T):
+    """ Internal energy [kJ/kg] as function of pressure [kPa] and temperature [°C] """
+    return table("u", p, T)
 
-    print("x11 ", x11)
-    print("x12 ", x12)
-    print("x21 ", x21)
-    print("x22 ", x22)
 
+def h_pt(p, T):
+    """ Enthalpy [kJ/kg] as function of pressure [kPa] and temperature [°C] """
+    return table("h", p, T)
 
-find_pt(200, 300)
 
+def s_pt(p, T):
+    """ Entropy [kJ/(kg K)] as function of pressure [kPa] and temperature [°C] """
+    return table("s", p, T)
+
+
+def find_pt(P, T):
+    """
+    Properties (v, u, h, s) of superheated steam at pressure P [kPa] and
+    temperature T [°C]
+    """
+    return table.state(P, T)
@@ -0,0 +1,1111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Vectorized IAPWS IF-97 steam tables
+
+Numpy version of the __xsteam__ region equations. Every function accepts
+scalars or array_like arguments, broadcasts them against each other and
+evaluates the whole array at once, so computing properties over a grid of
+pressures and temperatures does not need a Python loop per point.
+
+Low level functions use the same names and SI units as __xsteam__:
+
+    p    Pressure in MPa
+    T    Temperature in K
+    h    Enthalpy in kJ/kg
+    s    Entropy in kJ/(kg K)
+    rho  Density in kg/m3
+
+The xsteam like functions at the end of the module (h_pt, s_pt, t_ph, ...)
+use the units of xsteam (p in kPa, T in °C) and dispatch every element to
+its region. Points outside the valid range return nan where the scalar
+xsteam functions return None.
+
+state_pt, state_ph and state_ps return several properties at once in a
+numpy structured array with one field per property, like the State
+records of xsteam.state_pt.
+
+Example:
+
+    >>> import numpy as np
+    >>> from m2py.thermo import vxsteam
+    >>> p = np.array([100.0, 1000.0, 5000.0])   # kPa
+    >>> vxsteam.h_pt(p, 300.0)                  # kJ/kg
+    array([3074.54038363, 3051.70318558, 2925.64404236])
+"""
+
+import functools
+
+import numpy as np
+
+from . import __if97__ as coef
+from . import __xsteam__ as xst
+from . import xsteam
+
+R = coef.R  # kJ/(kg K)
+
+
+def _asarrays(*args):
+    return [np.asarray(a, dtype=float) for a in np.broadcast_arrays(*args)]
+
+
+def _scalar(func):
+    """
+    Decorator for the public functions: scalar arguments are evaluated as
+    one element arrays and the result is returned as a python number.
+    """
+    @functools.wraps(func)
+    def wrapper(*args):
+        if all(np.ndim(a) == 0 for a in args):
+            return np.asarray(func(*[np.atleast_1d(np.asarray(a, dtype=float)) for a in args]))[0].item()
+        return func(*args)
+    return wrapper
+
+
+# ************************************************************************************************
+# Region 1  - Equation 7, Table 2 and 3
+# ************************************************************************************************
+
+def _gamma1(p, T):
+    Pi = p / 16.53
+    tau = 1386 / T
+    return Pi, tau, 7.1 - Pi, tau - 1.222
+
+
+@_scalar
+def h1_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi, tau, x, y = _gamma1(p, T)
+    return R * T * tau * coef.gamma1_y(x, y)
+
+
+@_scalar
+def v1_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi, tau, x, y = _gamma1(p, T)
+    return R * T / p * Pi * -coef.gamma1_x(x, y) / 1000
+
+
+@_scalar
+def u1_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi, tau, x, y = _gamma1(p, T)
+    g_x, g_tau = coef.gamma1_u(x, y)
+    return R * T * (tau * g_tau + Pi * g_x)
+
+
+@_scalar
+def s1_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi, tau, x, y = _gamma1(p, T)
+    g, g_tau = coef.gamma1_s(x, y)
+    return R * tau * g_tau - R * g
+
+
+@_scalar
+def Cp1_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi, tau, x, y = _gamma1(p, T)
+    return -R * tau ** 2 * coef.gamma1_yy(x, y)
+
+
+@_scalar
+def Cv1_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi, tau, x, y = _gamma1(p, T)
+    g_x, g_pipi, g_xy, g_tautau = coef.gamma1_cv(x, y)
+    g_pi = -g_x
+    g_pitau = -g_xy
+    return R * (-tau ** 2 * g_tautau + (g_pi - tau * g_pitau) ** 2 / g_pipi)
+
+
+@_scalar
+def w1_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi, tau, x, y = _gamma1(p, T)
+    g_x, g_pipi, g_xy, g_tautau = coef.gamma1_cv(x, y)
+    g_pi = -g_x
+    g_pitau = -g_xy
+    return (1000 * R * T * g_pi ** 2 / ((g_pi - tau * g_pitau) ** 2 / (tau ** 2 * g_tautau) - g_pipi)) ** 0.5
+
+
+@_scalar
+def T1_ph(p, h):
+    """ Backward equation T(p, h) for region 1 - Equation 11, Table 6 """
+    p, h = _asarrays(p, h)
+    return coef.T1ph(p, h / 2500 + 1)
+
+
+@_scalar
+def T1_ps(p, s):
+    """ Backward equation T(p, s) for region 1 - Equation 13, Table 8 """
+    p, s = _asarrays(p, s)
+    return coef.T1ps(p, s + 2)
+
+
+# ************************************************************************************************
+# Region 2  - Equation 15 to 17, Table 10 to 12
+# ************************************************************************************************
+
+@_scalar
+def h2_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 540 / T
+    return R * T * tau * (coef.gamma2o_y(1.0, tau) + coef.gamma2r_y(p, tau - 0.5))
+
+
+@_scalar
+def v2_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 540 / T
+    return R * T / p * p * (1 / p + coef.gamma2r_x(p, tau - 0.5)) / 1000
+
+
+@_scalar
+def u2_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 540 / T
+    y = tau - 0.5
+    gr_pi, gr_tau = coef.gamma2r_u(p, y)
+    return R * T * (tau * (coef.gamma2o_y(1.0, tau) + gr_tau) - p * (1 / p + gr_pi))
+
+
+@_scalar
+def s2_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 540 / T
+    y = tau - 0.5
+    g0, g0_tau = coef.gamma2o_s(1.0, tau)
+    gr, gr_tau = coef.gamma2r_s(p, y)
+    return R * (tau * (g0_tau + gr_tau) - (g0 + np.log(p) + gr))
+
+
+@_scalar
+def Cp2_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 540 / T
+    return -R * tau ** 2 * (coef.gamma2o_yy(1.0, tau) + coef.gamma2r_yy(p, tau - 0.5))
+
+
+@_scalar
+def Cv2_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi = p
+    tau = 540 / T
+    y = tau - 0.5
+    gr_pi, gr_pitau, gr_pipi, gr_tautau = coef.gamma2r_cv(Pi, y)
+    g_tautau = coef.gamma2o_yy(1.0, tau) + gr_tautau
+    return R * (-tau ** 2 * g_tautau - (1 + Pi * gr_pi - tau * Pi * gr_pitau) ** 2 / (1 - Pi ** 2 * gr_pipi))
+
+
+@_scalar
+def w2_pT(p, T):
+    p, T = _asarrays(p, T)
+    Pi = p
+    tau = 540 / T
+    y = tau - 0.5
+    gr_pi, gr_pitau, gr_pipi, gr_tautau = coef.gamma2r_cv(Pi, y)
+    g_tautau = coef.gamma2o_yy(1.0, tau) + gr_tautau
+    return (1000 * R * T * (1 + 2 * Pi * gr_pi + Pi ** 2 * gr_pi ** 2) / (
+        (1 - Pi ** 2 * gr_pipi) + (1 + Pi * gr_pi - tau * Pi * gr_pitau) ** 2 / (tau ** 2 * g_tautau))) ** 0.5
+
+
+@_scalar
+def T2_ph(p, h):
+    """ Backward equation T(p, h) for region 2 - Equation 22 to 24, Table 20 to 22 """
+    p, h = _asarrays(p, h)
+    hs = h / 2000
+    out = np.empty(p.shape)
+
+    a = p < 4
+    b = ~a & (p < 905.84278514723 - 0.67955786399241 * h + 1.2809002730136E-04 * h ** 2)
+    c = ~a & ~b
+
+    out[a] = coef.T2ph_a(p[a], hs[a] - 2.1)
+    out[b] = coef.T2ph_b(p[b] - 2, hs[b] - 2.6)
+    out[c] = coef.T2ph_c(p[c] + 25, hs[c] - 1.8)
+    return out
+
+
+@_scalar
+def T2_ps(p, s):
+    """ Backward equation T(p, s) for region 2 - Equation 25 to 27, Table 25 to 27 """
+    p, s = _asarrays(p, s)
+    out = np.empty(p.shape)
+
+    a = p < 4
+    c = ~a & (s < 5.85)
+    b = ~a & ~c
+
+    out[a] = coef.T2ps_a(p[a], s[a] / 2 - 2)
+    out[b] = coef.T2ps_b(p[b], 10 - s[b] / 0.7853)
+    out[c] = coef.T2ps_c(p[c], 2 - s[c] / 2.9251)
+    return out
+
+
+# ************************************************************************************************
+# Region 3  - Equation 28, Table 30 and 31
+# ************************************************************************************************
+
+@_scalar
+def p3_rhoT(rho, T):
+    rho, T = _asarrays(rho, T)
+    delta = rho / 322
+    tau = 647.096 / T
+    fidelta = coef.phi3_x(delta, tau) + coef.phi3_n[0] / delta
+    return rho * R * T * delta * fidelta / 1000
+
+
+@_scalar
+def h3_rhoT(rho, T):
+    rho, T = _asarrays(rho, T)
+    delta = rho / 322
+    tau = 647.096 / T
+    fidelta, fitau = coef.phi3_h(delta, tau)
+    fidelta = fidelta + coef.phi3_n[0] / delta
+    return R * T * (tau * fitau + delta * fidelta)
+
+
+@_scalar
+def u3_rhoT(rho, T):
+    rho, T = _asarrays(rho, T)
+    delta = rho / 322
+    tau = 647.096 / T
+    return R * T * tau * coef.phi3_y(delta, tau)
+
+
+@_scalar
+def s3_rhoT(rho, T):
+    rho, T = _asarrays(rho, T)
+    delta = rho / 322
+    tau = 647.096 / T
+    fi, fitau = coef.phi3_s(delta, tau)
+    fi = fi + coef.phi3_n[0] * np.log(delta)
+    return R * (tau * fitau - fi)
+
+
+def _h3ab_p(p):
+    return 2014.64004206875 + 3.74696550136983 * p - 2.19921901054187E-02 * p ** 2 + 8.7513168600995E-05 * p ** 3
+
+
+@_scalar
+def T3_ph(p, h):
+    """ Backward equation T(p, h) for region 3 - Revised Supplementary Release 2004, Equation 2 and 3 """
+    p, h = _asarrays(p, h)
+    ps = p / 100
+    out = np.empty(p.shape)
+    a = h < _h3ab_p(p)
+    b = ~a
+    out[a] = coef.T3ph_a(ps[a] + 0.24, h[a] / 2300 - 0.615) * 760
+    out[b] = coef.T3ph_b(ps[b] + 0.298, h[b] / 2800 - 0.72) * 860
+    return out
+
+
+@_scalar
+def v3_ph(p, h):
+    """ Backward equation v(p, h) for region 3 - Revised Supplementary Release 2004, Equation 4 and 5 """
+    p, h = _asarrays(p, h)
+    ps = p / 100
+    out = np.empty(p.shape)
+    a = h < _h3ab_p(p)
+    b = ~a
+    out[a] = coef.v3ph_a(ps[a] + 0.128, h[a] / 2100 - 0.727) * 0.0028
+    out[b] = coef.v3ph_b(ps[b] + 0.0661, h[b] / 2800 - 0.72) * 0.0088
+    return out
+
+
+@_scalar
+def T3_ps(p, s):
+    """ Backward equation T(p, s) for region 3 - Revised Supplementary Release 2004, Equation 6 and 7 """
+    p, s = _asarrays(p, s)
+    Pi = p / 100
+    out = np.empty(p.shape)
+    a = s <= 4.41202148223476
+    b = ~a
+    out[a] = coef.T3ps_a(Pi[a] + 0.24, s[a] / 4.4 - 0.703) * 760
+    out[b] = coef.T3ps_b(Pi[b] + 0.76, s[b] / 5.3 - 0.818) * 860
+    return out
+
+
+@_scalar
+def v3_ps(p, s):
+    """ Backward equation v(p, s) for region 3 - Revised Supplementary Release 2004, Equation 8 and 9 """
+    p, s = _asarrays(p, s)
+    Pi = p / 100
+    out = np.empty(p.shape)
+    a = s <= 4.41202148223476
+    b = ~a
+    out[a] = coef.v3ps_a(Pi[a] + 0.187, s[a] / 4.4 - 0.755) * 0.0028
+    out[b] = coef.v3ps_b(Pi[b] + 0.298, s[b] / 5.3 - 0.816) * 0.0088
+    return out
+
+
+@_scalar
+def p3sat_h(h):
+    """ Saturation pressure as function of h for region 3 - Revised Supplementary Release 2004, Equation 10 """
+    h = np.asarray(h, dtype=float)
+    hs = h / 2600
+    return coef.p3sath(hs - 1.02, hs - 0.608) * 22
+
+
+@_scalar
+def p3sat_s(s):
+    """ Saturation pressure as function of s for region 3 - Revised Supplementary Release 2004, Equation 11 """
+    s = np.asarray(s, dtype=float)
+    Sigma = s / 5.2
+    return coef.p3sats(Sigma - 1.03, Sigma - 0.699) * 22
+
+
+# ************************************************************************************************
+# Region 4  - Saturation line, Equation 30 and 31
+# ************************************************************************************************
+
+@_scalar
+def T4_p(p):
+    beta = np.asarray(p, dtype=float) ** 0.25
+    E = beta ** 2 - 17.073846940092 * beta + 14.91510861353
+    f = 1167.0521452767 * beta ** 2 + 12020.82470247 * beta - 4823.2657361591
+    G = -724213.16703206 * beta ** 2 - 3232555.0322333 * beta + 405113.40542057
+    D = 2 * G / (-f - (f ** 2 - 4 * E * G) ** 0.5)
+    return (650.17534844798 + D - (
+        (650.17534844798 + D) ** 2 - 4 * (-0.23855557567849 + 650.17534844798 * D)) ** 0.5) / 2
+
+
+@_scalar
+def p4_T(T):
+    T = np.asarray(T, dtype=float)
+    teta = T - 0.23855557567849 / (T - 650.17534844798)
+    a = teta ** 2 + 1167.0521452767 * teta - 724213.16703206
+    B = -17.073846940092 * teta ** 2 + 12020.82470247 * teta - 3232555.0322333
+    C = 14.91510861353 * teta ** 2 - 4823.2657361591 * teta + 405113.40542057
+    return (2 * C / (-B + (B ** 2 - 4 * a * C) ** 0.5)) ** 4
+
+
+@_scalar
+def B23p_T(T):
+    """ Boundary between region 2 and 3 - Equation 5 """
+    T = np.asarray(T, dtype=float)
+    return 348.05185628969 - 1.1671859879975 * T + 1.0192970039326E-03 * T ** 2
+
+
+@_scalar
+def B23T_p(p):
+    """ Boundary between region 2 and 3 - Equation 6 """
+    p = np.asarray(p, dtype=float)
+    return 572.54459862746 + ((p - 13.91883977887) / 1.0192970039326E-03) ** 0.5
+
+
+def _bisection(func, target, low, high, tol, rising=True, maxit=200):
+    """
+    Half interval method applied to every element at once.
+
+    Solves  func(x, idx) = target  where idx are the indexes of the elements
+    still iterating, so func can pick the matching extra arguments. Each
+    element stops as soon as  abs(target - func(x)) <= tol, the same stop
+    criteria of the scalar loops in __xsteam__.
+
+    :param func:   Function f(x, idx) evaluated over the active elements
+    :param target: Target value of f for every element
+    :param low:    Lower bound for every element
+    :param high:   Upper bound for every element
+    :param tol:    Absolute tolerance on f
+    :param rising: True when f is increasing in x, False when decreasing
+    :param maxit:  Maximum number of halvings
+    :return:       Array of solutions
+    """
+    target, low, high = [a.ravel().copy() for a in _asarrays(target, low, high)]
+    x = np.empty(target.shape)
+    active = np.arange(target.size)
+
+    for _ in range(maxit):
+        if active.size == 0:
+            break
+
+        xs = (low[active] + high[active]) / 2
+        x[active] = xs
+        fs = func(xs, active)
+
+        above = fs > target[active] if rising else fs < target[active]
+        high[active[above]] = xs[above]
+        low[active[~above]] = xs[~above]
+
+        active = active[np.abs(target[active] - fs) > tol]
+
+    return x
+
+
+@_scalar
+def h4L_p(p):
+    """ Saturated liquid enthalpy, -99999 outside the saturation line """
+    p = np.asarray(p, dtype=float)
+    out = np.full(p.shape, -99999.0)
+
+    valid = (0.000611657 < p) & (p < 22.06395)
+    low = valid & (p < 16.529)
+    high = valid & ~low
+
+    out[low] = h1_pT(p[low], T4_p(p[low]))
+    ph = p[high]
+    out[high] = _bisection(lambda hs, idx: p3sat_h(hs), ph, 1670.858218, 2087.23500164864, 0.00001)
+    return out
+
+
+@_scalar
+def h4V_p(p):
+    """ Saturated vapour enthalpy, -99999 outside the saturation line """
+    p = np.asarray(p, dtype=float)
+    out = np.full(p.shape, -99999.0)
+
+    valid = (0.000611657 < p) & (p < 22.06395)
+    low = valid & (p < 16.529)
+    high = valid & ~low
+
+    out[low] = h2_pT(p[low], T4_p(p[low]))
+    ph = p[high]
+    out[high] = _bisection(lambda hs, idx: p3sat_h(hs), ph, 2087.23500164864, 2563.592004 + 5, 0.000001,
+                           rising=False)
+    return out
+
+
+@_scalar
+def x4_ph(p, h):
+    p, h = _asarrays(p, h)
+    hV = np.asarray(h4V_p(p))
+    hL = np.asarray(h4L_p(p))
+    return np.clip((h - hL) / (hV - hL), 0, 1)
+
+
+@_scalar
+def x4_ps(p, s):
+    p, s = _asarrays(p, s)
+    ssV = np.empty(p.shape)
+    ssL = np.empty(p.shape)
+    low = p < 16.529
+    high = ~low
+
+    Ts = T4_p(p[low])
+    ssV[low] = s2_pT(p[low], Ts)
+    ssL[low] = s1_pT(p[low], Ts)
+
+    ph = p[high]
+    Ts = T4_p(ph)
+    ssV[high] = s3_rhoT(1 / v3_ph(ph, h4V_p(ph)), Ts)
+    ssL[high] = s3_rhoT(1 / v3_ph(ph, h4L_p(ph)), Ts)
+    return np.clip((s - ssL) / (ssV - ssL), 0, 1)
+
+
+@_scalar
+def h3_pT(p, T):
+    """ Enthalpy in region 3 solving T3_ph(p, h) = T with the half interval method """
+    p, T = _asarrays(p, T)
+    low = np.empty(p.shape)
+    high = np.empty(p.shape)
+
+    below = p < 22.06395
+    liquid = below & (T <= np.asarray(T4_p(p)))
+    vapour = below & ~liquid
+    above = ~below
+
+    upper = ~vapour
+    low[upper] = h1_pT(p[upper], 623.15)
+    high[upper] = h2_pT(p[upper], B23T_p(p[upper]))
+    high[liquid] = h4L_p(p[liquid])
+    low[vapour] = h4V_p(p[vapour])
+    high[vapour] = h2_pT(p[vapour], B23T_p(p[vapour]))
+
+    pf = p.ravel()
+    out = _bisection(lambda hs, idx: T3_ph(pf[idx], hs), T, low, high, 0.00001)
+    return out
+
+
+# ************************************************************************************************
+# Region 5  - Equation 32 and 33, Table 37 to 41
+# ************************************************************************************************
+
+@_scalar
+def h5_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 1000 / T
+    return R * T * tau * (coef.gamma5o_y(1.0, tau) + coef.gamma5r_y(p, tau))
+
+
+@_scalar
+def v5_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 1000 / T
+    return R * T / p * p * (1 / p + coef.gamma5r_x(p, tau)) / 1000
+
+
+@_scalar
+def u5_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 1000 / T
+    gr_pi, gr_tau = coef.gamma5r_u(p, tau)
+    return R * T * (tau * (coef.gamma5o_y(1.0, tau) + gr_tau) - p * (1 / p + gr_pi))
+
+
+@_scalar
+def s5_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 1000 / T
+    g0, g0_tau = coef.gamma5o_s(1.0, tau)
+    gr, gr_tau = coef.gamma5r_s(p, tau)
+    return R * (tau * (g0_tau + gr_tau) - (g0 + np.log(p) + gr))
+
+
+@_scalar
+def Cp5_pT(p, T):
+    p, T = _asarrays(p, T)
+    tau = 1000 / T
+    return -R * tau ** 2 * (coef.gamma5o_yy(1.0, tau) + coef.gamma5r_yy(p, tau))
+
+
+@_scalar
+def T5_ph(p, h):
+    """ Temperature in region 5 solving h5_pT(p, T) = h with the half interval method """
+    p, h = _asarrays(p, h)
+    pf = p.ravel()
+    return _bisection(lambda Ts, idx: h5_pT(pf[idx], Ts), h, 1073.15, 2273.15, 0.00001)
+
+
+@_scalar
+def T5_ps(p, s):
+    """ Temperature in region 5 solving s5_pT(p, T) = s with the half interval method """
+    p, s = _asarrays(p, s)
+    pf = p.ravel()
+    return _bisection(lambda Ts, idx: s5_pT(pf[idx], Ts), s, 1073.15, 2273.15, 0.00001)
+
+
+# ************************************************************************************************
+# Region detection
+# ************************************************************************************************
+
+@_scalar
+def region_pT(p, T):
+    """
+    Region of every (p, T) pair, 0 outside the valid area.
+
+    :param p: Pressure in MPa
+    :param T: Temperature in K
+    :return:  Integer array with the regions 0 to 5
+    """
+    p, T = _asarrays(p, T)
+    region = np.zeros(p.shape, dtype=int)
+
+    r5 = (T > 1073.15) & (p < 10) & (T < 2273.15) & (p > 0.000611)
+    valid = ~r5 & (T <= 1073.15) & (T > 273.15) & (p <= 100) & (p > 0.000611)
+    hot = valid & (T > 623.15)
+    cold = valid & ~hot
+
+    region[r5] = 5
+
+    r3 = hot & (p > np.asarray(B23p_T(T)))
+    region[hot] = 2
+    region[r3] = 3
+    sat = r3 & (T < 647.096)
+    sat[sat] = np.abs(p[sat] - np.asarray(p4_T(T[sat]))) < 0.00001
+    region[sat] = 4
+
+    ps = np.asarray(p4_T(T[cold]))
+    pc = p[cold]
+    region[cold] = np.where(np.abs(pc - ps) < 0.00001, 4, np.where(pc > ps, 1, 2))
+    return region
+
+
+@_scalar
+def region_ph(p, h):
+    """
+    Region of every (p, h) pair, 0 outside the valid area.
+
+    :param p: Pressure in MPa
+    :param h: Enthalpy in kJ/kg
+    :return:  Integer array with the regions 0 to 5
+    """
+    p, h = _asarrays(p, h)
+    region = np.zeros(p.shape, dtype=int)
+    todo = (p >= 0.000611657) & (p <= 100)
+
+    # Outside low h. Linear adaption to h1_pT() + 2 to speed up calculations
+    quick = todo & (h < 0.963 * p + 2.2)
+    quick[quick] = h[quick] < h1_pT(p[quick], 273.15)
+    todo &= ~quick
+
+    # Bellow region 3, check region 1, 4 and 2
+    low = todo & (p < 16.5292)
+    pl, hl = p[low], h[low]
+    Ts = np.asarray(T4_p(pl))
+    rl = np.zeros(pl.shape, dtype=int)
+    left = np.ones(pl.shape, dtype=bool)
+
+    # Approximate function for hL_p, use the real function when it is not good enough.
+    hL = 109.6635 * np.log(pl) + 40.3481 * pl + 734.58
+    near = np.abs(hl - hL) < 100
+    hL[near] = h1_pT(pl[near], Ts[near])
+    sel = hl <= hL
+    rl[sel] = 1
+    left &= ~sel
+
+    # Approximate function for hV_p, use the real function when it is not good enough.
+    hV = 45.1768 * np.log(pl) - 20.158 * pl + 2804.4
+    near = left & (np.abs(hl - hV) < 50)
+    hV[near] = h2_pT(pl[near], Ts[near])
+    sel = left & (hl < hV)
+    rl[sel] = 4
+    left &= ~sel
+
+    # Upper limit of region 2, quick test and then real value
+    sel = left & (hl < 4000)
+    real = left & ~sel
+    sel[real] = hl[real] <= h2_pT(pl[real], 1073.15)
+    rl[sel] = 2
+    left &= ~sel
+
+    # Region 5
+    left &= pl <= 10
+    sel = left.copy()
+    sel[left] = hl[left] < h5_pT(pl[left], 2273.15)
+    rl[sel] = 5
+    region[low] = rl
+
+    # Above region 3 pressures
+    high = todo & ~low
+    ph, hh = p[high], h[high]
+    rh = np.zeros(ph.shape, dtype=int)
+
+    r1 = hh < h1_pT(ph, 623.15)
+    rh[r1] = 1
+    r34 = ~r1 & (hh < h2_pT(ph, B23T_p(ph)))
+    rh[r34] = np.where(ph[r34] > p3sat_h(hh[r34]), 3, 4)
+    r2 = ~r1 & ~r34 & (hh < h2_pT(ph, 1073.15))
+    rh[r2] = 2
+    region[high] = rh
+    return region
+
+
+@_scalar
+def region_ps(p, s):
+    """
+    Region of every (p, s) pair, 0 outside the valid area.
+
+    :param p: Pressure in MPa
+    :param s: Entropy in kJ/(kg K)
+    :return:  Integer array with the regions 0 to 5
+    """
+    p, s = _asarrays(p, s)
+    region = np.zeros(p.shape, dtype=int)
+
+    todo = (p >= 0.000611657) & (p <= 100) & (s >= 0)
+    todo[todo] = s[todo] <= s5_pT(p[todo], 2273.15)
+
+    # Region 5
+    sel = todo.copy()
+    sel[todo] = s[todo] > s2_pT(p[todo], 1073.15)
+    region[sel & (p <= 10)] = 5
+    todo &= ~sel
+
+    # Region 2
+    ss = np.empty(p.shape)
+    sup = todo & (p > 16.529)
+    sub = todo & ~sup
+    ss[sup] = s2_pT(p[sup], B23T_p(p[sup]))
+    ss[sub] = s2_pT(p[sub], T4_p(p[sub]))
+    sel = todo & (s > ss)
+    region[sel] = 2
+    todo &= ~sel
+
+    # Region 3 or 4 above the critical region pressure
+    sel = todo & (p > 16.529)
+    sel[sel] = s[sel] > s1_pT(p[sel], 623.15)
+    region[sel] = np.where(p[sel] > p3sat_s(s[sel]), 3, 4)
+    todo &= ~sel
+
+    # Region 4 (Not inside region 3)
+    sel = todo & (p < 16.529)
+    sel[sel] = s[sel] > s1_pT(p[sel], T4_p(p[sel]))
+    region[sel] = 4
+    todo &= ~sel
+
+    region[todo] = 1
+    return region
+
+
+# ************************************************************************************************
+# State functions - tuples (v, h, u, s, Cp, Cv, w) like the __xsteam__ state functions
+# ************************************************************************************************
+
+def state1_pT(p, T, second=True):
+    p, T = _asarrays(p, T)
+    Pi, tau, x, y = _gamma1(p, T)
+    if second:
+        g, g_x, g_tau, g_xx, g_xy, g_tautau = coef.gamma1_d2(x, y)
+        return xst.props_gibbs(p, T, Pi, tau, g, -g_x, g_tau, g_xx, -g_xy, g_tautau)
+
+    g, g_x, g_tau = coef.gamma1_d1(x, y)
+    return xst.props_gibbs(p, T, Pi, tau, g, -g_x, g_tau)
+
+
+def state2_pT(p, T, second=True):
+    p, T = _asarrays(p, T)
+    tau = 540 / T
+    if second:
+        g0, g0_tau, g0_tautau = coef.gamma2o_d2(1.0, tau)
+        gr, gr_pi, gr_tau, gr_pipi, gr_pitau, gr_tautau = coef.gamma2r_d2(p, tau - 0.5)
+        return xst.props_gibbs(p, T, p, tau, g0 + np.log(p) + gr, 1 / p + gr_pi, g0_tau + gr_tau,
+                               -1 / p ** 2 + gr_pipi, gr_pitau, g0_tautau + gr_tautau)
+
+    g0, g0_tau = coef.gamma2o_s(1.0, tau)
+    gr, gr_pi, gr_tau = coef.gamma2r_d1(p, tau - 0.5)
+    return xst.props_gibbs(p, T, p, tau, g0 + np.log(p) + gr, 1 / p + gr_pi, g0_tau + gr_tau)
+
+
+def state3_rhoT(rho, T, second=True):
+    rho, T = _asarrays(rho, T)
+    delta = rho / 322
+    tau = 647.096 / T
+    n1 = coef.phi3_n[0]
+    if second:
+        f, f_delta, f_tau, f_deltadelta, f_deltatau, f_tautau = coef.phi3_d2(delta, tau)
+        return xst.props_helmholtz(rho, T, delta, tau, f + n1 * np.log(delta), f_delta + n1 / delta, f_tau,
+                                   f_deltadelta - n1 / delta ** 2, f_deltatau, f_tautau)
+
+    f, f_delta, f_tau = coef.phi3_d1(delta, tau)
+    return xst.props_helmholtz(rho, T, delta, tau, f + n1 * np.log(delta), f_delta + n1 / delta, f_tau)
+
+
+def state4_p(p):
+    """
+    Saturation temperature, saturated liquid state (v, h, u, s) and
+    saturated vapour state (v, h, u, s) at the pressures p
+    """
+    p = np.asarray(p, dtype=float)
+    Ts = np.asarray(T4_p(p))
+    liquid = np.empty((4,) + p.shape)
+    vapour = np.empty((4,) + p.shape)
+
+    low = p < 16.529
+    high = ~low
+    liquid[:, low] = state1_pT(p[low], Ts[low], False)[:4]
+    vapour[:, low] = state2_pT(p[low], Ts[low], False)[:4]
+
+    ph = p[high]
+    liquid[:, high] = state3_rhoT(1 / v3_ph(ph, h4L_p(ph)), Ts[high], False)[:4]
+    vapour[:, high] = state3_rhoT(1 / v3_ph(ph, h4V_p(ph)), Ts[high], False)[:4]
+    return Ts, liquid, vapour
+
+
+def state5_pT(p, T, second=True):
+    p, T = _asarrays(p, T)
+    tau = 1000 / T
+    if second:
+        g0, g0_tau, g0_tautau = coef.gamma5o_d2(1.0, tau)
+        gr, gr_pi, gr_tau, gr_pipi, gr_pitau, gr_tautau = coef.gamma5r_d2(p, tau)
+        return xst.props_gibbs(p, T, p, tau, g0 + np.log(p) + gr, 1 / p + gr_pi, g0_tau + gr_tau,
+                               -1 / p ** 2 + gr_pipi, gr_pitau, g0_tautau + gr_tautau)
+
+    g0, g0_tau = coef.gamma5o_s(1.0, tau)
+    gr, gr_pi, gr_tau = coef.gamma5r_d1(p, tau)
+    return xst.props_gibbs(p, T, p, tau, g0 + np.log(p) + gr, 1 / p + gr_pi, g0_tau + gr_tau)
+
+
+# ************************************************************************************************
+# Steam table functions - p in kPa, T in °C
+# ************************************************************************************************
+
+def _dispatch(region, funcs, *args):
+    """
+    Evaluate funcs[r](*args) over the elements of every region r and
+    return nan for the elements of regions without function.
+    """
+    out = np.full(region.shape, np.nan)
+    for r, func in funcs.items():
+        sel = region == r
+        if sel.any():
+            out[sel] = func(*[a[sel] for a in args])
+    return out
+
+
+def _kpa_celsius(p, T):
+    p, T = _asarrays(p, T)
+    return p / 1000.0, T + 273.15
+
+
+def _h3_pT(p, T):
+    return h3_pT(p, T)
+
+
+def _v3_pT(p, T):
+    return v3_ph(p, h3_pT(p, T))
+
+
+def _s3_pT(p, T):
+    return s3_rhoT(1 / v3_ph(p, h3_pT(p, T)), T)
+
+
+def _u3_pT(p, T):
+    return u3_rhoT(1 / v3_ph(p, h3_pT(p, T)), T)
+
+
+@_scalar
+def h_pt(p, T):
+    """
+    Enthalpy as function of pressure and temperature
+
+    :param p: Pressure in kPa
+    :param T: Temperature in °C
+    :return:  Enthalpy in kJ/kg
+    """
+    p, T = _kpa_celsius(p, T)
+    return _dispatch(region_pT(p, T), {1: h1_pT, 2: h2_pT, 3: _h3_pT, 5: h5_pT}, p, T)
+
+
+@_scalar
+def v_pt(p, T):
+    """
+    Specific volume as function of pressure and temperature
+
+    :param p: Pressure in kPa
+    :param T: Temperature in °C
+    :return:  Specific volume in m3/kg
+    """
+    p, T = _kpa_celsius(p, T)
+    return _dispatch(region_pT(p, T), {1: v1_pT, 2: v2_pT, 3: _v3_pT, 5: v5_pT}, p, T)
+
+
+@_scalar
+def s_pt(p, T):
+    """
+    Entropy as function of pressure and temperature
+
+    :param p: Pressure in kPa
+    :param T: Temperature in °C
+    :return:  Entropy in kJ/(kg K)
+    """
+    p, T = _kpa_celsius(p, T)
+    return _dispatch(region_pT(p, T), {1: s1_pT, 2: s2_pT, 3: _s3_pT, 5: s5_pT}, p, T)
+
+
+@_scalar
+def u_pt(p, T):
+    """
+    Internal energy as function of pressure and temperature
+
+    :param p: Pressure in kPa
+    :param T: Temperature in °C
+    :return:  Internal energy in kJ/kg
+    """
+    p, T = _kpa_celsius(p, T)
+    return _dispatch(region_pT(p, T), {1: u1_pT, 2: u2_pT, 3: _u3_pT, 5: u5_pT}, p, T)
+
+
+@_scalar
+def tsat_p(p):
+    """
+    Saturation temperature in °C as function of pressure in kPa
+    """
+    p = np.asarray(p, dtype=float) / 1000.0
+    valid = (0.000611657 < p) & (p < 22.06395)
+    return np.where(valid, np.asarray(T4_p(np.where(valid, p, 1.0))) - 273.15, np.nan)
+
+
+@_scalar
+def psat_t(T):
+    """
+    Saturation pressure in kPa as function of temperature in °C
+    """
+    T = np.asarray(T, dtype=float) + 273.15
+    valid = (647.096 > T) & (T > 273.15)
+    return np.where(valid, np.asarray(p4_T(np.where(valid, T, 300.0))) * 1000.0, np.nan)
+
+
+def _T4_ph(p, h):
+    return T4_p(p)
+
+
+@_scalar
+def t_ph(p, h):
+    """
+    Temperature as function of pressure and enthalpy
+
+    :param p: Pressure in kPa
+    :param h: Enthalpy in kJ/kg
+    :return:  Temperature in °C
+    """
+    p, h = _asarrays(p, h)
+    p = p / 1000.0
+    return np.asarray(_dispatch(region_ph(p, h), {1: T1_ph, 2: T2_ph, 3: T3_ph, 4: _T4_ph, 5: T5_ph},
+                                        p, h)) - 273.15
+
+
+@_scalar
+def t_ps(p, s):
+    """
+    Temperature as function of pressure and entropy
+
+    :param p: Pressure in kPa
+    :param s: Entropy in kJ/(kg K)
+    :return:  Temperature in °C
+    """
+    p, s = _asarrays(p, s)
+    p = p / 1000.0
+    return np.asarray(_dispatch(region_ps(p, s), {1: T1_ps, 2: T2_ps, 3: T3_ps, 4: _T4_ph, 5: T5_ps},
+                                        p, s)) - 273.15
+
+
+def _h1_ps(p, s):
+    return h1_pT(p, T1_ps(p, s))
+
+
+def _h2_ps(p, s):
+    return h2_pT(p, T2_ps(p, s))
+
+
+def _h3_ps(p, s):
+    return h3_rhoT(1 / v3_ps(p, s), T3_ps(p, s))
+
+
+def _h4_ps(p, s):
+    xs = x4_ps(p, s)
+    return xs * h4V_p(p) + (1 - xs) * h4L_p(p)
+
+
+def _h5_ps(p, s):
+    return h5_pT(p, T5_ps(p, s))
+
+
+@_scalar
+def h_ps(p, s):
+    """
+    Enthalpy as function of pressure and entropy
+
+    :param p: Pressure in kPa
+    :param s: Entropy in kJ/(kg K)
+    :return:  Enthalpy in kJ/kg
+    """
+    p, s = _asarrays(p, s)
+    p = p / 1000.0
+    return _dispatch(region_ps(p, s), {1: _h1_ps, 2: _h2_ps, 3: _h3_ps, 4: _h4_ps, 5: _h5_ps}, p, s)
+
+
+# ************************************************************************************************
+# State functions - several properties in one structured array
+# ************************************************************************************************
+
+def _state_array(props, n):
+    """ Structured array of n states filled with nan, one float field per property """
+    xsteam.state_record(props)
+    return np.full(n, np.nan, dtype=[(name, float) for name in props])
+
+
+def _fill(out, sel, p, T, st, x=None):
+    """
+    Store the states of the elements sel, p in MPa, T in K and st the
+    tuple (v, h, u, s, Cp, Cv, w). Properties that are None stay nan.
+    """
+    v, h, u, s, cp, cv, w = st
+    values = {"p": p * 1000.0, "T": T - 273.15, "h": h, "s": s, "v": v, "rho": 1 / v,
+              "u": u, "cp": cp, "cv": cv, "w": w, "x": x}
+    for name in out.dtype.names:
+        if values[name] is not None:
+            out[name][sel] = values[name]
+
+
+def _fill4(out, sel, p, value, k):
+    """ Store the saturated mixtures of the elements sel with the vapour fraction from the property k """
+    Ts, liquid, vapour = state4_p(p)
+    xs = np.clip((value - liquid[k]) / (vapour[k] - liquid[k]), 0, 1)
+    v, h, u, s = xs * vapour + (1 - xs) * liquid
+    _fill(out, sel, p, Ts, (v, h, u, s, None, None, None), xs)
+
+
+def state_pt(p, T, props=("h", "s", "v", "u", "cp", "w")):
+    """
+    Several properties as function of pressure and temperature, see
+    xsteam.state_pt. The region of every point is found once and the basic
+    equation of every region is evaluated once for all the properties.
+
+        >>> st = vxsteam.state_pt([100.0, 1000.0], 300.0, props=("h", "s"))
+        >>> st["h"]
+        array([3074.54038363, 3051.70318558])
+
+    :param p:     Pressure in kPa
+    :param T:     Temperature in °C
+    :param props: Names of the properties, see xsteam.STATE_PROPS
+    :return:      Structured array with one field per property, nan outside the valid range
+    """
+    p, T = _kpa_celsius(p, T)
+    shape = p.shape
+    p, T = p.ravel(), T.ravel()
+    out = _state_array(props, p.size)
+    second = xsteam._second(props)
+
+    region = region_pT(p, T)
+    for r, func in [(1, state1_pT), (2, state2_pT), (5, state5_pT)]:
+        sel = region == r
+        _fill(out, sel, p[sel], T[sel], func(p[sel], T[sel], second))
+
+    sel = region == 3
+    ps, Ts = p[sel], T[sel]
+    _fill(out, sel, ps, Ts, state3_rhoT(1 / v3_ph(ps, h3_pT(ps, Ts)), Ts, second))
+    return out.reshape(shape)
+
+
+def state_ph(p, h, props=("T", "s", "v", "u", "x")):
+    """
+    Several properties as function of pressure and enthalpy, see xsteam.state_ph
+
+    :param p:     Pressure in kPa
+    :param h:     Enthalpy in kJ/kg
+    :param props: Names of the properties, see xsteam.STATE_PROPS
+    :return:      Structured array with one field per property, nan outside the valid range
+    """
+    p, h = _asarrays(p, h)
+    shape = p.shape
+    p, h = p.ravel() / 1000.0, h.ravel()
+    out = _state_array(props, p.size)
+    second = xsteam._second(props)
+
+    region = region_ph(p, h)
+    for r, backward, func in [(1, T1_ph, state1_pT), (2, T2_ph, state2_pT), (5, T5_ph, state5_pT)]:
+        sel = region == r
+        Ts = backward(p[sel], h[sel])
+        _fill(out, sel, p[sel], Ts, func(p[sel], Ts, second))
+
+    sel = region == 3
+    ps, hs = p[sel], h[sel]
+    Ts = T3_ph(ps, hs)
+    _fill(out, sel, ps, Ts, state3_rhoT(1 / v3_ph(ps, hs), Ts, second))
+
+    sel = region == 4
+    _fill4(out, sel, p[sel], h[sel], 1)
+    return out.reshape(shape)
+
+
+def state_ps(p, s, props=("T", "h", "v", "u", "x")):
+    """
+    Several properties as function of pressure and entropy, see xsteam.state_ps
+
+    :param p:     Pressure in kPa
+    :param s:     Entropy in kJ/(kg K)
+    :param props: Names of the properties, see xsteam.STATE_PROPS
+    :return:      Structured array with one field per property, nan outside the valid range
+    """
+    p, s = _asarrays(p, s)
+    shape = p.shape
+    p, s = p.ravel() / 1000.0, s.ravel()
+    out = _state_array(props, p.size)
+    second = xsteam._second(props)
+
+    region = region_ps(p, s)
+    for r, backward, func in [(1, T1_ps, state1_pT), (2, T2_ps, state2_pT), (5, T5_ps, state5_pT)]:
+        sel = region == r
+        Ts = backward(p[sel], s[sel])
+        _fill(out, sel, p[sel], Ts, func(p[sel], Ts, second))
+
+    sel = region == 3
+    ps, ss = p[sel], s[sel]
+    Ts = T3_ps(ps, ss)
+    _fill(out, sel, ps, Ts, state3_rhoT(1 / v3_ps(ps, ss), Ts, second))
+
+    sel = region == 4
+    _fill4(out, sel, p[sel], s[sel], 3)
+    return out.reshape(shape)
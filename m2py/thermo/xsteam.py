@@ -1,8 +1,52 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+from collections import namedtuple, OrderedDict
+from functools import wraps
+from math import floor, log10
+
 from . import __xsteam__ as xst
 
+# Lookup tables backend of h_pt, v_pt, s_pt, u_pt, t_ph, t_ps, h_ps and u_ps,
+# None for the exact IF-97 equations, see use_lut().
+_lut = None
+
+
+def use_lut(path=None, tol=1e-5, max_nodes=2 ** 14):
+    """
+    Evaluate h_pt, v_pt, s_pt, u_pt, t_ph, t_ps, h_ps and u_ps from the
+    bicubic lookup tables of m2py.thermo.lut. The tables are loaded from
+    path, built and saved there if it doesn't exist yet.
+
+    :param path:      .npy file of the tables, default lut.TABLES
+    :param tol:       Tolerance of the tables when they are built
+    :param max_nodes: Maximum number of nodes of a table when they are built
+    :return:          LUT object, see LUT.error_report()
+    """
+    global _lut
+    from . import lut
+
+    path = path or lut.TABLES
+    if os.path.exists(path):
+        tables = lut.LUT.load(path)
+    else:
+        tables = lut.LUT.build(tol=tol, max_nodes=max_nodes)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        tables.save(path)
+
+    _lut = tables
+    cache_clear()
+    return tables
+
+
+def use_exact():
+    """ Evaluate every function from the exact IF-97 equations (default) """
+    global _lut
+    _lut = None
+    cache_clear()
+
 
 def tsat_p(p):
     """
@@ -84,14 +128,14 @@ def h_pt(p, T):
     :param T: Temperature in K
     :return:  Enthalpy in kJ/kg.K
     """
+    if _lut is not None:
+        return _lut.h_pt(p, T)
 
     # p = xst.toSIunit_p(p)
     p /= 1e3
     T = xst.toSIunit_T(T)
     Region = xst.region_pT(p, T)
 
-    print("Region = ", Region)
-
     if Region == 1:
         Out = xst.fromSIunit_h(xst.h1_pT(p, T))
     elif Region == 2:
@@ -196,6 +240,8 @@ def v_pt(p, T):
     :param T: Temperatur
     :return:  v Specific Volume of Superheated Steam in m3/kg
     """
+    if _lut is not None:
+        return _lut.v_pt(p, T)
 
     p = p / 1000.0
     # p = xst.toSIunit_p(p)
@@ -203,8 +249,6 @@ def v_pt(p, T):
 
     Region = xst.region_pT(p, T)
 
-    print("Region  = ", Region)
-
     if Region == 1:
         Out = xst.v1_pT(p, T)
     elif Region == 2:
@@ -252,6 +296,9 @@ def sv_p(p):
     return Out
 
 def s_pt(p, T):
+    if _lut is not None:
+        return _lut.s_pt(p, T)
+
     from .__xsteam__ import toSIunit_p, toSIunit_T, region_pT, v3_ph, h3_pT
     from .__xsteam__ import fromSIunit_s, s1_pT, s2_pT, h3_rhoT, s5_pT, s3_rhoT
     p = p/1000.0
@@ -278,6 +325,8 @@ def s_pt(p, T):
     return Out
 
 def t_ph(p, h):
+    if _lut is not None:
+        return _lut.t_ph(p, h)
     
     p = p/1000.0
     h = xst.toSIunit_h(h)
@@ -286,13 +335,13 @@ def t_ph(p, h):
     
     if Region == 1:
         Out = xst.fromSIunit_T(xst.T1_ph(p, h))
-    elif 2:
+    elif Region == 2:
         Out = xst.fromSIunit_T(xst.T2_ph(p, h))
-    elif 3:
+    elif Region == 3:
         Out = xst.fromSIunit_T(xst.T3_ph(p, h))
-    elif 4:
+    elif Region == 4:
         Out = xst.fromSIunit_T(xst.T4_p(p))
-    elif 5:
+    elif Region == 5:
         Out = xst.fromSIunit_T(xst.T5_ph(p, h))
     else:
         Out = None
@@ -301,21 +350,24 @@ def t_ph(p, h):
 
 
 def t_ps(p, s):
+    if _lut is not None:
+        return _lut.t_ps(p, s)
+
     p = p/1000.0
     #s = toSIunit_s(In2)
     
     Region = xst.region_ps(p, s)
     
     if Region ==  1:
-        Out = fromSIunit_T(xst.T1_ps(p, s))
+        Out = xst.fromSIunit_T(xst.T1_ps(p, s))
     elif Region ==  2:
-        Out = fromSIunit_T(xst.T2_ps(p, s))
+        Out = xst.fromSIunit_T(xst.T2_ps(p, s))
     elif Region ==  3:
-        Out = fromSIunit_T(xst.T3_ps(p, s))
+        Out = xst.fromSIunit_T(xst.T3_ps(p, s))
     elif Region ==  4:
-        Out = fromSIunit_T(xst.T4_p(p))
+        Out = xst.fromSIunit_T(xst.T4_p(p))
     elif Region ==  5:
-        Out = fromSIunit_T(xst.T5_ps(p, s))
+        Out = xst.fromSIunit_T(xst.T5_ps(p, s))
     else:
         Out = None
 
@@ -330,15 +382,15 @@ def t_hs(h, s):
     
     if Region ==  1:
         p1 = xst.p1_hs(h, s)
-        Out = fromSIunit_T(xst.T1_ph(p1, h))
+        Out = xst.fromSIunit_T(xst.T1_ph(p1, h))
     elif Region ==  2:
         p2 = xst.p2_hs(h, s)
-        Out = fromSIunit_T(xst.T2_ph(p2, h))
+        Out = xst.fromSIunit_T(xst.T2_ph(p2, h))
     elif Region ==  3:
         p3 = xst.p3_hs(h, s)
-        Out = fromSIunit_T(xst.T3_ph(p3, h))
+        Out = xst.fromSIunit_T(xst.T3_ph(p3, h))
     elif Region ==  4:
-        Out = fromSIunit_T(xst.T4_hs(h, s))
+        Out = xst.fromSIunit_T(xst.T4_hs(h, s))
     elif Region ==  5:
         Exception('functions of hs is not avlaible in region 5')
     else:
@@ -397,6 +449,8 @@ def x_ps(p, s):
     else:
         Out = None
 
+    return Out
+
 
 #case 'p_hs'
 def p_hs(h, s):
@@ -454,6 +508,8 @@ def hl_t(T):
 
 #case 'h_ps'
 def h_ps(p, s):
+    if _lut is not None:
+        return _lut.h_ps(p, s)
 
     p = p /1000.0
     #s = toSIunit_s(In2)
@@ -513,6 +569,8 @@ def uv_p(p):
 
 
 def u_ps(p, s):
+    if _lut is not None:
+        return _lut.u_ps(p, s)
     
     p = p/1000.0
     
@@ -549,6 +607,9 @@ def u_ps(p, s):
 
 
 def u_pt(p, T):
+    if _lut is not None:
+        return _lut.u_pt(p, T)
+
     p = p / 1000.0
 
     T = xst.toSIunit_T(T)
@@ -573,6 +634,232 @@ def u_pt(p, T):
     return Out
 
 
+# ***********************************************************************************************************
+# State functions
+#
+# state_pt, state_ph, state_ps and state_hs find the region once, evaluate
+# the basic equation of the region once and return all the requested
+# properties in a State record (namedtuple).
+# ***********************************************************************************************************
+
+# Properties available in the State records and their units
+#
+#   p    Pressure                     kPa
+#   T    Temperature                  °C
+#   h    Enthalpy                     kJ/kg
+#   s    Entropy                      kJ/(kg K)
+#   v    Specific volume              m3/kg
+#   rho  Density                      kg/m3
+#   u    Internal energy              kJ/kg
+#   cp   Isobaric heat capacity       kJ/(kg K)
+#   cv   Isochoric heat capacity      kJ/(kg K)
+#   w    Speed of sound               m/s
+#   x    Vapour fraction, None outside the saturation region
+#
+# cp, cv and w are None inside the saturation region.
+STATE_PROPS = ("p", "T", "h", "s", "v", "rho", "u", "cp", "cv", "w", "x")
+
+_records = {}
+
+
+def state_record(props):
+    """
+    namedtuple class State with the fields props, one class is created
+    for every tuple of properties.
+    """
+    props = tuple(props)
+    if props not in _records:
+        unknown = [name for name in props if name not in STATE_PROPS]
+        if unknown:
+            raise ValueError("Unknown properties %s, expected some of %s" % (unknown, STATE_PROPS))
+        _records[props] = namedtuple("State", props)
+    return _records[props]
+
+
+def _second(props):
+    """ True when the properties need the second derivatives of the basic equation """
+    return "cp" in props or "cv" in props or "w" in props
+
+
+def _state(record, p, T, st, x=None):
+    """
+    State record from the pressure in MPa, the temperature in K and the
+    tuple (v, h, u, s, Cp, Cv, w) of the __xsteam__ state functions.
+    """
+    v, h, u, s, cp, cv, w = st
+    values = {"p": p * 1000.0, "T": xst.fromSIunit_T(T), "h": h, "s": s, "v": v, "rho": 1 / v,
+              "u": u, "cp": cp, "cv": cv, "w": w, "x": x}
+    return record(*[values[name] for name in record._fields])
+
+
+def _mixture(liquid, vapour, x):
+    """ State tuple of the saturated mixture with vapour fraction x """
+    v, h, u, s = [x * V + (1 - x) * L for L, V in zip(liquid[:4], vapour[:4])]
+    return v, h, u, s, None, None, None
+
+
+def _quality(value, liquid, vapour, k):
+    """ Vapour fraction from the property k (1 = h, 3 = s) of the saturated states """
+    return min(max((value - liquid[k]) / (vapour[k] - liquid[k]), 0.0), 1.0)
+
+
+def state_pt(p, T, props=("h", "s", "v", "u", "cp", "w")):
+    """
+    Several properties as function of pressure and temperature
+
+    The region is found once and its basic equation is evaluated once for
+    all the properties. In region 3 every property is computed from the
+    density v3_ph(p, h3_pT(p, T)), so h differs from h_pt by the consistency
+    of the backward equations (about 1e-5 relative).
+
+        >>> st = state_pt(100.0, 300.0)
+        >>> st.h, st.s
+        (3074.540383625381, 8.217124385520329)
+        >>> state_pt(100.0, 300.0, props=("v", "cp"))
+        State(v=2.6388678257415363, cp=2.0120590074842806)
+
+    :param p:     Pressure in kPa
+    :param T:     Temperature in °C
+    :param props: Names of the properties, see STATE_PROPS
+    :return:      State record with the fields props, None outside the valid range
+    """
+    record = state_record(props)
+    p = p / 1000.0
+    T = xst.toSIunit_T(T)
+    second = _second(props)
+
+    Region = xst.region_pT(p, T)
+
+    if Region == 1:
+        st = xst.state1_pT(p, T, second)
+    elif Region == 2:
+        st = xst.state2_pT(p, T, second)
+    elif Region == 3:
+        rhos = 1 / xst.v3_ph(p, xst.h3_pT(p, T))
+        st = xst.state3_rhoT(rhos, T, second)
+    elif Region == 5:
+        st = xst.state5_pT(p, T, second)
+    else:
+        return None
+
+    return _state(record, p, T, st)
+
+
+def state_ph(p, h, props=("T", "s", "v", "u", "x")):
+    """
+    Several properties as function of pressure and enthalpy
+
+    :param p:     Pressure in kPa
+    :param h:     Enthalpy in kJ/kg
+    :param props: Names of the properties, see STATE_PROPS
+    :return:      State record with the fields props, None outside the valid range
+    """
+    record = state_record(props)
+    p = p / 1000.0
+    h = xst.toSIunit_h(h)
+    second = _second(props)
+
+    Region = xst.region_ph(p, h)
+
+    if Region == 1:
+        Ts = xst.T1_ph(p, h)
+        st = xst.state1_pT(p, Ts, second)
+    elif Region == 2:
+        Ts = xst.T2_ph(p, h)
+        st = xst.state2_pT(p, Ts, second)
+    elif Region == 3:
+        Ts = xst.T3_ph(p, h)
+        st = xst.state3_rhoT(1 / xst.v3_ph(p, h), Ts, second)
+    elif Region == 4:
+        Ts, liquid, vapour = xst.state4_p(p)
+        xs = _quality(h, liquid, vapour, 1)
+        return _state(record, p, Ts, _mixture(liquid, vapour, xs), xs)
+    elif Region == 5:
+        Ts = xst.T5_ph(p, h)
+        st = xst.state5_pT(p, Ts, second)
+    else:
+        return None
+
+    return _state(record, p, Ts, st)
+
+
+def state_ps(p, s, props=("T", "h", "v", "u", "x")):
+    """
+    Several properties as function of pressure and entropy
+
+    :param p:     Pressure in kPa
+    :param s:     Entropy in kJ/(kg K)
+    :param props: Names of the properties, see STATE_PROPS
+    :return:      State record with the fields props, None outside the valid range
+    """
+    record = state_record(props)
+    p = p / 1000.0
+    s = xst.toSIunit_s(s)
+    second = _second(props)
+
+    Region = xst.region_ps(p, s)
+
+    if Region == 1:
+        Ts = xst.T1_ps(p, s)
+        st = xst.state1_pT(p, Ts, second)
+    elif Region == 2:
+        Ts = xst.T2_ps(p, s)
+        st = xst.state2_pT(p, Ts, second)
+    elif Region == 3:
+        Ts = xst.T3_ps(p, s)
+        st = xst.state3_rhoT(1 / xst.v3_ps(p, s), Ts, second)
+    elif Region == 4:
+        Ts, liquid, vapour = xst.state4_p(p)
+        xs = _quality(s, liquid, vapour, 3)
+        return _state(record, p, Ts, _mixture(liquid, vapour, xs), xs)
+    elif Region == 5:
+        Ts = xst.T5_ps(p, s)
+        st = xst.state5_pT(p, Ts, second)
+    else:
+        return None
+
+    return _state(record, p, Ts, st)
+
+
+def state_hs(h, s, props=("p", "T", "v", "u", "x")):
+    """
+    Several properties as function of enthalpy and entropy
+
+    :param h:     Enthalpy in kJ/kg
+    :param s:     Entropy in kJ/(kg K)
+    :param props: Names of the properties, see STATE_PROPS
+    :return:      State record with the fields props, None outside the valid range
+    """
+    record = state_record(props)
+    h = xst.toSIunit_h(h)
+    s = xst.toSIunit_s(s)
+    second = _second(props)
+
+    Region = xst.region_hs(h, s)
+
+    if Region == 1:
+        p = xst.p1_hs(h, s)
+        Ts = xst.T1_ph(p, h)
+        st = xst.state1_pT(p, Ts, second)
+    elif Region == 2:
+        p = xst.p2_hs(h, s)
+        Ts = xst.T2_ph(p, h)
+        st = xst.state2_pT(p, Ts, second)
+    elif Region == 3:
+        p = xst.p3_hs(h, s)
+        Ts = xst.T3_ph(p, h)
+        st = xst.state3_rhoT(1 / xst.v3_ph(p, h), Ts, second)
+    elif Region == 4:
+        p = xst.p4_T(xst.T4_hs(h, s))
+        Ts, liquid, vapour = xst.state4_p(p)
+        xs = _quality(h, liquid, vapour, 1)
+        return _state(record, p, Ts, _mixture(liquid, vapour, xs), xs)
+    else:
+        return None
+
+    return _state(record, p, Ts, st)
+
+
 #case 'h_prho'
 # def h_phro(p, prho)
 #     p = toSIunit_p(In1)
@@ -656,3 +943,157 @@ def tcl_p(p):
 #print v_pt(100.0, 1000)
 #print s_pt(100, 1000)
 #print t_ph(100, 4640.31)
+
+
+# ***********************************************************************************************************
+# Property cache
+# ***********************************************************************************************************
+#
+# Iterative solvers evaluate the same states many times, use_cache() puts a
+# bounded LRU cache in front of the functions of this module. The inputs are
+# rounded to a number of significant digits, states closer than that share
+# the value computed for the first of them.
+#
+#   >>> xsteam.use_cache(maxsize=10000, digits=10)
+#   >>> xsteam.h_pt(100.0, 300.0)
+#   >>> xsteam.cache_info()
+#   CacheInfo(hits=0, misses=1, evictions=0, maxsize=10000, currsize=1)
+#   >>> xsteam.cache_info("h_pt")      # Statistics of one function
+#   >>> xsteam.cache_clear()
+#   >>> xsteam.no_cache()
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions maxsize currsize")
+
+# Cached functions, all the public functions of the module
+CACHED = ("tsat_p", "tsat_s", "psat_t", "psat_s", "h_pt", "hv_t", "h_px", "h_tx", "x_ph", "v_pt", "vl_t",
+          "sv_p", "s_pt", "t_ph", "t_ps", "t_hs", "sv_t", "vx_ph", "x_ps", "p_hs", "hv_p", "hl_p", "hl_t",
+          "h_ps", "vx_ps", "uv_p", "u_ps", "u_pt", "state_pt", "state_ph", "state_ps", "state_hs")
+
+
+class PropertyCache(object):
+    """
+    Bounded LRU cache of function values keyed on (function name, inputs),
+    numeric inputs rounded to digits significant digits (None keeps the
+    exact inputs).
+
+    :param maxsize: Maximum number of cached values, the least recently
+                    used value is evicted when it is reached
+    :param digits:  Significant digits of the inputs in the key
+    """
+
+    def __init__(self, maxsize=4096, digits=12):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.digits = digits
+        self._data = OrderedDict()
+        # Function name -> [hits, misses, evictions, currsize]
+        self._stats = {}
+
+    def _round(self, x):
+        if self.digits is None or not isinstance(x, float) or x == 0.0 or x != x or abs(x) == float("inf"):
+            return x
+        return round(x, self.digits - 1 - int(floor(log10(abs(x)))))
+
+    def key(self, name, args, kwargs=None):
+        """ Key of the function name called with args and kwargs """
+        key = (name,) + tuple(self._round(x) for x in args)
+        if kwargs:
+            key += tuple(sorted(kwargs.items()))
+        return key
+
+    def call(self, name, func, args, kwargs=None):
+        """ Value of func(*args, **kwargs) from the cache, computed and stored on a miss """
+        kwargs = kwargs or {}
+        key = self.key(name, args, kwargs)
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = [0, 0, 0, 0]
+
+        try:
+            value = self._data[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable inputs like arrays or lists are not cached
+            return func(*args, **kwargs)
+        else:
+            self._data.move_to_end(key)
+            stats[0] += 1
+            return value
+
+        stats[1] += 1
+        value = func(*args, **kwargs)
+        self._data[key] = value
+        stats[3] += 1
+        if len(self._data) > self.maxsize:
+            old, _ = self._data.popitem(last=False)
+            evicted = self._stats[old[0]]
+            evicted[2] += 1
+            evicted[3] -= 1
+        return value
+
+    def info(self, name=None):
+        """ CacheInfo of the function name, of all the functions if name is None """
+        if name is not None:
+            stats = self._stats.get(name, [0, 0, 0, 0])
+            return CacheInfo(stats[0], stats[1], stats[2], self.maxsize, stats[3])
+        total = [sum(s[k] for s in self._stats.values()) for k in range(3)]
+        return CacheInfo(total[0], total[1], total[2], self.maxsize, len(self._data))
+
+    def clear(self):
+        """ Remove the cached values and reset the statistics """
+        self._data.clear()
+        self._stats.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_cache = None
+
+
+def use_cache(maxsize=4096, digits=12):
+    """
+    Cache the values of the functions of this module, see PropertyCache.
+
+    :return: PropertyCache object
+    """
+    global _cache
+    _cache = PropertyCache(maxsize, digits)
+    return _cache
+
+
+def no_cache():
+    """ Evaluate every call again (default) """
+    global _cache
+    _cache = None
+
+
+def cache_info(name=None):
+    """ Hits, misses and evictions of the cache, of the function name or of all the functions """
+    if _cache is None:
+        return None
+    return _cache.info(name)
+
+
+def cache_clear():
+    """ Remove the cached values, call it after changing the backend of the functions """
+    if _cache is not None:
+        _cache.clear()
+
+
+def _cached(func):
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _cache is None:
+            return func(*args, **kwargs)
+        return _cache.call(name, func, args, kwargs)
+
+    return wrapper
+
+
+for _name in CACHED:
+    globals()[_name] = _cached(globals()[_name])
@@ -8,6 +8,8 @@ using functional programming principles
 from functools import reduce
 import numpy
 
+from .Stream import Stream
+
 class List():
 
     def __init__(self, lst):
@@ -23,9 +25,11 @@ class List():
         return any(self.lst)
 
     def reverse(self):
-        reversed = self.lst
-        reversed.reverse()
-        return List(reversed)
+        return List(self.lst[::-1])
+
+    def stream(self):
+        """ Lazy Stream of the values, see pyhof.Stream """
+        return Stream(self.lst)
 
     def map(self, function):
         return List(list(map(function, self.lst)))
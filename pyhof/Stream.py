@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Lazy Stream of values built on generators
+
+The operations of a Stream return a new Stream and compute nothing, the
+values are produced one at a time when the Stream is consumed by a
+terminal operation (to_list, reduce, sum, to_array ...) or iterated.
+The consecutive map and filter steps are fused into a single pass, no
+intermediate list is created and the memory used by a pipeline is the
+memory of its windows, groups and chunks, not of the whole sequence.
+
+Every consumption runs the pipeline again from its source, a Stream of
+a list or a range can be consumed many times. A Stream can be consumed
+only once when its source is an iterator, as a generator or a file.
+
+Example:
+
+    >>> from pyhof import Stream
+    >>> Stream(range(10)).map(lambda x: x ** 2).filter(lambda x: x % 2).to_list()
+    [1, 9, 25, 49, 81]
+    >>>
+    >>> # Moving average of a large file without loading it
+    >>> Stream(open("prices.txt")).map(float).sliding_window(20).map(lambda w: sum(w) / 20).to_array()
+    >>>
+    >>> Stream.iterate(lambda x: 10.0 / (x ** 3 - 10.0), 2).take(5).to_list()
+    [2, -5.0, -0.07407407407407407, -0.9999593574411444, -0.9091009854605433]
+"""
+import itertools
+from collections import deque
+from functools import reduce
+
+_MAP, _FILTER = 0, 1
+
+
+def _fused(iterable, steps):
+    """ Values of iterable through the map and filter steps, in one pass """
+    if len(steps) == 1:
+        kind, function = steps[0]
+        return map(function, iterable) if kind == _MAP else filter(function, iterable)
+
+    def generator():
+        for x in iterable:
+            for kind, function in steps:
+                if kind == _MAP:
+                    x = function(x)
+                elif not function(x):
+                    break
+            else:
+                yield x
+
+    return generator()
+
+
+class _Stage(object):
+    """ Iterable of generator(*args), a new generator on each iteration """
+
+    def __init__(self, generator, *args, **kwargs):
+        self.generator = generator
+        self.args = args
+        self.kwargs = kwargs
+
+    def __iter__(self):
+        return iter(self.generator(*self.args, **self.kwargs))
+
+    def __repr__(self):
+        return "<%s>" % getattr(self.generator, "__name__", self.generator)
+
+
+def _iterate(function, x):
+    while True:
+        yield x
+        x = function(x)
+
+
+def _groups(iterable, function):
+    for key, group in itertools.groupby(iterable, function):
+        yield key, list(group)
+
+
+def _windows(iterable, k):
+    window = deque(maxlen=k)
+    for x in iterable:
+        window.append(x)
+        if len(window) == k:
+            yield tuple(window)
+
+
+def _chunks(iterable, n):
+    iterator = iter(iterable)
+    chunk = tuple(itertools.islice(iterator, n))
+    while chunk:
+        yield chunk
+        chunk = tuple(itertools.islice(iterator, n))
+
+
+class Stream(object):
+    """
+    Lazy sequence of values
+
+    :param iterable: Source of the values, any iterable
+    """
+
+    def __init__(self, iterable, steps=()):
+        self.iterable = iterable
+        # Map and filter steps not applied yet, (kind, function)
+        self.steps = tuple(steps)
+
+    @classmethod
+    def iterate(cls, function, x):
+        """ Infinite Stream x, function(x), function(function(x)) ... """
+        return cls(_Stage(_iterate, function, x))
+
+    @classmethod
+    def count(cls, start=0, step=1):
+        """ Infinite Stream start, start + step, start + 2 * step ... """
+        return cls(_Stage(itertools.count, start, step))
+
+    def __iter__(self):
+        if not self.steps:
+            return iter(self.iterable)
+        return _fused(self.iterable, self.steps)
+
+    def __repr__(self):
+        return "Stream(%r, steps=%d)" % (self.iterable, len(self.steps))
+
+    def _then(self, generator, *args, **kwargs):
+        """ Stream of generator(self, *args), started on each iteration """
+        return Stream(_Stage(generator, self, *args, **kwargs))
+
+    # Fused steps
+
+    def map(self, function):
+        return Stream(self.iterable, self.steps + ((_MAP, function),))
+
+    def filter(self, predicate):
+        return Stream(self.iterable, self.steps + ((_FILTER, predicate),))
+
+    def starmap(self, function):
+        return self.map(lambda args: function(*args))
+
+    # Lazy operations
+
+    def take(self, n):
+        """ The first n values """
+        return self._then(itertools.islice, n)
+
+    def drop(self, n):
+        """ The values after the first n """
+        return self._then(itertools.islice, n, None)
+
+    def take_while(self, predicate):
+        return Stream(_Stage(itertools.takewhile, predicate, self))
+
+    def drop_while(self, predicate):
+        return Stream(_Stage(itertools.dropwhile, predicate, self))
+
+    def sliding_window(self, k):
+        """
+        Overlapping tuples of k consecutive values, only the last k values
+        are kept in memory
+
+        >>> Stream(range(5)).sliding_window(3).to_list()
+        [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+        """
+        if k < 1:
+            raise ValueError("The window size must be at least 1, not %r" % (k,))
+        return self._then(_windows, k)
+
+    def chunk(self, n):
+        """
+        Tuples of n consecutive values, the last one can be shorter
+
+        >>> Stream(range(5)).chunk(2).to_list()
+        [(0, 1), (2, 3), (4,)]
+        """
+        if n < 1:
+            raise ValueError("The chunk size must be at least 1, not %r" % (n,))
+        return self._then(_chunks, n)
+
+    def groupby(self, function):
+        """
+        (key, list of values) of the runs of consecutive values with the
+        same key, a group is in memory only while it is produced. Unlike
+        hof.groupby the values must be sorted by the key to get a single
+        group per key.
+
+        >>> Stream([1, 3, 2, 4, 5]).groupby(lambda x: x % 2).to_list()
+        [(1, [1, 3]), (0, [2, 4]), (1, [5])]
+        """
+        return self._then(_groups, function)
+
+    def enumerate(self, start=0):
+        return self._then(enumerate, start)
+
+    def zip(self, *iterables):
+        return self._then(zip, *iterables)
+
+    def chain(self, *iterables):
+        return self._then(itertools.chain, *iterables)
+
+    def accumulate(self, function=None, initial=None):
+        """ Running totals, or running reduce of function """
+        return self._then(itertools.accumulate, function, initial=initial)
+
+    # Terminal operations
+
+    def to_list(self):
+        return list(self)
+
+    def reduce(self, function, initial=None):
+        if initial is None:
+            return reduce(function, self)
+        return reduce(function, self, initial)
+
+    def sum(self, start=0):
+        return sum(self, start)
+
+    def to_array(self, dtype=float, count=-1):
+        """
+        Numpy array of the values, built without an intermediate list
+
+        :param dtype: Data type of the array [default: float]
+        :param count: Number of values when known, faster allocation
+        """
+        import numpy
+        return numpy.fromiter(iter(self), dtype, count)
+
+    def first(self, default=None):
+        return next(iter(self), default)
+
+    def length(self):
+        """ Number of values, consumes the Stream """
+        return sum(1 for _ in self)
+
+    def foreach(self, function):
+        for x in self:
+            function(x)
@@ -4,11 +4,15 @@
 Higher Order Functions
 """
 
+import itertools
+
 try:
     import _thread as thread
 except ImportError:
     import thread
 
+from .Stream import Stream
+
 
 class Operator():
     """
@@ -935,7 +939,7 @@ def sliding_window(array, k):
 
     Note: http://toolz.readthedocs.org/en/latest/api.html#toolz.itertoolz.sliding_window
     """
-    return list(zip(*[array[i:] for i in range(k)]))
+    return list(Stream(array).sliding_window(k))
 
 
 def dictzip(keys, values):
@@ -1214,9 +1218,7 @@ def append(*ListOfLists):
     Note: Function taken from Erlang -
     http://erldocs.com/17.3/stdlib/lists.html#append
     """
-    newlist = []
-    mapl(lambda x: newlist.extend(x), ListOfLists)
-    return newlist
+    return list(itertools.chain.from_iterable(ListOfLists))
 
 
 def mapdict_values(function, dic):
@@ -1380,22 +1382,13 @@ def printf(function):
 
 
 def take_while(predicate, List):
-    result = []
-    for e in List:
-        if not predicate(e):
-            return result
-        else:
-            result.append(e)
+    """ The first elements of List while predicate is true """
+    return list(itertools.takewhile(predicate, List))
 
 
 def drop_while(predicate, List):
-    result = List.copy()
-
-    for e in List:
-        if not predicate(e):
-            return result.pop(0)
-        else:
-            result.pop(0)
+    """ The elements of List from the first one where predicate is false """
+    return list(itertools.dropwhile(predicate, List))
 
 
 def once(func):
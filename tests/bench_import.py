@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Cold start cost of importing the m2py subpackages
+
+Every module is imported in a new interpreter with python -X importtime,
+the time of all the imports triggered by the statement "import module"
+(the parent packages and everything they import, without the interpreter
+start up) is reported, the best of several runs.
+
+    $ python tests/bench_import.py
+    $ python tests/bench_import.py m2py.thermo.lut m2py.finance.series
+
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+MODULES = [
+    "m2py",
+    "m2py.misc.units",
+    "m2py.numerical",
+    "m2py.numerical.numerical",
+    "m2py.thermo",
+    "m2py.thermo.xsteam",
+    "m2py.thermo.vxsteam",
+    "m2py.thermo.steam",
+    "m2py.finance",
+    "m2py.finance.timeserie",
+    "m2py.finance.series",
+]
+
+RUNS = 5
+
+
+def _total(statement):
+    """ Sum of the cumulative times of the top level imports of statement in us, None if it fails """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                          cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    if proc.returncode != 0:
+        return None
+
+    # import time: self [us] | cumulative | imported package
+    # The names of the nested imports are indented
+    total = 0
+    for line in proc.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith("  "):
+            total += int(fields[1])
+    return total
+
+
+def import_time(module):
+    """ Cold start cost of importing module in a new interpreter in ms, None if the import fails """
+    base = _total("pass")
+    total = _total("import " + module)
+    if total is None:
+        return None
+    return (total - base) / 1000.0
+
+
+def heavy_modules(module):
+    """ Which of numpy, matplotlib and tabulate are loaded by importing module """
+    code = "import sys, %s; print(' '.join(m for m in ('numpy', 'matplotlib', 'tabulate') if m in sys.modules))"
+    proc = subprocess.run([sys.executable, "-c", code % module], cwd=ROOT,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    return proc.stdout.strip() if proc.returncode == 0 else ""
+
+
+def main(modules):
+    print("%-28s %12s   %s" % ("module", "import [ms]", "loaded"))
+    for module in modules:
+        times = [import_time(module) for _ in range(RUNS)]
+        if None in times:
+            print("%-28s %12s" % (module, "failed"))
+            continue
+        print("%-28s %12.1f   %s" % (module, min(times), heavy_modules(module)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or MODULES)
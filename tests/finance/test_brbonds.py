@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Brazilian bonds portfolios, m2py.finance.brbonds
+
+Reference: http://www.tesouro.fazenda.gov.br/documents/10180/258262/NTN-F/1d23ed84-4921-49f4-891b-fececd3115f9
+"""
+import time
+
+import numpy as np
+
+from m2py.finance import brbonds
+from m2py.finance import dtime as dt
+
+# NTN-F and LTN examples of the Tesouro Nacional
+assert brbonds.bond_price(0.1652, "09/01/2004", "01/01/2008", 0.1) == 828.5
+assert brbonds.bond_price(0.1246, "20/12/2006", "01/01/2009", 0) == 788.11
+assert abs(brbonds.bond_yield(828.5, 0.10, "09/01/2004", "01/01/2008") - 0.1652) < 1e-4
+
+# Coupon times of payment_dates
+t, tm = brbonds.bond_schedule("09/01/2004", "01/01/2008")
+settle = dt.date_dmy("09/01/2004")
+expected = [dt.daysbus(settle, d) / 252.0 for d in brbonds.payment_dates("09/01/2004", "01/01/2008")]
+assert t.shape == (1, 8) and np.allclose(t[0], expected)
+assert tm[0] == dt.daysbus(settle, dt.date_dmy("01/01/2008")) / 252.0
+
+# A portfolio of NTN-F and LTN on many settle dates
+rng = np.random.RandomState(0)
+n = 20000
+settles = np.datetime64("2010-01-04") + rng.randint(0, 1500, n)
+maturities = np.array(["2017-01-01", "2021-01-01", "2025-01-01", "2016-07-01"], dtype="M8[D]")[rng.randint(0, 4, n)]
+coupons = np.where(rng.rand(n) < 0.5, 0.10, 0.0)
+ytm = rng.uniform(0.08, 0.16, n)
+
+t0 = time.time()
+prices = brbonds.bond_prices(ytm, settles, maturities, coupons)
+t1 = time.time()
+yields = brbonds.bond_yields(prices, coupons, settles, maturities)
+t2 = time.time()
+print("%d bonds: prices %.0f ms, yields %.0f ms" % (n, (t1 - t0) * 1000, (t2 - t1) * 1000))
+
+for k in range(0, n, 997):
+    s, m = dt.date2str_dmy(settles[k].item()), dt.date2str_dmy(maturities[k].item())
+    assert prices[k] == brbonds.bond_price(ytm[k], s, m, coupons[k]), k
+
+# The price is rounded to cents
+assert np.abs(yields - ytm).max() < 1e-4
+assert np.array_equal(brbonds.bond_prices(yields, settles, maturities, coupons), prices)
+
+# Duration and DV01, the price change of one basis point
+a = brbonds.bond_analytics(prices[:100], coupons[:100], settles[:100], maturities[:100])
+assert np.array_equal(a["price"], prices[:100])
+zero = coupons[:100] == 0
+assert np.allclose(a["duration"][zero], brbonds.bond_schedule(settles[:100], maturities[:100])[1][zero])
+assert np.all(a["duration"][~zero] < brbonds.bond_schedule(settles[:100], maturities[:100])[1][~zero])
+
+up = brbonds.bond_yields(prices[:100], coupons[:100], settles[:100], maturities[:100])
+k = 3
+price = lambda y: brbonds.bond_prices(y, settles[k], maturities[k], coupons[k])
+bump = (price(up[k] - 1e-4)[0] - price(up[k] + 1e-4)[0]) / 2
+assert abs(bump - a["dv01"][k]) < 0.01
+
+try:
+    brbonds.bond_prices(0.1, "01/01/2009", "01/01/2008")
+    assert False
+except ValueError as err:
+    print(err)
+
+print("Ok")
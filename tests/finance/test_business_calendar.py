@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Business days calendar, m2py.finance.dtime.BusinessCalendar
+
+"""
+import random
+from datetime import datetime, timedelta
+
+from m2py.finance import dtime as dt
+
+cal = dt.get_calendar("brazil")
+print(cal)
+assert dt.get_calendar() is cal
+assert dt.calendar_names() == ["brazil", "weekends"]
+
+# Holidays of the database
+assert len(dt.brazil_holydays) == 936
+assert dt.brazil_holydays[0] == datetime(2001, 1, 1)
+assert dt.brazil_holydays[-1] == datetime(2078, 12, 25)
+
+assert not dt.isbusday(datetime(2014, 12, 25))
+assert not dt.isbusday(datetime(2014, 12, 6))
+assert dt.isbusday(datetime(2014, 12, 26))
+assert dt.isbusday(datetime(2014, 12, 25), "weekends")
+
+assert dt.daysbus(datetime(2014, 12, 1), datetime(2014, 12, 10)) == 8
+assert dt.daysbus(datetime(2014, 12, 10), datetime(2014, 12, 1)) == -8
+assert dt.daysbus(datetime(2014, 12, 6), datetime(2014, 12, 6)) == 0
+assert dt.daysaddbu(datetime(2014, 12, 24), 1) == datetime(2014, 12, 26)
+assert dt.daysaddbu(datetime(2014, 12, 26), -1) == datetime(2014, 12, 24)
+assert dt.nextbusday(datetime(2014, 12, 6)) == datetime(2014, 12, 8)
+assert dt.prevbusday(datetime(2014, 12, 7)) == datetime(2014, 12, 5)
+assert dt.nextbusday(datetime(2014, 12, 5, 10, 30)) == datetime(2014, 12, 5, 10, 30)
+
+# Same results of the day by day loops over the list of holidays
+holydays = list(dt.brazil_holydays)
+random.seed(1)
+for _ in range(300):
+    d1 = datetime(2000, 1, 1) + timedelta(days=random.randint(0, 28000))
+    d2 = d1 + timedelta(days=random.randint(0, 400))
+    n = random.randint(-30, 30)
+
+    assert dt.daysbus(d1, d2) == dt.networkdays(d1, d2, holydays), (d1, d2)
+    assert dt.isbusday(d1) == dt.isbusday(d1, holydays)
+    assert dt.daysaddbu(d1, n) == dt.daysaddbu(d1, n, holydays), (d1, n)
+    assert dt.nextbusday(d1) == dt.nextbusday(d1, holydays)
+    assert dt.prevbusday(d1) == dt.prevbusday(d1, holydays)
+
+# Named calendars
+dt.register_calendar("test", [datetime(2014, 12, 8)], start=datetime(2014, 1, 1), end=datetime(2014, 12, 31))
+assert dt.daysbus(datetime(2014, 12, 1), datetime(2014, 12, 10), "test") == 7
+assert dt.daysbus(datetime(2014, 12, 1), datetime(2014, 12, 10), dt.get_calendar("test")) == 7
+
+for date, n in [(datetime(2015, 1, 1), 0), (datetime(2014, 12, 31), 1), (datetime(2013, 12, 31), 0)]:
+    try:
+        dt.daysaddbu(date, n, "test")
+        assert False
+    except ValueError as err:
+        print(err)
+
+try:
+    dt.get_calendar("nyse")
+    assert False
+except ValueError as err:
+    print(err)
+
+print("Ok")
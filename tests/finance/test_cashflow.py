@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Cash flow matrices of pvvar, fvvar, irr and xirr
+
+"""
+import time
+
+import numpy as np
+
+from m2py.finance.finance import pvvar, fvvar, irr, xirr
+
+# Examples of the documentation
+CashFlow = [-10000, 2500, 2000, 3000, 4000]
+CFDates = ['1/12/1987', '2/14/1988', '3/03/1988', '6/14/1988', '12/1/1988']
+
+assert abs(pvvar([-10000, 2000, 1500, 3000, 3800, 5000], 0.08) - 1715.38623116) < 1e-6
+assert abs(pvvar(CashFlow, 0.09, CFDates) - 142.164804727) < 1e-6
+pv = pvvar(CashFlow, [0.07, 0.09, 0.11], CFDates)
+assert isinstance(pv, list)
+assert np.allclose(pv, [419.0136433133739, 142.16480472687726, -122.12751414382365])
+assert abs(xirr(CashFlow, ['01/12/2007', '02/14/2008', '03/03/2008', '06/14/2008', '12/01/2008']) - 0.100643783426) < 1e-10
+assert np.allclose(irr([-100000, 10000, 20000, 30000, 40000, 50000]), [0.12005761954196337])
+
+# Future value at the last date, the present value compounded
+fv = fvvar(CashFlow, 0.09, CFDates)
+days = (np.datetime64("1988-12-01") - np.datetime64("1987-01-12")).astype(int)
+assert abs(fv - pvvar(CashFlow, 0.09, CFDates) * 1.09 ** (days / 365.0)) < 1e-9
+assert abs(fvvar([-10000, 2000, 1500, 3000, 3800, 5000], 0.08) - 1715.3862311603225 * 1.08 ** 5) < 1e-9
+assert CashFlow == [-10000, 2500, 2000, 3000, 4000]     # Not reversed in place
+
+# Streams in the columns, a rate of each stream
+matrix = [[-10000, -5000], [2000, 3000], [1500, 3000]]
+assert np.allclose(pvvar(matrix, [0.08, 0.10]), [pvvar([-10000, 2000, 1500], 0.08), pvvar([-5000, 3000, 3000], 0.10)])
+assert np.allclose(pvvar(matrix, [[0.08], [0.10]]),
+                   [[pvvar(c, r) for c in ([-10000, 2000, 1500], [-5000, 3000, 3000])] for r in (0.08, 0.10)])
+assert irr(matrix) == [irr([-10000, 2000, 1500]), irr([-5000, 3000, 3000])]
+assert np.allclose(pvvar(matrix, [r[0] for r in irr(matrix)]), 0)
+
+# Many streams with their own dates
+rng = np.random.RandomState(1)
+n = 5000
+cf = np.vstack([np.full(n, -1000.0), rng.uniform(0, 400, (10, n))])
+dates = np.datetime64("2010-01-01") + np.sort(rng.randint(1, 3650, (11, n)), axis=0)
+dates[0] = np.datetime64("2010-01-01")
+
+t0 = time.time()
+rates = xirr(cf, dates)
+print("xirr of %d streams: %.2f ms" % (n, (time.time() - t0) * 1000))
+assert rates.shape == (n,) and not np.isnan(rates).any()
+assert np.abs(pvvar(cf, rates, dates)).max() < 1e-6
+
+strdates = np.datetime_as_string(dates[:, :3]).tolist()
+assert np.allclose(xirr(cf[:, :3], strdates, format="%Y-%m-%d"), rates[:3])
+k = 7
+assert abs(xirr(cf[:, k].tolist(), [str(d) for d in dates[:, k]], format="%Y-%m-%d") - rates[k]) < 1e-10
+
+# Shared dates of the streams
+shared = dates[:, 0]
+assert np.allclose(pvvar(cf[:, :4], 0.1, shared), [pvvar(cf[:, j], 0.1, shared) for j in range(4)])
+
+# Negative rates and streams without a sign change
+assert abs(xirr([-100, 50], ['01/01/2001', '01/01/2002']) + 0.5) < 1e-12
+assert np.isnan(xirr([100, 200], ['01/01/2001', '01/01/2002']))
+
+try:
+    pvvar([[-100, 1], [50, 2]], 0.1, ['01/01/2001'])
+    assert False
+except ValueError as err:
+    print(err)
+
+print("Ok")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Day count conventions over arrays of dates, m2py.finance.dtime
+
+"""
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from m2py.finance import dtime as dt
+
+# Conversion of the dates
+d = dt.datetime64([datetime(2013, 12, 1), "2014-01-02", np.datetime64("2014-01-03")])
+print(d)
+assert d.dtype == np.dtype("M8[D]")
+assert d.tolist() == [datetime(2013, 12, 1).date(), datetime(2014, 1, 2).date(), datetime(2014, 1, 3).date()]
+assert dt.datetime64("2014-01-02").ndim == 0
+
+# 30/360 conventions
+assert dt.days360(datetime(2014, 1, 31), datetime(2014, 3, 31)) == 60
+assert dt.days360(datetime(2014, 2, 28), datetime(2014, 3, 31)) == 31
+assert dt.days360e(datetime(2014, 2, 28), datetime(2014, 3, 31)) == 32
+assert dt.days360isda(datetime(2014, 1, 30), datetime(2014, 3, 31)) == 61
+assert dt.days360isda(datetime(2014, 1, 31), datetime(2014, 3, 31)) == 60
+assert dt.days360psa(datetime(2014, 2, 28), datetime(2014, 3, 31)) == 30
+assert dt.days360psa(datetime(2014, 1, 30), datetime(2014, 2, 15)) == 15
+
+# Arrays give the same values of the single dates
+random.seed(2)
+d1 = [datetime(1990, 1, 1) + timedelta(days=random.randint(0, 30000)) for _ in range(500)]
+d2 = [d + timedelta(days=random.randint(-800, 800)) for d in d1]
+
+for basis in range(14):
+    vector = dt.daysdif(d1, d2, basis)
+    assert vector.shape == (500,)
+    assert vector.tolist() == [dt.daysdif(a, b, basis) for a, b in zip(d1, d2)], basis
+
+    vector = dt.yearfrac(dt.datetime64(d1), dt.datetime64(d2), basis)
+    scalar = [dt.yearfrac(a, b, basis) for a, b in zip(d1, d2)]
+    assert np.allclose(vector, scalar, rtol=1e-15, atol=0), basis
+
+# Actual / actual, the days of every year over the length of the year
+assert dt.yearfrac(datetime(2004, 1, 1), datetime(2005, 1, 1)) == 1.0
+assert abs(dt.yearfrac("2003-06-01", "2005-03-01") - (214 / 365.0 + 1 + 59 / 365.0)) < 1e-15
+assert dt.yearfrac("2005-03-01", "2003-06-01", 8) == -dt.yearfrac("2003-06-01", "2005-03-01", 8)
+
+# Broadcasting, one start date and a schedule
+schedule = np.array(["2015-01-01", "2015-07-01", "2016-01-01"], dtype="M8[D]")
+print(dt.yearfrac("2014-12-01", schedule, 13))
+assert np.allclose(dt.yearfrac("2014-12-01", schedule, 13) * 252,
+                   [dt.daysbus(datetime(2014, 12, 1), d.astype(datetime)) for d in schedule])
+
+# Offsets of a list of dates
+dates = [datetime(2014, 12, 1), datetime(2014, 12, 10), datetime(2015, 1, 10)]
+assert dt.date2ofsset(dates) == [0, 9, 40]
+assert dt.date2offset_bu(dates) == [dt.daysbus(dates[0], x) for x in dates]
+
+try:
+    dt.daysdif(d1, d2, 14)
+    assert False
+except ValueError as err:
+    print(err)
+
+print("Ok")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Join and as-of join of Tserie objects
+
+"""
+import time
+
+import numpy as np
+
+from m2py.finance import dtime
+from m2py.finance import timeserie
+from m2py.finance.series import Dataset
+from m2py.finance.timeserie import Tserie
+
+a = Tserie(["2014-12-01", "2014-12-02", "2014-12-04", "2014-12-05"], [[1.0, 2.0, 4.0, 5.0]], headers=["x"], name="a")
+b = Tserie(["2014-12-02", "2014-12-03", "2014-12-05", "2014-12-08"], [[20.0, 30.0, 50.0, 80.0]], headers=["x"], name="b")
+
+inner = a.join(b)
+print(inner.get_table())
+assert inner.headers == ["time", "x", "x_2"]
+assert inner.time_formated() == ["2014-12-02", "2014-12-05"]
+assert inner["x"].tolist() == [2.0, 5.0] and inner["x_2"].tolist() == [20.0, 50.0]
+assert inner.name == "a"
+
+# Inner join by default, the method and the function
+assert timeserie.join([a, b]).time_formated() == inner.time_formated()
+
+outer = a.join(b, "outer")
+assert len(outer.time) == 6
+assert np.array_equal(outer["x"], [1, 2, np.nan, 4, 5, np.nan], equal_nan=True)
+assert np.array_equal(outer["x_2"], [np.nan, 20, 30, np.nan, 50, 80], equal_nan=True)
+
+left = a.join(b, "left")
+assert left.time is a.time
+assert np.array_equal(left["x_2"], [np.nan, 20, np.nan, 50], equal_nan=True)
+
+# As-of, the last observation on or before the date
+asof = a.join_asof(b)
+assert np.array_equal(asof["x_2"], [np.nan, 20, 30, 50], equal_nan=True)
+assert np.array_equal(a.join_asof(b, tolerance=0)["x_2"], [np.nan, 20, np.nan, 50], equal_nan=True)
+
+# Previous business day of the dates: 2014-12-06 (Saturday) -> 2014-12-05
+c = Tserie(["2014-12-06", "2014-12-09"], [[6.0, 9.0]], headers=["y"])
+assert c.join_asof(b, prevbusday=True)["x"].tolist() == [50.0, 80.0]
+
+try:
+    a.join(b, "right")
+    assert False
+except ValueError as err:
+    print(err)
+
+# SELIC and USD/BRL in one call, the same values of the lookups date by date
+selic = Dataset.selic
+usd2brl = Dataset.usd2brl
+t0 = time.time()
+table = timeserie.join([selic, usd2brl], "inner")
+t1 = time.time()
+merged = usd2brl.join_asof(selic, prevbusday=True)
+t2 = time.time()
+print("join %d rows %.2f ms, as-of join %d rows %.2f ms" %
+      (len(table.time), (t1 - t0) * 1000, len(merged.time), (t2 - t1) * 1000))
+assert table.headers == ["time", "rate", "factor", "VNA", "rate_2"]
+
+for k in range(0, len(table.time), 97):
+    date = table.time[k]
+    assert table["VNA"][k] == selic.get_date(date)[0][3]
+    assert table["rate_2"][k] == usd2brl.get_date(date)[0][1]
+
+for k in range(0, len(merged.time), 97):
+    date = dtime.prevbusday(merged.time[k])
+    rows = selic.date_range(np.datetime64("2000-01-01"), date)
+    expected = rows["VNA"][-1] if len(rows.time) else np.nan
+    assert np.array_equal(merged["VNA"][k], expected, equal_nan=True)
+
+print("Ok")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Bulk date parser and memoized parse_date, m2py.finance.dtime
+
+"""
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from m2py.finance import dtime as dt
+
+# Format detection, the same conventions of parse_date and parse_date2
+assert dt.detect_format("2014-12-08") == "%Y-%m-%d"
+assert dt.detect_format("08/12/2014") == "%d/%m/%Y"
+assert dt.detect_format("12/08/2014", american=True) == "%m/%d/%Y"
+assert dt.detect_format("2014-12-08 10:30:00") == "%Y-%m-%d %H:%M:%S"
+assert dt.detect_format("yesterday") is None
+
+# Prefix matches fall through to the next format
+assert dt.parse_date("2014-12-08 10:30:00") == datetime(2014, 12, 8, 10, 30)
+assert dt.dtime("08/12/2014") == datetime(2014, 12, 8)
+
+# Every fixed width format is the same as strptime
+days = [datetime(1950, 1, 1) + timedelta(days=k) for k in range(0, 40000, 7)]
+for fmt in ["%Y-%m-%d", "%Y/%m/%d", "%Y%m%d", "%d/%m/%Y", "%d-%m-%Y", "%m/%d/%Y", "%d/%m/%y"]:
+    strings = [d.strftime(fmt) for d in days]
+    american = fmt.startswith("%m")
+    expected = [datetime.strptime(s, fmt) for s in strings]
+    assert dt.parse_dates(strings, american=american) == expected, fmt
+    assert dt.parse_dates(strings, fmt) == expected, fmt
+    assert dt.parse_dates(strings, fmt, asarray=True).astype("M8[D]").tolist() == [d.date() for d in expected]
+    print("%-10s Ok" % fmt)
+
+assert dt.parse_dates(np.array(["2014-12-08", "2014-12-09"]), asarray=True).dtype == np.dtype("M8[D]")
+assert dt.parse_dates(["2014-12-08 10:30:00"], asarray=True).dtype == np.dtype("M8[s]")
+assert dt.parse_dates([]) == []
+
+# Strings that don't fit the fast path
+assert dt.parse_dates(["2014-12-08", "2014-12-9"], "%Y-%m-%d")[1] == datetime(2014, 12, 9)
+for strings in [["2014-02-30"], ["2014-12-08", "2014-13-01"], ["2014/12/08", "2014-12-08"], ["xmas"]]:
+    try:
+        dt.parse_dates(strings)
+        assert False
+    except ValueError as err:
+        print(err)
+
+# Memo cache of parse_date
+dt.parse_date.cache_clear()
+for _ in range(3):
+    dt.parse_date("08/12/2014")
+info = dt.parse_date.cache_info()
+print(info)
+assert info.hits == 2 and info.misses == 1 and info.maxsize == dt.DATE_CACHE_SIZE
+
+# Bulk parsing of a long daily series
+strings = [(datetime(1990, 1, 1) + timedelta(days=k)).strftime("%Y-%m-%d") for k in range(100000)]
+t0 = time.time()
+bulk = dt.parse_dates(strings)
+t1 = time.time()
+loop = [datetime.strptime(s, "%Y-%m-%d") for s in strings]
+t2 = time.time()
+print("parse_dates %.3f s, strptime %.3f s" % (t1 - t0, t2 - t1))
+assert bulk == loop
+
+print("Ok")
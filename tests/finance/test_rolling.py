@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Rolling windows, resampling and returns of Tserie, m2py.finance.rolling
+
+"""
+import time
+
+import numpy as np
+
+from m2py.finance import rolling
+from m2py.finance.timeserie import Tserie, cumproduct
+
+
+def naive(x, w, f):
+    out = np.full(len(x), np.nan)
+    for k in range(w - 1, len(x)):
+        out[k] = f(x[k - w + 1:k + 1])
+    return out
+
+
+# Same values of the window by window reductions
+rng = np.random.RandomState(0)
+for n in [1, 5, 17, 100]:
+    x = rng.normal(size=n)
+    for w in [1, 2, 3, 5, 16, 17]:
+        for function, f in [(rolling.rolling_sum, np.sum), (rolling.rolling_mean, np.mean),
+                            (rolling.rolling_min, np.min), (rolling.rolling_max, np.max),
+                            (rolling.rolling_prod, np.prod),
+                            (rolling.rolling_std, lambda v: np.std(v, ddof=1) if len(v) > 1 else np.nan)]:
+            assert np.allclose(function(x, w), naive(x, w, f), rtol=1e-10, atol=1e-12, equal_nan=True), \
+                (function.__name__, n, w)
+print("Rolling functions Ok")
+
+assert np.array_equal(rolling.rolling_sum([1, 2, 3, 4], 2), [np.nan, 3, 5, 7], equal_nan=True)
+assert np.isnan(rolling.rolling_max([1, np.nan, 3, 4, 5], 2)[1:3]).all()
+assert rolling.rolling_max([1, np.nan, 3, 4, 5], 2)[4] == 5
+
+# A large mean doesn't cancel the small deviations
+x = 1e8 + rng.normal(size=1000) * 1e-3
+assert np.allclose(rolling.rolling_std(x, 50)[49:], naive(x, 50, lambda v: np.std(v, ddof=1))[49:], rtol=1e-6)
+
+for w in [0, -1, 2.5]:
+    try:
+        rolling.rolling_sum([1.0, 2.0], w)
+        assert False
+    except ValueError:
+        pass
+
+# Tserie, 10 years of daily factors
+days = np.arange("2005-01-01", "2015-01-01", dtype="M8[D]")
+rates = 0.10 + 0.02 * np.sin(np.arange(days.size) / 200.0)
+factors = (1 + rates) ** (1 / 365.0)
+ts = Tserie(days, [factors, 1000.0 * np.cumprod(factors)], headers=["factor", "VNA"], name="test")
+
+returns = ts.pct_change()
+assert np.isnan(returns["VNA"][0])
+assert np.allclose(returns["VNA"][1:], factors[1:] - 1, rtol=1e-9)
+assert np.allclose(ts.pct_change(5)["VNA"][5:], ts["VNA"][5:] / ts["VNA"][:-5] - 1)
+assert np.isnan(ts.pct_change(days.size)["VNA"]).all()
+
+for periods in [0, -1, 1.5]:
+    try:
+        ts.pct_change(periods)
+        assert False
+    except ValueError as err:
+        print(err)
+assert np.allclose(Tserie(days, [factors], headers=["factor"]).cumprod()["factor"], ts["VNA"] / 1000.0)
+assert cumproduct([1.5, 2.0, 3.0]) == [1.5, 3.0, 9.0]
+
+t0 = time.time()
+vol = returns.rolling(252).std()
+print("252 days rolling std of %d rows: %.2f ms" % (days.size, (time.time() - t0) * 1000))
+assert vol.headers == ts.headers and vol.time is ts.time
+assert np.isnan(vol["VNA"][251]) and not np.isnan(vol["VNA"][252])
+assert abs(vol["VNA"][1000] - np.std(returns["VNA"][749:1001], ddof=1)) < 1e-12
+
+assert ts.rolling(30).max()["factor"][100] == factors[71:101].max()
+assert abs(ts.rolling(30).prod()["factor"][100] - ts["VNA"][100] / ts["VNA"][70]) < 1e-12
+
+# Resampling
+monthly = ts.resample("M", how="prod")
+assert len(monthly.time) == 120
+assert str(monthly.time[0]) == "2005-01-31" and str(monthly.time[-1]) == "2014-12-31"
+assert abs(monthly["factor"][0] - np.prod(factors[:31])) < 1e-12
+
+yearly = ts.resample("Y")
+assert yearly["VNA"].tolist() == [ts.get_date("%d-12-31" % y)[0][2] for y in range(2005, 2015)]
+assert ts.resample("Q", how="count")["factor"][0] == 90
+assert ts.resample("Y", how=np.median)["factor"][0] == np.median(factors[:365])
+
+weekly = ts.resample("W", how="first")
+# 2005-01-01 and 02 are a Saturday and a Sunday, the weeks start on Monday
+assert str(weekly.time[0]) == "2005-01-02" and str(weekly.time[1]) == "2005-01-09"
+
+try:
+    ts.resample("D")
+    assert False
+except ValueError as err:
+    print(err)
+
+print("Ok")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Cached coupon schedules, m2py.finance.schedule
+
+"""
+import time
+
+import numpy as np
+
+from m2py.finance import bonds, brbonds, schedule
+from m2py.finance import dtime as dt
+
+D = lambda dates: np.array(dates, dtype="M8[D]")
+
+# NTN-F of the Tesouro Nacional, payment_dates_br
+assert np.array_equal(schedule.coupons("09/01/2004", "01/01/2008"),
+                      D(["2004-07-01", "2005-01-01", "2005-07-01", "2006-01-01",
+                         "2006-07-01", "2007-01-01", "2007-07-01", "2008-01-01"]))
+assert list(map(dt.date2str_dmy, brbonds.payment_dates("9/1/2004", "1/1/2008"))) == \
+    ["30/06/2004", "01/01/2005", "01/07/2005", "01/01/2006", "01/07/2006", "01/01/2007", "01/07/2007", "01/01/2008"]
+
+# A settle date on a coupon date, the coupon isn't paid
+assert schedule.coupons("01/07/2007", "01/01/2008").tolist() == schedule.coupons("02/07/2007", "01/01/2008").tolist()
+assert len(schedule.coupons("01/07/2007", "01/01/2008")) == 1
+
+# The schedule is built once and shared
+schedule.cache_clear()
+full = schedule.coupon_dates("01/01/2017")
+assert schedule.coupon_dates(np.datetime64("2017-01-01")) is full
+assert not full.flags.writeable
+for day in range(0, 3000, 7):
+    dates = schedule.coupons(np.datetime64("2006-01-01") + day, "01/01/2017")
+    assert dates.base is full or dates.base is full.base
+info = schedule.cache_info()
+assert info.misses == 1 and info.hits > 400
+
+# Conventions
+assert np.array_equal(schedule.coupons("01/01/2004", "31/08/2005", 4, "backward"),
+                      D(["2004-02-29", "2004-05-31", "2004-08-31", "2004-11-30", "2005-02-28",
+                         "2005-05-31", "2005-08-31"]))
+# 15/05/2004 and 15/11/2009 are a Saturday and a Sunday
+assert str(schedule.coupons("01/01/2004", "15/05/2010", 2, "following")[0]) == "2004-05-17"
+assert str(schedule.coupons("01/01/2009", "15/05/2010", 2, "preceding")[1]) == "2009-11-13"
+assert str(schedule.coupons("01/01/2004", "31/07/2010", 12, "modified_following")[6]) == "2004-07-30"
+
+for args in [(5,), (2, "unknown")]:
+    try:
+        schedule.coupon_dates("01/01/2008", *args)
+        assert False
+    except ValueError as err:
+        print(err)
+
+# The prices of a bond on many settle dates
+settles = np.datetime64("2008-01-02") + np.arange(2000)
+t0 = time.time()
+prices = brbonds.bond_prices(0.12, settles, "01/01/2017", 0.10)
+print("NTN-F prices of %d settle dates: %.1f ms" % (settles.size, (time.time() - t0) * 1000))
+for k in range(0, settles.size, 331):
+    assert prices[k] == brbonds.bond_price(0.12, dt.date2str_dmy(settles[k].item()), "01/01/2017", 0.10)
+
+# Bonds of many maturities share one cached schedule
+rng = np.random.RandomState(0)
+settles = np.datetime64("2010-01-04") + rng.randint(0, 1500, 5000)
+maturities = np.datetime64("2016-01-01") + rng.randint(0, 9000, 5000)
+schedule.cache_clear()
+t, tm = brbonds.bond_schedule(settles, maturities)
+assert schedule.cache_info().currsize == 1
+for k in range(0, settles.size, 499):
+    tk, tmk = brbonds.bond_schedule(settles[k], maturities[k])
+    n = tk.shape[1]
+    assert np.array_equal(t[k, :n], tk[0]) and np.isnan(t[k, n:]).all() and tm[k] == tmk[0]
+
+# Cash flows of the bonds module
+assert bonds.bond_cashflow(954.53, 0.080, 2, 2) == ([0.0, 0.5, 1.0, 1.5, 2.0], [-954.53, 40.0, 40.0, 40.0, 1040.0])
+assert abs(bonds.bond_price(0.06, 0.08, 4, 2) - 1073.3996708972618) < 1e-9
+assert abs(bonds.bond_price(bonds.bond_yield(954.53, 0.080, 2, 2), 0.08, 2, 2) - 954.53) < 1e-3
+
+print("Ok")
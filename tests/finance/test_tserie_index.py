@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+datetime64 time index of m2py.finance.timeserie.Tserie
+
+"""
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from m2py.finance.timeserie import Tserie
+
+# 20 years of daily values
+dates = [datetime(1995, 1, 1) + timedelta(days=k) for k in range(7305)]
+values = np.arange(7305, dtype=float)
+ts = Tserie(dates, [values, 2 * values], headers=["a", "b"], name="test")
+
+assert ts.time.dtype == np.dtype("M8[D]")
+assert ts.serie_type == "tserie"
+assert ts.timelenght() == 7304
+assert ts.start() == (datetime(1995, 1, 1), 0.0, 0.0)
+assert ts.end() == (datetime(2014, 12, 31), 7304.0, 14608.0)
+
+# Ranges are views, the dates in any format
+r = ts.date_range("01/12/2014", "2014-12-10")
+print(r.time_formated())
+assert len(r.time) == 10 and r.headers == ["time", "a", "b"]
+assert r.time_formated()[0] == "2014-12-01" and r.time_formated()[-1] == "2014-12-10"
+assert np.shares_memory(r["a"], ts["a"]) and np.shares_memory(r.time, ts.time)
+assert len(ts.date_range(datetime(2020, 1, 1), datetime(2021, 1, 1)).time) == 0
+assert len(ts.date_range(np.datetime64("1990-01-01"), "05/01/1995").time) == 5
+
+# Single dates
+assert ts.get_date("08/12/2014") == [(datetime(2014, 12, 8), 7281.0, 14562.0)]
+assert ts.get_date(datetime(2014, 12, 8, 15, 30)) == ts.get_date("2014-12-08")
+assert ts.get_date("25/12/2030") == []
+assert ts.get_date("25/12/2014", prevbusday=True)[0][0] == datetime(2014, 12, 24)
+assert ts.index("2014-12-08") == 7281 and ts.index("2014-12-08", "right") == 7282
+
+# Unsorted input is sorted with its rows
+u = Tserie(["2014-01-03", "2014-01-01", "2014-01-02"], [[3.0, 1.0, 2.0]], headers=["x"])
+assert u["x"].tolist() == [1.0, 2.0, 3.0]
+assert u.times() == [datetime(2014, 1, 1), datetime(2014, 1, 2), datetime(2014, 1, 3)]
+
+# Range serie, offsets from the first date
+rs = ts.date_range("01/12/2014", "10/12/2014").time_range_serie()
+assert rs.serie_type == "rserie" and rs.time.tolist() == list(range(10))
+assert rs.date_range("01/12/2014", "10/12/2014") is None
+
+# A range query doesn't depend on the size of the serie
+t0 = time.time()
+for _ in range(1000):
+    ts.date_range("01/12/2014", "10/12/2014")
+print("date_range %.1f us" % ((time.time() - t0) * 1000.0))
+
+print("Ok")
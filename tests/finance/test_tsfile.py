@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Columnar binary time serie files, m2py.finance.tsfile and Tserie.to_bin
+
+"""
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from m2py.finance import tsfile
+from m2py.finance import series
+from m2py.finance.timeserie import Tserie
+
+tmpdir = tempfile.mkdtemp()
+filename = os.path.join(tmpdir, "test.tsb")
+
+days = np.arange("2014-01-01", "2014-03-01", dtype="M8[D]")
+values = np.arange(len(days), dtype=float)
+ts = Tserie(days, [values, values ** 2], headers=["x", "x2"], name="Test", description="Squares",
+            dataprovider="m2py", url="http://localhost")
+ts.to_bin(filename)
+
+# Round trip, the columns are mapped to memory
+new = Tserie.from_bin(filename)
+assert isinstance(new["x"], np.memmap) and isinstance(new.time, np.memmap)
+assert new.time.dtype == np.dtype("M8[D]")
+assert np.array_equal(new.time, ts.time) and np.array_equal(new["x2"], ts["x2"])
+assert new.headers == ts.headers and new.name == "Test" and new.url == "http://localhost"
+assert not isinstance(Tserie.from_bin(filename, mmap=False)["x"], np.memmap)
+
+header = tsfile.read_header(filename)
+print(header)
+assert header["rows"] == 59 and header["capacity"] == 59 + tsfile.MIN_FREE_ROWS
+assert header["offset"] % tsfile.ALIGN == 0
+
+# Appending in place, the data offset and the capacity don't change
+size = os.path.getsize(filename)
+more = np.arange("2014-03-01", "2014-03-11", dtype="M8[D]")
+assert tsfile.append(filename, more, [np.ones(10), 2 * np.ones(10)]) == 69
+assert os.path.getsize(filename) == size
+assert tsfile.read_header(filename)["offset"] == header["offset"]
+new = Tserie.from_bin(filename)
+assert len(new.time) == 69 and new.time[-1] == np.datetime64("2014-03-10") and new["x2"][-1] == 2.0
+assert new.get_date("2014-02-28")[0][1] == 58.0
+
+# Growing past the capacity rewrites the file
+more = np.arange("2014-03-11", "2015-03-11", dtype="M8[D]")
+assert tsfile.append(filename, more, [np.zeros(365), np.zeros(365)]) == 434
+header = tsfile.read_header(filename)
+assert header["rows"] == 434 and header["capacity"] > 434 and header["name"] == "Test"
+assert Tserie.from_bin(filename).end()[1:] == (0.0, 0.0)
+
+# Invalid appends leave the file unchanged
+for t, data in [(np.array(["2014-05-01"], dtype="M8[D]"), [[1.0], [1.0]]),
+                (np.array(["2016-01-02", "2016-01-01"], dtype="M8[D]"), [[1.0, 1.0], [1.0, 1.0]]),
+                (np.array(["2016-01-01"], dtype="M8[D]"), [[1.0]])]:
+    try:
+        tsfile.append(filename, t, data)
+        assert False
+    except ValueError as err:
+        print(err)
+assert tsfile.read_header(filename)["rows"] == 434
+
+# Builtin datasets, parsed once and mapped to memory afterwards
+for dataset in series.datasets:
+    t0 = time.time()
+    csv = series.load(dataset, cache=False)
+    t1 = time.time()
+    series.load(dataset)
+    t2 = time.time()
+    serie = series.load(dataset)
+    t3 = time.time()
+    print("%-8s %5d rows, csv %.1f ms, binary %.1f ms" % (dataset, len(serie.time), (t1 - t0) * 1000, (t3 - t2) * 1000))
+    assert isinstance(serie.data[0], np.memmap)
+    assert np.array_equal(serie.time, csv.time) and serie.headers == csv.headers
+    assert all(np.array_equal(a, b) for a, b in zip(serie.data, csv.data))
+
+shutil.rmtree(tmpdir)
+print("Ok")
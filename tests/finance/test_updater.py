@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Incremental update of the datasets, m2py.finance.series.updater, with a
+local stand-in of the SELIC service
+
+"""
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+import numpy as np
+
+from m2py.finance import series
+from m2py.finance import tsfile
+from m2py.finance.series import updater
+
+# Daily rates published by the service, the last day of the dataset first
+RATES = [("12/12/2014", "11,65"), ("15/12/2014", "11,65"), ("16/12/2014", "11,65"),
+         ("17/12/2014", "11,65"), ("18/12/2014", "11,65"), ("19/12/2014", "11,65")]
+
+requests = []
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode("ascii"))
+        requests.append((form["dataInicial"][0], form["dataFinal"][0]))
+        start = datetime.strptime(form["dataInicial"][0], "%d/%m/%Y")
+        end = datetime.strptime(form["dataFinal"][0], "%d/%m/%Y")
+
+        lines = ["Taxa SELIC", "Data;Taxa (% a.a.);Fator diario"]
+        lines += ["%s;%s;1,00043739" % (d, r) for d, r in RATES
+                  if start <= datetime.strptime(d, "%d/%m/%Y") <= end]
+        body = "\r\n".join(lines).encode("latin-1")
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = HTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+fetcher = updater.SelicFetcher("http://127.0.0.1:%d/selic" % server.server_port, timeout=10)
+
+tmpdir = tempfile.mkdtemp()
+shutil.copy(os.path.join(series.datasets_dir, "selic.csv"), tmpdir)
+csvfile = os.path.join(tmpdir, "selic.csv")
+
+old = series.load("selic", directory=tmpdir)
+print(old.end())
+
+# Only the missing days are fetched and appended
+size = os.path.getsize(csvfile)
+assert updater.update("selic", "17/12/2014", fetcher, tmpdir) == 3
+print(requests)
+assert requests == [("12/12/2014", "17/12/2014")]
+assert os.path.getsize(csvfile) > size
+
+new = series.load("selic", directory=tmpdir)
+assert isinstance(new.data[0], np.memmap)     # The binary file is up to date
+assert len(new.time) == len(old.time) + 3
+assert str(new.time[-1]) == "2014-12-17"
+
+# The same values of a csv file parsed from scratch
+csv = series.load("selic", cache=False, directory=tmpdir)
+assert np.array_equal(csv.time, new.time)
+assert all(np.allclose(a, b, rtol=1e-15) for a, b in zip(csv.data, new.data))
+
+# VNA continues the serie, VNA[k] = VNA[k - 1] * factor[k - 1]
+vna, factor = new["VNA"], new["factor"]
+assert np.allclose(vna[-3:], vna[-4:-1] * factor[-4:-1], rtol=1e-14)
+assert factor[-1] == round((1 + 0.1165) ** (1 / 252.0), 8)
+
+# Nothing new
+assert updater.update("selic", "17/12/2014", fetcher, tmpdir) == 0
+assert updater.update("selic", "19/12/2014", fetcher, tmpdir) == 2
+assert tsfile.read_header(os.path.join(tmpdir, "selic.tsb"))["rows"] == len(old.time) + 5
+
+# A revised observation stops the update
+RATES[-1] = ("19/12/2014", "11,75")
+RATES.append(("22/12/2014", "11,65"))
+try:
+    updater.update("selic", "22/12/2014", fetcher, tmpdir)
+    assert False
+except ValueError as err:
+    print(err)
+assert len(series.load("selic", directory=tmpdir).time) == len(old.time) + 5
+
+server.shutdown()
+shutil.rmtree(tmpdir)
+print("Ok")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Lazy Stream pipelines, pyhof.Stream
+
+"""
+import tracemalloc
+
+import numpy as np
+
+import pyhof
+from pyhof import List, Stream, hof
+
+square = lambda x: x ** 2
+odd = lambda x: x % 2
+
+assert Stream(range(10)).map(square).filter(odd).to_list() == [1, 9, 25, 49, 81]
+assert Stream(range(10)).map(square).filter(odd).reduce(lambda a, b: a + b) == 165
+assert Stream(range(10)).map(square).filter(odd).sum() == 165
+
+# Consecutive maps and filters are a single pass
+s = Stream(range(10)).map(square).filter(odd).map(str)
+assert len(s.steps) == 3 and s.iterable == range(10)
+assert s.to_list() == ["1", "9", "25", "49", "81"]
+
+# Nothing is computed before a terminal operation
+calls = []
+s = Stream(range(5)).map(lambda x: calls.append(x) or x)
+assert calls == []
+assert s.first() == 0 and calls == [0]
+
+assert Stream(range(10)).take_while(lambda x: x < 4).to_list() == [0, 1, 2, 3]
+assert Stream(range(10)).drop_while(lambda x: x < 7).to_list() == [7, 8, 9]
+assert Stream(range(5)).sliding_window(3).to_list() == [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+assert Stream(range(5)).chunk(2).to_list() == [(0, 1), (2, 3), (4,)]
+assert Stream([1, 3, 2, 4, 5]).groupby(odd).to_list() == [(1, [1, 3]), (0, [2, 4]), (1, [5])]
+assert Stream("abc").enumerate(1).to_list() == [(1, "a"), (2, "b"), (3, "c")]
+assert Stream(range(3)).zip("ab").to_list() == [(0, "a"), (1, "b")]
+assert Stream(range(4)).accumulate().to_list() == [0, 1, 3, 6]
+assert Stream.count(1).map(square).drop(2).take(3).to_list() == [9, 16, 25]
+assert Stream.iterate(lambda x: 2 * x, 1).take(5).to_list() == [1, 2, 4, 8, 16]
+
+# The Streams of a list can be consumed again
+for s in [Stream([1, 2, 3]).take(2), Stream([1, 2, 3]).map(square).take_while(lambda x: x < 5),
+          Stream([1, 2, 3]).drop_while(lambda x: x < 2), Stream([1, 2, 3]).enumerate().zip("abc"),
+          Stream([1, 2, 3]).groupby(odd).chain([4]), Stream([1, 2, 3]).accumulate().sliding_window(2),
+          Stream([1, 2, 3]).chunk(2), Stream.iterate(square, 2).take(3), Stream.count().take(3)]:
+    assert s.to_list() == s.to_list() != []
+
+# An iterator is consumed once
+s = Stream(iter([1, 2, 3])).take(2)
+assert s.to_list() == [1, 2] and s.to_list() == [3]
+
+x = Stream(range(5)).map(float).to_array()
+assert x.dtype == float and np.array_equal(x, [0, 1, 2, 3, 4])
+
+for op in [Stream(range(5)).sliding_window, Stream(range(5)).chunk]:
+    try:
+        op(0)
+        assert False
+    except ValueError as err:
+        print(err)
+
+# The memory of a moving average doesn't grow with the size of the stream
+def peak(n):
+    tracemalloc.start()
+    total = Stream.count().take(n).map(float).sliding_window(20).map(lambda w: sum(w) / 20).sum()
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return total, size
+
+small, large = peak(10 ** 3)[1], peak(10 ** 5)[1]
+print("peak memory of the moving average: %d bytes, 1000 values, %d bytes, 100000 values" % (small, large))
+assert large < 2 * small + 10000
+
+# List and hof
+lst = List([1, 2, 3])
+assert lst.reverse().lst == [3, 2, 1] and lst.lst == [1, 2, 3]
+assert lst.stream().map(square).to_list() == [1, 4, 9]
+assert hof.sliding_window(iter(range(4)), 2) == [(0, 1), (1, 2), (2, 3)]
+assert hof.take_while(lambda x: x < 3, [1, 2, 3, 1]) == [1, 2]
+assert hof.take_while(lambda x: x < 3, [1, 2]) == [1, 2]
+assert hof.drop_while(lambda x: x < 3, [1, 2, 3, 1]) == [3, 1]
+assert hof.append([1, 2, 3], ["a", "b"], [4, 5, 6]) == [1, 2, 3, "a", "b", 4, 5, 6]
+assert pyhof.X is hof.X
+
+print("Ok")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Table interpolation, m2py.numerical.numerical.Interpolator
+
+"""
+import time
+
+import numpy as np
+
+from m2py.numerical.numerical import Interpolator, interpol, interpol2
+
+T = [5.0, 10.0, 15.0, 20.0, 25.0]
+P = [0.8721, 1.2276, 1.705, 2.339, 3.169]
+V = [147.118, 106.377, 77.925, 57.79, 43.36]
+
+# Linear, the same values of the linear scan
+print(interpol(6.45, T, P))
+assert abs(interpol(6.45, T, P) - 0.975195) < 1e-12
+assert interpol(10.0, T, P) == 1.2276
+assert interpol(5.0, T, P) == 0.8721 and interpol(25.0, T, P) == 3.169
+
+y = interpol2(12.0, T, [P, V])
+assert isinstance(y, list) and len(y) == 2
+assert abs(y[1] - (106.377 + (77.925 - 106.377) * 0.4)) < 1e-12
+
+# The bisection path of interpol for a scalar x, the same values of Interpolator
+for extrapolate in ["linear", "clip", "nan"]:
+    for xk in [-3.0, 5.0, 6.45, 12, np.float64(17.5), np.array(25.0), 31.0, float("nan")]:
+        y, z = interpol(xk, T, P, extrapolate=extrapolate), Interpolator(T, [P], extrapolate=extrapolate)(xk)[0]
+        assert (np.isnan(y) and np.isnan(z)) or abs(y - z) < 1e-15, (extrapolate, xk)
+        y2 = interpol2(xk, np.array(T), [P, V], extrapolate=extrapolate)
+        assert np.allclose(y2, Interpolator(T, [P, V], extrapolate=extrapolate)(xk), rtol=1e-15, equal_nan=True)
+try:
+    interpol(40.0, T, P, extrapolate="raise")
+    assert False
+except ValueError as err:
+    print(err)
+
+# O(log n) scalar lookups without preprocessing the table
+X = np.linspace(0, 400, 80).tolist()
+Y = [x ** 1.5 for x in X]
+t0 = time.time()
+for _ in range(20000):
+    interpol(123.4, X, Y)
+print("interpol of a scalar, 80 rows: %.2f us" % ((time.time() - t0) / 20000 * 1e6))
+
+# Vector and scalar paths agree
+x = np.linspace(0.0, 30.0, 61)
+for kind in ["linear", "cubic", "loglinear"]:
+    for extrapolate in ["linear", "clip", "nan"]:
+        table = Interpolator(T, [P, V], kind, extrapolate)
+        vector = table(x)
+        assert vector[0].shape == x.shape
+        for k, xk in enumerate(x):
+            scalar = table(xk)
+            for c in range(2):
+                assert (np.isnan(scalar[c]) and np.isnan(vector[c][k])) or \
+                    abs(scalar[c] - vector[c][k]) < 1e-12 * abs(scalar[c]), (kind, extrapolate, xk)
+        print("%-10s %-7s Ok" % (kind, extrapolate))
+
+# Nodes are reproduced by every mode
+for kind in ["linear", "cubic", "loglinear"]:
+    assert np.allclose(Interpolator(T, [P], kind)(T)[0], P, rtol=1e-14)
+
+# Extrapolation policies
+table = Interpolator(T, [P])
+assert abs(table(30.0)[0] - (3.169 + (3.169 - 2.339))) < 1e-12
+assert Interpolator(T, [P], extrapolate="clip")(30.0) == [3.169]
+assert np.isnan(Interpolator(T, [P], extrapolate="nan")(0.0)[0])
+assert np.isnan(Interpolator(T, [P], extrapolate="nan")([0.0, 6.0])[0][0])
+try:
+    Interpolator(T, [P], extrapolate="raise")([6.0, 40.0])
+    assert False
+except ValueError as err:
+    print(err)
+
+# Log-linear is exact for exponentials
+X = np.linspace(0, 10, 11)
+table = Interpolator(X, [np.exp(0.3 * X)], "loglinear")
+assert abs(table(3.7)[0] - np.exp(0.3 * 3.7)) < 1e-12
+
+# Monotone cubic has no overshoot on a step
+X = [0.0, 1.0, 2.0, 3.0, 4.0]
+Y = [0.0, 0.0, 1.0, 1.0, 1.0]
+y = Interpolator(X, [Y], "cubic")(np.linspace(0, 4, 401))[0]
+assert y.min() >= 0.0 and y.max() <= 1.0 and np.all(np.diff(y) >= -1e-15)
+
+# Smooth data, the slopes are flattened at the extremum of sin(x)
+X = np.linspace(0, 3, 31)
+error = np.max(np.abs(Interpolator(X, [np.sin(X)], "cubic")(np.linspace(0, 3, 301))[0] - np.sin(np.linspace(0, 3, 301))))
+print("Cubic error sin(x), h = 0.1: %.2e" % error)
+assert error < 2e-3
+
+# Decreasing columns and selected columns
+table = Interpolator(T[::-1], [P[::-1], V[::-1]])
+assert table(6.45, columns=[1]) == [Interpolator(T, [V])(6.45)[0]]
+
+# Invalid tables
+for args in [([1.0, 1.0, 2.0], [[1, 2, 3]]), ([1.0], [[1.0]]), ([1.0, 2.0], [[1.0, 2.0, 3.0]])]:
+    try:
+        Interpolator(*args)
+        assert False
+    except ValueError:
+        pass
+try:
+    Interpolator(T, [[1.0, -1.0, 2.0, 3.0, 4.0]], "loglinear")
+    assert False
+except ValueError:
+    pass
+
+print("Ok")
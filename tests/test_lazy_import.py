@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Lazy imports of m2py and m2py.finance.series, every check runs in a new
+interpreter
+
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def run(code):
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout.strip()
+
+
+# Importing m2py doesn't load numpy, tabulate or the subpackages
+print(run("import sys, m2py; print(sorted(m for m in ('numpy', 'tabulate', 'm2py.misc.units', 'm2py.thermo') "
+          "if m in sys.modules))"))
+assert run("import sys, m2py; print('numpy' in sys.modules or 'm2py.misc.units' in sys.modules)") == "False"
+
+# The attributes are imported on the first access
+assert run("import m2py; print(m2py.units.__name__, m2py.unitfactor is m2py.units.factor)") == "m2py.misc.units True"
+assert run("import m2py; print(m2py.thermo.__name__)") == "m2py.thermo"
+assert run("from m2py import constants; print(constants.__name__)") == "m2py.misc.constants"
+assert run("import m2py, numpy; print(m2py.EPS == numpy.spacing(1), m2py.sin is numpy.sin, m2py.atan is numpy.arctan)") \
+    == "True True True"
+assert run("import m2py; print(round(m2py.sind(90), 12), round(m2py.atand(1), 12))") == "1.0 45.0"
+assert run("import m2py\ntry:\n    m2py.no_such_attribute\nexcept AttributeError:\n    print('Ok')") == "Ok"
+
+# The star import exports the lazy names, not the helper modules
+assert run("from m2py import *; print(np.__name__, sin is np.sin, units.__name__, unitfactor is units.factor, "
+           "constants.__name__, linspace(0, 1, 3).tolist())") == \
+    "numpy True m2py.misc.units True m2py.misc.constants [0.0, 0.5, 1.0]"
+assert run("from m2py import *; print([n for n in ('sys', 'import_module', 'utils') if n in dir()])") == "[]"
+
+# Datasets are read on the first access, matplotlib is imported only to plot
+code = """
+import sys
+import m2py.finance.series as series
+print('matplotlib' in sys.modules, 'm2py.finance.timeserie' in sys.modules)
+selic = series.Dataset.selic
+print(series.Dataset.selic is selic, type(selic).__name__, 'matplotlib' in sys.modules)
+"""
+print(run(code))
+assert run(code).split() == ["False", "False", "True", "Tserie", "False"]
+print("Ok")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Columnar table loader with the .npz cache, m2py.numerical.numerical.load_table
+
+"""
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from m2py.numerical.numerical import load_table, read_table
+
+data = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "m2py", "thermo", "data")
+folder = tempfile.mkdtemp()
+filename = os.path.join(folder, "saturated_steam.txt")
+shutil.copy(os.path.join(data, "saturated_steam.txt"), filename)
+
+# Same columns than read_table
+old = read_table(filename)
+new = load_table(filename, cache=True)
+assert new.headers == old.headers
+for h in old.headers:
+    assert new[h].dtype == np.float64 and new[h].flags["C_CONTIGUOUS"]
+    assert new[h].tolist() == old[h], h
+print(new.headers)
+print(new["T"][:5])
+
+# Loaded from the cache
+assert os.path.exists(filename + ".npz")
+t = time.time()
+cached = load_table(filename, cache=True)
+print("Cached load %.2f ms" % ((time.time() - t) * 1000))
+assert cached.headers == new.headers
+for h in new.headers:
+    assert np.array_equal(cached[h], new[h])
+
+# The cache follows the source file
+with open(filename, "a") as fp:
+    fp.write("375,   22000,  0.00295,    0.0005, 0.00345,    1900,   100,    2000,   1950,   140,    2090,   4.1,    0.2,    4.3,\n")
+changed = load_table(filename, cache=True)
+assert changed["T"][-1] == 375 and len(changed["T"]) == len(new["T"]) + 1
+
+# Damaged cache
+with open(filename + ".npz", "wb") as fp:
+    fp.write(b"garbage")
+assert np.array_equal(load_table(filename, cache=True)["P"], changed["P"])
+
+# No cache, by default small files are parsed every time
+os.remove(filename + ".npz")
+load_table(filename, cache=False)
+load_table(filename)
+assert not os.path.exists(filename + ".npz")
+
+shutil.rmtree(folder)
+print("Ok")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Vectorized root finding, m2py.numerical.roots
+
+"""
+import time
+
+import numpy as np
+
+from m2py.numerical.roots import vbrent, villinois, vnraphson
+
+# 100000 equations x**3 = c in one call
+c = np.linspace(1, 1000, 100000)
+cubic = lambda x: x ** 3 - c
+
+for solver in (vbrent, villinois):
+    t0 = time.time()
+    x, it, error = solver(cubic, 0, 11)
+    print("%s: %d equations, %.1f ms, %d iterations" % (solver.__name__, c.size, (time.time() - t0) * 1000, it.max()))
+    assert np.allclose(x, np.cbrt(c), rtol=1e-9, atol=0)
+    assert it.max() < 30
+
+x, it, error = vnraphson(cubic, lambda x: 3 * x ** 2, np.full(c.size, 10.0))
+assert np.allclose(x, np.cbrt(c), rtol=1e-12, atol=0)
+
+# Converged equations stop, the iterations are counted per equation
+x, it, error = vbrent(lambda x: x ** 2 - np.array([0.0, 0.25, 0.3]), 0, 1)
+assert np.allclose(x, np.sqrt([0.0, 0.25, 0.3])) and it[0] == 0 and it[2] > 1
+
+# exp(-x) = 3log(x), NaN without a sign change
+f = lambda x: np.exp(-x) - 3 * np.log(x)
+a, b = np.array([0.1, 2.0, 0.5]), np.array([1.5, 3.0, 5.0])
+for solver in (vbrent, villinois):
+    x, it, error = solver(f, a, b)
+    assert abs(x[0] - 1.1154480188) < 1e-8 and abs(x[2] - x[0]) < 1e-9 and np.isnan(x[1])
+
+# Newton steps out of the bracket are bisections
+x, it, error = vnraphson(lambda x: np.arctan(x - 0.7), lambda x: 1 / (1 + (x - 0.7) ** 2), np.full(2, 10.0))
+assert not np.isfinite(x).all()
+x, it, error = vnraphson(lambda x: np.arctan(x - 0.7), lambda x: 1 / (1 + (x - 0.7) ** 2), np.full(2, 10.0), a=-20, b=20)
+assert np.allclose(x, 0.7)
+
+# Roots at the ends of the intervals and a multiple root
+x, it, error = vbrent(lambda x: x, np.array([0.0, -1.0]), np.array([1.0, 0.0]))
+assert np.array_equal(x, [0.0, 0.0]) and not it.any()
+x, it, error = vbrent(lambda x: (x - 1) ** 9, -0.5, np.full(1, 3.0))
+assert abs(x[0] - 1) < 1e-10
+
+print("Ok")
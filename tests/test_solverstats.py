@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Statistics of the solvers, m2py.numerical.solverstats
+
+"""
+import time
+from math import exp, log
+
+import numpy as np
+
+from m2py.numerical import roots, roots2, solverstats
+
+f = lambda x: exp(-x) - 3 * log(x)
+df = lambda x: -exp(-x) - 3 / x
+
+# Nothing is recorded by default
+assert solverstats._active is None
+roots.nraphson(f, df, 1.0)
+
+with solverstats.record() as stats:
+    x, it, error = roots.nraphson(f, df, 1.0, tol=1e-10)
+    roots.steffenssen(f, 1.0, tol=1e-10, maxit=200)
+    roots.bissection(f, 0.1, 1.5, tol=1e-8)
+    roots2.newton_solver(f, df)(1.0, tol=1e-10)
+    roots2.bissection_solver(f)(0.1, 1.5, tol=1e-8)
+    try:
+        roots2.newton_solver(f, df)(1.0, itmax=2, tol=1e-15)
+        assert False
+    except Exception:
+        pass
+
+# No iterations, the root isn't found
+with solverstats.record() as empty:
+    for solver, guesses in [(roots2.newton_solver(f, df), (1.0,)), (roots2.bissection_solver(f), (0.1, 1.5))]:
+        try:
+            solver(*guesses, itmax=0)
+            assert False
+        except Exception as err:
+            assert str(err) == "Root not found"
+assert [r["iterations"] for r in empty.records] == [0, 0]
+
+assert solverstats._active is None
+print(stats.summary()["nraphson"])
+
+assert [r["solver"] for r in stats.records] == \
+    ["nraphson", "steffenssen", "bissection", "newton_solver", "bissection_solver", "newton_solver"]
+record = stats.records[0]
+assert record["iterations"] == it and record["evaluations"] == 2 * it and record["converged"]
+assert record["time"] > 0 and record["residual"] == error
+
+summary = stats.summary()
+assert summary["newton_solver"]["solves"] == 2 and summary["newton_solver"]["failed"] == 1
+assert summary["bissection"]["iterations"]["max"] == stats.records[2]["iterations"]
+assert stats.slowest(1)[0][1] == 4     # The bissection_solver
+
+# Vectorized solvers, the iterations of every equation
+c = np.linspace(1, 1000, 10000)
+stats = solverstats.SolverStats(tag="cubic")
+solverstats.enable(stats)
+x, it, error = roots.vbrent(lambda x: x ** 3 - c, 0, 11)
+stats.tag = "sqrt"
+roots.vnraphson(lambda x: x ** 2 - c, lambda x: 2 * x, np.ones(c.size))
+assert solverstats.disable() is stats
+
+assert stats.summary("vbrent")["vbrent"]["equations"] == c.size
+assert np.array_equal(stats.values("iterations", "vbrent"), it)
+assert stats.records[0]["evaluations"] == it.max() + 2
+assert stats.summary(tag="sqrt").keys() == {"vnraphson"}
+value, record, equation, tag = stats.slowest(1, solver="vbrent")[0]
+assert value == it.max() and it[equation] == value and tag == "cubic"
+
+counts, edges = stats.histogram("iterations", bins=5, solver="vnraphson")
+assert counts.sum() == c.size
+p = stats.percentiles("iterations", solver="vnraphson")
+assert p[50] <= p[90] <= p[99]
+
+merged = solverstats.SolverStats().merge(stats)
+assert len(merged) == 2
+
+# Overhead of the disabled instrumentation
+t0 = time.time()
+for _ in range(2000):
+    roots.nraphson(f, df, 1.0, tol=1e-10)
+disabled = time.time() - t0
+with solverstats.record():
+    t0 = time.time()
+    for _ in range(2000):
+        roots.nraphson(f, df, 1.0, tol=1e-10)
+    enabled = time.time() - t0
+print("2000 solves: %.1f ms disabled, %.1f ms recorded" % (disabled * 1000, enabled * 1000))
+
+print("Ok")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Automatic bracketing and warm starts, roots2.super_solver and roots.vbracket
+
+"""
+from math import exp, log
+
+import numpy as np
+
+from m2py.numerical import roots, roots2, solverstats
+from m2py.finance import brbonds
+
+f = lambda x: x ** 2 - exp(x)
+
+solver = roots2.super_solver(f)
+x = solver(-20, 13, tol=1e-12)
+assert abs(f(x)) < 1e-12 and abs(x + 0.7034674224983917) < 1e-12
+
+# The guesses don't bracket the root, the interval grows
+for guess0, guess1 in [(5, 6), (-3, -2), (100, None), (-100, None)]:
+    assert abs(roots2.super_solver(f)(guess0, guess1, tol=1e-12) - x) < 1e-10
+
+a, b, fa, fb = roots2.find_bracket(f, 10.0)
+assert a < x < b and fa * fb <= 0
+
+# Bounds of the domain, log(x) is defined for x > 0
+g = roots2.super_solver(lambda x: exp(-x) - 3 * log(x), lower=1e-12)
+assert abs(g(100, tol=1e-12) - 1.1154480188) < 1e-8
+assert abs(g(1e-6, tol=1e-12) - 1.1154480188) < 1e-8
+
+try:
+    roots2.super_solver(lambda x: x ** 2 + 1)(0.0)
+    assert False
+except Exception as err:
+    print(err)
+
+# Warm start from the last root, a slightly different equation
+c = [2.0]
+h = roots2.super_solver(lambda x: x ** 3 - c[0])
+with solverstats.record() as stats:
+    h(10.0, tol=1e-12)
+    c[0] = 2.001
+    r = h(tol=1e-12)
+cold, warm = stats.records
+print("cold start %d evaluations, warm start %d" % (cold["evaluations"], warm["evaluations"]))
+assert abs(r ** 3 - 2.001) < 1e-10 and warm["evaluations"] < cold["evaluations"]
+
+try:
+    roots2.super_solver(f)(tol=1e-12)
+    assert False
+except ValueError as err:
+    print(err)
+
+# Vectorized brackets
+k = np.array([1.0, 8.0, 27.0, -1.0])
+lo, hi = roots.vbracket(lambda x: x ** 3 - k, np.zeros(4))
+assert np.all(lo ** 3 <= k) and np.all(hi ** 3 >= k)
+lo, hi = roots.vbracket(lambda x: x ** 2 - k, np.ones(4), lower=0.0)
+assert np.isnan(lo[3]) and np.isnan(hi[3]) and np.all(lo[:3] ** 2 <= k[:3])
+
+# Yields of the next day from the yields of today
+rng = np.random.RandomState(0)
+n = 5000
+settles = np.datetime64("2012-01-02") + rng.randint(0, 700, n)
+maturities = np.array(["2017-01-01", "2021-01-01", "2016-07-01"], dtype="M8[D]")[rng.randint(0, 3, n)]
+coupons = np.where(rng.rand(n) < 0.5, 0.10, 0.0)
+prices = brbonds.bond_prices(rng.uniform(0.08, 0.16, n), settles, maturities, coupons)
+
+with solverstats.record() as stats:
+    today = brbonds.bond_yields(prices, coupons, settles, maturities)
+    tomorrow = brbonds.bond_yields(prices * 1.0005, coupons, settles + 1, maturities, guess=1 / (1 + today))
+cold, warm = stats.records
+print("bond yields: %.2f iterations, warm start %.2f" % (cold["iterations"].mean(), warm["iterations"].mean()))
+assert warm["iterations"].mean() < cold["iterations"].mean()
+assert np.allclose(tomorrow, brbonds.bond_yields(prices * 1.0005, coupons, settles + 1, maturities), rtol=1e-10)
+
+print("Ok")
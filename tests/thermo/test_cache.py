@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+LRU cache of the xsteam functions
+
+"""
+import inspect
+
+import m2py.thermo.xsteam as xs
+
+# Signatures are unchanged
+assert list(inspect.signature(xs.h_pt).parameters) == ["p", "T"]
+assert xs.h_pt.__doc__ and xs.h_pt.__name__ == "h_pt"
+assert xs.cache_info() is None
+
+exact = xs.h_pt(100.0, 300.0)
+
+cache = xs.use_cache(maxsize=3, digits=10)
+
+# Hits and misses
+assert xs.h_pt(100.0, 300.0) == exact
+assert xs.h_pt(100.0, 300.0) == exact
+assert xs.h_pt(100.0, 300.0 + 1e-12) == exact    # Same key after rounding
+print(xs.cache_info())
+assert xs.cache_info() == xs.CacheInfo(hits=2, misses=1, evictions=0, maxsize=3, currsize=1)
+
+xs.h_pt(100.0, 300.1)
+assert xs.cache_info("h_pt").misses == 2
+
+# Least recently used values are evicted
+xs.s_pt(100.0, 300.0)
+xs.h_pt(100.0, 300.0)     # Most recently used now
+xs.t_ph(100.0, 3000.0)    # Evicts h_pt(100.0, 300.1)
+print(xs.cache_info())
+print(xs.cache_info("h_pt"))
+assert len(cache) == 3
+assert xs.cache_info().evictions == 1
+assert xs.cache_info("h_pt") == xs.CacheInfo(hits=3, misses=2, evictions=1, maxsize=3, currsize=1)
+
+xs.h_pt(100.0, 300.0)
+assert xs.cache_info("h_pt").hits == 4
+
+# Keyword arguments and invalid states
+st = xs.state_pt(100.0, 300.0, props=("h", "s"))
+assert xs.state_pt(100.0, 300.0, props=("h", "s")) is st
+assert xs.state_pt(100.0, 300.0, props=("h",)) is not st
+assert xs.h_pt(100.0, -300.0) is None and xs.h_pt(100.0, -300.0) is None
+
+# Unhashable inputs go through
+assert xs.state_pt(100.0, 300.0, props=["h", "s"]) == st
+
+# Exact inputs
+xs.use_cache(digits=None)
+xs.h_pt(100.0, 300.0)
+xs.h_pt(100.0, 300.0 + 1e-12)
+assert xs.cache_info().misses == 2
+
+xs.cache_clear()
+assert xs.cache_info() == xs.CacheInfo(hits=0, misses=0, evictions=0, maxsize=4096, currsize=0)
+
+xs.no_cache()
+assert xs.cache_info() is None
+assert xs.h_pt(100.0, 300.0) == exact
+print("Ok")
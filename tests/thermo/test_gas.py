@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+NASA 7-coefficient polynomials, batch evaluation against the scalar
+functions and the GRI-Mech tables
+
+"""
+import os
+
+import numpy as np
+
+import m2py.thermo.gas as g
+from m2py.thermo.marktable import read_data_tables
+
+data = os.path.join(os.path.dirname(os.path.abspath(g.__file__)), "data", "gas_test_data.txt")
+tables = read_data_tables(data)
+
+gases = g.NASA7()
+T = np.linspace(250, 3000, 56)
+
+# Batch grid against the scalar functions, full precision
+cp = gases.cp(T)
+h = gases.h(T)
+s = gases.s(T)
+assert cp.shape == (len(g.substances), T.size)
+calmol = g.RJ / g.R_
+for k, name in enumerate(gases.species):
+    for j, t in enumerate(T):
+        assert abs(cp[k, j] / calmol - g.__cp_nasap_p7__(t, name, rounded=False)) < 1e-10 * abs(cp[k, j])
+        assert abs(s[k, j] / calmol - g.s_nasa_p7(t, name, rounded=False)) < 1e-10 * abs(s[k, j])
+        assert abs(h[k, j] / calmol - g.h_nasa_p7(t, name)) < 1e-8 * max(abs(h[k, j]), 1.0)
+print("Batch  Ok  %d species x %d temperatures" % cp.shape)
+
+# The rounding of the scalar functions is optional
+assert g.__cp_nasap_p7__(300.0, "O2") == round(g.__cp_nasap_p7__(300.0, "O2", rounded=False), 2)
+
+# dh/dT = cp and ds/dT = cp/T
+dT = 1e-3
+for name in ["O2", "CO2", "HNCO"]:
+    for t in [400.0, 999.0, 1200.0, 2500.0]:
+        dh = (gases.h(t + dT, [name]) - gases.h(t - dT, [name])) / (2 * dT)
+        ds = (gases.s(t + dT, [name]) - gases.s(t - dT, [name])) / (2 * dT)
+        cpt = gases.cp(t, [name])
+        assert abs(dh - cpt) < 1e-5 * cpt and abs(ds - cpt / t) < 1e-5 * cpt / t, (name, t)
+
+# GRI-Mech tables, cp and s in cal/(mol.K)
+for name, table in tables.items():
+    Tt = np.array(table["T"])
+    cp_error = np.max(np.abs(gases.cp(Tt, [name])[0] / calmol - table["cp"]) / table["cp"])
+    s_error = np.max(np.abs(gases.s(Tt, [name])[0] / calmol - table["s"]) / table["s"])
+    print("%-4s  max error cp %.2e  s %.2e" % (name, cp_error, s_error))
+    assert cp_error < 5e-3 and s_error < 5e-3
+
+# Air, mole fractions
+air = g.NASA7(["O2", "N2"])
+x = [0.21, 0.79]
+cp_air = air.cp_mix(x, 300.0, mass=True)
+print("Air cp(300 K) = %.1f J/(kg.K)" % cp_air)
+assert abs(cp_air - 1010) < 3
+assert abs(air.molarmass_mix(x) - 0.02885) < 1e-4
+assert np.allclose(air.h_mix(x, T), 0.21 * air.h(T, ["O2"])[0] + 0.79 * air.h(T, ["N2"])[0])
+
+# Mixing entropy
+s_mix = air.s_mix(x, T)
+assert np.allclose(s_mix, 0.21 * air.s(T, ["O2"])[0] + 0.79 * air.s(T, ["N2"])[0] -
+                   g.RJ * (0.21 * np.log(0.21) + 0.79 * np.log(0.79)))
+assert np.allclose(air.s_mix([1.0, 0.0], T), air.s(T, ["O2"])[0])
+
+# One composition per temperature
+xx = np.array([[0.21, 0.5, 1.0], [0.79, 0.5, 0.0]])
+assert np.allclose(air.cp_mix(xx, [300.0, 300.0, 300.0]),
+                   [air.cp_mix(x, 300.0), air.cp_mix([0.5, 0.5], 300.0), air.cp(300.0, ["O2"])[0]])
+
+try:
+    air.cp_mix([1.0], 300.0)
+    assert False
+except ValueError as err:
+    print(err)
+print("Ok")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Lookup tables backend of xsteam against the exact functions
+
+"""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import m2py.thermo.xsteam as xs
+import m2py.thermo.vxsteam as vxs
+from m2py.thermo import lut
+
+folder = tempfile.mkdtemp()
+path = os.path.join(folder, "tables", "xsteam_lut.npy")
+
+print("""
+#----------------------------------#
+#  Building and loading            #
+#----------------------------------#
+""")
+
+# Coarse tables, quick to build
+tables = xs.use_lut(path, tol=1e-4, max_nodes=2 ** 12)
+print(tables.error_report())
+assert os.path.exists(path) and os.path.exists(os.path.splitext(path)[0] + ".json")
+
+# The sampled error of every table is bounded by the tolerance, the cells
+# above it use the exact functions, between the samples it stays close
+for name, r in tables.report.items():
+    assert r["mismatch"] == 0, name
+    assert r["max_rel"] < 3e-4, name
+for key, nodes in tables.info["nodes"].items():
+    assert 0 <= nodes[-1] < 0.5, key
+table = [p for p in tables.planes["pT"] if p.name == "supercritical0"][0].tables["v"]
+assert table.exact.any() and not table.exact.all()
+
+# A cell computed by the exact function, close to the critical point
+i, j = np.argwhere(table.exact)[0]
+patch = [p for p in tables.planes["pT"] if p.name == "supercritical0"][0]
+X = (i + 0.5) / table.nx
+U = (j + 0.5) / table.ny
+pc, Tc = [float(a[0, 0]) for a in patch.nodes(np.array([X]), np.array([U]))]
+assert tables.evaluate("pT", "v", pc, Tc) == vxs.v_pt(pc * 1000.0, Tc - 273.15)
+assert tables.evaluate("pT", "v", np.array([pc]), np.array([Tc]))[0] == vxs.v_pt(pc * 1000.0, Tc - 273.15)
+
+# Loaded tables are memory mapped and give the same values
+loaded = lut.LUT.load(path)
+assert isinstance(np.load(path, mmap_mode="r"), np.memmap)
+assert loaded.report == tables.report
+assert loaded.h_pt(100.0, 300.0) == tables.h_pt(100.0, 300.0)
+assert loaded.v_pt(pc * 1000.0, Tc - 273.15) == tables.v_pt(pc * 1000.0, Tc - 273.15)
+
+print("""
+#----------------------------------#
+#  Scalar and vector functions     #
+#----------------------------------#
+""")
+
+rng = np.random.RandomState(4)
+p = np.exp(rng.uniform(np.log(1.0), np.log(90000), 200))
+T = rng.uniform(1, 1990, 200)
+h = rng.uniform(100, 7000, 200)
+s = rng.uniform(0.1, 11.5, 200)
+
+for name, y in [("h_pt", T), ("v_pt", T), ("s_pt", T), ("u_pt", T),
+                ("t_ph", h), ("t_ps", s), ("h_ps", s), ("u_ps", s)]:
+    vector = getattr(tables, name)(p, y)
+    for k in range(len(p)):
+        scalar = getattr(xs, name)(float(p[k]), float(y[k]))
+        if scalar is None:
+            assert np.isnan(vector[k]), (name, p[k], y[k])
+        else:
+            assert abs(scalar - vector[k]) <= 1e-12 * abs(scalar), (name, p[k], y[k])
+    print("%-5s Ok" % name)
+
+# Two-phase region, tabulated saturation properties and vapour fraction
+T = xs.t_ph(1000.0, 2000.0)
+print("t_ph(1000, 2000) = ", T)
+assert abs(T - vxs.tsat_p(1000.0)) < 1e-9
+
+h = xs.h_ps(1000.0, 5.0)
+xs.use_exact()
+print("h_ps(1000, 5) = ", h, xs.h_ps(1000.0, 5.0))
+assert abs(h - xs.h_ps(1000.0, 5.0)) < 1e-3 * h
+
+# Outside of the tables
+xs.use_lut(path)
+assert xs.h_pt(200000.0, 300.0) is None
+assert xs.t_ph(1000.0, -100.0) is None
+assert np.isnan(tables.h_pt(np.array([200000.0]), 300.0)[0])
+
+print("""
+#----------------------------------#
+#  Back to the exact functions     #
+#----------------------------------#
+""")
+
+xs.use_exact()
+assert xs._lut is None
+assert xs.h_pt(100.0, 300.0) == vxs.h_pt(100.0, 300.0)
+
+shutil.rmtree(folder)
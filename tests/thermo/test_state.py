@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+State functions against the IF-97 verification values and the single
+property functions of xsteam
+
+"""
+import numpy as np
+
+import m2py.thermo.__xsteam__ as xst
+import m2py.thermo.xsteam as xs
+import m2py.thermo.vxsteam as vxs
+
+
+def check_state(name, state, args, expected, tol=1e-8):
+    """
+    Compare the tuple (v, h, u, s, Cp, Cv, w) of a state function with the
+    expected values, None in expected is not checked.
+    """
+    result = state(*args)
+    for k, (r, e) in enumerate(zip(result, expected)):
+        if e is None:
+            continue
+        error = abs(r - e) / abs(e)
+        print("%-12s %-4s %-15.9g %-15.9g error = %.2e" % (name, "v h u s cp cv w".split()[k], r, e, error))
+        assert error < tol, name
+
+
+print("""
+#----------------------------------#
+#  IF-97 verification values       #
+#----------------------------------#
+""")
+
+# Table 5, Page 9 - v, h, u, s, cp, w
+check_state("state1_pT", xst.state1_pT, (3, 300),
+           (0.100215168e-2, 0.115331273e3, 0.112324818e3, 0.392294792, 0.417301218e1, None, 0.150773921e4))
+check_state("state1_pT", xst.state1_pT, (3, 500),
+           (0.120241800e-2, 0.975542239e3, 0.971934985e3, 0.258041912e1, 0.465580682e1, None, 0.124071337e4))
+
+# Table 15, Page 17
+check_state("state2_pT", xst.state2_pT, (0.0035, 300),
+           (0.394913866e2, 0.254991145e4, 0.241169160e4, 0.852238967e1, 0.191300162e1, None, 0.427920172e3))
+check_state("state2_pT", xst.state2_pT, (30, 700),
+           (0.542946619e-2, 0.263149474e4, 0.246861076e4, 0.517540298e1, 0.103505092e2, None, 0.480386523e3))
+
+# Table 33, Page 32
+check_state("state3_rhoT", xst.state3_rhoT, (500, 650),
+           (None, 0.186343019e4, 0.181226279e4, 0.405427273e1, 0.138935717e2, None, 0.502005554e3))
+check_state("state3_rhoT", xst.state3_rhoT, (500, 750),
+           (None, 0.225868845e4, 0.210206932e4, 0.446971906e1, 0.634165359e1, None, 0.760696041e3))
+
+# Table 42, Page 40 - v, h, s
+check_state("state5_pT", xst.state5_pT, (0.5, 1500),
+           (0.138455354e1, 0.521976332e4, None, 0.965408431e1, None, None, None))
+
+print("""
+#----------------------------------#
+#  State records - p kPa, T °C     #
+#----------------------------------#
+""")
+
+rng = np.random.RandomState(2004)
+p = np.exp(rng.uniform(np.log(0.5), np.log(110000), 300))
+T = rng.uniform(0, 2000, 300)
+h = rng.uniform(0, 7000, 300)
+s = rng.uniform(0, 12, 300)
+
+for pk, Tk in zip(p, T):
+    st = xs.state_pt(pk, Tk, ("s", "v", "u", "cp"))
+    if st is None:
+        assert xs.s_pt(pk, Tk) is None
+        continue
+    assert abs(st.s - xs.s_pt(pk, Tk)) < 1e-12 * abs(st.s)
+    assert abs(st.v - xs.v_pt(pk, Tk)) < 1e-12 * abs(st.v)
+    assert abs(st.u - xs.u_pt(pk, Tk)) < 1e-12 * abs(st.u)
+print("state_pt   Ok")
+
+for pk, hk, sk in zip(p, h, s):
+    st = xs.state_ph(pk, hk, ("T", "h"))
+    assert (st is None) == (xs.t_ph(pk, hk) is None)
+    if st is not None:
+        assert abs(st.T - xs.t_ph(pk, hk)) < 1e-9
+        # Consistency of the backward equations T(p, h)
+        assert abs(st.h - hk) < 5e-3 * hk
+
+    st = xs.state_ps(pk, sk, ("T", "h"))
+    assert (st is None) == (xs.t_ps(pk, sk) is None)
+    if st is not None:
+        assert abs(st.T - xs.t_ps(pk, sk)) < 1e-9
+        assert abs(st.h - xs.h_ps(pk, sk)) < 1e-9 * abs(st.h)
+print("state_ph   Ok")
+print("state_ps   Ok")
+
+# Saturated mixture, 10 bar
+st = xs.state_ph(1000.0, 2000.0, ("T", "h", "x"))
+print(st)
+assert abs(st.T - xs.tsat_p(1000.0)) < 1e-9 and 0 < st.x < 1 and abs(st.h - 2000.0) < 1e-9
+
+# Region 1 from h and s
+st = xs.state_hs(500.0, 1.5, ("p", "T", "h", "s"))
+print(st)
+assert abs(st.h - 500.0) < 1e-1 and abs(st.s - 1.5) < 1e-3
+
+# Saturated mixture from h and s
+st = xs.state_hs(2000.0, 5.0, ("p", "T", "h", "s", "x"))
+print(st)
+assert abs(st.T - xs.t_hs(2000.0, 5.0)) < 1e-9 and abs(st.s - 5.0) < 1e-4 and 0 < st.x < 1
+
+print("""
+#----------------------------------#
+#  Structured arrays               #
+#----------------------------------#
+""")
+
+props = xs.STATE_PROPS
+for name, args in [("state_pt", (p, T)), ("state_ph", (p, h)), ("state_ps", (p, s))]:
+    vector = getattr(vxs, name)(*args, props=props)
+    error = 0.0
+    for k, a in enumerate(zip(*args)):
+        st = getattr(xs, name)(*a, props=props)
+        for prop in props:
+            e = None if st is None else getattr(st, prop)
+            if e is None:
+                assert np.isnan(vector[prop][k]), (name, prop, a)
+            else:
+                error = max(error, abs(vector[prop][k] - e) / max(abs(e), 1.0))
+    print("%-10s Max relative error %.2e" % (name, error))
+    assert error < 1e-10, name
+
+st = vxs.state_pt([[100.0, 1000.0]], 300.0, props=("h", "s"))
+assert st.shape == (1, 2) and st.dtype.names == ("h", "s")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Saturated steam table, m2py.thermo.steam
+
+"""
+import time
+
+import numpy as np
+
+import m2py.thermo.steam as st
+
+# The table is read from m2py/thermo/data
+s = st.__saturation__
+assert s.headers[:3] == ["T", "P", "vf"]
+T = np.asarray(s["T"])
+P = np.asarray(s["P"])
+
+# The rows of the table are reproduced, scalar and array inputs
+for k in [0, 20, 47, len(T) - 1]:
+    row = [s[h][k] for h in s.headers]
+    assert np.allclose(st.__stable__(T[k], 'T', s.headers), row, rtol=1e-14, atol=0)
+    assert np.allclose(st.__stable__(P[k], 'P', s.headers), row, rtol=1e-12, atol=0)
+for name, values in zip(s.headers, st.__stable__(T, 'T', s.headers)):
+    assert np.allclose(values, s[name], rtol=1e-14, atol=0), name
+
+# Linear between the rows 230 and 235 ºC
+print(st.__stable__(232, 'T', ['P', 'vf', 'vg', 'uf']))
+assert np.allclose(st.__stable__(232, 'T', ['P', 'vf', 'vg', 'uf']), [2900.98, 0.001213, 0.069092, 995.984])
+assert abs(st.tsat_p(500) - 151.79315476190476) < 1e-12
+assert st.psat_t(100) == 101.3
+
+t = np.array([[100.0, 232.0], [5.0, 370.0]])
+p, vf = st.__stable__(t, 'T', ['P', 'vf'])
+assert p.shape == t.shape and p[0, 1] == st.psat_t(232)
+assert abs(st.mixture_volume(0.9, 4000, 'P') - 0.04495115454545455) < 1e-15
+assert abs(st.vapor_quality(st.mixture_volume(0.3, 150.0), 150.0) - 0.3) < 1e-12
+
+# Speed of the lookups
+t0 = time.time()
+for _ in range(10000):
+    st.__stable__(232.0, 'T', ['P', 'vf', 'vg', 'uf'])
+scalar = (time.time() - t0) / 10000
+x = np.random.RandomState(0).uniform(0.01, 370, 100000)
+t0 = time.time()
+st.__stable__(x, 'T', ['P', 'vf', 'vg', 'uf'])
+print("4 properties: %.1f us per scalar, %.1f ms per 1e5 temperatures" % (scalar * 1e6, (time.time() - t0) * 1e3))
+
+print("Ok")
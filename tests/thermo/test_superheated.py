@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Gridded superheated steam table against its data and the IF-97 functions
+
+"""
+import numpy as np
+
+import m2py.thermo.superheated as sh
+import m2py.thermo.vxsteam as vxs
+
+P = np.asarray(sh.s["P"])
+T = np.asarray(sh.s["T"])
+
+# The nodes are reproduced, every row of the file is in the grid
+assert sum(t.size for t in sh.table.temperatures) == P.size
+assert sh.pressures == sorted(set(P.tolist()))
+for name in sh.PROPERTIES:
+    assert np.allclose(sh.table(name, P, T), np.asarray(sh.s[name]), rtol=1e-14, atol=0), name
+
+print(sh.find_pt(300.0, 275.0))
+assert sh.find_pt(300.0, 275.0) == (0.83585, 2767.95, 3018.75, 7.611)
+
+# Textbook values against IF-97
+exact = {"v": vxs.v_pt, "u": vxs.u_pt, "h": vxs.h_pt, "s": vxs.s_pt}
+for name in sh.PROPERTIES:
+    error = np.max(np.abs(np.asarray(sh.s[name]) / exact[name](P, T) - 1))
+    print("%s  nodes  max relative error %.2e" % (name, error))
+    assert error < 1e-3
+
+# Batch of points inside the cells
+rng = np.random.RandomState(9)
+p = rng.uniform(10, 1800, 20000)
+t = rng.uniform(50, 1300, 20000)
+for name in sh.PROPERTIES:
+    y = getattr(sh, name + "_pt")(p, t)
+    valid = ~np.isnan(y)
+    error = np.max(np.abs(y[valid] / exact[name](p[valid], t[valid]) - 1))
+    print("%s  cells  max relative error %.2e  points %d" % (name, error, valid.sum()))
+    assert error < 1e-2 and valid.sum() > 10000
+
+# Scalar and vector paths, shapes
+pp, tt = np.meshgrid([150.0, 700.0], [250.0, 650.0])
+assert sh.h_pt(pp, tt).shape == (2, 2)
+assert sh.h_pt(150.0, 650.0) == sh.h_pt(pp, tt)[1, 0]
+assert isinstance(sh.h_pt(150.0, 650.0), float)
+
+# Outside of the table and below the superheated region of the higher pressure
+assert np.isnan(sh.h_pt(5.0, 300.0)) and np.isnan(sh.h_pt(2000.0, 300.0))
+assert np.isnan(sh.h_pt(300.0, 1400.0))
+assert np.isnan(sh.h_pt(1500.0, 200.0))
+assert not np.isnan(sh.h_pt(1400.0, 200.0))
+
+try:
+    sh.table("x", 100.0, 300.0)
+    assert False
+except ValueError as err:
+    print(err)
+print("Ok")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Vectorized steam tables against the IF-97 verification values, and against
+the scalar __xsteam__ and xsteam functions
+
+The scalar and the vectorized region equations evaluate the same compiled
+series, the comparisons between them only check the broadcasting, the
+region detection and the unit conversions. The coefficients are checked
+by the verification values of the IF-97 release.
+
+"""
+import numpy as np
+
+import m2py.thermo.__xsteam__ as xst
+import m2py.thermo.xsteam as xs
+import m2py.thermo.vxsteam as vxs
+
+
+tol = 1e-12
+
+
+def check_vector(name, scalar, vector, args):
+    """
+    Compare vector(*args) with map(scalar, *args), None is expected as nan.
+    """
+    expected = np.array([np.nan if y is None else y for y in map(scalar, *[list(a) for a in args])])
+    result = np.asarray(vector(*args))
+
+    assert np.array_equal(np.isnan(expected), np.isnan(result)), name
+
+    ok = ~np.isnan(expected)
+    error = np.max(np.abs(result[ok] - expected[ok]) / np.abs(expected[ok]), initial=0.0)
+
+    print("%-10s Max relative error %.2e" % (name, error))
+    assert error < tol, name
+
+
+def check_reference(name, vector, args, expected, tol=1e-8):
+    """ Compare vector(*args) with the verification values of the IF-97 release """
+    result = np.asarray(vector(*[np.array(a, dtype=float) for a in args]))
+    error = np.max(np.abs(result / np.array(expected) - 1))
+    print("%-10s Max relative error %.2e" % (name, error))
+    assert result.shape == np.shape(expected) and error < tol, name
+
+
+print("""
+#----------------------------------#
+#  IF-97 verification values       #
+#----------------------------------#
+""")
+
+# Table 5, Page 9 - (p, T) = (3, 300), (80, 300), (3, 500)
+p, T = [3, 80, 3], [300, 300, 500]
+check_reference("v1_pT", vxs.v1_pT, (p, T), [0.100215168e-2, 0.971180894e-3, 0.120241800e-2])
+check_reference("h1_pT", vxs.h1_pT, (p, T), [0.115331273e3, 0.184142828e3, 0.975542239e3])
+check_reference("u1_pT", vxs.u1_pT, (p, T), [0.112324818e3, 0.106448356e3, 0.971934985e3])
+check_reference("s1_pT", vxs.s1_pT, (p, T), [0.392294792, 0.368563852, 0.258041912e1])
+check_reference("Cp1_pT", vxs.Cp1_pT, (p, T), [0.417301218e1, 0.401008987e1, 0.465580682e1])
+check_reference("w1_pT", vxs.w1_pT, (p, T), [0.150773921e4, 0.163469054e4, 0.124071337e4])
+
+# Tables 7 and 9, Pages 11 and 13 - backward equations
+check_reference("T1_ph", vxs.T1_ph, ([3, 80, 80], [500, 500, 1500]), [0.391798509e3, 0.378108626e3, 0.611041229e3])
+check_reference("T1_ps", vxs.T1_ps, ([3, 80, 80], [0.5, 0.5, 3]), [0.307842258e3, 0.309979785e3, 0.565899909e3])
+
+# Table 15, Page 17 - (p, T) = (0.0035, 300), (0.0035, 700), (30, 700)
+p, T = [0.0035, 0.0035, 30], [300, 700, 700]
+check_reference("v2_pT", vxs.v2_pT, (p, T), [0.394913866e2, 0.923015898e2, 0.542946619e-2])
+check_reference("h2_pT", vxs.h2_pT, (p, T), [0.254991145e4, 0.333568375e4, 0.263149474e4])
+check_reference("u2_pT", vxs.u2_pT, (p, T), [0.241169160e4, 0.301262819e4, 0.246861076e4])
+check_reference("s2_pT", vxs.s2_pT, (p, T), [0.852238967e1, 0.101749996e2, 0.517540298e1])
+check_reference("Cp2_pT", vxs.Cp2_pT, (p, T), [0.191300162e1, 0.208141274e1, 0.103505092e2])
+check_reference("w2_pT", vxs.w2_pT, (p, T), [0.427920172e3, 0.644289068e3, 0.480386523e3])
+
+# Tables 24 and 29, Pages 25 and 29 - backward equations of the subregions 2a, 2b and 2c
+check_reference("T2_ph", vxs.T2_ph, ([0.001, 3, 3, 5, 5, 25, 40, 60, 60],
+                                     [3000, 3000, 4000, 3500, 4000, 3500, 2700, 2700, 3200]),
+                [0.534433241e3, 0.575373370e3, 0.101077577e4, 0.801299102e3, 0.101531583e4,
+                 0.875279054e3, 0.743056411e3, 0.791137067e3, 0.882756860e3])
+check_reference("T2_ps", vxs.T2_ps, ([0.1, 0.1, 2.5, 8, 8, 90, 20, 80, 80],
+                                     [7.5, 8, 8, 6, 7.5, 6, 5.75, 5.25, 5.75]),
+                [0.399517097e3, 0.514127081e3, 0.103984917e4, 0.600484040e3, 0.106495556e4,
+                 0.103801126e4, 0.697992849e3, 0.854011484e3, 0.949017998e3])
+
+# Table 33, Page 32 - (rho, T) = (500, 650), (200, 650), (500, 750)
+rho, T = [500, 200, 500], [650, 650, 750]
+check_reference("p3_rhoT", vxs.p3_rhoT, (rho, T), [0.255837018e2, 0.222930643e2, 0.783095639e2])
+check_reference("h3_rhoT", vxs.h3_rhoT, (rho, T), [0.186343019e4, 0.237512401e4, 0.225868845e4])
+check_reference("u3_rhoT", vxs.u3_rhoT, (rho, T), [0.181226279e4, 0.226365868e4, 0.210206932e4])
+check_reference("s3_rhoT", vxs.s3_rhoT, (rho, T), [0.405427273e1, 0.485438792e1, 0.446971906e1])
+
+# Tables 35 and 36, Pages 34 and 35 - saturation line
+check_reference("p4_T", vxs.p4_T, ([300, 500, 600],), [0.353658941e-2, 0.263889776e1, 0.123443146e2])
+check_reference("T4_p", vxs.T4_p, ([0.1, 1, 10],), [0.372755919e3, 0.453035632e3, 0.584149488e3])
+
+# Table 42, Page 40 - (p, T) = (0.5, 1500), (8, 1500), (8, 2000), region 5 of the 1997 release
+p, T = [0.5, 8, 8], [1500, 1500, 2000]
+check_reference("v5_pT", vxs.v5_pT, (p, T), [0.138455354e1, 0.865156616e-1, 0.115743146])
+check_reference("h5_pT", vxs.h5_pT, (p, T), [0.521976332e4, 0.520609634e4, 0.658380291e4])
+check_reference("u5_pT", vxs.u5_pT, (p, T), [0.452748654e4, 0.451397105e4, 0.565785774e4])
+check_reference("s5_pT", vxs.s5_pT, (p, T), [0.965408431e1, 0.836546724e1, 0.915671044e1])
+check_reference("Cp5_pT", vxs.Cp5_pT, (p, T), [0.261610228e1, 0.264453866e1, 0.285306750e1])
+
+# Equation 5, Page 5 - boundary between the regions 2 and 3
+check_reference("B23p_T", vxs.B23p_T, ([623.15],), [0.165291643e2])
+check_reference("B23T_p", vxs.B23T_p, ([0.165291643e2],), [0.623150000e3])
+
+rng = np.random.RandomState(1997)
+
+print("""
+#----------------------------------#
+#  Region equations - broadcasting #
+#----------------------------------#
+""")
+
+# Region 1
+p = rng.uniform(0.1, 100, 500)
+T = rng.uniform(274, 600, 500)
+for f in ["h1_pT", "v1_pT", "u1_pT", "s1_pT", "Cp1_pT", "Cv1_pT", "w1_pT"]:
+    check_vector(f, getattr(xst, f), getattr(vxs, f), (p, T))
+
+# Region 2
+p = rng.uniform(0.001, 0.5, 500)
+T = rng.uniform(400, 1073, 500)
+for f in ["h2_pT", "v2_pT", "u2_pT", "s2_pT", "Cp2_pT", "Cv2_pT"]:
+    check_vector(f, getattr(xst, f), getattr(vxs, f), (p, T))
+
+# Region 3
+rho = rng.uniform(200, 700, 500)
+T = rng.uniform(630, 860, 500)
+for f in ["p3_rhoT", "h3_rhoT", "u3_rhoT", "s3_rhoT"]:
+    check_vector(f, getattr(xst, f), getattr(vxs, f), (rho, T))
+
+# Region 5
+p = rng.uniform(0.01, 10, 500)
+T = rng.uniform(1080, 2270, 500)
+for f in ["h5_pT", "v5_pT", "u5_pT", "s5_pT"]:
+    check_vector(f, getattr(xst, f), getattr(vxs, f), (p, T))
+
+# Saturation line
+p = rng.uniform(0.001, 22.06, 500)
+for f in ["T4_p", "h4L_p", "h4V_p"]:
+    check_vector(f, getattr(xst, f), getattr(vxs, f), (p,))
+
+print("""
+#----------------------------------#
+#  Region detection                #
+#----------------------------------#
+""")
+
+p = np.exp(rng.uniform(np.log(0.0005), np.log(110), 2000))
+T = rng.uniform(270, 2300, 2000)
+h = rng.uniform(-10, 7500, 2000)
+s = rng.uniform(-0.5, 14, 2000)
+
+for f, x in [("region_pT", T), ("region_ph", h), ("region_ps", s)]:
+    expected = np.array(list(map(getattr(xst, f), p, x)))
+    assert np.array_equal(expected, getattr(vxs, f)(p, x)), f
+    print("%-10s Ok - regions found %s" % (f, np.unique(expected)))
+
+print("""
+#----------------------------------#
+#  Steam tables - p kPa, T °C      #
+#----------------------------------#
+""")
+
+p = np.exp(rng.uniform(np.log(0.5), np.log(110000), 1000))
+T = rng.uniform(0, 2000, 1000)
+h = rng.uniform(0, 7000, 1000)
+s = rng.uniform(0, 12, 1000)
+
+for f in ["h_pt", "v_pt", "s_pt", "u_pt"]:
+    check_vector(f, getattr(xs, f), getattr(vxs, f), (p, T))
+
+check_vector("t_ph", xs.t_ph, vxs.t_ph, (p, h))
+check_vector("t_ps", xs.t_ps, vxs.t_ps, (p, s))
+check_vector("h_ps", xs.h_ps, vxs.h_ps, (p, s))
+check_vector("tsat_p", xs.tsat_p, vxs.tsat_p, (p,))
+check_vector("psat_t", xs.psat_t, vxs.psat_t, (T,))
+
+# Scalar input returns a python number
+assert isinstance(vxs.h_pt(100.0, 20.0), float)
+assert isinstance(vxs.region_pT(0.1, 293.15), int)